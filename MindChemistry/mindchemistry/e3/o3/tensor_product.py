@@ -256,7 +256,17 @@ def _init_einsum_weight(mode, weight_mode, ls):
     return einsum
 
 
-def _init_ncon(mode, ls):
+def _ncon_shapes(weight_mode, ls, muls, path_shape, has_weight, batch_size):
+    """shapes of the wigner matrix, inputs and weights of the tensor graph contractions"""
+    shapes = [(2 * ls[0] + 1, 2 * ls[1] + 1, 2 * ls[2] + 1),
+              (batch_size, muls[0], 2 * ls[0] + 1),
+              (batch_size, muls[1], 2 * ls[1] + 1)]
+    if has_weight:
+        shapes.append(((batch_size,) if weight_mode == 'custom' else ()) + path_shape)
+    return shapes
+
+
+def _init_ncon(mode, ls, shapes=None):
     """tensor graph contractions"""
     if mode == 'uuu':
         con_list = [[1, 2, -3], [-1, -2, 1], [-1, -2, 2]]
@@ -268,7 +278,7 @@ def _init_ncon(mode, ls):
         con_list = [[1, 2, -3], [-1, 3, 1], [-1, -2, 2]]
     elif mode == 'uvuv':
         con_list = [[1, 2, -4], [-1, -2, 1], [-1, -3, 2]]
-    ncon = Ncon(con_list)
+    ncon = Ncon(con_list, shapes)
     return ncon
 
 
@@ -286,7 +296,7 @@ class uvw_ncon_v2(nn.Cell):
         return res
 
 
-def _init_ncon_weight(mode, weight_mode, ls):
+def _init_ncon_weight(mode, weight_mode, ls, shapes=None):
     """tensor graph contractions with weights"""
     if mode == 'uvw':
         con_list = [[1, 2, -3], [-1, 3, 1], [-1, 4, 2], [3, 4, -2]]
@@ -302,7 +312,7 @@ def _init_ncon_weight(mode, weight_mode, ls):
         con_list = [[1, 2, -4], [-1, -2, 1], [-1, -3, 2], [-2, -3]]
     if weight_mode == 'custom':
         con_list[3] = [-1] + con_list[3]
-    ncon = Ncon(con_list)
+    ncon = Ncon(con_list, shapes)
     return ncon
 
 
@@ -388,6 +398,8 @@ class TensorProduct(nn.Cell):
              - 'share': weights should given manually without batch dimension.
              - 'custom': weights should given manually with batch dimension.
 
+        ncon_batch_size (int): the expected batch size of the inputs, used to choose the order of the contractions
+            of each path when `core_mode` is 'ncon'. It only affects the speed. Default: 1024.
 
     Raises:
         ValueError: If `irreps_out` is not legal.
@@ -460,7 +472,8 @@ class TensorProduct(nn.Cell):
             weight_init='normal',
             weight_mode='inner',
             core_mode='ncon',
-            ncon_dtype=float32
+            ncon_dtype=float32,
+            ncon_batch_size=1024
     ):
         super().__init__()
 
@@ -476,6 +489,7 @@ class TensorProduct(nn.Cell):
         self.weight_mode = weight_mode
         self.dtype = dtype
         self.core_mode = core_mode
+        self.ncon_batch_size = ncon_batch_size
         self.ones = ops.Ones()
         self.zeros = ops.Zeros()
 
@@ -652,7 +666,7 @@ class TensorProduct(nn.Cell):
             ls = (mirs[0].ir.l, mirs[1].ir.l, mirs[2].ir.l)
 
             d, op = self._ins_dict(indice_one, indice_two, i_out, mode, has_weight,
-                                   path_weight, path_shape, num_elements, wigner_3j(*ls, self.dtype), ls)
+                                   path_weight, path_shape, num_elements, wigner_3j(*ls, self.dtype), ls, muls)
             ncons.append(op)
             d['i_ncon'] = len(ncons) - 1
             res.append(d)
@@ -665,7 +679,7 @@ class TensorProduct(nn.Cell):
         """generate reformed instructions"""
         d = {}
         keys = ['indice_one', 'indice_two', 'i_out', 'mode', 'has_weight',
-                'path_weight', 'path_shape', 'num_elements', 'wigner_matrix', 'ls']
+                'path_weight', 'path_shape', 'num_elements', 'wigner_matrix', 'ls', 'muls']
         for i, arg in enumerate(args):
             d[keys[i]] = arg
 
@@ -675,12 +689,16 @@ class TensorProduct(nn.Cell):
                     d['mode'], self.weight_mode, d['ls'])
             else:
                 operator = _init_ncon_weight(
-                    d['mode'], self.weight_mode, d['ls'])
+                    d['mode'], self.weight_mode, d['ls'],
+                    _ncon_shapes(self.weight_mode, d['ls'], d['muls'], d['path_shape'], True,
+                                 self.ncon_batch_size))
         else:
             if self.core_mode == 'einsum':
                 operator = _init_einsum(d['mode'], d['ls'])
             else:
-                operator = _init_ncon(d['mode'], d['ls'])
+                operator = _init_ncon(d['mode'], d['ls'],
+                                      _ncon_shapes(self.weight_mode, d['ls'], d['muls'], d['path_shape'], False,
+                                                   self.ncon_batch_size))
 
         return d, operator
 
@@ -14,6 +14,7 @@
 # ============================================================================
 """ncon"""
 from copy import deepcopy
+from itertools import permutations
 import numpy as np
 
 from mindspore import ops, nn, vmap
@@ -32,6 +33,20 @@ def nest_vmap(fn, in_list, out_list, pt):
     return vmap(nest_vmap(fn, in_list, out_list, pt + 1), in_list[pt], out_list[pt])
 
 
+# Orders of the contracted indices optimized for each (con_list, shapes), computed once.
+_ORDER_CACHE = {}
+
+# The order of up to this number of contracted indices is searched exhaustively, otherwise greedily.
+_EXHAUSTIVE_LIMIT = 6
+
+
+def _prod(x):
+    out = 1
+    for i in x:
+        out *= i
+    return out
+
+
 def _create_order(con_list):
     """ Identify all unique, positive indices and return them sorted. """
     flat_con = np.concatenate(con_list)
@@ -189,11 +204,12 @@ def _make_dict(mode,
     return d
 
 
-def _process_commands(con_list):
+def _process_commands(con_list, shapes=None):
     """_process_commands
 
     Args:
         con_list: con_list
+        shapes: shapes of the tensors to optimize the order of contractions. Defaults to None.
 
     Returns:
         conmmands, operators
@@ -201,6 +217,10 @@ def _process_commands(con_list):
     conmmands = []
     operators = []
 
+    if shapes is not None:
+        dims = _get_dims(con_list, shapes)
+        key = (list_to_tuple(con_list), shapes)
+
     # find sum index
     sum_legs = _find_sum(con_list)
     for leg in sum_legs:
@@ -221,6 +241,10 @@ def _process_commands(con_list):
 
     order = _create_order(con_list)
     batch_legs = _find_batch(con_list)
+    if shapes is not None:
+        if key not in _ORDER_CACHE:
+            _ORDER_CACHE[key] = _optimize_order(con_list, dims, order)
+        order = list(_ORDER_CACHE.get(key))
 
     if not con_list[0]:
         return conmmands, operators
@@ -263,6 +287,120 @@ def _process_commands(con_list):
     return conmmands, operators
 
 
+def _get_dims(con_list, shapes):
+    """_get_dims
+
+    Args:
+        con_list: con_list
+        shapes: shapes of the tensors
+
+    Raises:
+        ValueError: ValueError
+
+    Returns:
+        dims, the dimension of each index
+    """
+    if len(shapes) != len(con_list):
+        raise ValueError(f'The number of shapes {len(shapes)} does not match the number of tensors {len(con_list)}.')
+    dims = {}
+    for con, shape in zip(con_list, shapes):
+        if len(con) != len(shape):
+            raise ValueError(f'The shape {shape} does not match the indices {con}.')
+        for leg, dim in zip(con, shape):
+            if dims.setdefault(leg, dim) != dim:
+                raise ValueError(f'The dimensions of the index {leg} do not match: {dims[leg]} and {dim}.')
+    return dims
+
+
+def _contract_cost(con_list, dims, leg_now):
+    """_contract_cost
+
+    Contract the two tensors with the index `leg_now` in `con_list` as `do_ndot` does.
+
+    Args:
+        con_list: con_list, updated in place
+        dims: the dimension of each index
+        leg_now: the index to be contracted
+
+    Returns:
+        flops, size of the result, contracted indices
+    """
+    inds = [i for i, con in enumerate(con_list) if leg_now in con]
+    if len(inds) == 1:
+        con_list[inds[0]] = [leg for leg in con_list[inds[0]] if leg != leg_now]
+        return 0, 0, [leg_now]
+
+    con_0, con_1 = con_list[inds[0]], con_list[inds[1]]
+    shared = [leg for leg in con_0 if leg in con_1]
+    flops = _prod(dims[leg] for leg in set(con_0 + con_1))
+    res = [leg for leg in shared if leg < 0]
+    res += [leg for leg in con_0 if leg not in shared] + [leg for leg in con_1 if leg not in shared]
+    con_list[inds[0]] = res
+    con_list[inds[1]] = []
+    return flops, _prod(dims[leg] for leg in res), [leg for leg in shared if leg > 0]
+
+
+def _path_cost(con_list, dims, sequence):
+    """_path_cost
+
+    Args:
+        con_list: con_list
+        dims: the dimension of each index
+        sequence: the indices in the order to be contracted
+
+    Returns:
+        the total flops and the size of the largest intermediate tensor
+    """
+    con_list = [list(con) for con in con_list]
+    contracted = set()
+    flops = 0
+    peak = 0
+    for leg in sequence:
+        if leg in contracted:
+            continue
+        step_flops, size, legs = _contract_cost(con_list, dims, leg)
+        flops += step_flops
+        peak = max(peak, size)
+        contracted.update(legs)
+    return flops, peak
+
+
+def _optimize_order(con_list, dims, order):
+    """_optimize_order
+
+    Search the order of the contracted indices with the least flops, and then the smallest intermediate tensors.
+    The search is exhaustive for a few indices and greedy otherwise.
+    `do_ndot` contracts the indices from the end of the order.
+
+    Args:
+        con_list: con_list
+        dims: the dimension of each index
+        order: the contracted indices
+
+    Returns:
+        order
+    """
+    if len(order) <= 1:
+        return order
+
+    if len(order) <= _EXHAUSTIVE_LIMIT:
+        # the default order comes first and is kept when the costs are equal
+        sequences = permutations(order[::-1])
+        sequence = min(sequences, key=lambda seq: _path_cost(con_list, dims, seq))
+        return list(sequence[::-1])
+
+    con_list = [list(con) for con in con_list]
+    remaining = order[::-1]
+    sequence = []
+    while remaining:
+        costs = [_path_cost(con_list, dims, [leg]) for leg in remaining]
+        leg = remaining[costs.index(min(costs))]
+        _, _, legs = _contract_cost(con_list, dims, leg)
+        sequence.append(leg)
+        remaining = [i for i in remaining if i not in legs]
+    return sequence[::-1]
+
+
 def do_ndot(con_list, conmmands, operators, order, batch_legs):
     """do_ndot
 
@@ -410,9 +548,13 @@ class Ncon(nn.Cell):
             The the number of each list in `con_list` should coincide with the corresponding tensor's dimensions.
             The positive indices indicate the dimensions to be contracted or summed.
             The negative indices indicate the dimensions to be keeped (as batch dimensions).
+        shapes (List[Tuple[int]]): shapes of the tensors. If given, the order of contractions is optimized for the
+            number of floating point operations and the size of intermediate tensors, and cached for
+            the same `con_list` and `shapes`. Default: ``None``, contract the positive indices from the largest one.
 
     Raises:
         ValueError: If the number of commands is not match the number of operations.
+        ValueError: If `shapes` does not match `con_list`.
 
     Supported Platforms:
         ``CPU``, ``GPU``, ``Ascend``
@@ -440,11 +582,12 @@ class Ncon(nn.Cell):
         (2, 3, 1)
     """
 
-    def __init__(self, con_list):
+    def __init__(self, con_list, shapes=None):
         super().__init__()
         self.con_list = tuple(con_list)
+        self.shapes = None if shapes is None else tuple(tuple(shape) for shape in shapes)
         con_list_copy = deepcopy(con_list)
-        self.commands, self.ops = _process_commands(con_list_copy)
+        self.commands, self.ops = _process_commands(con_list_copy, self.shapes)
         if len(self.commands) != len(self.ops):
             raise ValueError(f'{self.commands} is not match {len(self.ops)}')
 
@@ -21,7 +21,7 @@ from mindspore.numpy import tensordot
 from mindchemistry.e3 import o3
 from mindchemistry.e3.o3 import Irreps
 
-from .wigner import wigner_D
+from .wigner import get_jzj, wigner_D_list
 
 
 class SO3Embedding(nn.Cell):
@@ -61,6 +61,7 @@ class SO3Rotation:
         self.irreps_in1 = Irreps(irreps_in)
         self.irreps_out = Irreps(irreps_out)
         self.tensordot_vmap = vmap(tensordot, (0, 0, None), 0)
+        self.jzj = get_jzj(lmax)
 
     @staticmethod
     def narrow(inputs, axis, start, length):
@@ -77,7 +78,7 @@ class SO3Rotation:
         return res
 
     @staticmethod
-    def rotation_to_wigner_d_matrix(edge_rot_mat, start_lmax, end_lmax):
+    def rotation_to_wigner_d_matrix(edge_rot_mat, start_lmax, end_lmax, jzj=None):
         """
         SO3_Rotation rotation_to_wigner_d_matrix
         """
@@ -89,16 +90,15 @@ class SO3Rotation:
         gamma = ops.atan2(rvalue[..., 0, 2], rvalue[..., 0, 0])
 
         block_list = []
-        for lmax in range(start_lmax, end_lmax + 1):
-            block = wigner_D(lmax, alpha, beta, gamma).astype(ms.float32)
-            block_list.append(block)
+        for block in wigner_D_list(end_lmax, alpha, beta, gamma, jzj)[start_lmax:]:
+            block_list.append(block.astype(ms.float32))
         return block_list
 
     def set_wigner(self, rot_mat3x3):
         """
         SO3_Rotation set_wigner
         """
-        wigner = self.rotation_to_wigner_d_matrix(rot_mat3x3, 0, self.lmax)
+        wigner = self.rotation_to_wigner_d_matrix(rot_mat3x3, 0, self.lmax, self.jzj)
         wigner_inv = []
         length = len(wigner)
         for i in range(length):
@@ -123,8 +123,6 @@ class SO3Rotation:
                      mir.ir))
         rotate_data_list = []
         for data, ir in res:
-            self.tensordot_vmap(data.astype(ms.float16),
-                                wigner[ir.l].astype(ms.float16), ([1], [1]))
             rotate_data = self.tensordot_vmap(data.astype(ms.float16),
                                               wigner[ir.l].astype(ms.float16),
                                               ((1), (1))).astype(ms.float32)
@@ -3,31 +3,16 @@
 
 import logging
 import math
-import decimal
 
 import pandas as pd
 import numpy as np
 
-from .utils import construct_abs_path, get_basic_env_info
-
-decimal.getcontext().rounding = "ROUND_HALF_UP"
+from .get_mesh_edges import get_coor_idx_array
+from .utils import construct_abs_path, get_basic_env_info, is_csv_exported, save_table
 
 logger = logging.getLogger()
 
 
-def decimal_float(x):
-    dec = decimal.Decimal
-    out = dec(x).quantize(dec('0.000'))
-    return float(out)
-
-
-def get_coor_idx(x, y):
-    x = '%.3f' % x
-    y = '%.3f' % y
-    out = x + "_" + y
-    return out
-
-
 def generate_grid_node(config):
     """Calculate the grid's longitude and latitude features."""
     input_path, _, tmp_path, level, resolution = get_basic_env_info(config)
@@ -40,15 +25,15 @@ def generate_grid_node(config):
     df = df.round(3)
 
     # construct features
-    df['cos_lat'] = df['latitude'].map(lambda x: math.cos(x * math.pi / 180.0))
-    df['sin_lon'] = df['longitude'].map(lambda x: math.sin(x * math.pi / 180.0))
-    df['cos_lon'] = df['longitude'].map(lambda x: math.cos(x * math.pi / 180.0))
-    df['coor'] = df.apply(lambda row: get_coor_idx(row['longitude'], row['latitude']), axis=1)
+    df['cos_lat'] = np.cos(df['latitude'].to_numpy() * math.pi / 180.0)
+    df['sin_lon'] = np.sin(df['longitude'].to_numpy() * math.pi / 180.0)
+    df['cos_lon'] = np.cos(df['longitude'].to_numpy() * math.pi / 180.0)
+    df['coor'] = get_coor_idx_array(df['longitude'], df['latitude'])
     df.index.names = ['idx']
 
-    df.to_csv(grid_features)
+    save_table(df.reset_index(), grid_features, is_csv_exported(config))
     cols_to_convert = ['cos_lat', 'sin_lon', 'cos_lon']
     np.save(grid_features_npy, df[cols_to_convert].to_numpy())
-    logger.info(f"Calculate the longitude and latitude features. The CSV file is stored in ={grid_features}, \
+    logger.info(f"Calculate the longitude and latitude features. The table is stored in ={grid_features}, \
                 shape={df.shape}; and the npy file is stored in={grid_features_npy}, \
                     shape={df[cols_to_convert].to_numpy().shape}")
@@ -16,8 +16,9 @@ import pandas as pd
 from spherical_geometry.polygon import SphericalPolygon
 
 from .get_grid2mesh_edge import get_number_of_parallels
-from .utils import construct_abs_path, get_basic_env_info
-from .get_mesh_edges import move_neg_zero, get_coor_idx, get_length, get_z_diff, get_y_diff, get_x_diff
+from .spatial_index import locate_triangles
+from .utils import construct_abs_path, get_basic_env_info, is_csv_exported, load_table, save_table
+from .get_mesh_edges import add_edge_features, round_move_neg_zero
 
 logger = logging.getLogger()
 
@@ -83,7 +84,7 @@ def get_m2g_edge_file_tmp(config, idx):
     m2g_edge_dir, _ = get_m2g_cached_folder(config)
     filename = os.path.basename(m2g_edge)
     parts = filename.split('.')
-    new_m2g_edge_filename = '.'.join(parts[:-1]) + '_' + str(idx) + '.' + parts[-1]
+    new_m2g_edge_filename = '.'.join(parts[:-1]) + '_' + str(idx) + '.npy'
     new_m2g_edge = os.path.join(m2g_edge_dir, new_m2g_edge_filename)
     return m2g_edge_dir, new_m2g_edge
 
@@ -146,12 +147,17 @@ def generate_part_m2g_edge(config, idx, total_process, grid, polygon):
     patials_grid, _ = grid_split[idx], len(grid_split[idx])
     logger.info(f"grid splitting, grid block={idx} , shape={patials_grid.shape}")
 
-    f = np.vectorize(func_wrapper, signature='(n),()->()')
-    position = f(patials_grid, polygon)
+    # narrow down the candidate triangles with a kd-tree, scan all triangles only for the points on triangle edges
+    keys = np.array(list(polygon.keys()))
+    triangles = np.array([polygon[key][1] for key in keys]).reshape(-1, 3, 2)
+    located = locate_triangles(patials_grid, triangles)
+    position = np.where(located >= 0, keys[located], -1)
+    for miss in np.flatnonzero(located < 0):
+        position[miss] = func_wrapper(patials_grid[miss], polygon)
     valid_mesh_lon_lat = np.array([polygon[idx][1] for idx in position])
 
     m2g_edge = np.c_[patials_grid, valid_mesh_lon_lat]
-    np.savetxt(m2g_edge_file_tmp, m2g_edge, delimiter=',')
+    np.save(m2g_edge_file_tmp, m2g_edge)
     logger.info(f"The current process idx={idx} calculates the m2g edge successfully. \
                 The result is saved in ={os.path.basename(m2g_edge_file_tmp)}, m2g edge's shape={m2g_edge.shape}.")
     return m2g_edge_file_tmp
@@ -161,8 +167,8 @@ def generate_mesh2grid_edge_features(config, idx, m2g_edge_file):
     """Calculate grid2mesh edge features"""
     logger.info("The current process idx = {} starts to calculate m2g edge features. "
                 "The calculation input file = {}. Please wait.".format(idx, os.path.basename(m2g_edge_file)))
-    edge_df = pd.read_csv(m2g_edge_file, header=None,
-                          names=["grid_lon", "grid_lat", "m1_x", "m1_y", "m2_x", "m2_y", "m3_x", "m3_y"]).to_numpy()
+    # columns: grid_lon, grid_lat, m1_x, m1_y, m2_x, m2_y, m3_x, m3_y
+    edge_df = np.load(m2g_edge_file)
 
     # Extract the m1_x, m1_y, m2_x, m2_y, m3_x, m3_y columns separately using the array slice operation.
     m1 = edge_df[:, [2, 3, 0, 1]]
@@ -173,25 +179,13 @@ def generate_mesh2grid_edge_features(config, idx, m2g_edge_file):
     edge_df = np.vstack([m1, m2, m3])
     edge_df = pd.DataFrame(edge_df, columns=['mesh_lon', 'mesh_lat', 'grid_lon', 'grid_lat'])
 
-    edge_df = edge_df.round(3)
-    edge_df = edge_df.applymap(move_neg_zero)
+    edge_df = round_move_neg_zero(edge_df)
     edge_df = edge_df.drop_duplicates(subset=['mesh_lon', 'mesh_lat', 'grid_lon', 'grid_lat'], keep='first')
     edge_df = edge_df.reset_index(drop=True)
-
-    edge_df['idx'] = edge_df.index
-    edge_df['sender'] = edge_df.apply(lambda row: get_coor_idx(row['mesh_lon'], row['mesh_lat']), axis=1)
-    edge_df['receiver'] = edge_df.apply(lambda row: get_coor_idx(row['grid_lon'], row['grid_lat']), axis=1)
-    edge_df['length'] = edge_df.apply(lambda row: get_length(row['mesh_lon'], row['mesh_lat'],
-                                                             row['grid_lon'], row['grid_lat']), axis=1)
-    edge_df['diff_x'] = edge_df.apply(lambda row: get_x_diff(row['mesh_lon'], row['mesh_lat'],
-                                                             row['grid_lon'], row['grid_lat']), axis=1)
-    edge_df['diff_y'] = edge_df.apply(lambda row: get_y_diff(row['mesh_lon'], row['mesh_lat'],
-                                                             row['grid_lon'], row['grid_lat']), axis=1)
-    edge_df['diff_z'] = edge_df.apply(lambda row: get_z_diff(row['mesh_lon'], row['mesh_lat'],
-                                                             row['grid_lon'], row['grid_lat']), axis=1)
+    edge_df = add_edge_features(edge_df, 'mesh_lon', 'mesh_lat', 'grid_lon', 'grid_lat')
 
     _, m2g_edge_feats = get_m2g_edge_features_file_tmp(config, idx)
-    edge_df.to_csv(m2g_edge_feats)
+    save_table(edge_df, m2g_edge_feats)
     logger.info(f"The m2g edge features calculated successfully by the current process idx={idx}.\
                 The result is saved in ={os.path.basename(m2g_edge_feats)}, \
                     m2g edge's shape={edge_df.shape}.")
@@ -202,18 +196,15 @@ def merge_m2g_cached_edges(config):
     _, _, tmp_path, level, resolution = get_basic_env_info(config)
     m2g_edge = construct_abs_path(tmp_path, config["mesh2grid_edge_feats"], level, resolution)
 
-    final_pd = pd.DataFrame()
     _, m2g_edge_features_dir = get_m2g_cached_folder(config)
-    for file in os.listdir(m2g_edge_features_dir):
-        filename = os.path.join(m2g_edge_features_dir, file)
-        cur_m2g = pd.read_csv(filename)
-        final_pd = pd.concat([final_pd, cur_m2g], ignore_index=True).reset_index(drop=True)
+    edge_dfs = [load_table(os.path.join(m2g_edge_features_dir, file)) for file in os.listdir(m2g_edge_features_dir)]
+    final_pd = pd.concat(edge_dfs, ignore_index=True).reset_index(drop=True)
 
     final_pd = final_pd.drop_duplicates(subset=['mesh_lon', 'mesh_lat', 'grid_lon', 'grid_lat'], keep='first')
     final_pd = final_pd.reset_index(drop=True)
     final_pd['idx'] = final_pd.index
 
-    final_pd.to_csv(m2g_edge)
+    save_table(final_pd, m2g_edge, is_csv_exported(config))
     delete_m2g_cached_folder(config)
     logger.info(f"The m2g edge & features are successfully generated and saved in {m2g_edge}. \
                 m2g edge's shape={final_pd.shape}.")
@@ -252,12 +243,15 @@ def generate_m2g_edge(config):
     # file cache cleanup
     clean_cached_dir(config)
 
-    # multiprocess parallel computing
-    pool = Pool(parallelism)
-    process_lst = list(range(parallelism))
-    patial_func = partial(worker_helper, total_process=parallelism, config=config)
-    pool.map(patial_func, process_lst)
-    pool.close()
-    pool.join()
+    # the kd-tree search is fast enough to run in the main process, the multiprocess split is optional
+    if parallelism == 1:
+        worker_helper(0, 1, config)
+    else:
+        pool = Pool(parallelism)
+        process_lst = list(range(parallelism))
+        patial_func = partial(worker_helper, total_process=parallelism, config=config)
+        pool.map(patial_func, process_lst)
+        pool.close()
+        pool.join()
 
     merge_m2g_cached_edges(config)
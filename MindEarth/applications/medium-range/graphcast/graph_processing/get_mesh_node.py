@@ -10,25 +10,12 @@ import os
 import numpy as np
 import pandas as pd
 
-from .utils import construct_abs_path, get_basic_env_info
+from .get_mesh_edges import get_coor_idx_array, round_move_neg_zero
+from .utils import construct_abs_path, get_basic_env_info, is_csv_exported, save_table
 
 logger = logging.getLogger()
 
 
-def get_coor_idx(x, y):
-    x = '%.3f' % x
-    y = '%.3f' % y
-    out = x + "_" + y
-    return out
-
-
-def move_neg_zero(x):
-    # -0 -> 0
-    if str(x) == "-0.0":
-        return -x
-    return x
-
-
 def generate_mesh_node(config):
     """Calculate mesh node features."""
     input_path, _, tmp_path, level, resolution = get_basic_env_info(config)
@@ -43,18 +30,17 @@ def generate_mesh_node(config):
 
     mesh_node_array = np.load(mesh_node_file)
     df = pd.DataFrame(data=mesh_node_array, columns=['mesh_lon', 'mesh_lat'])
-    df = df.round(3)
-    df = df.applymap(move_neg_zero)
+    df = round_move_neg_zero(df)
     df = df.drop_duplicates(subset=['mesh_lon', 'mesh_lat'], keep='first')
     df = df.reset_index(drop=True)
 
     # construct features
     df['idx'] = df.index
-    df['cos_lat'] = df['mesh_lat'].map(lambda x: math.cos(x * math.pi / 180.0))
-    df['sin_lon'] = df['mesh_lon'].map(lambda x: math.sin(x * math.pi / 180.0))
-    df['cos_lon'] = df['mesh_lon'].map(lambda x: math.cos(x * math.pi / 180.0))
-    df['coor'] = df.apply(lambda row: get_coor_idx(row['mesh_lon'], row['mesh_lat']), axis=1)
-    df.to_csv(features_file)
+    df['cos_lat'] = np.cos(df['mesh_lat'].to_numpy() * math.pi / 180.0)
+    df['sin_lon'] = np.sin(df['mesh_lon'].to_numpy() * math.pi / 180.0)
+    df['cos_lon'] = np.cos(df['mesh_lon'].to_numpy() * math.pi / 180.0)
+    df['coor'] = get_coor_idx_array(df['mesh_lon'], df['mesh_lat'])
+    save_table(df, features_file, is_csv_exported(config))
     output_array = df[['cos_lat', 'sin_lon', 'cos_lon']].to_numpy()
     np.save(features_file_npy, output_array)
     logger.info(f"The mesh node features, level={level}, are calculated successfully. \
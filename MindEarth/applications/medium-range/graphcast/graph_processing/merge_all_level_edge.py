@@ -8,7 +8,7 @@ import logging
 import numpy as np
 import pandas as pd
 
-from .utils import construct_abs_path, get_basic_env_info
+from .utils import construct_abs_path, get_basic_env_info, is_csv_exported, load_table, save_table
 
 logger = logging.getLogger()
 
@@ -29,7 +29,7 @@ def merge_all_level_mesh_edge(config):
     level_features = []
     for layer in range(0, level + 1):
         mesh_edge_file = construct_abs_path(tmp_path, config["mesh_edge_features"], layer, resolution)
-        level_features.append(pd.read_csv(mesh_edge_file, header=0))
+        level_features.append(load_table(mesh_edge_file))
 
     lst = [level_edge for level_edge in level_features]
     level_edge_merged = pd.concat(lst, ignore_index=True).reset_index(drop=True)
@@ -37,7 +37,7 @@ def merge_all_level_mesh_edge(config):
 
     all_edges = level_edge_merged[['length', 'diff_x', 'diff_y', 'diff_z']].to_numpy()
     np.save(merged_edge_file_npy, all_edges)
-    level_edge_merged.to_csv(merged_edge_file)
+    save_table(level_edge_merged, merged_edge_file, is_csv_exported(config))
     logger.info(f"The mesh edges of each layer are successfully merged. \
                 The CSV result is saved in ={merged_edge_file}, \
                 shape={level_edge_merged.shape}, \
@@ -54,13 +54,13 @@ def merge_all_level_mesh_sender(config):
     level_sender = []
     for layer in range(0, level + 1):
         sender_file = construct_abs_path(tmp_path, config["mesh_sender"], layer, resolution)
-        level_sender.append(pd.read_csv(sender_file, header=0))
+        level_sender.append(load_table(sender_file))
 
     sender_merged_df = pd.concat([sender for sender in level_sender], ignore_index=True).reset_index(drop=True)
     sender_merged_df["idx"] = sender_merged_df.index
     merged_sender_idx = sender_merged_df['idx_mesh'].to_numpy()
 
-    sender_merged_df.to_csv(merged_all_sender)
+    save_table(sender_merged_df, merged_all_sender, is_csv_exported(config))
     np.save(merged_all_sender_npy, merged_sender_idx)
     logger.info(f"The mesh senders of each layer are successfully merged. \
                 The CSV result is saved in the ={merged_all_sender}, \
@@ -76,14 +76,14 @@ def merge_all_level_mesh_receiver(config):
     level_receiver = []
     for layer in range(0, level + 1):
         receiver_file = construct_abs_path(tmp_path, config["mesh_receiver"], layer, resolution)
-        level_receiver.append(pd.read_csv(receiver_file, header=0))
+        level_receiver.append(load_table(receiver_file))
 
     receiver_merged_df = pd.concat([receiver for receiver in level_receiver], ignore_index=True).reset_index(drop=True)
     receiver_merged_df["idx"] = receiver_merged_df.index
     merged_receiver_idx = receiver_merged_df['idx_mesh'].to_numpy()
 
     np.save(merged_all_receiver_npy, merged_receiver_idx)
-    receiver_merged_df.to_csv(merged_all_receiver)
+    save_table(receiver_merged_df, merged_all_receiver, is_csv_exported(config))
     logger.info(f"The mesh receiver of each layer is successfully merged. \
                 The result is saved in ={merged_all_receiver}, \
                 shape={receiver_merged_df.shape}. The npy result is saved in ={merged_all_receiver_npy},\
@@ -6,9 +6,7 @@ normalization m2m/g2m/m2g
 import logging
 
 import numpy as np
-import pandas as pd
-
-from .utils import construct_abs_path, get_basic_env_info
+from .utils import construct_abs_path, get_basic_env_info, load_table
 
 logger = logging.getLogger()
 
@@ -17,7 +15,7 @@ def m2m_max_edge(config):
     """max edge of mesh to mesh"""
     _, _, tmp_path, level, resolution = get_basic_env_info(config)
     m2m_file = construct_abs_path(tmp_path, config["mesh_edge_features_merged_csv"], level, resolution)
-    edge_features = pd.read_csv(m2m_file, header=0, usecols=["length"])
+    edge_features = load_table(m2m_file, usecols=["length"])
     return edge_features["length"].max()
 
 
@@ -25,7 +23,7 @@ def g2m_max_edge(config):
     """max edge of grid to mesh"""
     _, _, tmp_path, level, resolution = get_basic_env_info(config)
     g2m_file = construct_abs_path(tmp_path, config["grid2mesh_edge_features"], level, resolution)
-    edge_features = pd.read_csv(g2m_file, header=0, usecols=["length"])
+    edge_features = load_table(g2m_file, usecols=["length"])
     return edge_features["length"].max()
 
 
@@ -33,7 +31,7 @@ def m2g_max_edge(config):
     """max edge of mesh to grid"""
     _, _, tmp_path, level, resolution = get_basic_env_info(config)
     m2g_file = construct_abs_path(tmp_path, config["mesh2grid_edge_feats"], level, resolution)
-    edge_features = pd.read_csv(m2g_file, header=0, usecols=["length"])
+    edge_features = load_table(m2g_file, usecols=["length"])
     return edge_features["length"].max()
 
 
@@ -66,8 +64,7 @@ def normalize_g2m_edge(config):
     g2m_edge_file = construct_abs_path(tmp_path, config["grid2mesh_edge_features"], level, resolution)
     normal_file = construct_abs_path(tmp_path, config["g2m_edge_normalization"], level, resolution)
 
-    # usecols=(13,14,15,16) ==> length,diff_x,diff_y,diff_z
-    g2m_edge = np.loadtxt(g2m_edge_file, usecols=(13, 14, 15, 16), delimiter=",", skiprows=1)
+    g2m_edge = load_table(g2m_edge_file, usecols=["length", "diff_x", "diff_y", "diff_z"]).to_numpy()
     g2m_edge = g2m_edge / g2m_max_length
     np.save(normal_file, g2m_edge)
     logger.info(f"Normalization of g2m succeeded, results saved in ={normal_file}, shape={g2m_edge.shape}")
@@ -80,8 +77,7 @@ def normalize_m2g_edge(config):
     _, _, tmp_path, level, resolution = get_basic_env_info(config)
     m2g_edge_file = construct_abs_path(tmp_path, config["mesh2grid_edge_feats"], level, resolution)
     normal_file = construct_abs_path(tmp_path, config["m2g_edge_normalization"], level, resolution)
-    # usecols=(9,10,11,12) ==> length,diff_x,diff_y,diff_z
-    m2g_edge = np.loadtxt(m2g_edge_file, usecols=(9, 10, 11, 12), delimiter=",", skiprows=1)
+    m2g_edge = load_table(m2g_edge_file, usecols=["length", "diff_x", "diff_y", "diff_z"]).to_numpy()
     m2g_edge = m2g_edge / m2g_max_length
     np.save(normal_file, m2g_edge)
     logger.info(f"Normalize m2g successfully, results saved in ={normal_file}, shape={m2g_edge.shape}")
@@ -0,0 +1,87 @@
+"""
+Spatial index helpers for grid2mesh and mesh2grid edge construction.
+"""
+#pylint: disable=W1203, W1202
+
+import logging
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+logger = logging.getLogger()
+
+
+def lon_lat_to_unit_xyz(lon, lat):
+    """Converts longitude and latitude (in degrees) to xyz coordinates on the unit sphere."""
+    lat, lon = np.deg2rad(lat), np.deg2rad(lon)
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def radius_query_edges(sender_xyz, receiver_xyz, radius):
+    """
+    Find all (sender, receiver) pairs whose euclidean distance is strictly less than `radius`.
+
+    Both point sets are indexed with a KD-tree and the pairs are collected in one pass. The result is sorted by
+    receiver and then by sender, which matches the order of the brute force search over receivers.
+
+    Args:
+        sender_xyz (numpy.ndarray): sender coordinates with shape of (num_senders, 3).
+        receiver_xyz (numpy.ndarray): receiver coordinates with shape of (num_receivers, 3).
+        radius (float): the query radius, in the same unit as the coordinates.
+
+    Returns:
+        Tuple of numpy.ndarray, the sender index, the receiver index and the distance of each edge.
+    """
+    sender_tree = cKDTree(sender_xyz)
+    receiver_tree = cKDTree(receiver_xyz)
+    pairs = receiver_tree.sparse_distance_matrix(sender_tree, radius, output_type='ndarray')
+    pairs = pairs[pairs['v'] < radius]
+    order = np.lexsort((pairs['j'], pairs['i']))
+    pairs = pairs[order]
+    return pairs['j'].astype(np.int64), pairs['i'].astype(np.int64), pairs['v']
+
+
+def _contains(triangles, points, eps=1e-12):
+    """Checks whether each point lies inside the matching spherical triangle, boundary included."""
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    orientation = np.sign(np.einsum('ij,ij->i', np.cross(a, b), c))
+    side_ab = np.einsum('ij,ij->i', np.cross(a, b), points) * orientation
+    side_bc = np.einsum('ij,ij->i', np.cross(b, c), points) * orientation
+    side_ca = np.einsum('ij,ij->i', np.cross(c, a), points) * orientation
+    same_hemisphere = np.einsum('ij,ij->i', a + b + c, points) > 0
+    return (side_ab >= -eps) & (side_bc >= -eps) & (side_ca >= -eps) & same_hemisphere
+
+
+def locate_triangles(points_lon_lat, triangles_lon_lat, num_candidates=8):
+    """
+    Locate the spherical triangle which contains each point.
+
+    The triangle centroids are indexed with a KD-tree and only the `num_candidates` nearest triangles of every point
+    are tested. Points on a shared edge or vertex are contained by several candidates, they are reported as
+    unresolved so that the caller can apply its own tie-breaking rule.
+
+    Args:
+        points_lon_lat (numpy.ndarray): points with shape of (num_points, 2), in degrees.
+        triangles_lon_lat (numpy.ndarray): triangle vertices with shape of (num_triangles, 3, 2), in degrees.
+        num_candidates (int): number of nearest triangles tested for each point. Default: 8.
+
+    Returns:
+        numpy.ndarray, index of the containing triangle of each point, -1 if the point is not contained by exactly
+        one of the candidates.
+    """
+    points = lon_lat_to_unit_xyz(points_lon_lat[:, 0], points_lon_lat[:, 1])
+    triangles = lon_lat_to_unit_xyz(triangles_lon_lat[..., 0], triangles_lon_lat[..., 1])
+    centroids = triangles.mean(axis=1)
+    centroids /= np.linalg.norm(centroids, axis=1, keepdims=True)
+
+    num_candidates = min(num_candidates, len(triangles))
+    _, candidates = cKDTree(centroids).query(points, k=num_candidates)
+    candidates = candidates.reshape(len(points), num_candidates)
+
+    inside = _contains(triangles[candidates.ravel()],
+                       np.repeat(points, num_candidates, axis=0)).reshape(candidates.shape)
+    located = np.where(inside.sum(axis=1) == 1, candidates[np.arange(len(points)), inside.argmax(axis=1)], -1)
+    logger.info(f"locate {len(points)} points in {len(triangles)} triangles, "
+                f"{np.count_nonzero(located == -1)} points are unresolved.")
+    return located
@@ -5,8 +5,7 @@ Associate the node and edge of the mesh.
 
 import logging
 
-import pandas as pd
-from .utils import construct_abs_path, get_basic_env_info
+from .utils import construct_abs_path, get_basic_env_info, is_csv_exported, load_table, save_table
 
 logger = logging.getLogger()
 
@@ -20,13 +19,13 @@ def union_edge_grid_m2m(config):
 
     # Node at the M[level] layer
     mesh_features = construct_abs_path(tmp_path, config["mesh_node_features"], level, resolution)
-    mesh_df = pd.read_csv(mesh_features, header=0, usecols=["idx", "mesh_lon", "mesh_lat", "coor"], index_col="coor")
+    mesh_df = load_table(mesh_features, usecols=["idx", "mesh_lon", "mesh_lat", "coor"], index_col="coor")
 
     for layer in range(0, level + 1):
         # M[0]-M[layer] edge of each layer
         edge_file = construct_abs_path(tmp_path, config["mesh_edge_features"], layer, resolution)
-        edge_df = pd.read_csv(edge_file, header=0, usecols=["idx", "mesh_lon1", "mesh_lat1", "mesh_lon2", "mesh_lat2",
-                                                            "sender", "receiver"])
+        edge_df = load_table(edge_file, usecols=["idx", "mesh_lon1", "mesh_lat1", "mesh_lon2", "mesh_lat2",
+                                                       "sender", "receiver"])
 
         # Association of mesh edges and vertices on the sender attribute.
         sender_join = edge_df.join(mesh_df, lsuffix='_l', rsuffix='_r', on="sender")
@@ -34,7 +33,7 @@ def union_edge_grid_m2m(config):
         del sender_join['mesh_lat']
         sender_join.rename(columns={'idx_l': 'idx', 'idx_r': 'idx_mesh'}, inplace=True)
         sender_file = construct_abs_path(tmp_path, config["mesh_sender"], layer, resolution)
-        sender_join.to_csv(sender_file)
+        save_table(sender_join, sender_file, is_csv_exported(config))
 
         # Association of mesh edges and vertices on the receiver attribute.
         receiver_join = edge_df.join(mesh_df, lsuffix='_l', rsuffix='_r', on="receiver")
@@ -42,7 +41,7 @@ def union_edge_grid_m2m(config):
         del receiver_join['mesh_lat']
         receiver_join.rename(columns={'idx_l': 'idx', 'idx_r': 'idx_mesh'}, inplace=True)
         receiver_file = construct_abs_path(tmp_path, config["mesh_receiver"], layer, resolution)
-        receiver_join.to_csv(receiver_file)
+        save_table(receiver_join, receiver_file, is_csv_exported(config))
         logger.info(
             f"The node and edge of the mesh are successfully associated. \
                 The level is {layer}. The result is saved in {sender_file} and {receiver_file}. \
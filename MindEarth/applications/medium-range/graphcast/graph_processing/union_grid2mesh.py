@@ -5,10 +5,9 @@ Associate the edges of g2m with the vertices of grid and mesh
 
 import logging
 
-import pandas as pd
 import numpy as np
 
-from .utils import construct_abs_path, get_basic_env_info
+from .utils import construct_abs_path, get_basic_env_info, is_csv_exported, load_table, save_table
 
 logger = logging.getLogger()
 
@@ -25,29 +24,29 @@ def union_g2m(config):
     g2m_receiver = construct_abs_path(tmp_path, config["g2m_receiver"], level, resolution)
     g2m_receiver_npy = construct_abs_path(tmp_path, config["g2m_receiver_npy"], level, resolution)
 
-    grid_df = pd.read_csv(grid_features, header=0, usecols=["idx", "longitude", "latitude", "coor"], index_col="coor")
-    g2m_df = pd.read_csv(g2m_edge_features, header=0, usecols=["idx", "grid_lon", "grid_lat", "mesh_lon", "mesh_lat",
-                                                               "sender", "receiver"])
+    grid_df = load_table(grid_features, usecols=["idx", "longitude", "latitude", "coor"], index_col="coor")
+    g2m_df = load_table(g2m_edge_features, usecols=["idx", "grid_lon", "grid_lat", "mesh_lon", "mesh_lat",
+                                                          "sender", "receiver"])
     sender_join = g2m_df.join(grid_df, lsuffix='_l', rsuffix='_r', on="sender")
 
     del sender_join['longitude']
     del sender_join['latitude']
     sender_join.rename(columns={'idx_l': 'idx', 'idx_r': 'idx_grid'}, inplace=True)
-    sender_join.to_csv(g2m_sender)
+    save_table(sender_join, g2m_sender, is_csv_exported(config))
     g2m_sender_idx = sender_join['idx_grid'].to_numpy()
     np.save(g2m_sender_npy, g2m_sender_idx)
     logger.info("The union g2m is successful. The sender csv result is saved in ={}, shape={};."
                 "npy results are saved in ={}, shape={}".format(g2m_sender, sender_join.shape,
                                                                 g2m_sender_npy, g2m_sender_idx.shape))
 
-    mesh_df = pd.read_csv(mesh_features, header=0, usecols=["idx", "mesh_lon", "mesh_lat", "coor"],
-                          index_col="coor")
+    mesh_df = load_table(mesh_features, usecols=["idx", "mesh_lon", "mesh_lat", "coor"],
+                         index_col="coor")
     receiver_join = g2m_df.join(mesh_df, lsuffix='_l', rsuffix='_r', on="receiver")
     del receiver_join['mesh_lon_r']
     del receiver_join['mesh_lat_r']
     receiver_join.rename(columns={'idx_l': 'idx', 'mesh_lon_l': 'mesh_lon',
                                   'mesh_lat_l': 'mesh_lat', 'idx_r': 'idx_mesh'}, inplace=True)
-    receiver_join.to_csv(g2m_receiver)
+    save_table(receiver_join, g2m_receiver, is_csv_exported(config))
     g2m_receiver_idx = receiver_join['idx_mesh'].to_numpy()
     np.save(g2m_receiver_npy, g2m_receiver_idx)
     logger.info(f"union g2m is successful. The receiver result is saved in ={g2m_receiver}, \
@@ -5,10 +5,9 @@ Associate the edges of m2g with the vertices of grid and mesh.
 
 import logging
 
-import pandas as pd
 import numpy as np
 
-from .utils import construct_abs_path, get_basic_env_info
+from .utils import construct_abs_path, get_basic_env_info, is_csv_exported, load_table, save_table
 
 logger = logging.getLogger()
 
@@ -24,28 +23,28 @@ def union_m2g(config):
     m2g_receiver = construct_abs_path(tmp_path, config["m2g_receiver"], level, resolution)
     m2g_receiver_npy = construct_abs_path(tmp_path, config["m2g_receiver_npy"], level, resolution)
 
-    mesh_df = pd.read_csv(mesh_features, header=0, usecols=["idx", "mesh_lon", "mesh_lat", "coor"], index_col="coor")
-    m2g_df = pd.read_csv(m2g_features, header=0,
-                         usecols=["idx", "mesh_lon", "mesh_lat", "grid_lon", "grid_lat", "sender", "receiver"])
+    mesh_df = load_table(mesh_features, usecols=["idx", "mesh_lon", "mesh_lat", "coor"], index_col="coor")
+    m2g_df = load_table(m2g_features,
+                        usecols=["idx", "mesh_lon", "mesh_lat", "grid_lon", "grid_lat", "sender", "receiver"])
     sender_join = m2g_df.join(mesh_df, lsuffix='_l', rsuffix='_r', on="sender")
     del sender_join['mesh_lon_r']
     del sender_join['mesh_lat_r']
     sender_join.rename(columns={'idx_l': 'idx', 'mesh_lon_l': 'mesh_lon',
                                 'mesh_lat_l': 'mesh_lat', 'idx_r': 'idx_mesh'}, inplace=True)
-    sender_join.to_csv(m2g_sender)
+    save_table(sender_join, m2g_sender, is_csv_exported(config))
     m2g_sender_idx = sender_join['idx_mesh'].to_numpy()
     np.save(m2g_sender_npy, m2g_sender_idx)
     logger.info("The union m2g is successful. The sender csv result is saved in ={}, shape={};"
                 "npy results are saved in ={}, shape={}".format(m2g_sender, sender_join.shape,
                                                                 m2g_sender_npy, m2g_sender_idx.shape))
 
-    grid_df = pd.read_csv(grid_features, header=0, usecols=["idx", "longitude", "latitude", "coor"], index_col="coor")
+    grid_df = load_table(grid_features, usecols=["idx", "longitude", "latitude", "coor"], index_col="coor")
     receiver_join = m2g_df.join(grid_df, lsuffix='_l', rsuffix='_r', on="receiver")
     del receiver_join['longitude']
     del receiver_join['latitude']
     receiver_join.rename(columns={'idx_l': 'idx', 'idx_r': 'idx_grid'}, inplace=True)
 
-    receiver_join.to_csv(m2g_receiver)
+    save_table(receiver_join, m2g_receiver, is_csv_exported(config))
     m2g_receiver_idx = receiver_join['idx_grid'].to_numpy()
     np.save(m2g_receiver_npy, m2g_receiver_idx)
     logger.info(f"union m2g is successful. The receiver result is saved in ={m2g_receiver}, \
@@ -3,11 +3,15 @@ utils function
 """
 #pylint: disable=W1203, W1202
 
+import json
 import logging
 import os
 import re
 import shutil
 
+import numpy as np
+import pandas as pd
+
 logger = logging.getLogger()
 
 
@@ -26,6 +30,10 @@ def get_basic_env_info(config):
     return input_path, output_path, tmp_path, level, resolution
 
 
+def is_csv_exported(config):
+    return config.get("export_csv", False)
+
+
 def obtain_output_tmp_relative_path(input_path):
     input_path = input_path.rstrip('/')
     parent_path = os.path.abspath(os.path.join(input_path, os.path.pardir))
@@ -47,3 +55,58 @@ def make_dir(config):
             os.mkdir(tmp_path)
     except OSError as e:
         logger.info("mkdir dir={} or {} failed. error={}".format(output_path, tmp_path, e))
+
+
+def get_table_dir(path):
+    """The binary table of `xxx.csv` is stored in the directory `xxx.table`."""
+    return os.path.splitext(path)[0] + ".table"
+
+
+def save_table(df, path, export_csv=False):
+    """
+    Save a DataFrame as a binary columnar table: one npy file per column plus a json manifest.
+    String columns are stored as fixed width unicode arrays, so every column can be memory-mapped.
+    The CSV file at `path` is only written if `export_csv` is True.
+    """
+    table_dir = get_table_dir(path)
+    if os.path.exists(table_dir):
+        shutil.rmtree(table_dir, True)
+    os.makedirs(table_dir)
+
+    manifest = {"num_rows": len(df), "columns": []}
+    for idx, name in enumerate(df.columns):
+        values = df[name].to_numpy()
+        if values.dtype == object:
+            values = values.astype(str)
+        filename = "col_{}.npy".format(idx)
+        np.save(os.path.join(table_dir, filename), values)
+        manifest["columns"].append({"name": str(name), "dtype": values.dtype.str, "file": filename})
+    with open(os.path.join(table_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    if export_csv:
+        df.to_csv(path)
+    return table_dir
+
+
+def load_table_columns(path, usecols=None, mmap_mode="r"):
+    """Load the columns of a binary table as a dict of (memory-mapped) numpy arrays."""
+    table_dir = get_table_dir(path)
+    with open(os.path.join(table_dir, "manifest.json"), "r") as f:
+        manifest = json.load(f)
+
+    columns = {}
+    for column in manifest["columns"]:
+        if usecols is not None and column["name"] not in usecols:
+            continue
+        columns[column["name"]] = np.load(os.path.join(table_dir, column["file"]), mmap_mode=mmap_mode)
+    return columns
+
+
+def load_table(path, usecols=None, index_col=None):
+    """Load a binary table saved by `save_table` as a DataFrame."""
+    columns = load_table_columns(path, usecols)
+    df = pd.DataFrame({name: np.asarray(values) for name, values in columns.items()})
+    if index_col is not None:
+        df = df.set_index(index_col)
+    return df
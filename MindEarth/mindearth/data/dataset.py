@@ -15,7 +15,9 @@
 '''Module providing dataset functions'''
 import os
 import abc
+import collections
 import datetime
+import json
 import random
 
 import h5py
@@ -88,6 +90,7 @@ TARGET_ATMOSPHERIC_NO_W_VARS = (
 
 FEATURE_DICT = {'Z500': (7, 0), 'T850': (10, 2), 'U10': (-3, 0), 'T2M': (-1, 0)}
 SIZE_DICT = {0.25: [721, 1440], 0.5: [360, 720], 1.4: [128, 256]}
+_STATISTIC_NAMES = ('mean_pressure_level', 'std_pressure_level', 'mean_surface', 'std_surface')
 
 
 class Data:
@@ -133,6 +136,17 @@ class Era5Data(Data):
         run_mode (str, optional): whether the dataset is used for training, evaluation or testing. Supports [“train”,
             “test”, “valid”]. Default: 'train'.
 
+    Note:
+        Consecutive samples share `t_in + t_out - 1` frames. Set `frame_cache_size` in `data_params` to the maximum
+        number of bytes of decoded and normalized frames kept in an LRU cache, so that shared frames are loaded once.
+        The frame cache is disabled by default. The per-year static files are loaded once and kept resident.
+        Use `cache_info` to get the hit counters of the frame cache.
+
+        `convert_to_memmap` writes the frames of the split, de-scaled, normalized and already in the final layout,
+        to a memory-mapped store. Set `memmap_dir` in `data_params` to the same directory to read samples from the
+        store, `__getitem__` then only slices the memory-mapped file. The normalization statistics are saved with the
+        store and loaded from it, so subclasses which normalize other data can still use them.
+
     Supported Platforms:
         ``Ascend`` ``GPU``
 
@@ -190,8 +204,6 @@ class Era5Data(Data):
         validator.check_value_type("test_dir", self.test_dir, [str, none_type])
         validator.check_value_type("valid_dir", self.valid_dir, [str, none_type])
 
-        self._get_statistic()
-
         self.run_mode = run_mode
         self.t_in = data_params.get('t_in')
         self.h_size = data_params.get('h_size')
@@ -213,6 +225,14 @@ class Era5Data(Data):
         if self.patch:
             self.patch_size = data_params.get('patch_size')
 
+        self.frame_cache_size = data_params.get('frame_cache_size', 0)
+        validator.check_non_negative_int(self.frame_cache_size, "frame_cache_size")
+        self._frame_cache = collections.OrderedDict()
+        self._frame_cache_bytes = 0
+        self._frame_cache_hits = 0
+        self._frame_cache_misses = 0
+        self._static_cache = {}
+
         if run_mode == 'train':
             self.t_out = data_params.get('t_out_train')
             self.path = self.train_dir
@@ -240,8 +260,19 @@ class Era5Data(Data):
             self.interval = self.test_interval
             self.start_date = datetime.datetime(self.test_period[0], 1, 1, 0, 0, 0)
 
+        self.memmap_dir = data_params.get('memmap_dir')
+        if self.memmap_dir:
+            self._open_memmap()
+        else:
+            self._get_statistic()
+            self._preload_static()
+
     def __len__(self):
-        if self.run_mode == 'train':
+        if self.memmap_dir:
+            length = (self._memmap_meta['num_frames'] * self.data_frequency -
+                      (self.t_out + self.t_in) * self.pred_lead_time) // self.interval
+
+        elif self.run_mode == 'train':
             self.train_len = self._get_file_count(self.train_dir, self.train_period)
             length = (self.train_len * self.data_frequency -
                       (self.t_out + self.t_in) * self.pred_lead_time) // self.train_interval
@@ -258,6 +289,9 @@ class Era5Data(Data):
         return length
 
     def __getitem__(self, idx):
+        if self.memmap_dir:
+            return self._get_memmap_item(idx)
+
         inputs_lst = []
         inputs_surface_lst = []
         label_lst = []
@@ -267,32 +301,14 @@ class Era5Data(Data):
         for t in range(self.t_in):
             cur_input_data_idx = idx + t * self.pred_lead_time
             input_date, year_name = get_datapath_from_date(self.start_date, cur_input_data_idx.item())
-            x = np.load(os.path.join(self.path, input_date))[:, :, :self.h_size].astype(np.float32)
-            x_surface = np.load(os.path.join(self.surface_path,
-                                             input_date))[:, :self.h_size].astype(np.float32)
-            x_static = np.load(os.path.join(self.static_path, year_name)).astype(np.float32)
-            x_surface_static = np.load(os.path.join(self.static_surface_path,
-                                                    year_name)).astype(np.float32)
-            x = self._get_origin_data(x, x_static)
-            x_surface = self._get_origin_data(x_surface, x_surface_static)
-            x, x_surface = self._normalize(x, x_surface)
+            x, x_surface = self._get_frame(input_date, year_name)
             inputs_lst.append(x)
             inputs_surface_lst.append(x_surface)
 
         for t in range(self.t_out):
             cur_label_data_idx = idx + (self.t_in + t) * self.pred_lead_time
             label_date, year_name = get_datapath_from_date(self.start_date, cur_label_data_idx.item())
-            label = np.load(os.path.join(self.path, label_date))[:, :, :self.h_size].astype(np.float32)
-            label_surface = np.load(os.path.join(self.surface_path,
-                                                 label_date))[:, :self.h_size].astype(np.float32)
-            label_static = np.load(os.path.join(self.static_path,
-                                                year_name)).astype(np.float32)
-            label_surface_static = np.load(os.path.join(self.static_surface_path,
-                                                        year_name)).astype(np.float32)
-            label = self._get_origin_data(label, label_static)
-            label_surface = self._get_origin_data(label_surface, label_surface_static)
-            label, label_surface = self._normalize(label, label_surface)
-
+            label, label_surface = self._get_frame(label_date, year_name)
             label_lst.append(label)
             label_surface_lst.append(label_surface)
 
@@ -302,6 +318,180 @@ class Era5Data(Data):
         label_surface = np.squeeze(np.stack(label_surface_lst, axis=0), axis=1).astype(np.float32)
         return self._process_fn(x, x_surface, label, label_surface)
 
+    def cache_info(self):
+        """
+        Get the statistics of the frame cache.
+
+        Returns:
+            dict, the hits, misses, hit rate, number of cached frames and cached bytes of the frame cache, and the
+            number of resident static files.
+        """
+        total = self._frame_cache_hits + self._frame_cache_misses
+        return {'hits': self._frame_cache_hits,
+                'misses': self._frame_cache_misses,
+                'hit_rate': self._frame_cache_hits / total if total else 0.0,
+                'frames': len(self._frame_cache),
+                'bytes': self._frame_cache_bytes,
+                'static_files': len(self._static_cache)}
+
+    def convert_to_memmap(self, memmap_dir):
+        """
+        Convert the frames of the current split into a memory-mapped store under `memmap_dir/run_mode`.
+
+        Every frame is de-scaled, normalized, cast to float32 and transformed to the layout of the model inputs:
+        (h_size * w_size, feature_dims) for grid nodes, or (feature_dims, h_size, w_size) in patch mode. In patch mode
+        the training labels are split into patches, they are stored in a second file with the patch layout.
+        The normalization statistics are saved in `statistic.npz` of the store.
+
+        Args:
+            memmap_dir (str): the root directory of the memory-mapped store.
+
+        Returns:
+            str, the directory of the memory-mapped store of the current split.
+        """
+        if self.memmap_dir:
+            raise ValueError("Era5Data reading from a memory-mapped store can not be converted again.")
+        period = {'train': self.train_period, 'valid': self.valid_period}.get(self.run_mode, self.test_period)
+        num_frames = self._get_file_count(self.path, period)
+        store_dir = os.path.join(memmap_dir, self.run_mode)
+        if not os.path.exists(store_dir):
+            os.makedirs(store_dir)
+
+        inputs_store, labels_store = None, None
+        for k in range(num_frames):
+            date, year_name = get_datapath_from_date(self.start_date, k * self.data_frequency)
+            frame = self._frame_layout(*self._load_frame(date, year_name))
+            if inputs_store is None:
+                inputs_store = np.lib.format.open_memmap(os.path.join(store_dir, 'inputs.npy'), mode='w+',
+                                                         dtype=np.float32, shape=(num_frames,) + frame.shape)
+            inputs_store[k] = frame
+            if self.patch and self.run_mode == 'train':
+                label_frame = self._patch(frame[None], frame.shape[1:], self.patch_size, frame.shape[0])
+                if labels_store is None:
+                    labels_store = np.lib.format.open_memmap(os.path.join(store_dir, 'labels.npy'), mode='w+',
+                                                             dtype=np.float32,
+                                                             shape=(num_frames,) + label_frame.shape)
+                labels_store[k] = label_frame
+
+        for store in (inputs_store, labels_store):
+            if store is not None:
+                store.flush()
+        np.savez(os.path.join(store_dir, 'statistic.npz'), **{name: getattr(self, name) for name in _STATISTIC_NAMES})
+        meta = {'num_frames': num_frames,
+                'start_date': self.start_date.isoformat(),
+                'data_frequency': self.data_frequency,
+                'h_size': self.h_size,
+                'w_size': self.w_size,
+                'patch': bool(self.patch),
+                'patch_size': self.patch_size if self.patch else None,
+                'labels_file': 'labels.npy' if labels_store is not None else 'inputs.npy'}
+        with open(os.path.join(store_dir, 'meta.json'), 'w') as f:
+            json.dump(meta, f, indent=2)
+        return store_dir
+
+    def _frame_layout(self, x, x_surface):
+        """Transform one normalized frame to the layout of the model inputs."""
+        _, level_size, _, _, feature_size = x.shape
+        surface_size = x_surface.shape[-1]
+        if self.patch:
+            h_size = self.h_size - self.h_size % self.patch_size
+            x = x[:, :, :h_size].transpose((0, 4, 1, 2, 3)).reshape(level_size * feature_size, h_size, self.w_size)
+            x_surface = x_surface[:, :h_size].transpose((0, 3, 1, 2)).reshape(surface_size, h_size, self.w_size)
+            return np.concatenate([x, x_surface], axis=0)
+        x = x.transpose((0, 2, 3, 4, 1)).reshape(self.h_size * self.w_size, level_size * feature_size)
+        x_surface = x_surface.reshape(self.h_size * self.w_size, surface_size)
+        return np.concatenate([x, x_surface], axis=-1)
+
+    def _open_memmap(self):
+        """Open the memory-mapped store of the current split and check it matches the data parameters."""
+        store_dir = os.path.join(self.memmap_dir, self.run_mode)
+        with open(os.path.join(store_dir, 'meta.json'), 'r') as f:
+            self._memmap_meta = json.load(f)
+        expected = {'start_date': self.start_date.isoformat(),
+                    'data_frequency': self.data_frequency,
+                    'h_size': self.h_size,
+                    'w_size': self.w_size,
+                    'patch': bool(self.patch),
+                    'patch_size': self.patch_size if self.patch else None}
+        for key, value in expected.items():
+            if self._memmap_meta[key] != value:
+                raise ValueError(f"The {key} of the memory-mapped store {store_dir} is {self._memmap_meta[key]}, "
+                                 f"but the data parameters require {value}.")
+        if self.pred_lead_time % self.data_frequency:
+            raise ValueError(f"The pred_lead_time {self.pred_lead_time} should be a multiple of the data_frequency "
+                             f"{self.data_frequency} to read from a memory-mapped store.")
+        statistic_file = os.path.join(store_dir, 'statistic.npz')
+        if os.path.exists(statistic_file):
+            with np.load(statistic_file) as statistic:
+                for name in _STATISTIC_NAMES:
+                    setattr(self, name, statistic[name])
+        else:
+            self._get_statistic()
+        self._inputs_store = np.load(os.path.join(store_dir, 'inputs.npy'), mmap_mode='r')
+        self._labels_store = np.load(os.path.join(store_dir, self._memmap_meta['labels_file']), mmap_mode='r')
+
+    def _get_memmap_item(self, idx):
+        """Assemble one sample by slicing the memory-mapped store."""
+        start = int(idx) * self.interval // self.data_frequency
+        step = self.pred_lead_time // self.data_frequency
+        label_start = start + self.t_in * step
+        inputs = self._inputs_store[start:label_start:step]
+        labels = self._labels_store[label_start:label_start + self.t_out * step:step]
+
+        if self.patch:
+            if self.run_mode != 'train':
+                labels = labels.transpose(1, 0, 2, 3)
+            return np.squeeze(inputs), np.squeeze(labels)
+        inputs = inputs.transpose((1, 0, 2)).reshape(inputs.shape[1], self.t_in * inputs.shape[2])
+        return inputs, np.squeeze(labels)
+
+    def _get_static(self, year_name):
+        """Load the static files of the given year once and keep them resident."""
+        if year_name not in self._static_cache:
+            static = np.load(os.path.join(self.static_path, year_name)).astype(np.float32)
+            surface_static = np.load(os.path.join(self.static_surface_path, year_name)).astype(np.float32)
+            self._static_cache[year_name] = (static, surface_static)
+        return self._static_cache[year_name]
+
+    def _preload_static(self):
+        """Load the static files of the whole period before the dataset workers are forked."""
+        period = {'train': self.train_period, 'valid': self.valid_period}.get(self.run_mode, self.test_period)
+        for year in range(period[0], period[1] + 1):
+            year_name = f'{year}/{year}.npy'
+            if os.path.exists(os.path.join(self.static_path, year_name)) and \
+                    os.path.exists(os.path.join(self.static_surface_path, year_name)):
+                self._get_static(year_name)
+
+    def _load_frame(self, date, year_name):
+        """Load, de-scale and normalize the pressure level and surface data of one frame."""
+        x = np.load(os.path.join(self.path, date))[:, :, :self.h_size].astype(np.float32)
+        x_surface = np.load(os.path.join(self.surface_path, date))[:, :self.h_size].astype(np.float32)
+        x_static, x_surface_static = self._get_static(year_name)
+        x = self._get_origin_data(x, x_static)
+        x_surface = self._get_origin_data(x_surface, x_surface_static)
+        x, x_surface = self._normalize(x, x_surface)
+        return x.astype(np.float32), x_surface.astype(np.float32)
+
+    def _get_frame(self, date, year_name):
+        """Get one frame from the LRU frame cache, load it on a miss."""
+        if date in self._frame_cache:
+            self._frame_cache_hits += 1
+            self._frame_cache.move_to_end(date)
+            return self._frame_cache[date]
+
+        self._frame_cache_misses += 1
+        x, x_surface = self._load_frame(date, year_name)
+        frame_bytes = x.nbytes + x_surface.nbytes
+        if frame_bytes <= self.frame_cache_size:
+            while self._frame_cache_bytes + frame_bytes > self.frame_cache_size:
+                _, (old_x, old_x_surface) = self._frame_cache.popitem(last=False)
+                self._frame_cache_bytes -= old_x.nbytes + old_x_surface.nbytes
+            x.setflags(write=False)
+            x_surface.setflags(write=False)
+            self._frame_cache[date] = (x, x_surface)
+            self._frame_cache_bytes += frame_bytes
+        return x, x_surface
+
     @staticmethod
     def _get_origin_data(x, static):
         data = x * static[..., 0] + static[..., 1]
@@ -18,7 +18,8 @@ import math
 
 import numpy as np
 
-from mindspore import amp
+import mindspore as ms
+from mindspore import amp, ops, Tensor
 
 from ..data import FEATURE_DICT, SIZE_DICT
 
@@ -159,6 +160,8 @@ class WeatherForecast:
         self.climate_mean = self._get_history_climate_mean(config, self.w_size, self.adjust_size)
         self.t_out_test = config['data'].get("t_out_test", 20)
         self.pred_lead_time = config['data']['pred_lead_time']
+        self._grid_node_weight = None
+        self._grid_node_weight_tensor = None
 
     @staticmethod
     def _get_total_sample_description(config, info_mode):
@@ -268,16 +271,19 @@ class WeatherForecast:
     def _get_metrics(self, inputs, labels):
         """get metrics for plot"""
         pred = self.forecast(inputs, labels)
-        feature_num = labels.shape[1]
-        lat_weight_rmse = np.zeros((feature_num, self.t_out_test))
-        lat_weight_acc = np.zeros((feature_num, self.t_out_test))
-        for t in range(self.t_out_test):
-            for f in range(feature_num):
-                lat_weight_rmse[f, t] = self._calculate_lat_weighted_rmse(
-                    labels[:, f, t].asnumpy(), pred[t][:, f].asnumpy())  # label(B,C,T,H W) pred(B,C,H W)
-                lat_weight_acc[f, t] = self._calculate_lat_weighted_acc(
-                    labels[:, f, t].asnumpy(), pred[t][:, f].asnumpy())
-        return lat_weight_rmse, lat_weight_acc
+        batch_size, feature_num = labels.shape[:2]
+        # label(B,C,T,H W) pred(T)(B,C,H W), all features and lead times are reduced in one pass on device
+        labels = labels[:, :, :self.t_out_test].astype(ms.float32).reshape(batch_size, feature_num,
+                                                                             self.t_out_test, -1)
+        pred = ops.stack(pred[:self.t_out_test], axis=2).astype(ms.float32).reshape(batch_size, feature_num,
+                                                                                      self.t_out_test, -1)
+        weight = self._get_grid_node_weight_tensor()
+        lat_weight_rmse = (ops.square(labels - pred) * weight).sum(axis=(0, 3))
+        acc_numerator = (pred * labels * weight).sum(axis=(0, 3))
+        acc_denominator = ops.sqrt((ops.square(pred) * weight).sum(axis=(0, 3)) *
+                                   (ops.square(labels) * weight).sum(axis=(0, 3)))
+        metrics = ops.stack([lat_weight_rmse, acc_numerator / acc_denominator]).asnumpy().astype(np.float64)
+        return metrics[0], metrics[1]
 
     def _lat(self, j):
         return 90. - j * 180. / float(self.h_size - 1)
@@ -285,24 +291,33 @@ class WeatherForecast:
     def _latitude_weighting_factor(self, j, s):
         return self.h_size * np.cos(PI / 180. * self._lat(j)) / s
 
+    def _get_grid_node_weight(self):
+        """get the latitude weight of every grid node, it is computed once for the grid size."""
+        if self._grid_node_weight is None or self._grid_node_weight.size != self.h_size * self.w_size:
+            lat_t = np.arange(0, self.h_size)
+            s = np.sum(np.cos(PI / 180. * self._lat(lat_t)))
+            weight = self._latitude_weighting_factor(lat_t, s)
+            self._grid_node_weight = np.repeat(weight, self.w_size, axis=0).reshape(-1)
+            self._grid_node_weight_tensor = None
+        return self._grid_node_weight
+
+    def _get_grid_node_weight_tensor(self):
+        """get the latitude weight of every grid node as a device tensor."""
+        grid_node_weight = self._get_grid_node_weight()
+        if self._grid_node_weight_tensor is None:
+            self._grid_node_weight_tensor = Tensor(grid_node_weight, ms.float32)
+        return self._grid_node_weight_tensor
+
     def _calculate_lat_weighted_rmse(self, label, prediction):
         batch_size = label.shape[0]
-        lat_t = np.arange(0, self.h_size)
-
-        s = np.sum(np.cos(PI / 180. * self._lat(lat_t)))
-        weight = self._latitude_weighting_factor(lat_t, s)
-        grid_node_weight = np.repeat(weight, self.w_size, axis=0).reshape(-1)
+        grid_node_weight = self._get_grid_node_weight()
         error = np.square(np.reshape(label, (batch_size, -1)) - np.reshape(prediction, (batch_size, -1)))
         lat_weight_error = np.sum(error * grid_node_weight)
         return lat_weight_error
 
     def _calculate_lat_weighted_acc(self, label, prediction):
         """ calculate lat weighted acc"""
-        lat_t = np.arange(0, self.h_size)
-
-        s = np.sum(np.cos(PI / 180. * self._lat(lat_t)))
-        weight = self._latitude_weighting_factor(lat_t, s).reshape(self.h_size, 1)
-        grid_node_weight = np.repeat(weight, self.w_size, axis=1)
+        grid_node_weight = self._get_grid_node_weight().reshape(self.h_size, self.w_size)
 
         pred_prime = prediction
         label_prime = label
@@ -14,6 +14,8 @@
 # limitations under the License.
 # ============================================================================
 '''
+from functools import lru_cache
+
 import numpy as np
 from scipy.linalg import dft
 
@@ -26,93 +28,129 @@ from mindspore.ops import operations as P
 from ...utils.check_func import check_param_no_greater, check_param_value, check_param_type, check_param_even
 
 
+def _complex_mat(mat, compute_dtype):
+    """Real part, imaginary part and their sum of a complex matrix, the sum is used by the Gauss trick."""
+    return (Tensor(mat.real, dtype=compute_dtype), Tensor(mat.imag, dtype=compute_dtype),
+            Tensor(mat.real + mat.imag, dtype=compute_dtype))
+
+
+@lru_cache(maxsize=64)
+def _dft_matrices(n, modes, last_index, inv, compute_dtype):
+    """
+    Truncated DFT matrices of `DFT1d`. The matrices only depend on the arguments, so they are shared by all the layers
+    with the same arguments. The least recently used matrices are released when more than 64 are cached.
+    """
+    dft_mat = dft(n, scale="sqrtn")
+    if not inv:
+        mats = (_complex_mat(dft_mat[:, :modes], compute_dtype),
+                _complex_mat(dft_mat[:, -modes:], compute_dtype))
+    elif last_index:
+        if modes == n // 2 + 1:
+            dft_mat_res = np.flip(dft_mat[:, -modes + 2:], axis=-1)
+            dft_mat_res = np.concatenate((np.zeros((n, 1)), dft_mat_res, np.zeros((n, 1))), axis=-1)
+        else:
+            dft_mat_res = np.flip(dft_mat[:, -modes + 1:], axis=-1)
+            dft_mat_res = np.concatenate((np.zeros((n, 1)), dft_mat_res), axis=-1)
+        mats = (_complex_mat(dft_mat[:, :modes].conj().T, compute_dtype),
+                _complex_mat(dft_mat_res.T, compute_dtype))
+    else:
+        mats = (_complex_mat(dft_mat[:, :modes].conj().T, compute_dtype),
+                _complex_mat(dft_mat[:, -modes:].conj().T, compute_dtype))
+    return mats
+
+
 class DFT1d(nn.Cell):
     '''One dimensional Discrete Fourier Transformation'''
 
-    def __init__(self, n, modes, last_index, idx=0, inv=False, compute_dtype=mindspore.float32):
+    def __init__(self, n, modes, last_index, idx=0, inv=False, compute_dtype=mindspore.float32, backend="gauss"):
         super().__init__()
 
         self.n = n
-        self.dft_mat = dft(n, scale="sqrtn")
         self.modes = modes
         self.last_index = last_index
         self.inv = inv
         self.idx = idx
         self.compute_dtype = compute_dtype
-
-        self.dft_mode_mat_upper = self.dft_mat[:, :modes]
-        self.a_re_upper = Tensor(
-            self.dft_mode_mat_upper.real, dtype=compute_dtype)
-        self.a_im_upper = Tensor(
-            self.dft_mode_mat_upper.imag, dtype=compute_dtype)
-
-        self.dft_mode_mat_lower = self.dft_mat[:, -modes:]
-        self.a_re_lower = Tensor(
-            self.dft_mode_mat_lower.real, dtype=compute_dtype)
-        self.a_im_lower = Tensor(
-            self.dft_mode_mat_lower.imag, dtype=compute_dtype)
+        check_param_value(backend, "backend", ("fft", "gauss"))
+        self.backend = backend
         self.concat = ops.Concat(axis=-1)
 
-        if self.inv:
-            self.a_re_upper = self.a_re_upper.T
-            self.a_im_upper = -self.a_im_upper.T
-            if last_index:
-                if modes == n // 2 + 1:
-                    self.dft_mat_res = self.dft_mat[:, -modes + 2:]
-                else:
-                    self.dft_mat_res = self.dft_mat[:, -modes + 1:]
-
-                mat = Tensor(np.zeros(n, ), dtype=compute_dtype).reshape(n, 1)
-                self.a_re_res = mindspore.numpy.flip(
-                    Tensor(self.dft_mat_res.real, dtype=compute_dtype), axis=-1)
-                self.a_im_res = mindspore.numpy.flip(
-                    Tensor(self.dft_mat_res.imag, dtype=compute_dtype), axis=-1)
-                if modes == n // 2 + 1:
-                    self.a_re_res = self.concat((mat, self.a_re_res, mat))
-                    self.a_im_res = self.concat((mat, self.a_im_res, mat))
-                else:
-                    self.a_re_res = self.concat((mat, self.a_re_res))
-                    self.a_im_res = self.concat((mat, self.a_im_res))
-
-                self.a_re_res = self.a_re_res.T
-                self.a_im_res = -self.a_im_res.T
+        if self.backend == "fft":
+            self.complex = ops.Complex()
+            self.mode_mask = Tensor(self._mode_mask(), dtype=compute_dtype)
+        else:
+            upper, res = _dft_matrices(n, modes, last_index, inv, compute_dtype)
+            self.a_re_upper, self.a_im_upper, self.a_sum_upper = upper
+            if self.inv:
+                self.a_re_res, self.a_im_res, self.a_sum_res = res
             else:
-                self.a_re_res = self.a_re_lower.T
-                self.a_im_res = -self.a_im_lower.T
-
-        if (self.n - 2 * self.modes) > 0:
-            self.mat = Tensor(shape=(self.n - 2 * self.modes),
-                              dtype=compute_dtype, init=Zero())
+                self.a_re_lower, self.a_im_lower, self.a_sum_lower = res
+
+    def _mode_mask(self):
+        """Weights of the frequencies kept by the truncated transform along the last axis."""
+        if self.inv and self.last_index:
+            # the upper and the mirrored part of the inverse share the same frequencies except the zero frequency,
+            # and the nyquist frequency when all the rfft modes are kept.
+            mask = np.full(self.modes, 2.)
+            mask[0] = 1.
+            if self.modes == self.n // 2 + 1:
+                mask[-1] = 1.
+            return mask
+        mask = np.zeros(self.n)
+        mask[:self.modes] = 1.
+        if not self.last_index or self.inv:
+            mask[-self.modes:] = 1.
+        return mask
 
     def swap_axes(self, x_re, x_im):
         return x_re.swapaxes(-1, self.idx), x_im.swapaxes(-1, self.idx)
 
-    def complex_matmul(self, x_re, x_im, a_re, a_im):
-        y_re = ops.matmul(x_re, a_re) - ops.matmul(x_im, a_im)
-        y_im = ops.matmul(x_im, a_re) + ops.matmul(x_re, a_im)
+    def complex_matmul(self, x_re, x_im, a_re, a_im, a_sum):
+        """Complex matmul with three real matmuls (Gauss trick), `a_sum` is `a_re + a_im`."""
+        t_re = ops.matmul(x_re, a_re)
+        t_im = ops.matmul(x_im, a_im)
+        y_re = t_re - t_im
+        y_im = ops.matmul(x_re + x_im, a_sum) - t_re - t_im
         return y_re, y_im
 
+    def fft(self, x_re, x_im):
+        """Truncated transform along the last axis with FFT."""
+        if not self.inv:
+            y = ops.fft(self.complex(x_re, x_im), norm="ortho")
+            y_re, y_im = ops.real(y), ops.imag(y)
+            if self.last_index:
+                return y_re[..., :self.modes], y_im[..., :self.modes]
+            return y_re * self.mode_mask, y_im * self.mode_mask
+
+        if self.last_index:
+            x_re, x_im = x_re[..., :self.modes] * self.mode_mask, x_im[..., :self.modes] * self.mode_mask
+        else:
+            x_re, x_im = x_re * self.mode_mask, x_im * self.mode_mask
+        y = ops.ifft(self.complex(x_re, x_im), n=self.n, norm="ortho")
+        return ops.real(y), ops.imag(y)
+
     def construct(self, x):
         x_re, x_im = x
         x_re, x_im = P.Cast()(x_re, self.compute_dtype), P.Cast()(x_im, self.compute_dtype)
+        if self.backend == "fft":
+            x_re, x_im = self.swap_axes(x_re, x_im)
+            y_re, y_im = self.fft(x_re, x_im)
+            return self.swap_axes(y_re, y_im)
+
         if not self.inv:
             x_re, x_im = self.swap_axes(x_re, x_im)
             y_re, y_im = self.complex_matmul(
-                x_re=x_re, x_im=x_im, a_re=self.a_re_upper, a_im=self.a_im_upper)
+                x_re=x_re, x_im=x_im, a_re=self.a_re_upper, a_im=self.a_im_upper, a_sum=self.a_sum_upper)
 
             if not self.last_index:
                 y_re2, y_im2 = self.complex_matmul(
-                    x_re=x_re, x_im=x_im, a_re=self.a_re_lower, a_im=self.a_im_lower)
+                    x_re=x_re, x_im=x_im, a_re=self.a_re_lower, a_im=self.a_im_lower, a_sum=self.a_sum_lower)
 
                 if self.n == self.modes * 2:
                     y_re = self.concat((y_re, y_re2))
                     y_im = self.concat((y_im, y_im2))
                 else:
-                    dims = x_re.shape[:-1]
-                    length = len(dims)
-                    mat = self.mat
-                    for i in range(length - 1, -1, -1):
-                        mat = mat.expand_dims(0).repeat(dims[i], 0)
+                    mat = ops.zeros(x_re.shape[:-1] + (self.n - 2 * self.modes,), self.compute_dtype)
                     y_re = self.concat((y_re, mat, y_re2))
                     y_im = self.concat((y_im, mat, y_im2))
 
@@ -121,16 +159,15 @@ class DFT1d(nn.Cell):
 
         x_re, x_im = self.swap_axes(x_re, x_im)
         y_re, y_im = self.complex_matmul(x_re=x_re[..., :self.modes], x_im=x_im[..., :self.modes],
-                                         a_re=self.a_re_upper,
-                                         a_im=self.a_im_upper)
+                                         a_re=self.a_re_upper, a_im=self.a_im_upper, a_sum=self.a_sum_upper)
         y_re, y_im = self.swap_axes(y_re, y_im)
 
         if self.last_index:
             y_re_res, y_im_res = self.complex_matmul(
-                x_re=x_re, x_im=x_im, a_re=self.a_re_res, a_im=-self.a_im_res)
+                x_re=x_re, x_im=x_im, a_re=self.a_re_res, a_im=self.a_im_res, a_sum=self.a_sum_res)
         else:
             y_re_res, y_im_res = self.complex_matmul(x_re=x_re[..., -self.modes:], x_im=x_im[..., -self.modes:],
-                                                     a_re=self.a_re_res, a_im=self.a_im_res)
+                                                     a_re=self.a_re_res, a_im=self.a_im_res, a_sum=self.a_sum_res)
 
         y_re_res, y_im_res = self.swap_axes(y_re_res, y_im_res)
         return y_re + y_re_res, y_im + y_im_res
@@ -139,7 +176,7 @@ class DFT1d(nn.Cell):
 class DFTn(nn.Cell):
     '''N dimensional Discrete Fourier Transformation'''
 
-    def __init__(self, shape, modes, dim=None, inv=False, compute_dtype=mindspore.float32):
+    def __init__(self, shape, modes, dim=None, inv=False, compute_dtype=mindspore.float32, backend="gauss"):
         super().__init__()
 
         if dim is None:
@@ -150,25 +187,25 @@ class DFTn(nn.Cell):
         for dim_id, idx in enumerate(dim):
             self.dft1_seq.append(
                 DFT1d(n=shape[dim_id], modes=modes[dim_id], last_index=last_index[dim_id], idx=idx, inv=inv,
-                      compute_dtype=compute_dtype))
+                      compute_dtype=compute_dtype, backend=backend))
 
     def construct(self, x):
         return self.dft1_seq(x)
 
 
-def _dftn(shape, modes, dim=None, compute_dtype=mindspore.float32):
+def _dftn(shape, modes, dim=None, compute_dtype=mindspore.float32, backend="gauss"):
     dftn_ = DFTn(shape=shape, modes=modes, dim=dim,
-                 inv=False, compute_dtype=compute_dtype)
+                 inv=False, compute_dtype=compute_dtype, backend=backend)
     return dftn_
 
 
-def _idftn(shape, modes, dim=None, compute_dtype=mindspore.float32):
+def _idftn(shape, modes, dim=None, compute_dtype=mindspore.float32, backend="gauss"):
     idftn_ = DFTn(shape=shape, modes=modes, dim=dim,
-                  inv=True, compute_dtype=compute_dtype)
+                  inv=True, compute_dtype=compute_dtype, backend=backend)
     return idftn_
 
 
-def dft3(shape, modes, dim=(-3, -2, -1), compute_dtype=mindspore.float32):
+def dft3(shape, modes, dim=(-3, -2, -1), compute_dtype=mindspore.float32, backend="gauss"):
     r"""
     Calculate three-dimensional discrete Fourier transform. Corresponding to the rfftn operator in torch.
 
@@ -178,6 +215,9 @@ def dft3(shape, modes, dim=(-3, -2, -1), compute_dtype=mindspore.float32):
             dimension of input 'x'.
         dim (tuple): Dimensions to be transformed.
         compute_dtype (mindspore.dtype): The type of input tensor. Default: mindspore.float32.
+        backend (str): The backend of the transform, ``"gauss"`` uses truncated DFT matrices with three real matmuls
+            per complex product, ``"fft"`` uses the FFT operators on the platforms supporting them. Default:
+            ``"gauss"``.
 
     Inputs:
         - **x** (Tensor, Tensor): The input data. It's 3-D tuple of Tensor. It's a complex,
@@ -252,10 +292,10 @@ def dft3(shape, modes, dim=(-3, -2, -1), compute_dtype=mindspore.float32):
     check_param_no_greater(modes[0], "mode1", shape[0] // 2)
     check_param_no_greater(modes[1], "mode2", shape[1] // 2)
     check_param_no_greater(modes[2], "mode3", shape[2] // 2 + 1)
-    return _dftn(shape, modes, dim=dim, compute_dtype=compute_dtype)
+    return _dftn(shape, modes, dim=dim, compute_dtype=compute_dtype, backend=backend)
 
 
-def idft3(shape, modes, dim=(-3, -2, -1), compute_dtype=mindspore.float32):
+def idft3(shape, modes, dim=(-3, -2, -1), compute_dtype=mindspore.float32, backend="gauss"):
     r"""
     Calculate three-dimensional discrete Fourier transform. Corresponding to the irfftn operator in torch.
 
@@ -265,6 +305,9 @@ def idft3(shape, modes, dim=(-3, -2, -1), compute_dtype=mindspore.float32):
             dimension of input 'x'.
         dim (tuple): Dimensions to be transformed.
         compute_dtype (mindspore.dtype): The type of input tensor. Default: mindspore.float32.
+        backend (str): The backend of the transform, ``"gauss"`` uses truncated DFT matrices with three real matmuls
+            per complex product, ``"fft"`` uses the FFT operators on the platforms supporting them. Default:
+            ``"gauss"``.
 
     Inputs:
         - **x** (Tensor, Tensor): The input data. It's 3-D tuple of Tensor. It's a complex, including x real and
@@ -311,10 +354,10 @@ def idft3(shape, modes, dim=(-3, -2, -1), compute_dtype=mindspore.float32):
     check_param_no_greater(modes[0], "mode1", shape[0] // 2)
     check_param_no_greater(modes[1], "mode2", shape[1] // 2)
     check_param_no_greater(modes[2], "mode3", shape[2] // 2 + 1)
-    return _idftn(shape, modes, dim=dim, compute_dtype=compute_dtype)
+    return _idftn(shape, modes, dim=dim, compute_dtype=compute_dtype, backend=backend)
 
 
-def dft2(shape, modes, dim=(-2, -1), compute_dtype=mindspore.float32):
+def dft2(shape, modes, dim=(-2, -1), compute_dtype=mindspore.float32, backend="gauss"):
     """
     Calculate two-dimensional discrete Fourier transform. Corresponding to the rfft2 operator in torch.
 
@@ -324,6 +367,9 @@ def dft2(shape, modes, dim=(-2, -1), compute_dtype=mindspore.float32):
             dimension of input 'x'.
         dim (tuple): Dimensions to be transformed.
         compute_dtype (:class:`mindspore.dtype`): The type of input tensor. Default: mindspore.float32.
+        backend (str): The backend of the transform, ``"gauss"`` uses truncated DFT matrices with three real matmuls
+            per complex product, ``"fft"`` uses the FFT operators on the platforms supporting them. Default:
+            ``"gauss"``.
 
     Inputs:
         - **x** (Tensor, Tensor): The input data. It's 2-D tuple of Tensor. It's a complex,
@@ -361,10 +407,10 @@ def dft2(shape, modes, dim=(-2, -1), compute_dtype=mindspore.float32):
     check_param_even(shape, "shape")
     check_param_no_greater(modes[0], "mode1", shape[0] // 2)
     check_param_no_greater(modes[1], "mode2", shape[1] // 2 + 1)
-    return _dftn(shape, modes, dim=dim, compute_dtype=compute_dtype)
+    return _dftn(shape, modes, dim=dim, compute_dtype=compute_dtype, backend=backend)
 
 
-def idft2(shape, modes, dim=(-2, -1), compute_dtype=mindspore.float32):
+def idft2(shape, modes, dim=(-2, -1), compute_dtype=mindspore.float32, backend="gauss"):
     """
     Calculate two-dimensional discrete Fourier transform. Corresponding to the irfft2 operator in torch.
 
@@ -374,6 +420,9 @@ def idft2(shape, modes, dim=(-2, -1), compute_dtype=mindspore.float32):
             dimension of input 'x'.
         dim (tuple): Dimensions to be transformed.
         compute_dtype (:class:`mindspore.dtype`): The type of input tensor. Default: mindspore.float32.
+        backend (str): The backend of the transform, ``"gauss"`` uses truncated DFT matrices with three real matmuls
+            per complex product, ``"fft"`` uses the FFT operators on the platforms supporting them. Default:
+            ``"gauss"``.
 
     Inputs:
         - **x** (Tensor, Tensor): The input data. It's 2-D tuple of Tensor. It's a complex,
@@ -411,10 +460,10 @@ def idft2(shape, modes, dim=(-2, -1), compute_dtype=mindspore.float32):
     check_param_even(shape, "shape")
     check_param_no_greater(modes[0], "mode1", shape[0] // 2)
     check_param_no_greater(modes[1], "mode2", shape[1] // 2 + 1)
-    return _idftn(shape, modes, dim=dim, compute_dtype=compute_dtype)
+    return _idftn(shape, modes, dim=dim, compute_dtype=compute_dtype, backend=backend)
 
 
-def dft1(shape, modes, dim=(-1,), compute_dtype=mindspore.float32):
+def dft1(shape, modes, dim=(-1,), compute_dtype=mindspore.float32, backend="gauss"):
     """
     Calculate one-dimensional discrete Fourier transform. Corresponding to the rfft operator in torch.
 
@@ -425,6 +474,9 @@ def dft1(shape, modes, dim=(-1,), compute_dtype=mindspore.float32):
        dim (tuple): Dimensions to be transformed.
        compute_dtype (:class:`mindspore.dtype`): The type of input tensor.
          Default: mindspore.float32.
+       backend (str): The backend of the transform, ``"gauss"`` uses truncated DFT matrices with three real matmuls
+            per complex product, ``"fft"`` uses the FFT operators on the platforms supporting them. Default:
+            ``"gauss"``.
 
     Inputs:
        - **x** (Tensor, Tensor): The input data. It's 2-D tuple of Tensor. It's a complex,
@@ -456,10 +508,10 @@ def dft1(shape, modes, dim=(-1,), compute_dtype=mindspore.float32):
     check_param_even(shape, "shape")
     check_param_no_greater(modes, "mode1", shape[0] // 2 + 1)
     modes = (modes,)
-    return _dftn(shape, modes, dim=dim, compute_dtype=compute_dtype)
+    return _dftn(shape, modes, dim=dim, compute_dtype=compute_dtype, backend=backend)
 
 
-def idft1(shape, modes, dim=(-1,), compute_dtype=mindspore.float32):
+def idft1(shape, modes, dim=(-1,), compute_dtype=mindspore.float32, backend="gauss"):
     """
     Calculate one-dimensional discrete Fourier transform. Corresponding to the irfft operator in torch.
 
@@ -469,6 +521,9 @@ def idft1(shape, modes, dim=(-1,), compute_dtype=mindspore.float32):
             dimension of input 'x'.
         dim (tuple): Dimensions to be transformed.
         compute_dtype (:class:`mindspore.dtype`): The type of input tensor. Default: mindspore.float32.
+        backend (str): The backend of the transform, ``"gauss"`` uses truncated DFT matrices with three real matmuls
+            per complex product, ``"fft"`` uses the FFT operators on the platforms supporting them. Default:
+            ``"gauss"``.
 
     Inputs:
         - **x** (Tensor, Tensor): The input data. It's 2-D tuple of Tensor. It's a complex,
@@ -500,13 +555,14 @@ def idft1(shape, modes, dim=(-1,), compute_dtype=mindspore.float32):
     check_param_even(shape, "shape")
     check_param_no_greater(modes, "mode1", shape[0] // 2 + 1)
     modes = (modes,)
-    return _idftn(shape, modes, dim=dim, compute_dtype=compute_dtype)
+    return _idftn(shape, modes, dim=dim, compute_dtype=compute_dtype, backend=backend)
 
 
 class SpectralConvDft(nn.Cell):
     """Base Class for Fourier Layer, including DFT, linear transform, and Inverse DFT"""
 
-    def __init__(self, in_channels, out_channels, n_modes, resolutions, compute_dtype=mstype.float32):
+    def __init__(self, in_channels, out_channels, n_modes, resolutions, compute_dtype=mstype.float32,
+                 backend="gauss"):
         super().__init__()
         self.in_channels = in_channels
         self.out_channels = out_channels
@@ -522,6 +578,7 @@ class SpectralConvDft(nn.Cell):
                 but got dimension of n_modes {} and dimension of resolutions {}".format(len(self.n_modes),
                                                                                         len(self.resolutions)))
         self.compute_dtype = compute_dtype
+        self.backend = backend
 
     def construct(self, x: Tensor):
         raise NotImplementedError()
@@ -536,8 +593,9 @@ class SpectralConvDft(nn.Cell):
 class SpectralConv1dDft(SpectralConvDft):
     """1D Fourier Layer. It does DFT, linear transform, and Inverse DFT."""
 
-    def __init__(self, in_channels, out_channels, n_modes, resolutions, compute_dtype=mstype.float32):
-        super().__init__(in_channels, out_channels, n_modes, resolutions)
+    def __init__(self, in_channels, out_channels, n_modes, resolutions, compute_dtype=mstype.float32,
+                 backend="gauss"):
+        super().__init__(in_channels, out_channels, n_modes, resolutions, backend=backend)
         self._scale = (1. / (self.in_channels * self.out_channels))
         w_re = Tensor(self._scale * np.random.rand(self.in_channels, self.out_channels, self.n_modes[0]),
                       dtype=mstype.float32)
@@ -545,8 +603,10 @@ class SpectralConv1dDft(SpectralConvDft):
                       dtype=mstype.float32)
         self._w_re = Parameter(w_re, requires_grad=True)
         self._w_im = Parameter(w_im, requires_grad=True)
-        self._dft1_cell = dft1(shape=(self.resolutions[0],), modes=self.n_modes[0], compute_dtype=self.compute_dtype)
-        self._idft1_cell = idft1(shape=(self.resolutions[0],), modes=self.n_modes[0], compute_dtype=self.compute_dtype)
+        self._dft1_cell = dft1(shape=(self.resolutions[0],), modes=self.n_modes[0], compute_dtype=self.compute_dtype,
+                               backend=self.backend)
+        self._idft1_cell = idft1(shape=(self.resolutions[0],), modes=self.n_modes[0], compute_dtype=self.compute_dtype,
+                                 backend=self.backend)
 
     def construct(self, x: Tensor):
         x_re = x
@@ -567,8 +627,9 @@ class SpectralConv1dDft(SpectralConvDft):
 class SpectralConv2dDft(SpectralConvDft):
     """2D Fourier Layer. It does DFT, linear transform, and Inverse DFT."""
 
-    def __init__(self, in_channels, out_channels, n_modes, resolutions, compute_dtype=mstype.float32):
-        super().__init__(in_channels, out_channels, n_modes, resolutions)
+    def __init__(self, in_channels, out_channels, n_modes, resolutions, compute_dtype=mstype.float32,
+                 backend="gauss"):
+        super().__init__(in_channels, out_channels, n_modes, resolutions, backend=backend)
         self._scale = (1. / (self.in_channels * self.out_channels))
         w_re1 = Tensor(
             self._scale * np.random.rand(self.in_channels, self.out_channels, self.n_modes[0], self.n_modes[1]),
@@ -589,9 +650,11 @@ class SpectralConv2dDft(SpectralConvDft):
         self._w_im2 = Parameter(w_im2, requires_grad=True)
 
         self._dft2_cell = dft2(shape=(self.resolutions[0], self.resolutions[1]),
-                               modes=(self.n_modes[0], self.n_modes[1]), compute_dtype=self.compute_dtype)
+                               modes=(self.n_modes[0], self.n_modes[1]), compute_dtype=self.compute_dtype,
+                               backend=self.backend)
         self._idft2_cell = idft2(shape=(self.resolutions[0], self.resolutions[1]),
-                                 modes=(self.n_modes[0], self.n_modes[1]), compute_dtype=self.compute_dtype)
+                                 modes=(self.n_modes[0], self.n_modes[1]), compute_dtype=self.compute_dtype,
+                                 backend=self.backend)
         self._mat = Tensor(shape=(1, self.out_channels, self.resolutions[1] - 2 * self.n_modes[0], self.n_modes[1]),
                            dtype=self.compute_dtype, init=Zero())
         self._concat = ops.Concat(-2)
@@ -624,8 +687,9 @@ class SpectralConv2dDft(SpectralConvDft):
 class SpectralConv3dDft(SpectralConvDft):
     """3D Fourier layer. It does DFT, linear transform, and Inverse DFT."""
 
-    def __init__(self, in_channels, out_channels, n_modes, resolutions, compute_dtype=mstype.float32):
-        super().__init__(in_channels, out_channels, n_modes, resolutions)
+    def __init__(self, in_channels, out_channels, n_modes, resolutions, compute_dtype=mstype.float32,
+                 backend="gauss"):
+        super().__init__(in_channels, out_channels, n_modes, resolutions, backend=backend)
         self._scale = (1 / (self.in_channels * self.out_channels))
 
         w_re1 = Tensor(
@@ -664,10 +728,10 @@ class SpectralConv3dDft(SpectralConvDft):
 
         self._dft3_cell = dft3(shape=(self.resolutions[0], self.resolutions[1], self.resolutions[2]),
                                modes=(self.n_modes[0], self.n_modes[1], self.n_modes[2]),
-                               compute_dtype=self.compute_dtype)
+                               compute_dtype=self.compute_dtype, backend=self.backend)
         self._idft3_cell = idft3(shape=(self.resolutions[0], self.resolutions[1], self.resolutions[2]),
                                  modes=(self.n_modes[0], self.n_modes[1], self.n_modes[2]),
-                                 compute_dtype=self.compute_dtype)
+                                 compute_dtype=self.compute_dtype, backend=self.backend)
         self._mat_x = Tensor(
             shape=(1, self.out_channels, self.resolutions[0] - 2 * self.n_modes[0], self.n_modes[1], self.n_modes[2]),
             dtype=self.compute_dtype, init=Zero())
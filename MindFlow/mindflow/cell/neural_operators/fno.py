@@ -43,6 +43,8 @@ class FNOBlocks(nn.Cell):
         fno_compute_dtype (dtype.Number): The computation type of MLP in fno skip. Default: ``mstype.float16``.
             Should be ``mstype.float32`` or ``mstype.float16``. mstype.float32 is recommended for
             the GPU backend, mstype.float16 is recommended for the Ascend backend.
+        dft_backend (str): The backend of DFT in SpectralConvDft, ``"gauss"`` uses truncated DFT matrices,
+            ``"fft"`` uses the FFT operators on the platforms supporting them. Default: ``"gauss"``.
 
     Inputs:
         - **x** (Tensor) - Tensor of shape :math:`(batch\_size, in\_channels, resolution)`.
@@ -79,7 +81,8 @@ class FNOBlocks(nn.Cell):
                  act="gelu",
                  add_residual=False,
                  dft_compute_dtype=mstype.float32,
-                 fno_compute_dtype=mstype.float16
+                 fno_compute_dtype=mstype.float16,
+                 dft_backend="gauss"
                  ):
         super().__init__()
         check_param_type(in_channels, "in_channels", data_type=int)
@@ -101,6 +104,7 @@ class FNOBlocks(nn.Cell):
         self.add_residual = add_residual
         self.dft_compute_dtype = dft_compute_dtype
         self.fno_compute_dtype = fno_compute_dtype
+        self.dft_backend = dft_backend
 
         if len(self.resolutions) == 1:
             self._convs = SpectralConv1dDft(
@@ -108,7 +112,8 @@ class FNOBlocks(nn.Cell):
                 self.out_channels,
                 self.n_modes,
                 self.resolutions,
-                compute_dtype=self.dft_compute_dtype
+                compute_dtype=self.dft_compute_dtype,
+                backend=self.dft_backend
             )
             self._fno_skips = nn.Conv1d(
                 self.in_channels,
@@ -123,7 +128,8 @@ class FNOBlocks(nn.Cell):
                 self.out_channels,
                 self.n_modes,
                 self.resolutions,
-                compute_dtype=self.dft_compute_dtype
+                compute_dtype=self.dft_compute_dtype,
+                backend=self.dft_backend
             )
             self._fno_skips = nn.Conv2d(
                 self.in_channels,
@@ -138,7 +144,8 @@ class FNOBlocks(nn.Cell):
                 self.out_channels,
                 self.n_modes,
                 self.resolutions,
-                compute_dtype=self.dft_compute_dtype
+                compute_dtype=self.dft_compute_dtype,
+                backend=self.dft_backend
             )
             self._fno_skips = nn.Conv3d(
                 self.in_channels,
@@ -185,6 +192,8 @@ class FNO(nn.Cell):
         fno_compute_dtype (dtype.Number): The computation type of MLP in fno skip. Default: ``mstype.float16``.
             Should be ``mstype.float32`` or ``mstype.float16``. mstype.float32 is recommended for
             the GPU backend, mstype.float16 is recommended for the Ascend backend.
+        dft_backend (str): The backend of DFT in SpectralConvDft, ``"gauss"`` uses truncated DFT matrices,
+            ``"fft"`` uses the FFT operators on the platforms supporting them. Default: ``"gauss"``.
 
     Inputs:
         - **x** (Tensor) - Tensor of shape :math:`(batch\_size, resolution, in\_channels)`.
@@ -236,7 +245,8 @@ class FNO(nn.Cell):
             add_residual=False,
             positional_embedding=True,
             dft_compute_dtype=mstype.float32,
-            fno_compute_dtype=mstype.float16
+            fno_compute_dtype=mstype.float16,
+            dft_backend="gauss"
     ):
         super().__init__()
         check_param_type(in_channels, "in_channels", data_type=int, exclude_type=bool)
@@ -276,6 +286,7 @@ class FNO(nn.Cell):
             self.in_channels += len(self.resolutions)
         self.dft_compute_dtype = dft_compute_dtype
         self.fno_compute_dtype = fno_compute_dtype
+        self.dft_backend = dft_backend
         self._concat = ops.Concat(axis=-1)
         self._positional_embedding, self._input_perm, self._output_perm = self._transpose(len(self.resolutions))
         if self.lifting_channels:
@@ -291,7 +302,8 @@ class FNO(nn.Cell):
             self._fno_blocks.append(FNOBlocks(self.hidden_channels, self.hidden_channels, n_modes=self.n_modes,
                                               resolutions=self.resolutions, act=self.fnoblock_act,
                                               add_residual=self.add_residual, dft_compute_dtype=self.dft_compute_dtype,
-                                              fno_compute_dtype=self.fno_compute_dtype))
+                                              fno_compute_dtype=self.fno_compute_dtype,
+                                              dft_backend=self.dft_backend))
         self._projection = nn.SequentialCell()
         self._projection.append(nn.Dense(self.hidden_channels, self.projection_channels, has_bias=False))
         self._projection.append(self.mlp_act)
@@ -359,6 +371,8 @@ class FNO1D(FNO):
         fno_compute_dtype (dtype.Number): The computation type of MLP in fno skip. Default: ``mstype.float16``.
             Should be ``mstype.float32`` or ``mstype.float16``. mstype.float32 is recommended for
             the GPU backend, mstype.float16 is recommended for the Ascend backend.
+        dft_backend (str): The backend of DFT in SpectralConvDft, ``"gauss"`` uses truncated DFT matrices,
+            ``"fft"`` uses the FFT operators on the platforms supporting them. Default: ``"gauss"``.
 
     Inputs:
         - **x** (Tensor) - Tensor of shape :math:`(batch\_size, resolution, in\_channels)`.
@@ -412,7 +426,8 @@ class FNO1D(FNO):
             add_residual=False,
             positional_embedding=True,
             dft_compute_dtype=mstype.float32,
-            fno_compute_dtype=mstype.float16
+            fno_compute_dtype=mstype.float16,
+            dft_backend="gauss"
     ):
         super().__init__(
             in_channels,
@@ -429,7 +444,8 @@ class FNO1D(FNO):
             add_residual,
             positional_embedding,
             dft_compute_dtype,
-            fno_compute_dtype
+            fno_compute_dtype,
+            dft_backend
         )
 
 
@@ -461,6 +477,8 @@ class FNO2D(FNO):
         fno_compute_dtype (dtype.Number): The computation type of MLP in fno skip. Default: ``mstype.float16``.
             Should be ``mstype.float32`` or ``mstype.float16``. mstype.float32 is recommended for
             the GPU backend, mstype.float16 is recommended for the Ascend backend.
+        dft_backend (str): The backend of DFT in SpectralConvDft, ``"gauss"`` uses truncated DFT matrices,
+            ``"fft"`` uses the FFT operators on the platforms supporting them. Default: ``"gauss"``.
 
     Inputs:
         - **x** (Tensor) - Tensor of shape :math:`(batch\_size, resolution[0], resolution[1], in\_channels)`.
@@ -514,7 +532,8 @@ class FNO2D(FNO):
             add_residual=False,
             positional_embedding=True,
             dft_compute_dtype=mstype.float32,
-            fno_compute_dtype=mstype.float16
+            fno_compute_dtype=mstype.float16,
+            dft_backend="gauss"
     ):
         super().__init__(
             in_channels,
@@ -531,7 +550,8 @@ class FNO2D(FNO):
             add_residual,
             positional_embedding,
             dft_compute_dtype,
-            fno_compute_dtype
+            fno_compute_dtype,
+            dft_backend
         )
 
 
@@ -563,6 +583,8 @@ class FNO3D(FNO):
         fno_compute_dtype (dtype.Number): The computation type of MLP in fno skip. Default: ``mstype.float16``.
             Should be ``mstype.float32`` or ``mstype.float16``. mstype.float32 is recommended for
             the GPU backend, mstype.float16 is recommended for the Ascend backend.
+        dft_backend (str): The backend of DFT in SpectralConvDft, ``"gauss"`` uses truncated DFT matrices,
+            ``"fft"`` uses the FFT operators on the platforms supporting them. Default: ``"gauss"``.
 
     Inputs:
         - **x** (Tensor) - Tensor of shape :math:`(batch\_size, resolution[0], resolution[1], resolution[2], \
@@ -618,7 +640,8 @@ class FNO3D(FNO):
             add_residual=False,
             positional_embedding=True,
             dft_compute_dtype=mstype.float32,
-            fno_compute_dtype=mstype.float16
+            fno_compute_dtype=mstype.float16,
+            dft_backend="gauss"
     ):
         super().__init__(
             in_channels,
@@ -635,5 +658,6 @@ class FNO3D(FNO):
             add_residual,
             positional_embedding,
             dft_compute_dtype,
-            fno_compute_dtype
+            fno_compute_dtype,
+            dft_backend
         )
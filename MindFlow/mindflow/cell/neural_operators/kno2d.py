@@ -36,6 +36,8 @@ class KNO2D(nn.Cell):
         compute_dtype (dtype.Number): The computation type of dense. Default: ``mstype.float16``.
             Should be ``mstype.float32`` or ``mstype.float16``. mstype.float32 is recommended for
             the GPU backend, mstype.float16 is recommended for the Ascend backend.
+        backend (str): The backend of DFT in the Koopman layer, ``"gauss"`` uses truncated DFT matrices,
+            ``"fft"`` uses the FFT operators on the platforms supporting them. Default: ``"gauss"``.
 
     Inputs:
         - **x** (Tensor) - Tensor of shape :math:`(batch\_size, resolution, in\_channels)`.
@@ -71,7 +73,8 @@ class KNO2D(nn.Cell):
                  modes=16,
                  depths=4,
                  resolution=64,
-                 compute_dtype=mstype.float32):
+                 compute_dtype=mstype.float32,
+                 backend="gauss"):
         super().__init__()
         check_param_type(in_channels, "in_channels",
                          data_type=int, exclude_type=bool)
@@ -90,8 +93,8 @@ class KNO2D(nn.Cell):
         self.resolution = resolution
         self.enc = nn.Dense(in_channels, channels, has_bias=True)
         self.dec = nn.Dense(channels, in_channels, has_bias=True)
-        self.koopman_layer = SpectralConv2dDft(channels, channels, modes, modes, resolution,
-                                               resolution, compute_dtype=compute_dtype)
+        self.koopman_layer = SpectralConv2dDft(channels, channels, [modes, modes], [resolution, resolution],
+                                               compute_dtype=compute_dtype, backend=backend)
         self.w0 = nn.Conv2d(channels, channels, 1, has_bias=True)
 
     def construct(self, x: Tensor):
@@ -13,12 +13,17 @@
 # limitations under the License.
 # ==============================================================================
 """init of mindflow cfd"""
+from .domain_decomposition import CollectiveCommunicator, DomainDecomposition, LocalCommunicator, launch_local
 from .runtime import RunTime
 from .simulator import Simulator
 from .utils import cal_pri_var, cal_con_var
 from .visualization import vis_1d, vis_2d
 
 __all__ = [
+    "CollectiveCommunicator",
+    "DomainDecomposition",
+    "LocalCommunicator",
+    "launch_local",
     "RunTime",
     "Simulator",
     "cal_pri_var",
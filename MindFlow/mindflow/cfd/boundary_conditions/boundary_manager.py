@@ -40,10 +40,14 @@ def define_boundary(config):
 
 @jit_class
 class BoundaryManager():
-    """Container of boundaries for all active axis."""
+    """
+    Container of boundaries for all active axis. If the domain is decomposed, the pad values on the faces shared with
+    the other blocks are exchanged with them instead.
+    """
 
-    def __init__(self, config, mesh_info):
+    def __init__(self, config, mesh_info, decomposition=None):
         self.mesh_info = mesh_info
+        self.decomposition = decomposition
         self.head_list = []
         self.tail_list = []
 
@@ -70,8 +74,15 @@ class BoundaryManager():
 
             pri_var = ops.Transpose()(pri_var, permute_tuple)
 
-            head_val = self.head_list[i].fill_values_head(pri_var, i, pad_size)
-            tail_val = self.tail_list[i].fill_values_tail(pri_var, i, pad_size)
+            head_val = None
+            tail_val = None
+            if self.decomposition is not None:
+                head_val, tail_val = self.decomposition.exchange_halo(pri_var[:, :pad_size, :, :],
+                                                                      pri_var[:, -pad_size:, :, :], i)
+            if head_val is None:
+                head_val = self.head_list[i].fill_values_head(pri_var, i, pad_size)
+            if tail_val is None:
+                tail_val = self.tail_list[i].fill_values_tail(pri_var, i, pad_size)
 
             pri_var = mnp.concatenate((head_val, pri_var, tail_val), axis=1)
 
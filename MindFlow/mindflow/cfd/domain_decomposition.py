@@ -0,0 +1,360 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""domain decomposition of the compute mesh."""
+import copy
+import multiprocessing
+import queue as queue_module
+import threading
+from abc import ABC, abstractmethod
+
+import numpy as np
+from mindspore import Tensor, ops
+from mindspore import numpy as mnp
+
+
+class Communicator(ABC):
+    r"""
+    Abstract base class for the communication between the blocks of a decomposed domain.
+
+    Args:
+        rank (int): Rank of the current process.
+        group_size (int): Number of processes.
+    """
+
+    def __init__(self, rank, group_size):
+        self.rank = rank
+        self.group_size = group_size
+
+    @abstractmethod
+    def exchange(self, head_rank, tail_rank, head_slab, tail_slab):
+        """
+        Send `head_slab` to `head_rank` and `tail_slab` to `tail_rank`, receive the slabs sent back by them.
+
+        Args:
+            head_rank (int): Rank of the block before the current block, ``None`` if there is no such block.
+            tail_rank (int): Rank of the block after the current block, ``None`` if there is no such block.
+            head_slab (Tensor): The cells next to the head face of the current block.
+            tail_slab (Tensor): The cells next to the tail face of the current block.
+
+        Returns:
+            Tuple of Tensor, the tail slab of the head block and the head slab of the tail block, ``None`` for the
+            missing blocks.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def all_reduce_max(self, value):
+        """Get the maximum of `value` over all processes."""
+        raise NotImplementedError()
+
+
+class LocalCommunicator(Communicator):
+    r"""
+    Communicator between the processes of one host, based on `multiprocessing` pipes. It is a CPU stand-in of the
+    collective communication, mainly for debugging and testing the decomposed simulation.
+
+    The communicators should be created by :meth:`LocalCommunicator.create_group` before the processes are started.
+
+    Args:
+        rank (int): Rank of the current process.
+        group_size (int): Number of processes.
+        send_connections (dict): Connections to send data to the other ranks, keyed by rank.
+        recv_connections (dict): Connections to receive data from the other ranks, keyed by rank.
+
+    Supported Platforms:
+        ``CPU``
+
+    Examples:
+        >>> from mindflow import cfd
+        >>> communicators = cfd.LocalCommunicator.create_group(2)
+    """
+
+    def __init__(self, rank, group_size, send_connections, recv_connections):
+        super(LocalCommunicator, self).__init__(rank, group_size)
+        self.send_connections = send_connections
+        self.recv_connections = recv_connections
+
+    @staticmethod
+    def create_group(group_size):
+        """
+        Create the communicators of all ranks, connected with each other.
+
+        Args:
+            group_size (int): Number of processes.
+
+        Returns:
+            List of LocalCommunicator, the communicator of each rank.
+        """
+        pipes = {}
+        for src in range(group_size):
+            for dst in range(group_size):
+                if src != dst:
+                    pipes[(src, dst)] = multiprocessing.Pipe(duplex=False)
+        communicators = []
+        for rank in range(group_size):
+            send_connections = {dst: pipes[(rank, dst)][1] for dst in range(group_size) if dst != rank}
+            recv_connections = {src: pipes[(src, rank)][0] for src in range(group_size) if src != rank}
+            communicators.append(LocalCommunicator(rank, group_size, send_connections, recv_connections))
+        return communicators
+
+    def _send_all(self, messages):
+        for rank, data in messages:
+            self.send_connections[rank].send(data)
+
+    def _send_async(self, messages):
+        """Send in a background thread, so that the pairs of processes sending to each other do not block."""
+        sender = threading.Thread(target=self._send_all, args=(messages,))
+        sender.start()
+        return sender
+
+    def exchange(self, head_rank, tail_rank, head_slab, tail_slab):
+        messages = []
+        if tail_rank is not None:
+            messages.append((tail_rank, tail_slab.asnumpy()))
+        if head_rank is not None:
+            messages.append((head_rank, head_slab.asnumpy()))
+        sender = self._send_async(messages)
+
+        head_halo = None
+        tail_halo = None
+        if head_rank is not None:
+            head_halo = Tensor(self.recv_connections[head_rank].recv())
+        if tail_rank is not None:
+            tail_halo = Tensor(self.recv_connections[tail_rank].recv())
+        sender.join()
+        return head_halo, tail_halo
+
+    def all_reduce_max(self, value):
+        local_value = value.asnumpy()
+        sender = self._send_async([(rank, local_value) for rank in self.send_connections])
+        values = [local_value] + [connection.recv() for connection in self.recv_connections.values()]
+        sender.join()
+        return Tensor(np.max(values, axis=0), dtype=value.dtype)
+
+
+def _run_local_rank(func, communicator, args, queue):
+    queue.put((communicator.rank, func(communicator, *args)))
+
+
+def launch_local(func, group_size, args=()):
+    """
+    Run `func(communicator, *args)` in `group_size` local processes connected by :class:`LocalCommunicator`.
+
+    Args:
+        func (Callable): The function to run. It should be picklable, and its return value as well.
+        group_size (int): Number of processes.
+        args (tuple): Extra arguments of `func`. Default: ``()``.
+
+    Returns:
+        List, the return values of `func` ordered by rank.
+
+    Raises:
+        RuntimeError: If any of the processes exits abnormally.
+
+    Supported Platforms:
+        ``CPU``
+    """
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    processes = []
+    for communicator in LocalCommunicator.create_group(group_size):
+        process = context.Process(target=_run_local_rank, args=(func, communicator, args, queue))
+        process.start()
+        processes.append(process)
+
+    results = {}
+    while len(results) < group_size:
+        try:
+            rank, result = queue.get(timeout=1.0)
+            results[rank] = result
+        except queue_module.Empty:
+            failed = [process.exitcode for process in processes if process.exitcode not in (None, 0)]
+            if failed:
+                for process in processes:
+                    process.terminate()
+                raise RuntimeError("local rank process exited with code {}".format(failed[0]))
+    for process in processes:
+        process.join()
+    return [results[rank] for rank in range(group_size)]
+
+
+class CollectiveCommunicator(Communicator):
+    r"""
+    Communicator based on the collective communication of MindSpore. The communication should be initialized by
+    `mindspore.communication.init` before creating it.
+
+    Supported Platforms:
+        ``Ascend`` ``GPU``
+    """
+
+    def __init__(self):
+        # pylint: disable=C0415
+        from mindspore.communication import get_rank, get_group_size
+        from mindspore.communication.comm_func import P2POp, batch_isend_irecv
+        super(CollectiveCommunicator, self).__init__(get_rank(), get_group_size())
+        self._p2p_op = P2POp
+        self._batch_isend_irecv = batch_isend_irecv
+        self._all_reduce_max = ops.AllReduce(ops.ReduceOp.MAX)
+
+    def exchange(self, head_rank, tail_rank, head_slab, tail_slab):
+        if head_rank is not None and head_rank == tail_rank:
+            # the peer is both the head and the tail block, send both slabs in one message to keep them in order.
+            slabs = mnp.stack((tail_slab, head_slab))
+            received = self._batch_isend_irecv([self._p2p_op('isend', slabs, tail_rank),
+                                                self._p2p_op('irecv', mnp.zeros_like(slabs), head_rank)])[1]
+            return received[0], received[1]
+
+        p2p_ops = []
+        if tail_rank is not None:
+            p2p_ops.append(self._p2p_op('isend', tail_slab, tail_rank))
+        if head_rank is not None:
+            p2p_ops.append(self._p2p_op('isend', head_slab, head_rank))
+            p2p_ops.append(self._p2p_op('irecv', mnp.zeros_like(head_slab), head_rank))
+        if tail_rank is not None:
+            p2p_ops.append(self._p2p_op('irecv', mnp.zeros_like(tail_slab), tail_rank))
+        if not p2p_ops:
+            return None, None
+
+        received = list(self._batch_isend_irecv(p2p_ops))
+        tail_halo = received.pop() if tail_rank is not None else None
+        head_halo = received.pop() if head_rank is not None else None
+        return head_halo, tail_halo
+
+    def all_reduce_max(self, value):
+        return self._all_reduce_max(value)
+
+
+class DomainDecomposition:
+    r"""
+    Decomposition of the compute mesh into blocks, one block per process. Each process only holds the cells of its
+    own block, and the `pad_size` ghost cells next to the faces shared with the other blocks are exchanged at every
+    stage of the time integration.
+
+    The number of blocks along each axis is set by `partition` in the mesh configuration, the blocks are numbered in
+    row-major order. If it is not given, the mesh is split along x-dimension.
+
+    Args:
+        config (dict): The dict of parameters of the whole simulation, with the keys of ``mesh`` and
+            ``boundary_conditions``.
+        communicator (Communicator): The communicator between blocks.
+
+    Raises:
+        ValueError: If the number of blocks is not equal to the group size of `communicator`.
+        ValueError: If an inactive axis is split.
+        ValueError: If a block has less cells than `pad_size` along a split axis.
+
+    Supported Platforms:
+        ``Ascend`` ``GPU`` ``CPU``
+
+    Examples:
+        >>> from mindflow import cfd
+        >>> communicators = cfd.LocalCommunicator.create_group(2)
+        >>> config = {'mesh': {'dim': 1, 'nx': 100, 'x_range': [0, 1], 'pad_size': 3, 'partition': [2]},
+        ...           'boundary_conditions': {'x_min': {'type': 'Periodic'}, 'x_max': {'type': 'Periodic'}}}
+        >>> d = cfd.DomainDecomposition(config, communicators[0])
+    """
+
+    def __init__(self, config, communicator):
+        mesh_config = config['mesh']
+        self.communicator = communicator
+        self.rank = communicator.rank
+        dim = mesh_config.get("dim", None)
+        pad = mesh_config.get("pad_size", 0)
+
+        partition = list(mesh_config.get("partition", [communicator.group_size]))
+        self.partition = partition + [1] * (3 - len(partition))
+        if int(np.prod(self.partition)) != communicator.group_size:
+            raise ValueError("the number of blocks {} should be equal to the group size {}"
+                             .format(self.partition, communicator.group_size))
+        self.block_index = [int(i) for i in np.unravel_index(self.rank, self.partition)]
+
+        self.local_config = copy.deepcopy(mesh_config)
+        self.local_config.pop("partition", None)
+        self.offsets = []
+        self.neighbours = []
+        for axis, (size_key, range_key, bc_key) in enumerate(
+                (("nx", "x_range", "x_min"), ("ny", "y_range", "y_min"), ("nz", "z_range", "z_min"))):
+            num_blocks = self.partition[axis]
+            if num_blocks > 1 and axis >= dim:
+                raise ValueError("inactive axis {} should not be split".format(axis))
+            cells = mesh_config.get(size_key, 1)
+            block_cells = [cells // num_blocks + (1 if i < cells % num_blocks else 0) for i in range(num_blocks)]
+            if num_blocks > 1 and min(block_cells) < pad:
+                raise ValueError("each block should have at least pad_size={} cells, but got {} cells along axis {}"
+                                 .format(pad, min(block_cells), axis))
+            index = self.block_index[axis]
+            offset = sum(block_cells[:index])
+            self.offsets.append(offset)
+            self.local_config[size_key] = block_cells[index]
+            if range_key in mesh_config:
+                low, high = mesh_config[range_key]
+                cell_size = (high - low) / cells
+                self.local_config[range_key] = [low + offset * cell_size,
+                                                low + (offset + block_cells[index]) * cell_size]
+
+            periodic = axis < dim and config['boundary_conditions'][bc_key]['type'] == 'Periodic'
+            self.neighbours.append((self._neighbour(axis, index - 1, periodic),
+                                    self._neighbour(axis, index + 1, periodic)))
+
+        self.number_of_cells = [self.local_config["nx"], self.local_config["ny"], self.local_config["nz"]]
+
+    def _neighbour(self, axis, index, periodic):
+        """Rank of the block next to the current block, ``None`` if the face is a boundary of the whole domain."""
+        num_blocks = self.partition[axis]
+        if num_blocks == 1:
+            return None
+        if index < 0 or index >= num_blocks:
+            if not periodic:
+                return None
+            index = index % num_blocks
+        block_index = list(self.block_index)
+        block_index[axis] = index
+        return int(np.ravel_multi_index(block_index, self.partition))
+
+    def exchange_halo(self, head_slab, tail_slab, axis):
+        """
+        Exchange the ghost cells with the neighbouring blocks along `axis`.
+
+        Args:
+            head_slab (Tensor): The first `pad_size` cells of the current block along `axis`.
+            tail_slab (Tensor): The last `pad_size` cells of the current block along `axis`.
+            axis (int): 0, 1, 2 indicate x-dimension, y-dimension and z-dimension respectively.
+
+        Returns:
+            Tuple of Tensor, the ghost cells before and after the current block, ``None`` if the face is a boundary
+            of the whole domain.
+        """
+        head_rank, tail_rank = self.neighbours[axis]
+        if head_rank is None and tail_rank is None:
+            return None, None
+        return self.communicator.exchange(head_rank, tail_rank, head_slab, tail_slab)
+
+    def all_reduce_max(self, value):
+        """Get the maximum of `value` over all blocks."""
+        return self.communicator.all_reduce_max(value)
+
+    def local_slice(self, var):
+        """
+        Take the cells of the current block from the variables of the whole domain.
+
+        Args:
+            var (Union[Tensor, numpy.ndarray]): Variables of the whole domain with shape of :math:`(C, N_x, N_y, N_z)`.
+
+        Returns:
+            The variables of the current block, of the same type as `var`.
+        """
+        starts = self.offsets
+        ends = [start + size for start, size in zip(self.offsets, self.number_of_cells)]
+        return var[:, starts[0]: ends[0], starts[1]: ends[1], starts[2]: ends[2]]
@@ -26,6 +26,8 @@ class RunTime:
         config (dict): The dict of parameters.
         mesh_info (MeshInfo): The information of the compute mesh.
         material (Material): The fluid material model.
+        decomposition (DomainDecomposition): The decomposition of the compute mesh. If given, the timestep is
+            reduced over all blocks so that they advance together. Default: ``None``.
 
     Supported Platforms:
         ``GPU``
@@ -43,7 +45,7 @@ class RunTime:
         >>> r = cfd.RunTime(c, s.mesh_info, s.material)
     """
 
-    def __init__(self, config, mesh_info, material):
+    def __init__(self, config, mesh_info, material, decomposition=None):
         self.current_time = Tensor(config.get('current_time', 0.0))
         self.end_time = config.get('end_time', 0.0)
         self.fixed_timestep = config.get('fixed_timestep', False)
@@ -54,6 +56,7 @@ class RunTime:
         self.cfl = config.get('CFL', 0.0)
         self.mesh_info = mesh_info
         self.material = material
+        self.decomposition = decomposition
         self.eps = 1e-8
 
     def compute_timestep(self, pri_var):
@@ -74,9 +77,14 @@ class RunTime:
             abs_velocity = 0.0
             for i in self.mesh_info.active_axis:
                 abs_velocity += (mnp.abs(pri_var[i + 1, :, :, :]) + sound_speed)
-            dt = min_cell_size / (mnp.max(abs_velocity) + self.eps)
+            max_velocity = mnp.max(abs_velocity)
+            if self.decomposition is not None:
+                max_velocity = self.decomposition.all_reduce_max(max_velocity)
+            dt = min_cell_size / (max_velocity + self.eps)
             self.timestep = self.cfl * dt
-        print("current time = {:.6f}, time step = {:.6f}".format(self.current_time.asnumpy(), self.timestep.asnumpy()))
+        if self.decomposition is None or self.decomposition.rank == 0:
+            print("current time = {:.6f}, time step = {:.6f}".format(self.current_time.asnumpy(),
+                                                                   self.timestep.asnumpy()))
 
     def advance(self):
         """
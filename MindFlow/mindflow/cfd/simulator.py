@@ -20,6 +20,7 @@ from .material import define_material
 from .integrator import define_integrator
 from .space_solver import SpaceSolver
 from .boundary_conditions import BoundaryManager
+from .domain_decomposition import CollectiveCommunicator, DomainDecomposition
 from .utils import cal_con_var, cal_pri_var
 
 
@@ -31,6 +32,10 @@ class Simulator:
     Args:
         config (dict): The dict of parameters.
         net_dict (dict): The dict of netwoks. Default: ``None``.
+        communicator (Communicator): The communicator between the blocks of the decomposed mesh. If it is given, or
+            ``partition`` is set in the mesh configuration, the mesh is decomposed into blocks and the simulator only
+            holds the block of the current process, see :class:`mindflow.cfd.DomainDecomposition`. If ``partition``
+            is set without a communicator, :class:`mindflow.cfd.CollectiveCommunicator` is used. Default: ``None``.
 
     Supported Platforms:
         ``GPU``
@@ -47,14 +52,21 @@ class Simulator:
         >>> s = cfd.Simulator(config)
     """
 
-    def __init__(self, config, net_dict=None):
-        self.mesh_info = MeshInfo(config['mesh'])
+    def __init__(self, config, net_dict=None, communicator=None):
+        if communicator is None and 'partition' in config['mesh']:
+            communicator = CollectiveCommunicator()
+        if communicator is None:
+            self.decomposition = None
+            self.mesh_info = MeshInfo(config['mesh'])
+        else:
+            self.decomposition = DomainDecomposition(config, communicator)
+            self.mesh_info = MeshInfo(self.decomposition.local_config)
         self.material = define_material(config['material'])
         self.integrator = define_integrator(config['integrator'])
         self.space_solver = SpaceSolver(config['space_solver'], self.mesh_info, self.material, net_dict)
-        self.boundary = BoundaryManager(config['boundary_conditions'], mesh_info=self.mesh_info)
+        self.boundary = BoundaryManager(config['boundary_conditions'], mesh_info=self.mesh_info,
+                                        decomposition=self.decomposition)
 
-    @jit
     def integration_step(self, con_var, timestep):
         """Do integration in a timestep.
 
@@ -65,6 +77,29 @@ class Simulator:
         Returns:
             Tensor. Conservative variables at the next timestep.
         """
+        if self.decomposition is None:
+            return self._integration_step(con_var, timestep)
+
+        # the halo exchange happens between the compiled stages, as the communicators work in PyNative mode.
+        init_con_var = con_var.copy()
+        for stage in range(self.integrator.number_of_stages):
+            filled_pri_var = self.boundary.fill_boundarys(self._cal_pri_var(con_var))
+            con_var = self._integration_stage(con_var, init_con_var, filled_pri_var, timestep, stage)
+        return con_var
+
+    @jit
+    def _cal_pri_var(self, con_var):
+        return cal_pri_var(con_var, self.material)
+
+    @jit
+    def _integration_stage(self, con_var, init_con_var, filled_pri_var, timestep, stage):
+        filled_con_var = cal_con_var(filled_pri_var, self.material)
+        rhs = self.space_solver.compute_rhs(filled_con_var)
+        return self.integrator.integrate(con_var, init_con_var, rhs, timestep, stage)
+
+    @jit
+    def _integration_step(self, con_var, timestep):
+        """Do integration in a timestep on the whole mesh."""
         rhs = None
         init_con_var = con_var.copy()
         for stage in range(self.integrator.number_of_stages):
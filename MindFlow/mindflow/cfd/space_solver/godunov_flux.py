@@ -38,8 +38,7 @@ class GodunovFlux:
         Returns:
             Tensor. conservative variables flux.
         """
-        con_var_left = self.reconstructor.reconstruct_from_left(con_var, axis)
-        con_var_right = self.reconstructor.reconstruct_from_right(con_var, axis)
+        con_var_left, con_var_right = self.reconstructor.reconstruct(con_var, axis)
 
         flux = self.riemann_solver.compute_riemann_flux(con_var_left, con_var_right, axis)
 
@@ -31,29 +31,92 @@ class Reconstructor:
         """Reconstruct variables from right side."""
         return self._reconstruct_on_face(var, axis, 1)
 
-    @abstractmethod
+    def reconstruct(self, var, axis):
+        """
+        Reconstruct variables from both sides.
+
+        The stencils of the right side are the stencils of the left side shifted by one cell, the terms shared by both
+        sides are only computed once.
+
+        Inputs:
+        - **var** (Tensor) - Input tensor.
+        - **axis** (int) - 0, 1, 2 indicate x-dimension, y-dimension and z-dimension respectively.
+
+        Outputs:
+        Tuple of Tensor, the variables reconstructed from left side and right side.
+        """
+        var_list = self._get_var(var, axis)
+        one_beta_sq = self._one_beta_sq(var_list)
+        var_left = self._reconstruct_with_weights(var_list, one_beta_sq, axis, 0)
+        var_right = self._reconstruct_with_weights(var_list, one_beta_sq, axis, 1)
+        return var_left, var_right
+
     def _reconstruct_on_face(self, var, axis, j):
+        """
+        Calculate the recunstructed variables on faces.
+
+        Inputs:
+        - **var** (Tensor) - Input tensor.
+        - **axis** (int) - 0, 1, 2 indicate x-dimension, y-dimension and z-dimension respectively.
+        - **j** (int) - reconstruct direction, 0, 1 indicate reconstruct from left and right respectively.
+
+        Outputs:
+        Tensor, output tensor.
+        """
+        var_list = self._get_var(var, axis)
+        one_beta_sq = self._one_beta_sq(var_list)
+        return self._reconstruct_with_weights(var_list, one_beta_sq, axis, j)
+
+    @abstractmethod
+    def _one_beta_sq(self, var_list):
+        """Calculate `1 / (eps + beta) ** 2` of each stencil from the smoothness indicator `beta`."""
         raise NotImplementedError()
 
-    def _slice(self, inputs, output_size):
+    def _reconstruct_with_weights(self, var_list, one_beta_sq, axis, j):
         """
-        Take slice of the input tensor according to output_size.
+        Combine the candidate polynomials on faces. The nonlinear weights are not normalized one by one, the weighted
+        sum of the polynomials is divided by the sum of the weights instead.
+        """
+        length = self.mesh_info.number_of_cells[axis] + 1
+        var_list = [self._take(var_i, axis, j, j + length) for var_i in var_list]
+        weighted_sum = 0
+        alpha_sum = 0
+        for k, one_beta_sq_k in enumerate(one_beta_sq):
+            alpha = self._coe1[j][k] * self._take(one_beta_sq_k, axis, j, j + length)
+            poly = 0
+            for i, coe in enumerate(self._coe2[j][k]):
+                poly = poly + coe * var_list[k + i]
+            weighted_sum = weighted_sum + alpha * poly
+            alpha_sum = alpha_sum + alpha
+        return weighted_sum / alpha_sum
 
-        Args:
-            inputs: Tensor. Input tensor.
-            output_size : List. Output size.
-        Returns:
-            Tensor. Output tensor with shape of output_size.
+    def _get_var(self, inputs, axis):
+        """
+        Get the shifted variables of the stencils. The variables cover the faces of both sides, so each of them has
+        one more cell than the faces along `axis`, and the padding of the other axes is removed.
         """
+        num_stencils = len(self._coe1[0])
         starts = []
         ends = []
-
         for i in range(3):
-            if inputs.shape[i + 1] == output_size[i + 1]:
+            if i == axis:
+                starts.append(self.pad - num_stencils)
+                ends.append(self.pad + num_stencils + self.mesh_info.number_of_cells[i])
+            elif inputs.shape[i + 1] == self.mesh_info.number_of_cells[i]:
                 starts.append(0)
                 ends.append(inputs.shape[i + 1])
             else:
-                starts.append(self.mesh_info.pad)
-                ends.append(-self.mesh_info.pad)
+                starts.append(self.pad)
+                ends.append(inputs.shape[i + 1] - self.pad)
+        inputs = inputs[:, starts[0]: ends[0], starts[1]: ends[1], starts[2]: ends[2]]
+
+        length = self.mesh_info.number_of_cells[axis] + 2
+        return [self._take(inputs, axis, i, i + length) for i in range(2 * num_stencils - 1)]
 
-        return inputs[:, starts[0]: ends[0], starts[1]: ends[1], starts[2]: ends[2]]
+    def _take(self, inputs, axis, start, end):
+        """Take slice of the input tensor along `axis`."""
+        if axis == 0:
+            return inputs[:, start: end, :, :]
+        if axis == 1:
+            return inputs[:, :, start: end, :]
+        return inputs[:, :, :, start: end]
@@ -57,19 +57,9 @@ class WENO3(Reconstructor):
             raise ValueError('pad should be not smaller than 2 for WENO3 reconstructor')
         self.eps = 1e-5
 
-    def _reconstruct_on_face(self, var, axis, j):
-        """
-        Calculate the recunstructed variables on faces.
-
-        Inputs:
-        - **var** (Tensor) - Input tensor.
-        - **axis** (int) - 0, 1, 2 indicate x-dimension, y-dimension and z-dimension respectively.
-        - **j** (int) - reconstruct direction, 0, 1 indicate reconstruct from left and right respectively.
-
-        Outputs:
-        Tensor, output tensor.
-        """
-        var_0, var_1, var_2 = self._get_var(var, axis, j)
+    def _one_beta_sq(self, var_list):
+        """Calculate `1 / (eps + beta) ** 2` of each stencil from the smoothness indicator `beta`."""
+        var_0, var_1, var_2 = var_list
 
         beta_0 = (var_1 - var_0) ** 2
         beta_1 = (var_2 - var_1) ** 2
@@ -77,45 +67,4 @@ class WENO3(Reconstructor):
         one_beta_0_sq = 1.0 / ((self.eps + beta_0) * (self.eps + beta_0))
         one_beta_1_sq = 1.0 / ((self.eps + beta_1) * (self.eps + beta_1))
 
-        alpha_0 = self._coe1[j][0] * one_beta_0_sq
-        alpha_1 = self._coe1[j][1] * one_beta_1_sq
-
-        one_alpha = 1.0 / (alpha_0 + alpha_1)
-
-        omega_0 = alpha_0 * one_alpha
-        omega_1 = alpha_1 * one_alpha
-
-        p_0 = self._coe2[j][0][0] * var_0 + self._coe2[j][0][1] * var_1
-        p_1 = self._coe2[j][1][0] * var_1 + self._coe2[j][1][1] * var_2
-
-        var_on_face = omega_0 * p_0 + omega_1 * p_1
-
-        output_size = [
-            3,
-        ] + self.mesh_info.number_of_cells
-        output_size[axis + 1] += 1
-
-        return self._slice(var_on_face, output_size)
-
-    def _get_var(self, inputs, axis, j):
-        """get variables for reconstructor."""
-        var_0 = None
-        var_1 = None
-        var_2 = None
-
-        if axis == 0:
-            var_0 = inputs[:, self.pad - 2 + j : self.pad - 1 + j + self.mesh_info.number_of_cells[0], :, :]
-            var_1 = inputs[:, self.pad - 1 + j : self.pad + j + self.mesh_info.number_of_cells[0], :, :]
-            var_2 = inputs[:, self.pad + j : self.pad + j + 1 + self.mesh_info.number_of_cells[0], :, :]
-
-        if axis == 1:
-            var_0 = inputs[:, :, self.pad - 2 + j : self.pad - 1 + j + self.mesh_info.number_of_cells[1], :]
-            var_1 = inputs[:, :, self.pad - 1 + j : self.pad + j + self.mesh_info.number_of_cells[1], :]
-            var_2 = inputs[:, :, self.pad + j : self.pad + j + 1 + self.mesh_info.number_of_cells[1], :]
-
-        if axis == 2:
-            var_0 = inputs[:, :, :, self.pad - 2 + j : self.pad - 1 + j + self.mesh_info.number_of_cells[2]]
-            var_1 = inputs[:, :, :, self.pad - 1 + j : self.pad + j + self.mesh_info.number_of_cells[2]]
-            var_2 = inputs[:, :, :, self.pad + j : self.pad + j + 1 + self.mesh_info.number_of_cells[2]]
-
-        return var_0, var_1, var_2
+        return [one_beta_0_sq, one_beta_1_sq]
@@ -18,13 +18,46 @@ Base class of user-defined pde problems.
 from __future__ import absolute_import
 from sympy import diff, Function, symbols, Symbol
 import numpy as np
-from mindspore import jit_class
+from mindspore import nn, ops, grad, jit, jit_class, vjp, vmap, Tensor
+from mindspore import dtype as mstype
 
 from .sympy2mindspore import sympy_to_mindspore
 from ..operators import batched_hessian, batched_jacobian
 from ..loss import get_loss_metric
 
 
+class _OutputGradient(nn.Cell):
+    """Select one output channel of the network and return all the outputs as auxiliary data."""
+
+    def __init__(self, net, out_idx):
+        super().__init__()
+        self.net = net
+        self.out_idx = out_idx
+        self.cast = ops.Cast()
+
+    def construct(self, x):
+        outputs = self.net(x)
+        return self.cast(outputs[:, self.out_idx].sum(), mstype.float32), outputs
+
+
+class _HessianRows(nn.Cell):
+    """
+    Hessian rows of one output channel along the given input directions. The network outputs and the jacobian row are
+    computed once, and the backward passes of all the directions are vectorized over the same jacobian row.
+    """
+
+    def __init__(self, net, out_idx):
+        super().__init__()
+        self.jacobian = grad(_OutputGradient(net, out_idx), grad_position=0, has_aux=True)
+
+    @jit
+    def construct(self, x, directions):
+        jacobian, vjp_fn, (outputs,) = vjp(self.jacobian, x, has_aux=True)
+        sens = ops.broadcast_to(directions[:, None, :], (directions.shape[0],) + jacobian.shape)
+        hessian, = vmap(vjp_fn)(sens)
+        return hessian, jacobian, outputs
+
+
 @jit_class
 class PDEWithLoss:
     """
@@ -110,8 +143,17 @@ class PDEWithLoss:
 
     def __init__(self, model, in_vars, out_vars, params=None, params_val=None):
         self.model = model
+        # the full batched jacobian and hessian are no longer used by parse_node, they are kept for the subclasses
+        # which call them directly.
         self.jacobian = batched_jacobian(self.model)
         self.hessian = batched_hessian(self.model)
+        self.in_num = len(in_vars)
+        self.out_num = len(out_vars)
+        self.in_eye = Tensor(np.eye(self.in_num), mstype.float32)
+        self.out_eye = Tensor(np.eye(self.out_num), mstype.float32)
+        self.jacobian_rows = [grad(_OutputGradient(self.model, i), grad_position=0, has_aux=True)
+                              for i in range(self.out_num)]
+        self.hessian_rows = [_HessianRows(self.model, i) for i in range(self.out_num)]
         self.param_val = params_val
         pde_nodes = self.pde() or dict()
         if isinstance(pde_nodes, dict) and pde_nodes:
@@ -130,6 +172,40 @@ class PDEWithLoss:
         """
         return None
 
+    def _derivative_0(self, inputs, out_weight):
+        """Weighted sum of the network outputs over the batch."""
+        return (self.model(inputs) * out_weight).sum()
+
+    def _derivative_1(self, inputs, out_weight, directions):
+        """Directional derivative of `_derivative_0` along the last direction."""
+        derivative = grad(self._derivative_0, grad_position=0)(inputs, out_weight)
+        return (derivative * directions[-1]).sum()
+
+    def _derivative_2(self, inputs, out_weight, directions):
+        """Directional derivative of `_derivative_1` along the last direction."""
+        derivative = grad(self._derivative_1, grad_position=0)(inputs, out_weight, directions[:-1])
+        return (derivative * directions[-1]).sum()
+
+    def _derivative_3(self, inputs, out_weight, directions):
+        """Directional derivative of `_derivative_2` along the last direction."""
+        derivative = grad(self._derivative_2, grad_position=0)(inputs, out_weight, directions[:-1])
+        return (derivative * directions[-1]).sum()
+
+    def _higher_order_row(self, inputs, out_idx, in_idx):
+        """
+        Gradient of the derivative of the `out_idx` output with respect to the `in_idx` inputs. The derivative is
+        built by nesting one directional gradient per input, so every level only differentiates a scalar instead
+        of the full jacobian or hessian, and the cost does not depend on the number of inputs. Each level is a reverse
+        pass over the graph of the level below, so the cost still grows by a constant factor per order.
+        """
+        out_weight = self.out_eye[out_idx]
+        directions = tuple()
+        for idx in in_idx:
+            directions += (self.in_eye[idx],)
+        if len(in_idx) == 2:
+            return grad(self._derivative_2, grad_position=0)(inputs, out_weight, directions)
+        return grad(self._derivative_3, grad_position=0)(inputs, out_weight, directions)
+
     def parse_node(self, formula_nodes, inputs=None, norm=None):
         """
         Calculate the results for each formula node.
@@ -143,26 +219,46 @@ class PDEWithLoss:
         Returns:
             List(Tensor), the results of the partial differential equations.
         """
-        max_order = 0
+        jacobian_terms = tuple()
+        hessian_terms = tuple()
+        higher_order_terms = tuple()
         for formula_node in formula_nodes:
-            max_order = max(formula_node.max_order, max_order)
-
-        outputs = self.model(inputs)
-        if max_order == 2:
-            hessian = self.hessian(inputs)
-            jacobian = self.jacobian(inputs)
-        elif max_order == 1:
-            hessian = None
-            jacobian = self.jacobian(inputs)
-        else:
-            hessian = None
-            jacobian = None
+            jacobian_terms += formula_node.jacobian_terms
+            hessian_terms += formula_node.hessian_terms
+            higher_order_terms += formula_node.higher_order_terms
+
+        # only the derivative terms referenced by the formula nodes are evaluated, the second-order pass of an output
+        # computes its jacobian row once for all the hessian rows and also returns the network outputs.
+        outputs = None
+        jacobian = []
+        hessian = []
+        for i in range(self.out_num):
+            jacobian_row = None
+            hessian_row = [None] * self.in_num
+            in_idx = [j for j in range(self.in_num) if (i, j) in hessian_terms]
+            if in_idx:
+                directions = ops.stack([self.in_eye[j] for j in in_idx])
+                hessian_items, jacobian_row, outputs = self.hessian_rows[i](inputs, directions)
+                for k, j in enumerate(in_idx):
+                    hessian_row[j] = hessian_items[k]
+            if jacobian_row is None and i in jacobian_terms:
+                jacobian_row, (outputs,) = self.jacobian_rows[i](inputs)
+            jacobian.append(jacobian_row)
+            hessian.append(hessian_row)
+        if outputs is None:
+            outputs = self.model(inputs)
+
+        derivatives = {}
+        for term in higher_order_terms:
+            if term not in derivatives:
+                derivatives[term] = self._higher_order_row(inputs, term[0], term[1])
 
         if self.param_val is None:
-            data_map = {"inputs": inputs, "outputs": outputs, "jacobian": jacobian, "hessian": hessian, "norm": norm}
+            data_map = {"inputs": inputs, "outputs": outputs, "jacobian": jacobian, "hessian": hessian, "norm": norm,
+                        "derivatives": derivatives}
         else:
             data_map = {"inputs": inputs, "outputs": outputs, "jacobian": jacobian, "hessian": hessian,
-                        "norm": norm, "params": self.param_val}
+                        "norm": norm, "derivatives": derivatives, "params": self.param_val}
         res = []
         for formula_node in formula_nodes:
             cur_eq_ret = formula_node.compute(data_map)
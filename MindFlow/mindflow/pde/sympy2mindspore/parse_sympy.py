@@ -31,11 +31,20 @@ class FormulaNode:
 
     Args:
          eq_name (str): the name of sympy expression.
+
+    Note:
+        `jacobian_terms` records the output indices whose first-order derivatives are used, and `hessian_terms`
+        records the (output, input) index pairs whose second-order derivatives are used. `higher_order_terms` records
+        the output index and all but the last input indices of the derivatives above second order, whose gradient
+        with respect to the inputs gives the derivative.
     """
     def __init__(self, eq_name):
         self.name = eq_name
         self.nodes = list()
         self.max_order = 0
+        self.jacobian_terms = tuple()
+        self.hessian_terms = tuple()
+        self.higher_order_terms = tuple()
 
     def compute(self, data):
         rst = list()
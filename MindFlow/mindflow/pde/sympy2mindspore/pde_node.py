@@ -216,5 +216,7 @@ class DerivativeNode:
             ret = self.input_split(derivative_out)[self.in_var_idx[1]]
             return ret
 
-        raise ValueError("For `Derivative`, only first-order and second-order differentials are supported \
-            but got {}".format(self.order))
+        derivatives = data.get("derivatives")
+        derivative_out = derivatives[(self.out_var_idx, self.in_var_idx[:-1])]
+        ret = self.input_split(derivative_out)[self.in_var_idx[-1]]
+        return ret
@@ -124,6 +124,7 @@ class SympyTranslation:
         out_var_idx = self.out_vars.index(item.args[0])
 
         if order == 1:
+            self._add_term("jacobian_terms", out_var_idx)
             cur_var = item.args[1][0]
             if cur_var == sympy.Symbol('n'):
                 derivative_node = DerivativeNode(self.in_vars, order=order, out_var_idx=out_var_idx, is_norm=True)
@@ -132,18 +133,30 @@ class SympyTranslation:
                 in_var_idx = self.in_vars.index(cur_var)
                 derivative_node = DerivativeNode(self.in_vars, order=order, in_var_idx=in_var_idx,
                                                  out_var_idx=out_var_idx)
-        elif order == 2:
+        elif order <= 4:
             var_idx = list()
             for it in item.args[1:]:
                 for _ in range(it[1]):
                     in_var_idx = self.in_vars.index(it[0])
                     var_idx.append(in_var_idx)
+            if order == 2:
+                self._add_term("hessian_terms", (out_var_idx, var_idx[0]))
+            else:
+                # mixed partial derivatives commute, sorting the input indices lets equal terms share one evaluation
+                var_idx = tuple(sorted(var_idx))
+                self._add_term("higher_order_terms", (out_var_idx, var_idx[:-1]))
             derivative_node = DerivativeNode(self.in_vars, order=order, in_var_idx=var_idx, out_var_idx=out_var_idx)
         else:
-            raise ValueError("For `Derivative`, only first-order and second-order differentials are supported \
+            raise ValueError("For `Derivative`, only differentials up to fourth-order are supported \
                 but got {}".format(order))
         return derivative_node
 
+    def _add_term(self, name, term):
+        """records a derivative term used by the formula node"""
+        terms = getattr(self.formula_node, name)
+        if term not in terms:
+            setattr(self.formula_node, name, terms + (term,))
+
     def _parse_function(self, item):
         """parses function"""
         if type(item).__name__ in MINDSPORE_SYMPY_TRANSLATIONS:
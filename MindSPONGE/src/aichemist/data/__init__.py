@@ -23,6 +23,7 @@
 Module data
 """
 
-from .graph import Graph, GraphBatch
+from .graph import Graph, GraphBatch, knn_edges
 from .molecule import Molecule, MoleculeBatch
+from .packed import PackedGraph
 from .knowledge import KnowledgeGraphSet, KnowledgeNodeSet
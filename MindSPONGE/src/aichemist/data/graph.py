@@ -36,6 +36,69 @@ from ..features import mol_feat as feature
 from ..configs import Registry as R
 
 
+def knn_edges(coord: np.ndarray, max_neighbors: int = None, cutoff: float = None, box: np.ndarray = None,
+              n_nodes: np.ndarray = None):
+    """Find the neighbors of each node with a KD-tree, so neither the time nor the memory grow with N x N.
+
+    Args:
+        coord (np.ndarray): The coordinate matrix of nodes. Shape: N x 3
+        max_neighbors (int, optional): The maximum number of neighbors of each node. Defaults to None.
+        cutoff (float, optional): The maximum distance of allowable edge between two nodes. Defaults to None.
+        box (np.ndarray, optional): The lengths of the orthorhombic periodic box. Shape: (3, ).
+            If given, the distances follow the minimum image convention and `cutoff` should not be larger than
+            half of the box. Defaults to None.
+        n_nodes (np.ndarray, optional): The number of nodes of each graph, if `coord` holds a batch of graphs.
+            Nodes are only connected to the nodes of the same graph. Defaults to None.
+
+    Returns:
+        edges (np.ndarray): The 2 x M matrix of edges from each node to its neighbors, ordered by the start node
+            and then by the distance.
+        dist (np.ndarray): The distances of edges. Shape: (M, )
+    """
+    if max_neighbors is None and cutoff is None:
+        raise ValueError('At least one of max_neighbors and cutoff should be given.')
+    coord = np.asarray(coord, dtype=np.float64)
+    if box is not None:
+        box = np.asarray(box, dtype=np.float64)
+        coord = np.mod(coord, box)
+        # np.mod rounds tiny negative coordinates to the box length, which is out of the range of cKDTree
+        coord = np.where(coord >= box, 0, coord)
+    if n_nodes is None:
+        n_nodes = [len(coord)]
+    upper_bound = np.inf if cutoff is None else cutoff
+
+    edges = []
+    dists = []
+    start = 0
+    for n_node in n_nodes:
+        n_node = int(n_node)
+        node = np.arange(n_node)
+        tree = spatial.cKDTree(coord[start:start + n_node], boxsize=box)
+        if max_neighbors is None:
+            pairs = tree.sparse_distance_matrix(tree, cutoff, output_type='ndarray')
+            node_in, node_out, dist = pairs['i'], pairs['j'], pairs['v']
+            mask = (node_in != node_out) & (dist < cutoff)
+            order = np.lexsort((dist[mask], node_in[mask]))
+            node_in, node_out, dist = node_in[mask][order], node_out[mask][order], dist[mask][order]
+        else:
+            # one more neighbor as the node itself is usually the nearest one
+            n_query = min(max_neighbors + 1, n_node)
+            dist, neighbor = tree.query(coord[start:start + n_node], k=n_query, distance_upper_bound=upper_bound)
+            dist = dist.reshape(n_node, n_query)
+            neighbor = neighbor.reshape(n_node, n_query)
+            mask = (neighbor != node[:, None]) & (dist < upper_bound)
+            mask &= np.cumsum(mask, axis=1) <= max_neighbors
+            node_in = np.broadcast_to(node[:, None], mask.shape)[mask]
+            node_out = neighbor[mask]
+            dist = dist[mask]
+        edges.append(np.stack([node_in, node_out]) + start)
+        dists.append(dist)
+        start += n_node
+    edges = np.concatenate(edges, axis=1).astype(np.int64)
+    dist = np.concatenate(dists)
+    return edges, dist
+
+
 @R.register('data.Graph')
 @ms.jit_class
 @dataclass
@@ -174,33 +237,33 @@ class Graph(core.MetaData):
         return cls(edges=edges, **kwargs)
 
     @classmethod
-    def knn_graph(cls, coord: np.ndarray, max_neighbors: int = None, cutoff: float = None, **kwargs):
+    def knn_graph(cls, coord: np.ndarray, max_neighbors: int = None, cutoff: float = None, box: np.ndarray = None,
+                  n_nodes: np.ndarray = None, **kwargs):
         """K-Nearest Neighbor methods to construct graph data from coordinate. The distance metric is Eucidean distance.
+        The neighbors are searched by KD-tree, see `knn_edges` for details.
 
         Args:
             coord (np.ndarray): The coordinate matrix that contains the spatial position each node. Shape: N x 3
             max_neighbors (int, optional): The maximum number of each node. Defaults to None.
             cutoff (float, optional): The maximum distance of allowable edge between two nodes. Defaults to None.
+            box (np.ndarray, optional): The lengths of the orthorhombic periodic box. Shape: (3, ). Defaults to None.
+            n_nodes (np.ndarray, optional): The number of nodes of each graph. If given, a GraphBatch is constructed
+                from the batch of coordinates. Defaults to None.
 
         Returns:
-            Graph
+            Graph or GraphBatch
         """
-        dist = spatial.distance.cdist(coord, coord)
-
-        if max_neighbors is None:
-            edges = np.stack(np.nonzero(dist < cutoff), axis=1)
-        else:
-            neighbors = np.argsort(dist, axis=1)
-            sorted_dist = np.sort(dist, axis=1)
-            if max_neighbors < len(coord):
-                neighbors = neighbors[:, 1:max_neighbors]
-            mask = sorted_dist < cutoff
-            edge_in = np.nonzero(mask)[:, 0].astype(ms.int32)
-            edge_out = neighbors[mask]
-            edges = np.stack([edge_in, edge_out], axis=1)
-        dist_list = dist[tuple(edges)]
-        edge_feat = feature.distance(dist_list=dist_list, **kwargs)
-        graph = cls(edges=edges.T, n_node=dist.shape[0], edge_feat=edge_feat, node_coord=coord)
+        edges, dist = knn_edges(coord, max_neighbors=max_neighbors, cutoff=cutoff, box=box, n_nodes=n_nodes)
+        edge_feat = feature.distance(dist_list=dist, **kwargs)
+        if n_nodes is None:
+            return cls(edges=edges, n_node=len(coord), n_relation=1, edge_feat=edge_feat, node_coord=coord)
+        n_nodes = np.asarray(n_nodes)
+        start = np.cumsum(n_nodes) - n_nodes
+        node2graph = np.repeat(np.arange(len(n_nodes)), n_nodes)[edges[0]]
+        n_edges = np.bincount(node2graph, minlength=len(n_nodes))
+        offsets = start[node2graph]
+        graph = cls.batch_type(edges=edges, n_nodes=n_nodes, n_edges=n_edges, offsets=offsets, n_relation=1,
+                               edge_feat=edge_feat, node_coord=coord)
         return graph
 
     @classmethod
@@ -0,0 +1,223 @@
+# Copyright 2021-2023 @ Shenzhen Bay Laboratory &
+#                       Peking University &
+#                       Huawei Technologies Co., Ltd
+#
+# This code is a part of AIchemist package.
+#
+# The AIchemist is open-source software based on the AI-framework:
+# MindSpore (https://www.mindspore.cn/)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Packed storage of graphs
+"""
+import os
+import json
+import numpy as np
+
+from ..configs import Registry as R
+
+_SKIP_KEYS = ['cls_name', 'detach', 'n_node', 'n_relation']
+
+
+def _level(key):
+    """The level of a property, i.e. whether it has a row for each node, each edge or each graph."""
+    if key == 'edges' or key.startswith('edge_'):
+        return 'edge'
+    if key.startswith('node_'):
+        return 'node'
+    return 'graph'
+
+
+def _variadic_index(starts, counts):
+    """Concatenate the ranges [start, start + count) into one index array."""
+    total = int(counts.sum())
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + np.arange(total) - offsets
+
+
+class PackedGraph:
+    """
+    Graphs of the same type stored as concatenated arrays. The properties of nodes and edges of all graphs are
+    concatenated along their first axis (the second axis of `edges`), and the properties of graphs are stacked.
+    The rows of each graph are found by the number of nodes and edges of graphs.
+
+    Compared with a list of graphs, it is saved and loaded as a few arrays, and a batch is sliced from the arrays
+    without constructing the graphs one by one.
+
+    Args:
+        graph_type (type):      The class of graphs, e.g. Graph or Molecule.
+        fields (dict):          The concatenated arrays of properties.
+        n_nodes (np.ndarray):   Number of nodes of each graph. Shape: (B, )
+        n_edges (np.ndarray):   Number of edges of each graph. Shape: (B, )
+        n_relation (int):       Number of different types of edges. Defaults to None.
+
+    Supported Platforms:
+        ``Ascend`` ``GPU`` ``CPU``
+    """
+
+    def __init__(self, graph_type, fields, n_nodes, n_edges, n_relation=None):
+        self.graph_type = graph_type
+        self.fields = fields
+        self.n_nodes = np.asarray(n_nodes, dtype=np.int64)
+        self.n_edges = np.asarray(n_edges, dtype=np.int64)
+        self.n_relation = n_relation
+        self.starts = {'node': np.cumsum(self.n_nodes) - self.n_nodes,
+                       'edge': np.cumsum(self.n_edges) - self.n_edges,
+                       'graph': np.arange(len(self.n_nodes))}
+        self.counts = {'node': self.n_nodes, 'edge': self.n_edges, 'graph': np.ones_like(self.n_nodes)}
+
+    def __len__(self):
+        return len(self.n_nodes)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __deepcopy__(self, memo):
+        # the arrays are never modified in place, so the copies of datasets can share them
+        return self
+
+    def __getitem__(self, index):
+        if not isinstance(index, (int, np.integer)):
+            return self.subset(index)
+        if index < 0:
+            index += len(self)
+        kwargs = {}
+        for key, value in self.fields.items():
+            level = _level(key)
+            start = self.starts[level][index]
+            end = start + self.counts[level][index]
+            if key == 'edges':
+                kwargs[key] = np.array(value[:, start:end])
+            elif level == 'graph':
+                kwargs[key] = np.array(value[index])
+            else:
+                kwargs[key] = np.array(value[start:end])
+        return self.graph_type(n_node=int(self.n_nodes[index]), n_relation=self.n_relation, **kwargs)
+
+    @classmethod
+    def from_graphs(cls, graphs: list):
+        """
+        Pack a list of graphs of the same type.
+
+        Args:
+            graphs (list): a list of graphs.
+
+        Raises:
+            ValueError: If a property is given for some of the graphs but missing in others.
+
+        Returns:
+            PackedGraph
+        """
+        graph_type = type(graphs[0])
+        n_relations = set(g.n_relation for g in graphs)
+        if len(n_relations) > 1:
+            raise ValueError(f'The graphs have different n_relation: {n_relations}')
+        n_nodes = np.array([g.n_node for g in graphs], dtype=np.int64)
+        n_edges = np.array([g.n_edge for g in graphs], dtype=np.int64)
+        counts = {'node': n_nodes, 'edge': n_edges, 'graph': np.ones_like(n_nodes)}
+        fields = {}
+        for key in graph_type.keys():
+            if key in _SKIP_KEYS:
+                continue
+            values = [g.__dict__.get(key) for g in graphs]
+            if all(value is None for value in values):
+                continue
+            level = _level(key)
+            # empty properties are set to None, which only makes sense for graphs without nodes or edges
+            if any(value is None and count > 0 for value, count in zip(values, counts.get(level))):
+                raise ValueError(f'The property `{key}` is missing in some of the graphs.')
+            values = [value for value in values if value is not None]
+            if level == 'graph':
+                fields[key] = np.stack(values)
+            else:
+                fields[key] = np.concatenate(values, axis=1 if key == 'edges' else 0)
+        return cls(graph_type, fields, n_nodes, n_edges, n_relations.pop())
+
+    def subset(self, index):
+        """
+        Select the graphs by the index.
+
+        Args:
+            index (Union[list, np.ndarray, slice]): the index of graphs.
+
+        Returns:
+            PackedGraph
+        """
+        index = np.arange(len(self))[index]
+        fields = {}
+        for key, value in self.fields.items():
+            level = _level(key)
+            if level == 'graph':
+                fields[key] = value[index]
+                continue
+            rows = _variadic_index(self.starts[level][index], self.counts[level][index])
+            fields[key] = value[:, rows] if key == 'edges' else value[rows]
+        return type(self)(self.graph_type, fields, self.n_nodes[index], self.n_edges[index], self.n_relation)
+
+    def pack(self, index=None):
+        """
+        Construct the batch of graphs from the arrays, which is the same as `Graph.pack` of the graphs.
+
+        Args:
+            index (Union[list, np.ndarray, slice], optional): the index of graphs. Defaults to None.
+
+        Returns:
+            GraphBatch
+        """
+        packed = self if index is None else self.subset(index)
+        kwargs = {}
+        for key, value in packed.fields.items():
+            if _level(key) == 'graph':
+                value = value.reshape((-1,) + value.shape[2:])
+            kwargs[key] = np.array(value)
+        return self.graph_type.batch_type(n_nodes=packed.n_nodes, n_edges=packed.n_edges,
+                                          n_relation=self.n_relation, **kwargs)
+
+    def save(self, path: str):
+        """
+        Save the arrays as `.npy` files in a directory.
+
+        Args:
+            path (str): the directory to save.
+        """
+        os.makedirs(path, exist_ok=True)
+        for key, value in self.fields.items():
+            np.save(os.path.join(path, key + '.npy'), value)
+        np.save(os.path.join(path, 'n_nodes.npy'), self.n_nodes)
+        np.save(os.path.join(path, 'n_edges.npy'), self.n_edges)
+        n_relation = None if self.n_relation is None else int(self.n_relation)
+        meta = {'graph_type': self.graph_type.cls_name, 'n_relation': n_relation, 'keys': list(self.fields)}
+        with open(os.path.join(path, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: str = 'r'):
+        """
+        Load the arrays saved by `save`.
+
+        Args:
+            path (str): the directory of arrays.
+            mmap_mode (str, optional): the memory map mode of `np.load`. Defaults to 'r'.
+
+        Returns:
+            PackedGraph
+        """
+        with open(os.path.join(path, 'meta.json'), 'r') as f:
+            meta = json.load(f)
+        fields = {key: np.load(os.path.join(path, key + '.npy'), mmap_mode=mmap_mode) for key in meta['keys']}
+        n_nodes = np.load(os.path.join(path, 'n_nodes.npy'))
+        n_edges = np.load(os.path.join(path, 'n_edges.npy'))
+        return cls(R.get(meta['graph_type']), fields, n_nodes, n_edges, meta['n_relation'])
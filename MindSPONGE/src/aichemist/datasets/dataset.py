@@ -25,6 +25,12 @@ Dataset
 
 import warnings
 import os
+import shutil
+import pickle
+import marshal
+import hashlib
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from rdkit import Chem
@@ -35,10 +41,38 @@ from tqdm import tqdm
 from ..configs import Registry as R
 from ..core import BaseDataset
 from ..data.molecule import Molecule, MoleculeBatch
+from ..data.packed import PackedGraph
+from ..utils import compute_md5
 
 
 mol_passers = {'smiles': Chem.MolFromSmiles, 'smarts': Chem.MolFromSmiles, 'inchi': Chem.MolFromInchi}
 
+# version of the cached molecules, which should be increased if the featurization changes
+CACHE_VERSION = 1
+
+
+def _code_digest(transform):
+    """Digest of the byte code of the transform, so editing a transform of the same name invalidates the cache."""
+    func = getattr(transform, 'func', transform)
+    func = getattr(func, '__func__', func)
+    if not hasattr(func, '__code__'):
+        func = getattr(type(func), '__call__', None)
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return None
+    return hashlib.sha256(marshal.dumps(code)).hexdigest()
+
+
+def _featurize(mol, fmt, transform, task_list, kwargs):
+    """Parse and transform one molecule. It runs in the worker processes of `MolSet.load_mol`."""
+    if fmt != 'sdf':
+        passer = mol_passers.get(fmt)
+        mol = passer(mol)
+    label = None
+    if task_list is not None:
+        label = [mol.GetProp(task) for task in task_list]
+    return transform(mol, **kwargs), label
+
 
 @R.register('dataset.MolSet')
 class MolSet(BaseDataset):
@@ -51,6 +85,16 @@ class MolSet(BaseDataset):
                                             loading time. Default: ``False``.
             verbose (int, optional):        verbose (int, optional): output verbose level. Defaults to 0.
             transform (Callable, optional): transform (Callable, optional): data transformation function.
+                                            It should be picklable if `num_workers` is larger than 1
+                                            or `cache_dir` is given.
+                                            Defaults to None.
+            num_workers (int, optional):    number of processes to transform the molecules. Defaults to 0.
+            cache_dir (str, optional):      directory to cache the transformed molecules of the loaded files, keyed by
+                                            the content of the file, the loading options, the pickled transform and
+                                            the byte code of the transform. The molecules are stored as packed
+                                            arrays, see `PackedGraph`. If None or the transform can not be pickled,
+                                            the molecules are not cached. The functions called by the transform are
+                                            not part of the key, so the cache should be cleared if they change.
                                             Defaults to None.
     """
     _caches = ['data', 'label']
@@ -59,10 +103,14 @@ class MolSet(BaseDataset):
                  lazy=False,
                  verbose=0,
                  transform=None,
+                 num_workers=0,
+                 cache_dir=None,
                  **kwargs) -> None:
         super().__init__(**kwargs)
         self.verbose = verbose
         self.lazy = lazy
+        self.num_workers = num_workers
+        self.cache_dir = cache_dir
         self.columns = ['graph.' + key for key in MoleculeBatch.keys()]
         self.columns += self._caches[1:]
         self.transform = transform or Molecule.from_molecule
@@ -75,6 +123,14 @@ class MolSet(BaseDataset):
         return f"{self.__class__.__name__}(\n  {lines}\n)"
 
     def __getitem__(self, index):
+        if isinstance(self.data, PackedGraph):
+            # slice the batch from the packed arrays without constructing the molecules
+            index = self._standarize_index(index)
+            batch_index = [index] if isinstance(index, (int, np.integer)) else index
+            params = [None] + [getattr(self, cache)[index] for cache in self._caches[1:]]
+            data = self.data.pack(batch_index).to_dict()
+            output = [data.get(k.split('.')[-1]) for k in self.columns if '.' in k]
+            return output + params[1:]
         params = list(super().__getitem__(index))
         if self.lazy:
             data = []
@@ -117,6 +173,8 @@ class MolSet(BaseDataset):
             for smiles in self.mol:
                 graph = Molecule.from_smiles(smiles, **self.kwargs)
                 atom_types.update(graph.atom_type.tolist())
+        elif isinstance(self.data, PackedGraph):
+            atom_types.update(np.unique(self.data.fields['node_type']).tolist())
         else:
             for graph in self.data:
                 atom_types.update(graph.atom_type.tolist())
@@ -134,6 +192,9 @@ class MolSet(BaseDataset):
             for smiles in self.mol:
                 graph = Molecule.from_smiles(smiles, **self.kwargs)
                 bond_types.update(graph.edge_type.tolist())
+        elif isinstance(self.data, PackedGraph):
+            if 'edge_type' in self.data.fields:
+                bond_types.update(np.unique(self.data.fields['edge_type']).tolist())
         else:
             for graph in self.data:
                 bond_types.update(graph.edge_type.tolist())
@@ -168,10 +229,73 @@ class MolSet(BaseDataset):
         else:
             raise TypeError(f'The iput file format \"{fmt}\" is not support')
 
-        if hasattr(self, 'mol'):
-            return self.load_mol(max_len=max_len, fmt=fmt, **kwargs)
+        if not hasattr(self, 'mol'):
+            return self
+        cache_path = self._cache_path(fname, fmt=fmt, mol_field=mol_field, max_len=max_len, **kwargs)
+        if cache_path is not None and os.path.exists(cache_path):
+            return self.load_cache(cache_path)
+        self.load_mol(max_len=max_len, fmt=fmt, **kwargs)
+        if cache_path is not None and self.data:
+            self.save_cache(cache_path)
         return self
 
+    def load_cache(self, path):
+        """
+        Load the molecules and labels cached by `save_cache`.
+
+        Args:
+            path (str): directory of the cache.
+
+        Returns:
+            self
+        """
+        self.data = PackedGraph.load(path)
+        if 'label' in self._caches:
+            self.label = np.load(os.path.join(path, 'label.npy'))
+        return self
+
+    def save_cache(self, path):
+        """
+        Save the molecules as packed arrays and the labels into a directory.
+
+        Args:
+            path (str): directory of the cache.
+        """
+        try:
+            packed = PackedGraph.from_graphs(self.data)
+        except ValueError as e:
+            warnings.warn(f"The molecules are not cached: {e}")
+            return
+        # write to a temporary directory first, so an interrupted run never leaves a partial cache
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        packed.save(tmp_path)
+        if 'label' in self._caches:
+            np.save(os.path.join(tmp_path, 'label.npy'), self.label)
+        try:
+            os.rename(tmp_path, path)
+        except OSError:
+            # the cache has been written by another process
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def _cache_path(self, fname, **kwargs):
+        """The directory to cache the molecules, which is keyed by the content of the file and the options."""
+        # only the molecules of a single file are cached
+        if self.cache_dir is None or self.lazy or len(self.data) > 0:
+            return None
+        # lambdas and local functions can not be told apart by their names, so the pickled transform is hashed
+        try:
+            transform = hashlib.sha256(pickle.dumps(self.transform)).hexdigest()
+        except (pickle.PicklingError, AttributeError, TypeError):
+            warnings.warn(f"The molecules are not cached as the transform {self.transform} can not be pickled.")
+            return None
+        # functions are pickled by their names, so their byte code is hashed as well
+        key = [CACHE_VERSION, compute_md5(fname), type(self).__name__, transform, _code_digest(self.transform),
+               sorted(kwargs.items()), list(self.task_list) if hasattr(self, 'task_list') else None]
+        key = hashlib.sha256(repr(key).encode())
+        if isinstance(self.label, np.ndarray) and self.label.dtype != object:
+            key.update(self.label.tobytes())
+        return os.path.join(os.path.expanduser(self.cache_dir), key.hexdigest())
+
     def load_mol(self, max_len=None, fmt='smiles', **kwargs):
         """
         Transform the molecule to Graph data.
@@ -186,23 +310,40 @@ class MolSet(BaseDataset):
         if not hasattr(self, 'mol') or self.lazy:
             return self
 
-        indexes = enumerate(self.mol)
-        if self.verbose:
-            indexes = tqdm(indexes, "Constructing molecules", total=len(self.mol))
-        for i, mol in indexes:
+        # the original index of molecules to be transformed
+        indexes = []
+        mols = []
+        for i, mol in enumerate(self.mol):
             if mol is None:
                 continue
-            if fmt != 'sdf':
-                passer = mol_passers.get(fmt)
-                mol = passer(mol)
-            if not self.lazy:
-                mol = self.transform(mol, **kwargs)
-            self.data.append(mol)
-            if 'label' in self._caches:
-                label = [mol.GetProp(task) for task in self.task_list] if self.label is None else self.label[i]
-                labels.append(label)
-            if max_len and len(self.data) >= max_len:
+            indexes.append(i)
+            mols.append(mol)
+            if max_len and len(mols) >= max_len:
                 break
+        if isinstance(self.data, PackedGraph):
+            self.data = list(self.data)
+        read_prop = 'label' in self._caches and self.label is None
+        func = partial(_featurize, fmt=fmt, transform=self.transform,
+                       task_list=self.task_list if read_prop else None, kwargs=kwargs)
+
+        executor = ProcessPoolExecutor(self.num_workers) if self.num_workers > 1 else None
+        try:
+            if executor is not None:
+                chunksize = max(1, len(mols) // (self.num_workers * 16))
+                results = executor.map(func, mols, chunksize=chunksize)
+            else:
+                results = map(func, mols)
+            if self.verbose:
+                results = tqdm(results, "Constructing molecules", total=len(mols))
+            # the results are in the order of molecules
+            for i, (mol, label) in zip(indexes, results):
+                self.data.append(mol)
+                if 'label' in self._caches:
+                    labels.append(label if read_prop else self.label[i])
+        finally:
+            # the workers are shut down even if a molecule fails to be transformed
+            if executor is not None:
+                executor.shutdown()
         if 'label' in self._caches:
             self.label = np.stack(labels).astype(np.float32)
         return self
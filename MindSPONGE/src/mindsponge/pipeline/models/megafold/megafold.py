@@ -26,9 +26,12 @@
 
 import time
 import os
+import copy
+import logging
 import numpy as np
 
 import mindspore as ms
+import mindspore.common.dtype as mstype
 from mindspore.common import mutable
 from mindspore import Tensor
 import mindspore.communication.management as D
@@ -37,6 +40,7 @@ from mindspore.context import ParallelMode
 
 from mindsponge.common.protein import to_pdb, from_prediction
 from mindsponge.cell.mask import LayerNormProcess
+from mindsponge.cell.amp import amp_convert
 from .module.fold_wrapcell import TrainOneStepCell, WithLossCell
 from .module.lr import cos_decay_lr
 from .nn_arch import Megafold, compute_confidence
@@ -89,6 +93,9 @@ class MEGAFold(Model):
                                                "atomic_clean_policy": 1,})
             self.mixed_precision = True
             self.fp32_white_list = (ms.nn.Softmax, ms.nn.LayerNorm, LayerNormProcess)
+        compile_cache_path = getattr(self.config, 'compile_cache_path', None)
+        if compile_cache_path:
+            context.set_context(enable_compile_cache=True, compile_cache_path=compile_cache_path)
 
         self.use_jit = self.config.use_jit
         megafold = Megafold(self.config, self.mixed_precision)
@@ -97,6 +104,10 @@ class MEGAFold(Model):
         self.checkpoint_path = "./MEGA_Fold_1.ckpt"
         super().__init__(self.checkpoint_url, self.checkpoint_path, self.network, self.name,
                          white_list=self.fp32_white_list, mixed_precision=self.mixed_precision)
+        # networks for the padded lengths of the length buckets, which share the parameters of self.network
+        self.bucket_networks = {self.config.seq_length: self.network}
+        # number of recycles run by the last prediction, which is less than num_recycle if recycling converged
+        self.last_num_recycle = None
 
         if self.config.is_training:
             if config.train.is_parallel:
@@ -124,12 +135,13 @@ class MEGAFold(Model):
 
     def forward(self, data):
         "forward"
+        network = self._get_network(data['aatype'].shape[-1])
         if self.use_jit:
             prev_pos, prev_msa_first_row, prev_pair, predicted_lddt_logits \
-                = self._jit_forward(data)
+                = self._jit_forward(network, data)
         else:
             prev_pos, prev_msa_first_row, prev_pair, predicted_lddt_logits \
-                = self._pynative_forward(data)
+                = self._pynative_forward(network, data)
 
         res = prev_pos, prev_msa_first_row, prev_pair, predicted_lddt_logits
         return res
@@ -164,11 +176,16 @@ class MEGAFold(Model):
     def predict(self, data, **kwargs):
         "predict"
         num_recycle = self.config.data.num_recycle
+        pos_tolerance = getattr(self.config.data, 'recycle_pos_tolerance', None)
+        plddt_tolerance = getattr(self.config.data, 'recycle_plddt_tolerance', None)
+        early_stop = pos_tolerance is not None or plddt_tolerance is not None
         num_residues = data["num_residues"]
         recycle_feature_name = self.feature_list[:-3]
         prev_pos = Tensor(data['prev_pos'])
         prev_msa_first_row = Tensor(data['prev_msa_first_row'])
         prev_pair = Tensor(data['prev_pair'])
+        last_ca, last_plddt = None, None
+        self.last_num_recycle = num_recycle
         for recycle in range(num_recycle):
             data_iter = {}
             for key in recycle_feature_name:
@@ -178,6 +195,18 @@ class MEGAFold(Model):
             data_iter['prev_pair'] = prev_pair
             data_iter = mutable(data_iter)
             prev_pos, prev_msa_first_row, prev_pair, predicted_lddt_logits = self.forward(data_iter)
+            if early_stop and recycle < num_recycle - 1:
+                ca = prev_pos.asnumpy()[:num_residues, 1].astype(np.float32)
+                plddt = compute_confidence(predicted_lddt_logits.asnumpy()[:num_residues])
+                if last_ca is not None:
+                    ca_rmsd = np.sqrt(np.mean(np.sum(np.square(ca - last_ca), axis=-1)))
+                    pos_converged = pos_tolerance is None or ca_rmsd < pos_tolerance
+                    plddt_converged = plddt_tolerance is None or abs(plddt - last_plddt) < plddt_tolerance
+                    if pos_converged and plddt_converged:
+                        self.last_num_recycle = recycle + 1
+                        logging.info("Recycling converged after %d iterations", recycle + 1)
+                        break
+                last_ca, last_plddt = ca, plddt
         final_atom_positions = prev_pos.asnumpy()[:num_residues]
         final_atom_mask = data_iter['atom37_atom_exists'].asnumpy()[:num_residues]
         predicted_lddt_logits = predicted_lddt_logits.asnumpy()[:num_residues]
@@ -260,17 +289,38 @@ class MEGAFold(Model):
         return loss_info
 
 
+    def _get_network(self, seq_length):
+        "network for the padded sequence length, which shares the parameters of self.network"
+        if seq_length not in self.bucket_networks:
+            config = copy.deepcopy(self.config)
+            config.seq_length = seq_length
+            network = Megafold(config, self.mixed_precision)
+            if self.mixed_precision:
+                network.to_float(mstype.float16)
+                amp_convert(network, self.fp32_white_list)
+            # replace the parameters instead of copying them, so the weights are held once for all the buckets
+            # and the weights loaded by from_pretrained later are seen by all the buckets
+            params = self.network.parameters_dict()
+            for _, cell in network.cells_and_names():
+                # pylint: disable=protected-access
+                for name, param in list(cell._params.items()):
+                    shared = None if param is None else params.get(param.name)
+                    if shared is not None and shared.shape == param.shape:
+                        setattr(cell, name, shared)
+            self.bucket_networks[seq_length] = network
+        return self.bucket_networks.get(seq_length)
+
     @jit
-    def _jit_forward(self, data):
+    def _jit_forward(self, network, data):
         feat = []
         for key in self.feature_list:
             feat.append(data[key])
-        res = self.network(*feat)
+        res = network(*feat)
         return res
 
-    def _pynative_forward(self, data):
+    def _pynative_forward(self, network, data):
         feat = []
         for key in self.feature_list:
             feat.append(data[key])
-        res = self.network(*feat)
+        res = network(*feat)
         return res
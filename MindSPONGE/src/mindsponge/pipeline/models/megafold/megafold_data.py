@@ -30,6 +30,9 @@ from mindsponge.common.utils import make_atom14_positions
 from ...dataset import curry1
 from .megafold_feature import NUM_RES, NUM_MSA_SEQ, NUM_EXTRA_SEQ, NUM_TEMPLATES
 
+MSA_NUM_CLASSES = 23
+MSA_CHUNK_SIZE = 256
+
 
 @curry1
 def dict_filter_key(feature=None, feature_list=None):
@@ -255,28 +258,40 @@ def make_atom14_mask(feature):
 
 
 @curry1
-def msa_nearest_neighbor_clusters(feature=None, gap_agreement_weight=0.):
-    """Assign each extra MSA sequence to its nearest neighbor in sampled MSA."""
+def msa_nearest_neighbor_clusters(feature=None, gap_agreement_weight=0., chunk_size=MSA_CHUNK_SIZE):
+    """Assign each extra MSA sequence to its nearest neighbor in sampled MSA.
+
+    The extra MSA is one-hot encoded `chunk_size` sequences at a time, so the peak memory does not grow with the
+    depth of the extra MSA.
+    """
 
     # Determine how much weight we assign to each agreement.  In theory, we could
     # use a full blosum matrix here, but right now let's just down-weight gap
     # agreement because it could be spurious.
     # Never put weight on agreeing on BERT mask
-    weights = np.concatenate([np.ones(21), gap_agreement_weight * np.ones(1), np.zeros(1)], 0)
+    weights = np.concatenate([np.ones(21), gap_agreement_weight * np.ones(1), np.zeros(1)], 0).astype(np.float32)
 
     # Make agreement score as weighted Hamming distance
-    sample_one_hot = feature["msa_mask"][:, :, None] * one_hot(23, feature['msa'])
-    num_seq, num_res, _ = sample_one_hot.shape
-    array_extra_msa_mask = feature['extra_msa_mask']
-    if array_extra_msa_mask.any():
-        extra_one_hot = feature['extra_msa_mask'][:, :, None] * one_hot(23, feature['extra_msa'])
-        extra_num_seq, _, _ = extra_one_hot.shape
-
-        agreement = np.matmul(
-            np.reshape(extra_one_hot, [extra_num_seq, num_res * 23]),
-            np.reshape(sample_one_hot * weights, [num_seq, num_res * 23]).T)
-        # Assign each sequence in the extra sequences to the closest MSA sample
-        feature['extra_cluster_assignment'] = np.argmax(agreement, axis=1)
+    msa = feature['msa'].astype(np.int64)
+    num_seq, num_res = msa.shape
+    res_offset = np.arange(num_res) * MSA_NUM_CLASSES
+    sample_weight = np.zeros((num_seq, num_res * MSA_NUM_CLASSES), np.float32)
+    np.put_along_axis(sample_weight, msa + res_offset, feature['msa_mask'] * weights[msa], axis=1)
+
+    extra_msa_mask = feature['extra_msa_mask']
+    if extra_msa_mask.any():
+        extra_msa = feature['extra_msa'].astype(np.int64)
+        extra_num_seq = extra_msa.shape[0]
+        assignment = np.zeros(extra_num_seq, np.int64)
+        extra_one_hot = np.zeros((min(chunk_size, extra_num_seq), num_res * MSA_NUM_CLASSES), np.float32)
+        for start in range(0, extra_num_seq, chunk_size):
+            end = min(start + chunk_size, extra_num_seq)
+            chunk = extra_one_hot[:end - start]
+            chunk.fill(0)
+            np.put_along_axis(chunk, extra_msa[start:end] + res_offset, extra_msa_mask[start:end], axis=1)
+            # Assign each sequence in the extra sequences to the closest MSA sample
+            assignment[start:end] = np.argmax(np.matmul(chunk, sample_weight.T), axis=1)
+        feature['extra_cluster_assignment'] = assignment
     else:
         feature['extra_cluster_assignment'] = np.array([])
     return feature
@@ -284,24 +299,30 @@ def msa_nearest_neighbor_clusters(feature=None, gap_agreement_weight=0.):
 
 def msa_summarize_clusters(feature=None):
     """Produce profile and deletion_matrix_mean within each cluster."""
-    num_seq = feature['msa'].shape[0]
+    num_seq, num_res = feature['msa'].shape
+    assignment = feature['extra_cluster_assignment'].astype(np.int64)
+    # an empty assignment means that no extra sequence belongs to any cluster
+    num_extra = assignment.shape[0] if assignment.shape[0] == feature['extra_msa_mask'].shape[0] else 0
+    assignment = assignment[:num_extra]
+    mask = feature['extra_msa_mask'][:num_extra]
+
+    # flat index of (cluster, residue) of each extra MSA entry
+    segment = (assignment[:, None] * num_res + np.arange(num_res)).reshape(-1)
 
     def csum(x):
-        result = []
-        for i in range(num_seq):
-            result.append(np.sum(x[np.where(feature['extra_cluster_assignment'] == i)], axis=0))
-        return np.array(result)
+        return np.bincount(segment, weights=x.reshape(-1), minlength=num_seq * num_res).reshape(num_seq, num_res)
 
-    mask = feature['extra_msa_mask']
-    mask_counts = 1e-6 + feature['msa_mask'] + csum(mask)  # Include center
+    mask_counts = 1e-6 + feature['msa_mask'] + csum(mask).astype(mask.dtype)  # Include center
 
-    msa_sum = csum(mask[:, :, None] * one_hot(23, feature['extra_msa']))
-    msa_sum += one_hot(23, feature['msa'])  # Original sequence
+    msa_segment = segment * MSA_NUM_CLASSES + feature['extra_msa'][:num_extra].reshape(-1)
+    msa_sum = np.bincount(msa_segment, weights=mask.reshape(-1), minlength=num_seq * num_res * MSA_NUM_CLASSES)
+    msa_sum = msa_sum.reshape(num_seq, num_res, MSA_NUM_CLASSES)
+    msa_sum = msa_sum + one_hot(MSA_NUM_CLASSES, feature['msa'])  # Original sequence
     feature['cluster_profile'] = msa_sum / mask_counts[:, :, None]
 
     del msa_sum
 
-    del_sum = csum(mask * feature['extra_deletion_matrix'])
+    del_sum = csum(mask * feature['extra_deletion_matrix'][:num_extra]).astype(mask.dtype)
     del_sum += feature['deletion_matrix']  # Original sequence
     feature['cluster_deletion_mean'] = del_sum / mask_counts
     del del_sum
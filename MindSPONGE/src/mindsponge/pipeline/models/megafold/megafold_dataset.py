@@ -42,6 +42,7 @@ from .megafold_data import correct_restypes, make_atom14_mask, tail_process, \
     template_feature_crop, label_pseudo_beta, initial_template_mask, prev_initial, \
     label_make_atom14_positions, label_atom37_to_frames, label_atom37_to_torsion_angles
 from .megafold_feature import _msa_feature_names, _inference_feature, _training_feature
+from .megafold_store import FeatureStore, FeatureStoreWriter
 from ...dataset import PSP, data_process_run
 
 
@@ -126,14 +127,19 @@ class MEGAFoldDataSet(PSP):
             self.ensemble.append(dict_del_key(filter_list=extra_msa_feature_names))
 
         self.ensemble.append(msa_feature_concatenate)
+        self.length_buckets = None
+        self.bucket_crops = {}
         if self.config.fixed_size:
-            self.ensemble.append(
-                random_crop_to_size(
-                    feature_list=self.feature_names, crop_size=self.config.seq_length,
-                    max_templates=data_config.max_templates, max_msa_clusters=max_msa_clusters,
-                    max_extra_msa=data_config.max_extra_msa,
-                    subsample_templates=data_config.subsample_templates, seed=seed,
-                    random_recycle=data_config.random_recycle))
+            self.crop_kwargs = dict(feature_list=self.feature_names,
+                                    max_templates=data_config.max_templates, max_msa_clusters=max_msa_clusters,
+                                    max_extra_msa=data_config.max_extra_msa,
+                                    subsample_templates=data_config.subsample_templates, seed=seed,
+                                    random_recycle=data_config.random_recycle)
+            self.ensemble.append(random_crop_to_size(crop_size=self.config.seq_length, **self.crop_kwargs))
+            # pad each sequence to the shortest bucket which holds it, so MEGAFold compiles once per bucket
+            length_buckets = getattr(data_config, 'length_buckets', None)
+            if length_buckets and not self.is_training:
+                self.length_buckets = sorted(length_buckets)
         else:
             self.ensemble.append(template_feature_crop(max_templates=data_config.max_templates))
 
@@ -168,18 +174,24 @@ class MEGAFoldDataSet(PSP):
         self.training_pdb_path = None
         self.training_pdb_items = None
         self.training_pkl_items = None
+        self.training_store = None
 
         super().__init__()
 
     def __len__(self):
+        if self.training_store is not None:
+            return len(self.training_store)
         return len(self.training_pkl_items)
 
     def __getitem__(self, idx):
-        if self.in_memory:
-            data, label = self.inputs[idx]
+        if self.training_store is not None:
+            features = self.ensemble_process(self.training_store[idx], 4)
         else:
-            data, label = self.data_parse(idx)
-        features = self.process(data, label, 4)
+            if self.in_memory:
+                data, label = self.inputs[idx]
+            else:
+                data, label = self.data_parse(idx)
+            features = self.process(data, label, 4)
         tuple_feature = tuple([features.get(key, np.array([])) for key in self.feature_list])
         return tuple_feature
 
@@ -207,15 +219,24 @@ class MEGAFoldDataSet(PSP):
         return data
 
     def process(self, data, label=None, ensemble_num=4):
+        features = self.static_process(data, label)
+        return self.ensemble_process(features, ensemble_num)
+
+    def static_process(self, data, label=None):
+        "deterministic part of process, which is saved in the feature store"
         if self.is_training:
             labels = data_process_run(label, self.label_fns)
             data.update(labels)
         data = self.template_shape(data)
-        features = data_process_run(data.copy(), self.data_process)
+        return data_process_run(data.copy(), self.data_process)
+
+    def ensemble_process(self, features, ensemble_num=4):
+        "random sampling and cropping of the ensembles and the tail process"
         if self.ensemble is not None:
+            ensemble = self.get_ensemble(features)
             res = {}
             for _ in range(ensemble_num):
-                ensemble_features = data_process_run(features.copy(), self.ensemble)
+                ensemble_features = data_process_run(features.copy(), ensemble)
                 if not res:
                     res = {x: () for x in ensemble_features.keys()}
                 for key in ensemble_features.keys():
@@ -230,6 +251,16 @@ class MEGAFoldDataSet(PSP):
         features = data_process_run(features, self.tail_fns)
         return features
 
+    def get_ensemble(self, features):
+        "ensemble functions, which crop and pad the features to the length bucket of the sequence if it is set"
+        if self.length_buckets is None:
+            return self.ensemble
+        seq_length = int(np.reshape(features['seq_length'], (-1,))[0])
+        crop_size = next((size for size in self.length_buckets if size >= seq_length), self.length_buckets[-1])
+        if crop_size not in self.bucket_crops:
+            self.bucket_crops[crop_size] = random_crop_to_size(crop_size=crop_size, **self.crop_kwargs)
+        return self.ensemble[:-1] + [self.bucket_crops.get(crop_size)]
+
     def data_parse(self, idx):
         "data_parse"
         pkl_path = self.training_pkl_items[idx]
@@ -255,8 +286,12 @@ class MEGAFoldDataSet(PSP):
         return data, label
 
     def set_training_data_src(self, data_src):
-        "set_training_data_src"
+        "set_training_data_src, which is either a directory of pkl and pdb files or a feature store"
         self.training_data_src = data_src
+        if FeatureStore.exists(data_src):
+            self.training_store = FeatureStore(data_src)
+            return
+        self.training_store = None
         self.training_pkl_path = self.training_data_src + "/pkl/"
         self.training_pdb_path = self.training_data_src + "/pdb/"
 
@@ -269,6 +304,19 @@ class MEGAFoldDataSet(PSP):
         self.training_pdb_items = [self.training_pdb_path + key + ".pdb" for  key in name_list]
         self.training_pkl_items = [self.training_pkl_path + key + ".pkl" for key in name_list]
 
+    def save_feature_store(self, store_path, shard_size=1 << 30):
+        """
+        Convert the training data set by `set_training_data_src` to a feature store, which holds the features after
+        `static_process`. Set the store by `set_training_data_src(store_path)` to only run `ensemble_process` online.
+        """
+        if self.training_pkl_items is None:
+            raise ValueError("The training data should be set by set_training_data_src before saving the store.")
+        with FeatureStoreWriter(store_path, shard_size) as writer:
+            for idx, pkl_path in enumerate(self.training_pkl_items):
+                data, label = self.data_parse(idx)
+                name = os.path.basename(pkl_path).split(".")[0]
+                writer.add(name, self.static_process(data, label))
+
     def create_iterator(self, num_epochs, **kwargs):
         "create_iterator"
         if self.is_parallel:
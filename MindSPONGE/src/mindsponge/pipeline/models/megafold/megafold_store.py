@@ -0,0 +1,201 @@
+# Copyright 2023 @ Shenzhen Bay Laboratory &
+#                  Peking University &
+#                  Huawei Technologies Co., Ltd
+#
+# This code is a part of MindSPONGE:
+# MindSpore Simulation Package tOwards Next Generation molecular modelling.
+#
+# MindSPONGE is open-source software based on the AI-framework:
+# MindSpore (https://www.mindspore.cn/)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""megafold_store"""
+import os
+import json
+import mmap
+import numpy as np
+
+STORE_INDEX = 'index.json'
+STORE_VERSION = 2
+_ALIGNMENT = 64
+
+
+def _encode(value):
+    """
+    Kind of a feature and the array written to the shard, which is None for the values kept in the index.
+
+    Arrays of str or bytes objects are written as fixed width arrays, and numpy scalars as 0-d arrays.
+    """
+    if isinstance(value, np.generic):
+        return 'scalar', np.asarray(value)
+    if not isinstance(value, np.ndarray):
+        try:
+            json.dumps(value)
+        except TypeError as e:
+            raise TypeError(f"Features of type {type(value)} can not be saved in the feature store.") from e
+        return 'value', None
+    if not value.dtype.hasobject:
+        return 'array', value
+    elements = value.reshape(-1).tolist()
+    if all(isinstance(element, bytes) for element in elements):
+        return 'object', value.astype(bytes)
+    if all(isinstance(element, str) for element in elements):
+        return 'object', value.astype(str)
+    raise TypeError("Only the arrays of objects which are all str or all bytes can be saved in the feature store.")
+
+
+class FeatureStoreWriter:
+    """
+    Write the feature dicts of samples into a feature store.
+
+    The arrays are appended to binary shard files of at most `shard_size` bytes, and their dtypes, shapes and offsets
+    are recorded in a JSON index, which is written by `close`. Numpy scalars and arrays of str or bytes objects are
+    written as arrays as well, and the other values, which should be JSON serializable, are kept in the index.
+
+    Args:
+        path (str):         Directory of the feature store.
+        shard_size (int):   Maximum size of a shard file in bytes. A larger sample starts a shard of its own.
+                            Default: 1 << 30.
+    """
+
+    def __init__(self, path, shard_size=1 << 30):
+        self.path = path
+        self.shard_size = shard_size
+        os.makedirs(path, exist_ok=True)
+        self.shards = []
+        self.names = []
+        self.items = []
+        self._file = None
+        self._size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._file is not None:
+            self._file.close()
+
+    def _new_shard(self):
+        "open the next shard file"
+        if self._file is not None:
+            self._file.close()
+        shard = f"shard_{len(self.shards):05d}.bin"
+        self.shards.append(shard)
+        self._file = open(os.path.join(self.path, shard), 'wb')
+        self._size = 0
+
+    def add(self, name, features):
+        "append the features of one sample"
+        encoded = {key: _encode(value) for key, value in features.items()}
+        nbytes = sum(array.nbytes + _ALIGNMENT for _, array in encoded.values() if array is not None)
+        if self._file is None or (self._size > 0 and self._size + nbytes > self.shard_size):
+            self._new_shard()
+
+        item = {}
+        for key, (kind, array) in encoded.items():
+            if array is None:
+                item[key] = {'kind': kind, 'value': features[key]}
+                continue
+            pad = -self._size % _ALIGNMENT
+            self._file.write(b'\0' * pad)
+            self._size += pad
+            # np.require keeps the shape of 0-d arrays, which np.ascontiguousarray turns into (1,)
+            array = np.require(array, requirements='C')
+            item[key] = {'kind': kind, 'shard': len(self.shards) - 1, 'offset': self._size,
+                         'dtype': array.dtype.str, 'shape': list(array.shape)}
+            self._file.write(array.tobytes())
+            self._size += array.nbytes
+        self.names.append(name)
+        self.items.append(item)
+
+    def close(self):
+        "close the last shard and write the index"
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        index = {'version': STORE_VERSION, 'shards': self.shards, 'names': self.names, 'items': self.items}
+        # the index is written last, so an interrupted conversion is not taken as a store
+        tmp_path = os.path.join(self.path, STORE_INDEX + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, os.path.join(self.path, STORE_INDEX))
+
+
+class FeatureStore:
+    """
+    Read the samples of a feature store written by `FeatureStoreWriter`.
+
+    The shard files are memory mapped when they are first read in each process, so the arrays of a sample are read
+    from the page cache without parsing. The arrays are read-only views of the shard files, so the functions which
+    process the features, e.g. the ensemble functions of `MEGAFoldDataSet`, should replace the arrays instead of
+    writing into them.
+
+    Args:
+        path (str): Directory of the feature store.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, STORE_INDEX), 'r') as f:
+            index = json.load(f)
+        if index.get('version') != STORE_VERSION:
+            raise ValueError(f"The version of the feature store in {path} is {index.get('version')}, "
+                             f"but {STORE_VERSION} is required. Please convert the training data again.")
+        self.shards = index['shards']
+        self.names = index['names']
+        self.items = index['items']
+        self._maps = {}
+
+    @staticmethod
+    def exists(path):
+        "whether there is a feature store in path"
+        return os.path.isfile(os.path.join(path, STORE_INDEX))
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getstate__(self):
+        # memory maps can not be pickled and are opened again by each worker
+        state = self.__dict__.copy()
+        state['_maps'] = {}
+        return state
+
+    def _get_map(self, shard):
+        "memory map of a shard file"
+        if shard not in self._maps:
+            with open(os.path.join(self.path, self.shards[shard]), 'rb') as f:
+                self._maps[shard] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._maps[shard]
+
+    def __getitem__(self, idx):
+        features = {}
+        for key, entry in self.items[idx].items():
+            if entry['kind'] == 'value':
+                features[key] = entry['value']
+                continue
+            dtype = np.dtype(entry['dtype'])
+            shape = tuple(entry['shape'])
+            count = int(np.prod(shape))
+            if count == 0:
+                value = np.zeros(shape, dtype)
+            else:
+                value = np.frombuffer(self._get_map(entry['shard']), dtype, count, entry['offset']).reshape(shape)
+            if entry['kind'] == 'scalar':
+                value = value[()]
+            elif entry['kind'] == 'object':
+                value = value.astype(object)
+            features[key] = value
+        return features
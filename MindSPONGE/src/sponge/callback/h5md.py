@@ -74,6 +74,11 @@ class WriteH5MD(Callback):
 
         auto_close (bool):      Whether to automatically close the writing of H5MD files at the end of
                                 the simulation process. Default: ``True``.
+        buffer_size (int):      Number of records buffered in the host memory before they are appended to the
+                                H5MD file in one block. Default: ``1``.
+        background (bool):      Whether to write the blocks to the H5MD file in a background thread, so that the
+                                simulation is not blocked by the file I/O. Default: ``False``.
+        queue_size (int):       Maximum number of blocks waiting for the background thread. Default: ``4``.
         save_last_pdb (str):    Decide to store the last crd in a pdb format file or not. If choose to store the pdb,
                                 the value should be string format pdb file name. Default: ``None``.
 
@@ -98,7 +103,10 @@ class WriteH5MD(Callback):
                  compression: str = 'gzip',
                  compression_opts: int = 4,
                  auto_close: bool = True,
-                 save_last_pdb: str = None
+                 save_last_pdb: str = None,
+                 buffer_size: int = 1,
+                 background: bool = False,
+                 queue_size: int = 4,
                  ):
 
         if mode not in ['w', 'w-', 'x', 'a']:
@@ -109,7 +117,8 @@ class WriteH5MD(Callback):
         self.units = system.units
         self.h5md = H5MD(self.system, filename, directory, mode=mode,
                          length_unit=length_unit, energy_unit=energy_unit,
-                         compression=compression, compression_opts=compression_opts)
+                         compression=compression, compression_opts=compression_opts,
+                         buffer_size=buffer_size, background=background, queue_size=queue_size)
 
         self.convert_to_angstram = self.system.units.convert_length_to('A')
         self.use_pbc = system.pbc_box is not None
@@ -357,7 +366,7 @@ class WriteH5MD(Callback):
 
             self.count_records += 1
 
-        self.count += 1
+        self.count += run_context.original_args().step_interval
 
     def end(self, run_context: RunContext):
         """
@@ -369,6 +378,8 @@ class WriteH5MD(Callback):
         #pylint: disable=unused-argument
         if self.auto_close:
             self.close()
+        else:
+            self.h5md.flush()
 
     def save_to_pdb(self):
         """ Save the system information into a pdb file.
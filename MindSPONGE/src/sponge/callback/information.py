@@ -165,7 +165,7 @@ class RunInfo(Callback):
             info += ', Time: %1.2fms' % ((time.time() - self.start_time) * 1000)
             print('[MindSPONGE]', info)
 
-        self.count += 1
+        self.count += run_context.original_args().step_interval
 
     def end(self, run_context: RunContext):
         """
@@ -132,7 +132,7 @@ class SaveLastPdb(Callback):
             self.save_to_pdb()
             self.count_records += 1
 
-        self.count += 1
+        self.count += run_context.original_args().step_interval
 
     def end(self, run_context: RunContext):
         """
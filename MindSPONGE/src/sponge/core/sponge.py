@@ -30,6 +30,7 @@ import time
 import datetime
 from collections.abc import Iterable
 
+import mindspore as ms
 from mindspore import nn
 from mindspore import ops
 from mindspore.ops import functional as F
@@ -50,13 +51,41 @@ from mindspore.dataset.engine.datasets import _set_training_dataset
 from .simulation import WithEnergyCell, WithForceCell
 from .simulation import RunOneStepCell
 from .analysis import AnalysisCell
-from ..function import any_not_none, get_arguments
+from ..function import any_not_none, get_arguments, get_integer
 from ..potential import PotentialCell, ForceCell
 from ..optimizer import Updater, UpdaterMD
 from ..system.molecule import Molecule
 from ..metrics import MetricCV, get_metrics
 
 
+class _MultiStepCell(nn.Cell):
+    r"""Run several steps of the simulation network in one graph call.
+
+    The steps are run by a loop over a Tensor counter, so the graph holds a single copy of the network whatever
+    the number of steps.
+
+    Args:
+        network (RunOneStepCell):   Network to run one step of the simulation.
+        steps (int):                Number of steps to run in one call.
+
+    """
+
+    def __init__(self, network: RunOneStepCell, steps: int):
+        super().__init__(auto_prefix=False)
+        self.network = network
+        self.steps = steps
+        self.num_steps = Tensor(steps, ms.int32)
+
+    def construct(self, *inputs):
+        energy, force = self.network(*inputs)
+        step = F.ones_like(self.num_steps)
+        while step < self.num_steps:
+            energy, force = self.network(*inputs)
+            # not in-place: `step += 1` would update the Tensor of the initial value and miscount the next call
+            step = step + 1
+        return energy, force
+
+
 class Sponge():
     r"""Core engine of MindSPONGE for simulation and analysis.
 
@@ -265,6 +294,9 @@ class Sponge():
         self._potential = None
         self._force = None
 
+        self._fused_steps = 1
+        self._fused_network = None
+
         self._use_bias = False
 
         self.reduce_mean = ops.ReduceMean()
@@ -302,6 +334,7 @@ class Sponge():
     def recompile(self):
         """recompile the simulation network"""
         self._simulation_network.compile_cache.clear()
+        self._fused_network = None
         return self
 
     def update_neighbour_list(self):
@@ -343,6 +376,7 @@ class Sponge():
         self._simulation_network = RunOneStepCell(
             energy=self._system_with_energy, optimizer=self._optimizer)
         self._simulation_network.set_pbc_grad(self.use_updater)
+        self._fused_network = None
 
         lr = self._optimizer.learning_rate
         if self._optimizer.dynamic_lr:
@@ -377,6 +411,7 @@ class Sponge():
         self._simulation_network = RunOneStepCell(
             energy=self._system_with_energy, optimizer=self._optimizer)
         self._simulation_network.set_pbc_grad(self.use_updater)
+        self._fused_network = None
 
         return self
 
@@ -429,6 +464,7 @@ class Sponge():
             callbacks: Union[Callback, List[Callback]] = None,
             dataset: Dataset = None,
             show_time: bool = True,
+            fused_steps: int = 1,
             ):
         """Simulation API.
 
@@ -438,14 +474,27 @@ class Sponge():
                                     Callback function(s) to obtain the information of the system during
                                     the simulation. Default: ``None``.
             dataset (Dataset):      Dataset used at simulation process. Default: ``None``.
+            show_time (bool):       Whether to print the start and finish time of the simulation. Default: ``True``.
+            fused_steps (int):      Number of steps `K` per cycle of fused simulation. When it is larger than 1,
+                                    only the steps which are multiples of `K` are run one by one with the callbacks,
+                                    and the `K - 1` steps between them are run in one call of the network,
+                                    without the callbacks and the transfer of the energies, kinetics, temperature
+                                    and pressure to them. The number of steps covered by each call of the callbacks
+                                    is given by `step_interval` of the callback parameters. The recording frequencies
+                                    of the callbacks and the update paces of the neighbour list, bias potential,
+                                    energy wrapper and force modifier should be multiples of `K`. Default: 1
 
         Example:
             >>> from mindsponge import Sponge
             >>> from mindsponge.callback import RunInfo
             >>> md = Sponge(system, potential, optimizer)
             >>> md.run(10000, callbacks=[RunInfo(10)])
+            >>> # run 10 steps in each call of the network
+            >>> md.run(10000, callbacks=[RunInfo(10)], fused_steps=10)
 
         """
+        self._set_fused_steps(fused_steps, callbacks)
+
         if self.neighbour_list_pace == 0 or steps < self.neighbour_list_pace:
             epoch = 1
             cycle_steps = steps
@@ -499,6 +548,8 @@ class Sponge():
         cb_params.energy_names = self._energy_names
 
         cb_params.num_biases = self._num_biases
+        cb_params.step_interval = 1
+        self._set_neighbour_list_info(cb_params)
 
         if self._num_biases > 0:
             cb_params.bias = 0
@@ -617,6 +668,7 @@ class Sponge():
         cb_params.mode = "analyse"
         cb_params.analysis_network = self._analysis_network
         cb_params.cur_step_num = 0
+        cb_params.step_interval = 1
         if dataset is not None:
             cb_params.analysis_dataset = dataset
             cb_params.batch_num = dataset.get_dataset_size()
@@ -638,6 +690,86 @@ class Sponge():
                              "but got 'loss_fn': {}, 'optimizer': {}.".format(self._potential_function,
                                                                               self._optimizer))
 
+    def _set_fused_steps(self, fused_steps: int, callbacks: Union[Callback, List[Callback]] = None):
+        """Check the number of fused steps and build the network to run the fused steps."""
+        fused_steps = get_integer(fused_steps)
+        if fused_steps < 1:
+            raise ValueError(f'fused_steps must be a positive integer, but got: {fused_steps}')
+
+        if fused_steps > 1:
+            paces = {'neighbour list': self.neighbour_list_pace}
+            if self._system_with_energy is not None:
+                for i in range(self._num_biases):
+                    paces[f'bias potential {i}'] = self._system_with_energy.bias_pace(i)
+                paces['energy wrapper'] = self._system_with_energy.wrapper_pace
+            if self._system_with_force is not None:
+                paces['force modifier'] = self._system_with_force.modifier_pace
+            for name, pace in paces.items():
+                if pace % fused_steps != 0:
+                    raise ValueError(f'The update pace of {name} ({pace}) must be a multiple of '
+                                     f'fused_steps ({fused_steps}).')
+
+            if callbacks is not None and not isinstance(callbacks, Iterable):
+                callbacks = [callbacks]
+            # the callbacks are only called at the multiples of `fused_steps`
+            for callback in callbacks or []:
+                for key in ('print_freq', 'save_freq'):
+                    freq = getattr(callback, key, None)
+                    if freq is not None and freq % fused_steps != 0:
+                        raise ValueError(f'The {key} of callback {type(callback).__name__} ({freq}) must be '
+                                         f'a multiple of fused_steps ({fused_steps}).')
+
+            if self._fused_network is None or self._fused_network.steps != fused_steps - 1:
+                self._fused_network = _MultiStepCell(self._simulation_network, fused_steps - 1)
+
+        self._fused_steps = fused_steps
+        return self
+
+    def _set_step_info(self, cb_params: _InternalCallbackParam):
+        """Set the energies and the states of the optimizer after the last step to callbacks."""
+        cb_params.potential = self._potential
+        cb_params.force = self._force
+
+        cb_params.energies = self.get_energies()
+        if self._num_biases > 0:
+            cb_params.bias = self.get_bias()
+            cb_params.biases = self.get_biases()
+
+        if self.use_updater:
+            cb_params.velocity = self._optimizer.velocity
+            # (B) <- (B,D)
+            kinetics = F.reduce_sum(self._optimizer.kinetics, -1)
+            cb_params.kinetics = kinetics
+            cb_params.temperature = self._optimizer.temperature
+            pressure = self._optimizer.pressure
+            if pressure is not None:
+                # (B) <- (B,D)
+                pressure = self.reduce_mean(pressure, -1)
+            cb_params.pressure = pressure
+        return self
+
+    def _get_num_fused_steps(self, step: int, cycles: int) -> int:
+        """Get the number of steps to run in one call from the current step of the epoch."""
+        num_fused = self._fused_steps - 1
+        if num_fused > 0 and self.sim_step % self._fused_steps != 0 and step + num_fused <= cycles:
+            return num_fused
+        return 0
+
+    def _set_neighbour_list_info(self, cb_params: _InternalCallbackParam):
+        """Set the number of rebuilds and the maximum number of neighbours of the neighbour list to callbacks."""
+        neighbour_list = self.energy_neighbour_list
+        if neighbour_list is None:
+            neighbour_list = self.force_neighbour_list
+        if neighbour_list is None:
+            cb_params.neighbour_list_rebuilds = None
+            cb_params.max_neighbours = None
+            cb_params.num_neighbours = None
+        else:
+            cb_params.neighbour_list_rebuilds = neighbour_list.num_rebuilds
+            cb_params.max_neighbours = neighbour_list.max_neighbours
+            cb_params.num_neighbours = neighbour_list.num_neighbours
+        return self
+
     @staticmethod
     def _transform_callbacks(callbacks: Callback):
         """Transform callback to a list."""
@@ -681,6 +813,7 @@ class Sponge():
         for i in range(epoch):
             cb_params.cur_epoch = i
             self.update_neighbour_list()
+            self._set_neighbour_list_info(cb_params)
             should_stop = self._run_one_epoch(cycle_steps, list_callback, cb_params, run_context)
             should_stop = should_stop or run_context.get_stop_requested()
             if should_stop:
@@ -688,6 +821,7 @@ class Sponge():
 
         if rest_steps > 0:
             self.update_neighbour_list()
+            self._set_neighbour_list_info(cb_params)
             self._run_one_epoch(rest_steps, list_callback,
                                 cb_params, run_context)
 
@@ -702,8 +836,21 @@ class Sponge():
         """run one epoch simulation"""
         should_stop = False
         list_callback.epoch_begin(run_context)
-        for _ in range(cycles):
-
+        step = 0
+        while step < cycles:
+            num_fused = self._get_num_fused_steps(step, cycles)
+            if num_fused > 0:
+                # the steps between two multiples of `fused_steps` are run in one call without callbacks
+                self._potential, self._force = self._fused_network()
+                self.sim_step += num_fused
+                self.sim_time += self.time_step * num_fused
+                step += num_fused
+                if step >= cycles:
+                    # the epoch ends without another step, so the callbacks at the end of epoch need them
+                    self._set_step_info(cb_params)
+                continue
+
+            step += 1
             cb_params.cur_step = self.sim_step
             cb_params.cur_time = self.sim_time
             list_callback.step_begin(run_context)
@@ -714,30 +861,13 @@ class Sponge():
             self.update_bias(self.sim_step)
             self.update_wrapper(self.sim_step)
             self.update_modifier(self.sim_step)
-
-            cb_params.potential = self._potential
-            cb_params.force = self._force
-
-            cb_params.energies = self.get_energies()
-            if self._num_biases > 0:
-                cb_params.bias = self.get_bias()
-                cb_params.biases = self.get_biases()
-
-            if self.use_updater:
-                cb_params.velocity = self._optimizer.velocity
-                # (B) <- (B,D)
-                kinetics = F.reduce_sum(self._optimizer.kinetics, -1)
-                cb_params.kinetics = kinetics
-                cb_params.temperature = self._optimizer.temperature
-                pressure = self._optimizer.pressure
-                if pressure is not None:
-                    # (B) <- (B,D)
-                    pressure = self.reduce_mean(pressure, -1)
-                cb_params.pressure = pressure
+            self._set_step_info(cb_params)
 
             self.sim_step += 1
             self.sim_time += self.time_step
 
+            # number of steps from this step to the next call of the callbacks
+            cb_params.step_interval = self._get_num_fused_steps(step, cycles) + 1
             list_callback.step_end(run_context)
 
             #pylint: disable = protected-access
@@ -29,8 +29,9 @@ from .hyperparam import set_class_parameters, set_hyper_parameter, set_class_int
 from .hyperparam import load_hyperparam, load_hyper_param_into_class
 from .template import get_template, get_template_index, get_molecule
 from .forcefield import get_forcefield
-from .data import read_yaml, write_yaml, update_dict
+from .data import read_yaml, write_yaml, update_dict, get_cache_directory
 from .data import get_bonded_types, get_dihedral_types, get_improper_types, get_parameter_terms
+from .data import match_parameter_types
 
 
 __all__ = ['get_forcefield']
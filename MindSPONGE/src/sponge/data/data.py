@@ -26,7 +26,11 @@ Base function for yaml
 
 import os
 import stat
+import json
+import pickle
+import hashlib
 from itertools import permutations
+from typing import Tuple
 import yaml
 import numpy as np
 from numpy import ndarray
@@ -36,15 +40,24 @@ from mindspore.train._utils import _make_directory
 
 _cur_dir = os.getcwd()
 
+# Version of the format of the cached YAML data. Change it to invalidate all the old cache files.
+_CACHE_VERSION = 2
+# Key of the JSON object that holds the items of a dict with keys other than str, e.g. `NO: ...` read as `False`.
+_DICT_ITEMS = '__dict_items__'
+# Pickled data of the YAML files already loaded in this process, indexed by the absolute path.
+_yaml_memo = {}
+
 
 __all__ = [
     'update_dict',
     'read_yaml',
+    'get_cache_directory',
     'write_yaml',
     'get_bonded_types',
     'get_dihedral_types',
     'get_improper_types',
     'get_parameter_terms',
+    'match_parameter_types',
 ]
 
 
@@ -100,22 +113,115 @@ def write_yaml(data: dict, filename: str, directory: str = None):
         yaml.dump(data, file, sort_keys=False)
 
 
-def read_yaml(filename: str) -> dict:
+def get_cache_directory() -> str:
+    """
+    get the directory of the cache of the parsed YAML files.
+
+    The directory is given by the environment variable `MINDSPONGE_CACHE_DIR`, or `~/.cache/mindsponge` by default.
+
+    Returns:
+        directory(str): Directory of the cache.
+
+    Supported Platforms:
+        ``Ascend`` ``GPU`` ``CPU``
+
+    """
+    directory = os.environ.get('MINDSPONGE_CACHE_DIR')
+    if directory is None:
+        directory = os.path.join(os.path.expanduser('~'), '.cache', 'mindsponge')
+    return os.path.join(directory, 'yaml')
+
+
+def _encode_json(data):
+    """convert the dicts with keys other than str to JSON objects of their items."""
+    if isinstance(data, dict):
+        items = [(key, _encode_json(value)) for key, value in data.items()]
+        if all(isinstance(key, str) for key in data) and _DICT_ITEMS not in data:
+            return dict(items)
+        return {_DICT_ITEMS: [list(item) for item in items]}
+    if isinstance(data, list):
+        return [_encode_json(value) for value in data]
+    return data
+
+
+def _decode_json(obj: dict) -> dict:
+    """object hook of `json.loads` to restore the dicts converted by `_encode_json`."""
+    if len(obj) == 1 and _DICT_ITEMS in obj:
+        return {key: value for key, value in obj[_DICT_ITEMS]}
+    return obj
+
+
+def _load_cache(cache_file: str) -> dict:
+    """load the data from the JSON cache file, or return None if it does not exist or is broken."""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as file:
+            return json.load(file, object_hook=_decode_json)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cache(cache_file: str, data: dict):
+    """write the data to the JSON cache file atomically. Failures are ignored as the cache is optional."""
+    try:
+        content = json.dumps(_encode_json(data))
+        # data that JSON can not hold exactly, e.g. dates, is not cached
+        if json.loads(content, object_hook=_decode_json) != data:
+            return
+    except (TypeError, ValueError):
+        return
+    try:
+        os.makedirs(os.path.dirname(cache_file), mode=stat.S_IRWXU, exist_ok=True)
+        temp_file = f'{cache_file}.{os.getpid()}.tmp'
+        with os.fdopen(os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, stat.S_IRUSR | stat.S_IWUSR),
+                       'w', encoding='utf-8') as file:
+            file.write(content)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+
+def read_yaml(filename: str, cache: bool = True) -> dict:
     """
     read YAML file.
 
+    The parsed data is cached on disk as JSON under the SHA-256 hash of the content of the file
+    (see `get_cache_directory`), so a large force field file is parsed only once and is parsed again when it is
+    changed.
+
     Args:
         filename(str):  Name of YAML file.
+        cache(bool):    Whether to use the cache of the parsed data. Default: ``True``.
 
     Returns:
-        data(dict):     Data read from the YAML file.
+        data(dict):     Data read from the YAML file. A new object is returned at each call and can be modified.
 
     Supported Platforms:
         ``Ascend`` ``GPU`` ``CPU``
 
     """
-    with open(filename, 'r', encoding="utf-8") as file:
-        data = yaml.safe_load(file.read())
+    if not cache:
+        with open(filename, 'r', encoding="utf-8") as file:
+            data = yaml.safe_load(file.read())
+        return data
+
+    path = os.path.abspath(filename)
+    status = os.stat(path)
+    signature = (status.st_mtime_ns, status.st_size)
+    memo = _yaml_memo.get(path)
+    if memo is not None and memo[0] == signature:
+        return pickle.loads(memo[1])
+
+    with open(path, 'rb') as file:
+        content = file.read()
+    digest = hashlib.sha256(content).hexdigest()
+    cache_file = os.path.join(get_cache_directory(), f'{digest}.v{_CACHE_VERSION}.json')
+    data = _load_cache(cache_file)
+    if data is None:
+        data = yaml.safe_load(content.decode('utf-8'))
+        _save_cache(cache_file, data)
+
+    # the memo only holds the data pickled by this process, it is never read from disk
+    _yaml_memo[path] = (signature, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
     return data
 
 
@@ -245,3 +351,97 @@ def get_parameter_terms(parameters: dict,
         terms[key] = {k: v[i] for k, v in params.items()}
 
     return terms
+
+
+def match_parameter_types(atom_type: ndarray,
+                          keys: list,
+                          orders: list = None,
+                          valid: ndarray = None,
+                          symbol: str = '-',
+                          wildcard: str = '?',
+                          ) -> Tuple[ndarray, ndarray]:
+    """
+    match the types of the atoms in bonded terms to the keys of force field parameters.
+
+    The atom types are encoded as integers and the type tuples of the keys are hashed into a sorted index,
+    so that all the terms are matched in one vectorized pass for each wildcard pattern and order of atoms.
+    A term matches a key if the types of its atoms in one of the `orders` are the same as the key,
+    where `wildcard` in the key matches any type. If several keys match a term, the first one in `keys`
+    is taken, and then the first order in `orders`.
+
+    Args:
+        atom_type(ndarray): types of the atoms of the terms with shape `(..., n)`.
+        keys(list):         keys of the parameters, e.g. "?-C-N-?". Each key must have n types.
+        orders(list):       orders of the atoms to be matched, e.g. [(0, 1, 2, 3), (3, 2, 1, 0)].
+                            Default: None, means only the original order.
+        valid(ndarray):     mask of the orders allowed for each term with shape `(..., len(orders))`.
+                            Default: None, means all the orders are allowed.
+        symbol(str):        symbol between the types in the keys. Default: '-'
+        wildcard(str):      type in the keys that matches any type. Default: '?'
+
+    Returns:
+        - key_index(ndarray), index of the key matched by each term with shape `(...)`, -1 if no key is matched.
+        - order_index(ndarray), index of the order matched by each term with shape `(...)`.
+
+    Supported Platforms:
+        ``Ascend`` ``GPU`` ``CPU``
+    """
+    atom_type = np.asarray(atom_type, np.str_)
+    shape = atom_type.shape[:-1]
+    num_atoms = atom_type.shape[-1]
+    atom_type = atom_type.reshape(-1, num_atoms)
+    num_terms = atom_type.shape[0]
+
+    if orders is None:
+        orders = [tuple(range(num_atoms))]
+    orders = np.array(orders, np.int32).reshape(-1, num_atoms)
+    num_orders = orders.shape[0]
+    if valid is None:
+        valid = np.ones((num_terms, num_orders), np.bool_)
+    else:
+        valid = np.asarray(valid, np.bool_).reshape(num_terms, num_orders)
+
+    key_index = np.full(num_terms, -1, np.int64)
+    order_index = np.zeros(num_terms, np.int64)
+    if num_terms == 0 or not keys:
+        return key_index.reshape(shape), order_index.reshape(shape)
+
+    key_type = [key.split(symbol) for key in keys]
+    for key, types in zip(keys, key_type):
+        if len(types) != num_atoms:
+            raise ValueError(f'The key "{key}" of parameters should have {num_atoms} types but got {len(types)}.')
+    key_type = np.array(key_type, np.str_)
+
+    # encode the types as integers, and use the extra code for the wildcard
+    vocabulary, codes = np.unique(np.concatenate((key_type.reshape(-1), atom_type.reshape(-1))),
+                                  return_inverse=True)
+    codes = codes.reshape(-1)
+    wildcard_code = vocabulary.size
+    base = vocabulary.size + 1
+    if base ** num_atoms >= np.iinfo(np.int64).max:
+        raise ValueError(f'Too many atom types ({vocabulary.size}) to hash the terms with {num_atoms} atoms.')
+    weights = base ** np.arange(num_atoms, dtype=np.int64)
+
+    key_wildcard = key_type == wildcard
+    key_codes = np.where(key_wildcard, wildcard_code, codes[:key_type.size].reshape(key_type.shape))
+    key_hash = key_codes.astype(np.int64) @ weights
+    term_codes = codes[key_type.size:].reshape(atom_type.shape).astype(np.int64)
+
+    # score of the best match so far: index of key * number of orders + index of order
+    max_score = np.iinfo(np.int64).max
+    score = np.full(num_terms, max_score, np.int64)
+    for pattern in np.unique(key_wildcard, axis=0):
+        group = np.where(np.all(key_wildcard == pattern, axis=-1))[0]
+        group = group[np.argsort(key_hash[group])]
+        group_hash = key_hash[group]
+        for j, order in enumerate(orders):
+            term_hash = np.where(pattern, wildcard_code, term_codes[:, order]) @ weights
+            position = np.minimum(np.searchsorted(group_hash, term_hash), group.size - 1)
+            this_score = group[position] * num_orders + j
+            found = (group_hash[position] == term_hash) & valid[:, j] & (this_score < score)
+            score = np.where(found, this_score, score)
+
+    matched = score < max_score
+    key_index[matched] = score[matched] // num_orders
+    order_index[matched] = score[matched] % num_orders
+    return key_index.reshape(shape), order_index.reshape(shape)
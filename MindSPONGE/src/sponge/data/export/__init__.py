@@ -25,6 +25,7 @@ Export coordinate and trajectory files
 """
 
 from .h5md import H5MD
+from .h5md_reader import H5MDReader
 from .xyz import export_xyz
 
-__all__ = ['H5MD', 'export_xyz']
+__all__ = ['H5MD', 'H5MDReader', 'export_xyz']
@@ -25,6 +25,9 @@ Export H5MD file.
 """
 
 import os
+import threading
+from queue import Queue
+from time import perf_counter
 from typing import Union, List
 import numpy as np
 from numpy import ndarray
@@ -34,10 +37,34 @@ from mindspore import Tensor
 from mindspore.train._utils import _make_directory
 
 from ...system import Molecule
+from ...function import get_integer
 from ...function.units import Units, GLOBAL_UNITS
 
 _cur_dir = os.getcwd()
 
+# upper limit of the size of a chunk of the datasets written in blocks
+_MAX_CHUNK_BYTES = 1 << 22
+
+
+class _FrameBuffer:
+    r"""Preallocated host buffer for the frames to be appended to a dataset.
+
+    Args:
+        dataset (h5py.Dataset): Dataset with the frames along the first axis.
+        size (int):             Number of frames in the buffer.
+        num_arrays (int):       Number of the preallocated arrays. The array being filled is swapped with a spare
+                                one when it is sent to the background writer.
+
+    """
+
+    def __init__(self, dataset: h5py.Dataset, size: int, num_arrays: int = 1):
+        self.dataset = dataset
+        self.spare = Queue()
+        for _ in range(num_arrays - 1):
+            self.spare.put(np.empty((size,) + dataset.shape[1:], dataset.dtype))
+        self.data = np.empty((size,) + dataset.shape[1:], dataset.dtype)
+        self.count = 0
+
 
 class H5MD:
     r"""write HDF5 molecular data (H5MD) file
@@ -78,6 +105,15 @@ class H5MD:
 
         compression_opts (int): Compression settings for HDF5. Default: 4
 
+        buffer_size (int):      Number of frames buffered in the host memory before they are appended to the file
+                                in one block. The datasets of the frames are chunked to align with the blocks.
+                                Default: 1
+
+        background (bool):      Whether to write the blocks to the file in a background thread. Default: ``False``.
+
+        queue_size (int):       Maximum number of blocks waiting for the background thread. The simulation is
+                                blocked when the queue is full. Default: 4
+
     Supported Platforms:
         ``Ascend`` ``GPU`` ``CPU``
 
@@ -92,8 +128,22 @@ class H5MD:
                  energy_unit: str = None,
                  compression: str = 'gzip',
                  compression_opts: int = 4,
+                 buffer_size: int = 1,
+                 background: bool = False,
+                 queue_size: int = 4,
                  ):
 
+        self.buffer_size = get_integer(buffer_size)
+        if self.buffer_size < 1:
+            raise ValueError(f'buffer_size must be a positive integer, but got: {buffer_size}')
+
+        self._buffers = {}
+        self.num_records = 0
+        self.num_blocks = 0
+        self.num_bytes = 0
+        self.io_time = 0.
+        self.wait_time = 0.
+
         if directory is not None:
             self._directory = _make_directory(directory)
         else:
@@ -102,6 +152,14 @@ class H5MD:
 
         self.hdf5_file = h5py.File(self.filename, mode)
 
+        self._queue = None
+        self._writer = None
+        self._writer_error = None
+        if background:
+            self._queue = Queue(get_integer(queue_size))
+            self._writer = threading.Thread(target=self._write_loop, daemon=True)
+            self._writer.start()
+
         self.h5md = self.hdf5_file.create_group('h5md')
         self.h5md.attrs['version'] = [1, 1]
 
@@ -223,8 +281,31 @@ class H5MD:
         else:
             self.obs_group = self.create_obs_group('trajectory')
 
+    @property
+    def write_metrics(self) -> dict:
+        """
+        Metrics of the writing of the frames.
+
+        Returns:
+            dict, with the number of records, blocks and bytes written to the file, the time spent on writing the
+            blocks (`io_time`), the time the simulation is blocked by the writing (`wait_time`), both in seconds,
+            and the throughput of the writing in MB/s.
+        """
+        throughput = 0.
+        if self.io_time > 0:
+            throughput = self.num_bytes / self.io_time / 1e6
+        return {
+            'records': self.num_records,
+            'blocks': self.num_blocks,
+            'bytes': self.num_bytes,
+            'io_time': self.io_time,
+            'wait_time': self.wait_time,
+            'throughput': throughput,
+        }
+
     def reload(self, mode: str = 'a'):
         """reload the HDF5 file"""
+        self.flush()
         self.hdf5_file = h5py.File(self.filename, mode)
         return self
 
@@ -260,18 +341,21 @@ class H5MD:
 
         if create_step:
             element.create_dataset('step', shape=(0,), dtype='int32', maxshape=(None,),
+                                   chunks=self._get_chunks((), 'int32'),
                                    compression=self.compression, compression_opts=self.compression_opts)
         else:
             element['step'] = group['step']
 
         if create_time:
             element.create_dataset('time', shape=(0,), dtype='float32', maxshape=(None,),
+                                   chunks=self._get_chunks((), 'float32'),
                                    compression=self.compression, compression_opts=self.compression_opts)
             element['time'].attrs['unit'] = self.time_unit.encode('ascii', 'ignore')
         else:
             element['time'] = group['time']
 
         element.create_dataset('value', shape=(0,)+shape, dtype=dtype, maxshape=(None,)+shape,
+                               chunks=self._get_chunks(shape, dtype),
                                compression=self.compression, compression_opts=self.compression_opts)
         if unit is not None:
             element['value'].attrs['unit'] = unit.encode('ascii', 'ignore')
@@ -330,10 +414,12 @@ class H5MD:
 
         if create_step:
             trajectory.create_dataset('step', shape=(0,), dtype='int32', maxshape=(None,),
+                                      chunks=self._get_chunks((), 'int32'),
                                       compression=self.compression, compression_opts=self.compression_opts)
 
         if create_time:
             trajectory.create_dataset('time', shape=(0,), dtype='float32', maxshape=(None,),
+                                      chunks=self._get_chunks((), 'float32'),
                                       compression=self.compression, compression_opts=self.compression_opts)
 
         return trajectory
@@ -350,10 +436,12 @@ class H5MD:
                                  compression=self.compression, compression_opts=self.compression_opts)
         if create_step:
             obs_group.create_dataset('step', shape=(0,), dtype='int32', maxshape=(None,),
+                                     chunks=self._get_chunks((), 'int32'),
                                      compression=self.compression, compression_opts=self.compression_opts)
 
         if create_time:
             obs_group.create_dataset('time', shape=(0,), dtype='float32', maxshape=(None,),
+                                     chunks=self._get_chunks((), 'float32'),
                                      compression=self.compression, compression_opts=self.compression_opts)
         return obs_group
 
@@ -388,12 +476,14 @@ class H5MD:
             edges = group['box'].create_group('edges')
             if create_step:
                 edges.create_dataset('step', shape=(0,), dtype='int32', maxshape=(None,),
+                                     chunks=self._get_chunks((), 'int32'),
                                      compression=self.compression, compression_opts=self.compression_opts)
             else:
                 edges['step'] = group['step']
 
             if create_time:
                 edges.create_dataset('time', shape=(0,), dtype='float32', maxshape=(None,),
+                                     chunks=self._get_chunks((), 'float32'),
                                      compression=self.compression, compression_opts=self.compression_opts)
                 edges['time'].attrs['unit'] = self.time_unit.encode('ascii', 'ignore')
             else:
@@ -401,6 +491,7 @@ class H5MD:
 
             shape = (self.dimension,)
             edges.create_dataset('value', shape=(0,)+shape, dtype='float32', maxshape=(None,)+shape,
+                                 chunks=self._get_chunks(shape, 'float32'),
                                  compression=self.compression, compression_opts=self.compression_opts)
             edges['value'].attrs['unit'] = self.units.length_unit_name.encode('ascii', 'ignore')
         else:
@@ -513,61 +604,68 @@ class H5MD:
         """write simulation step"""
         if self.num_walker > 1:
             for i in range(self.num_walker):
-                traj_step = self.trajectory[i]['step']
-                traj_step.resize(traj_step.shape[0]+1, axis=0)
-                traj_step[-1] = step
-
-                obs_step = self.obs_group[i]['step']
-                obs_step.resize(obs_step.shape[0]+1, axis=0)
-                obs_step[-1] = step
+                self.append(self.trajectory[i], 'step', step)
+                self.append(self.obs_group[i], 'step', step)
         else:
-            traj_step = self.trajectory['step']
-            traj_step.resize(traj_step.shape[0]+1, axis=0)
-            traj_step[-1] = step
-
-            obs_step = self.obs_group['step']
-            obs_step.resize(obs_step.shape[0]+1, axis=0)
-            obs_step[-1] = step
+            self.append(self.trajectory, 'step', step)
+            self.append(self.obs_group, 'step', step)
+        self.num_records += 1
         return self
 
     def write_time(self, time: float):
         """write simulation time"""
         if self.num_walker > 1:
             for i in range(self.num_walker):
-                traj_time = self.trajectory[i]['time']
-                traj_time.resize(traj_time.shape[0]+1, axis=0)
-                traj_time[-1] = time
-
-                obs_time = self.obs_group[i]['time']
-                obs_time.resize(obs_time.shape[0]+1, axis=0)
-                obs_time[-1] = time
+                self.append(self.trajectory[i], 'time', time)
+                self.append(self.obs_group[i], 'time', time)
         else:
-            traj_time = self.trajectory['time']
-            traj_time.resize(traj_time.shape[0]+1, axis=0)
-            traj_time[-1] = time
-
-            obs_time = self.obs_group['time']
-            obs_time.resize(obs_time.shape[0]+1, axis=0)
-            obs_time[-1] = time
-
+            self.append(self.trajectory, 'time', time)
+            self.append(self.obs_group, 'time', time)
         return self
 
     def write_element(self, group: Group, value: ndarray, step: int = None, time: float = None):
         """write element to H5MD file"""
         if step is not None:
-            ds_step = group['step']
-            ds_step.resize(ds_step.shape[0]+1, axis=0)
-            ds_step[-1] = step
+            self.append(group, 'step', step)
 
         if time is not None:
-            ds_time = group['time']
-            ds_time.resize(ds_time.shape[0]+1, axis=0)
-            ds_time[-1] = time
+            self.append(group, 'time', time)
+
+        self.append(group, 'value', value)
+
+        return self
 
-        ds_value = group['value']
-        ds_value.resize(ds_value.shape[0]+1, axis=0)
-        ds_value[-1] = value
+    def append(self, group: Group, name: str, value: ndarray):
+        """append a frame to the dataset `name` in `group`"""
+        if self.buffer_size == 1 and self._queue is None:
+            dataset = group[name]
+            self._write_block(dataset, np.asarray(value, dataset.dtype)[None], 1)
+            return self
+
+        key = group.name + '/' + name
+        buffer: _FrameBuffer = self._buffers.get(key)
+        if buffer is None:
+            num_arrays = 1 if self._queue is None else 2
+            buffer = _FrameBuffer(group[name], self.buffer_size, num_arrays)
+            self._buffers[key] = buffer
+
+        buffer.data[buffer.count] = value
+        buffer.count += 1
+        if buffer.count == self.buffer_size:
+            self._flush_buffer(buffer)
+        return self
 
+    def flush(self):
+        """write all the buffered frames to the H5MD file"""
+        for buffer in self._buffers.values():
+            self._flush_buffer(buffer)
+        if self._queue is not None:
+            beg_time = perf_counter()
+            self._queue.join()
+            self.wait_time += perf_counter() - beg_time
+        self._check_writer()
+        if self.hdf5_file:
+            self.hdf5_file.flush()
         return self
 
     def write_mw_element(self, group: Union[Group, List[Group]],
@@ -630,4 +728,73 @@ class H5MD:
 
     def close(self):
         """close the HDF5 file"""
+        if self.hdf5_file:
+            self.flush()
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+        self._buffers = {}
         return self.hdf5_file.close()
+
+    def _get_chunks(self, shape: tuple, dtype: str) -> tuple:
+        """get the chunk shape of a dataset of frames to align with the blocks of the buffer"""
+        if self.buffer_size == 1:
+            return None
+        frame_bytes = int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+        num_frames = self.buffer_size
+        while num_frames > 1 and (num_frames * frame_bytes > _MAX_CHUNK_BYTES or self.buffer_size % num_frames):
+            num_frames -= 1
+        return (num_frames,) + tuple(shape)
+
+    def _write_block(self, dataset: h5py.Dataset, data: ndarray, count: int):
+        """append a block of frames to the dataset"""
+        beg_time = perf_counter()
+        size = dataset.shape[0]
+        dataset.resize(size + count, axis=0)
+        dataset[size:] = data[:count]
+        self.num_blocks += 1
+        self.num_bytes += data[:count].nbytes
+        self.io_time += perf_counter() - beg_time
+
+    def _flush_buffer(self, buffer: _FrameBuffer):
+        """write the frames in the buffer, or send them to the background writer"""
+        if buffer.count == 0:
+            return
+        if self._queue is None:
+            self._write_block(buffer.dataset, buffer.data, buffer.count)
+            buffer.count = 0
+            return
+
+        self._check_writer()
+        beg_time = perf_counter()
+        self._queue.put((buffer, buffer.data, buffer.count))
+        # wait until the last block of this buffer is written
+        buffer.data = buffer.spare.get()
+        buffer.count = 0
+        self.wait_time += perf_counter() - beg_time
+
+    def _write_loop(self):
+        """loop of the background writer"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            buffer, data, count = item
+            try:
+                if self._writer_error is None:
+                    self._write_block(buffer.dataset, data, count)
+            # pylint: disable=broad-except
+            except Exception as error:
+                self._writer_error = error
+            buffer.spare.put(data)
+            self._queue.task_done()
+
+    def _check_writer(self):
+        """raise the error in the background writer"""
+        if self._writer_error is not None:
+            error = self._writer_error
+            self._writer_error = None
+            raise RuntimeError(f'Failed to write the H5MD file {self.filename}') from error
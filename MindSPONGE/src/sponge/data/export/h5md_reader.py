@@ -0,0 +1,370 @@
+# Copyright 2021-2023 @ Shenzhen Bay Laboratory &
+#                       Peking University &
+#                       Huawei Technologies Co., Ltd
+#
+# This code is a part of MindSPONGE:
+# MindSpore Simulation Package tOwards Next Generation molecular modelling.
+#
+# MindSPONGE is open-source software based on the AI-framework:
+# MindSpore (https://www.mindspore.cn/)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Read H5MD file.
+"""
+
+import threading
+from queue import Queue
+from typing import Union, List, Tuple, Iterator
+import numpy as np
+from numpy import ndarray
+import h5py
+from mindspore import Tensor
+
+from ...function import get_integer
+from ...function.units import Units
+from ...metrics import MetricCV, get_metrics
+
+
+class H5MDReader:
+    r"""Lazy reader of the trajectory in HDF5 molecular data (H5MD) file
+
+    The frames are only read from the file when they are accessed, so that the trajectory larger than
+    the memory can be analysed in batches.
+
+    Args:
+        filename (str):         Name of the H5MD file.
+
+        trajectory (str):       Name of the trajectory in the group `particles`. If it is ``None``, the first
+                                trajectory in the file is used. Default: ``None``.
+
+        atoms (Union[List[int], ndarray]):
+                                Index of the atoms to be read. If it is ``None``, all atoms are read.
+                                Default: ``None``.
+
+        length_unit (str):      Length unit of the coordinates and PBC box read from the file.
+                                If given "None", it will be equal to the length unit in the file.
+                                Default: ``None``.
+
+        batch_size (int):       Default number of frames in each batch when iterating the trajectory. It is
+                                rounded up to a multiple of the chunk size of the file. If it is ``None``,
+                                the chunk size is used. Default: ``None``.
+
+        prefetch (int):         Number of batches read ahead in a background thread when iterating the
+                                trajectory. If it is 0, the batches are read in the calling thread. Default: 2
+
+    Supported Platforms:
+        ``Ascend`` ``GPU`` ``CPU``
+
+    Examples:
+        >>> from sponge.data.export import H5MDReader
+        >>> from sponge.colvar import Distance
+        >>> reader = H5MDReader('trajectory.h5md', batch_size=100)
+        >>> for coordinate, pbc_box in reader:
+        >>>     print(coordinate.shape)
+        (100, 12, 3)
+        >>> metrics = reader.analyse({'distance': Distance([0, 1])})
+
+    """
+
+    def __init__(self,
+                 filename: str,
+                 trajectory: str = None,
+                 atoms: Union[List[int], ndarray] = None,
+                 length_unit: str = None,
+                 batch_size: int = None,
+                 prefetch: int = 2,
+                 ):
+
+        self.filename = filename
+        self.hdf5_file = h5py.File(filename, 'r')
+
+        particles = self.hdf5_file['particles']
+        if trajectory is None:
+            trajectory = sorted(particles.keys())[0]
+        self.trajectory = particles[trajectory]
+
+        self._position = self.trajectory['position']['value']
+        self.num_frames = self._position.shape[0]
+        self.dimension = self._position.shape[-1]
+
+        file_unit = self._get_unit(self._position)
+        if length_unit is None:
+            length_unit = file_unit
+        self.units = Units(length_unit)
+        self.length_unit_scale = 1.
+        if file_unit is not None:
+            self.length_unit_scale = self.units.convert_length_from(file_unit)
+
+        self._box = None
+        self._const_box = None
+        if 'box' in self.trajectory and 'edges' in self.trajectory['box']:
+            edges = self.trajectory['box']['edges']
+            if isinstance(edges, h5py.Dataset):
+                self._const_box = np.asarray(edges[()], np.float32).reshape(-1) * self.length_unit_scale
+            else:
+                self._box = edges['value']
+
+        self.atoms = None
+        self._atom_span = slice(None)
+        if atoms is None:
+            self.num_atoms = self._position.shape[1]
+        else:
+            atoms = np.asarray(atoms, np.int64).reshape(-1)
+            start = int(atoms.min())
+            stop = int(atoms.max()) + 1
+            self._atom_span = slice(start, stop)
+            self.num_atoms = atoms.size
+            if atoms.size != stop - start or np.any(atoms != np.arange(start, stop)):
+                self.atoms = atoms - start
+
+        self.chunk_size = 1
+        if self._position.chunks is not None:
+            self.chunk_size = self._position.chunks[0]
+        if batch_size is None:
+            batch_size = self.chunk_size
+        self.batch_size = self._align_batch_size(get_integer(batch_size))
+        self.prefetch = get_integer(prefetch)
+
+        self._steps = None
+        self._times = None
+
+    def __len__(self) -> int:
+        return self.num_frames
+
+    def __getitem__(self, index: Union[int, slice, List[int], ndarray]) -> ndarray:
+        """read the coordinates of the frames"""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.num_frames)
+            return self.read(start, stop, step)[0]
+
+        if isinstance(index, (int, np.integer)):
+            index = int(index)
+            if index < 0:
+                index += self.num_frames
+            if index < 0 or index >= self.num_frames:
+                raise IndexError(f'Frame index out of range: {index}')
+            return self.read(index, index + 1)[0][0]
+
+        index = np.asarray(index, np.int64) % self.num_frames
+        # h5py only supports increasing index
+        frames = np.unique(index)
+        coordinate = self._read_position(frames)
+        return coordinate[np.searchsorted(frames, index)]
+
+    def __iter__(self) -> Iterator[Tuple[ndarray, ndarray]]:
+        return self.iter_batches()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *err):
+        self.close()
+
+    @property
+    def steps(self) -> ndarray:
+        """simulation steps of the frames"""
+        if self._steps is None:
+            self._steps = self.trajectory['position']['step'][()]
+        return self._steps
+
+    @property
+    def times(self) -> ndarray:
+        """simulation time of the frames"""
+        if self._times is None:
+            self._times = self.trajectory['position']['time'][()]
+        return self._times
+
+    def read(self, start: int = 0, stop: int = None, step: int = 1) -> Tuple[ndarray, ndarray]:
+        """
+        Read the frames in the range `[start, stop)` with interval `step`.
+
+        Args:
+            start (int):    Index of the first frame. Default: 0
+            stop (int):     End of the frames. If it is ``None``, read to the last frame. Default: ``None``.
+            step (int):     Interval of the frames. Default: 1
+
+        Returns:
+            - coordinate (ndarray), array of shape `(T, A, D)`.
+            - pbc_box (ndarray), array of shape `(T, D)`, or None if there is no PBC box in the file.
+
+        Note:
+            T:  Number of frames read.
+            A:  Number of atoms selected.
+            D:  Spatial dimension of the simulation system. Usually is 3.
+        """
+        if stop is None:
+            stop = self.num_frames
+        frames = slice(start, stop, step)
+        coordinate = self._read_position(frames)
+
+        pbc_box = None
+        if self._box is not None:
+            pbc_box = np.asarray(self._box[frames], np.float32) * self.length_unit_scale
+        elif self._const_box is not None:
+            pbc_box = np.broadcast_to(self._const_box, (coordinate.shape[0], self._const_box.size))
+        return coordinate, pbc_box
+
+    def iter_batches(self,
+                     batch_size: int = None,
+                     start: int = 0,
+                     stop: int = None,
+                     step: int = 1,
+                     ) -> Iterator[Tuple[ndarray, ndarray]]:
+        """
+        Iterate the frames in batches. The batches are aligned with the chunks of the file, and the next
+        batches are read in a background thread when `prefetch` is larger than 0.
+
+        Args:
+            batch_size (int):   Number of frames of the file covered by each batch. If it is ``None``, the
+                                `batch_size` of the reader is used. Default: ``None``.
+            start (int):        Index of the first frame. Default: 0
+            stop (int):         End of the frames. If it is ``None``, iterate to the last frame. Default: ``None``.
+            step (int):         Interval of the frames. Default: 1
+
+        Yields:
+            - coordinate (ndarray), array of shape `(T, A, D)`.
+            - pbc_box (ndarray), array of shape `(T, D)`, or None if there is no PBC box in the file.
+        """
+        if batch_size is None:
+            batch_size = self.batch_size
+        else:
+            batch_size = self._align_batch_size(get_integer(batch_size))
+        start, stop, step = slice(start, stop, step).indices(self.num_frames)
+
+        ranges = []
+        begin = start
+        while begin < stop:
+            end = min(stop, (begin // batch_size + 1) * batch_size)
+            ranges.append((begin, end))
+            # the first frame of the next batch according to the interval
+            begin += -(-(end - begin) // step) * step
+
+        if self.prefetch == 0:
+            for begin, end in ranges:
+                yield self.read(begin, end, step)
+            return
+
+        batches = Queue(self.prefetch)
+        stop_event = threading.Event()
+
+        def _read_batches():
+            try:
+                for begin, end in ranges:
+                    if stop_event.is_set():
+                        break
+                    batches.put(self.read(begin, end, step))
+            # pylint: disable=broad-except
+            except Exception as error:
+                batches.put(error)
+            batches.put(None)
+
+        reader = threading.Thread(target=_read_batches, daemon=True)
+        reader.start()
+        try:
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+                if isinstance(batch, Exception):
+                    raise RuntimeError(f'Failed to read the H5MD file {self.filename}') from batch
+                yield batch
+        finally:
+            stop_event.set()
+            # release the reader if it is blocked by the full queue
+            while reader.is_alive():
+                while not batches.empty():
+                    batches.get()
+                reader.join(0.01)
+
+    def analyse(self,
+                metrics: Union[dict, set],
+                batch_size: int = None,
+                start: int = 0,
+                stop: int = None,
+                step: int = 1,
+                ) -> dict:
+        """
+        Evaluate the metrics or collective variables over the trajectory in batches.
+
+        Args:
+            metrics (Union[dict, set]): Dict or set of `Metric` or `Colvar`. The atom index of them refer to
+                                        the atoms selected by the reader.
+            batch_size (int):   Number of frames covered by each batch. Default: ``None``.
+            start (int):        Index of the first frame. Default: 0
+            stop (int):         End of the frames. Default: ``None``.
+            step (int):         Interval of the frames. Default: 1
+
+        Returns:
+            dict, the key is the name of the metric. The collective variables of `Colvar` and `MetricCV` are
+            calculated for the frames of a batch together, and the value is the array of them of all the frames.
+            Other `Metric` are updated with the frames of a batch by `Metric.update_frames` as a single walker,
+            and the value is the result of `Metric.eval` after all the frames are updated.
+        """
+        metrics = get_metrics(metrics)
+        values = {}
+        for name, metric in metrics.items():
+            metric.clear()
+            if isinstance(metric, MetricCV):
+                values[name] = []
+
+        for coordinate, pbc_box in self.iter_batches(batch_size, start, stop, step):
+            coordinate = Tensor(coordinate)
+            if pbc_box is not None:
+                pbc_box = Tensor(np.ascontiguousarray(pbc_box))
+            for name, metric in metrics.items():
+                if isinstance(metric, MetricCV):
+                    # the frames in the batch are calculated together as walkers
+                    metric.update(coordinate, pbc_box)
+                    values[name].append(np.asarray(metric.eval()))
+                else:
+                    metric.update_frames(coordinate, pbc_box)
+
+        results = {}
+        for name, metric in metrics.items():
+            if isinstance(metric, MetricCV):
+                results[name] = np.concatenate(values[name]) if values[name] else None
+            else:
+                results[name] = metric.eval()
+        return results
+
+    def close(self):
+        """close the HDF5 file"""
+        return self.hdf5_file.close()
+
+    @staticmethod
+    def _get_unit(dataset: h5py.Dataset) -> str:
+        """get the unit of the dataset"""
+        unit = dataset.attrs.get('unit')
+        if unit is None:
+            return None
+        if isinstance(unit, bytes):
+            unit = unit.decode('ascii')
+        return unit
+
+    def _align_batch_size(self, batch_size: int) -> int:
+        """round the batch size up to a multiple of the chunk size"""
+        if batch_size < 1:
+            raise ValueError(f'batch_size must be a positive integer, but got: {batch_size}')
+        return -(-batch_size // self.chunk_size) * self.chunk_size
+
+    def _read_position(self, frames: Union[slice, ndarray]) -> ndarray:
+        """read the coordinates of the selected atoms in the frames"""
+        coordinate = self._position[frames, self._atom_span]
+        if self.atoms is not None:
+            coordinate = coordinate[:, self.atoms]
+        coordinate = np.asarray(coordinate, np.float32)
+        if self.length_unit_scale != 1:
+            coordinate *= self.length_unit_scale
+        return coordinate
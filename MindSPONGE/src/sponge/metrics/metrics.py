@@ -144,6 +144,28 @@ class Metric(_Metric):
         #pylint: disable=unused-argument
         raise NotImplementedError
 
+    def update_frames(self, coordinate: Tensor, pbc_box: Tensor = None):
+        """
+        update the state information with the frames of the trajectory of a single walker.
+
+        Args:
+            coordinate (Tensor):    Tensor of shape (T, A, D). Data type is float.
+                                    Position coordinate of atoms in the frames.
+            pbc_box (Tensor, optional):       Tensor of shape (T, D). Data type is float.
+                                    Tensor of PBC box of the frames. Default: ``None``.
+
+        Note:
+            - T:  Number of frames.
+            - A:  Number of atoms of the simulation system.
+            - D:  Dimension of the space of the simulation system. Usually is 3.
+
+            The frames are updated one by one by default. Subclasses can override it to update all the frames
+            in one call.
+        """
+        for i in range(coordinate.shape[0]):
+            box = None if pbc_box is None else pbc_box[i:i+1]
+            self.update(coordinate[i:i+1], box)
+
 
 class MetricCV(Metric):
     """Metric for collective variables (CVs)"""
@@ -254,7 +276,7 @@ class Average(Metric):
         self._weights = 0
 
     def clear(self):
-        self._value = 0
+        self._average = 0
         self._weights = 0
 
     def update(self,
@@ -298,6 +320,20 @@ class Average(Metric):
         self._average += self._convert_data(colvar)
         self._weights += 1
 
+    def update_frames(self, coordinate: Tensor, pbc_box: Tensor = None):
+        """
+        update the average with the frames of the trajectory of a single walker in one call.
+
+        Args:
+            coordinate (Tensor):    Tensor of shape (T, A, D). Data type is float.
+                                    Position coordinate of atoms in the frames.
+            pbc_box (Tensor, optional):       Tensor of shape (T, D). Data type is float.
+                                    Tensor of PBC box of the frames. Default: ``None``.
+        """
+        colvar = self._convert_data(self.colvar(coordinate, pbc_box))
+        self._average += colvar.sum(axis=0, keepdims=True)
+        self._weights += colvar.shape[0]
+
     def eval(self):
         return self._average / self._weights
 
@@ -65,6 +65,12 @@ class DistanceNeighbours(Cell):
                                 For use with some devices that only support sorting of float16 data.
                                 Default: ``False``.
 
+        check_scaled_cutoff (bool, optional): Whether to count the neighbouring atoms within the scaled cutoff
+                                distance instead of the cutoff distance when checking the overflow of the
+                                neighbour list. It should be ``True`` if the atoms within the scaled cutoff
+                                must all be kept in the list, e.g. when the list is not rebuilt at every step.
+                                Default: ``False``.
+
     Note:
 
         - B:  Number of simulation walker.
@@ -114,6 +120,7 @@ class DistanceNeighbours(Cell):
                  cutoff_scale: float = 1.2,
                  large_dis: float = 1e4,
                  cast_fp16: bool = False,
+                 check_scaled_cutoff: bool = False,
                  ):
 
         super().__init__()
@@ -121,6 +128,7 @@ class DistanceNeighbours(Cell):
         self.cutoff = Tensor(cutoff, ms.float32)
         self.cutoff_scale = Tensor(cutoff_scale, ms.float32)
         self.scaled_cutoff = self.cutoff * self.cutoff_scale
+        self.check_cutoff = self.scaled_cutoff if check_scaled_cutoff else self.cutoff
 
         self.num_neighbours = get_integer(num_neighbours)
         if self.num_neighbours is None:
@@ -278,7 +286,7 @@ class DistanceNeighbours(Cell):
             num_neighbours = num_atoms - 1
         else:
             num_neighbours = self.num_neighbours
-            max_neighbours = self.calc_max_neighbours(distances, self.cutoff)
+            max_neighbours = self.calc_max_neighbours(distances, self.check_cutoff)
             distances = F.depend(distances, F.assign(self.max_neighbours, max_neighbours))
 
         if self.cast_fp16:
@@ -27,6 +27,7 @@ Neighbour list
 from inspect import signature
 from distutils.version import LooseVersion
 from typing import Tuple
+import numpy as np
 import mindspore as ms
 import mindspore.numpy as msnp
 from mindspore import Tensor
@@ -52,7 +53,8 @@ class NeighbourList(Cell):
                                   with the default value of 1 nm.
                                   Default: ``None``.
 
-        pace (int, optional):   Update frequency for neighbour list. Default: ``20``
+        pace (int, optional):   Update frequency for neighbour list. If `adaptive` is ``True``, it is the frequency
+                                to check whether the neighbour list should be rebuilt. Default: ``20``
 
         exclude_index (Tensor, optional): Tensor of the indices of the neighbouring atoms
                                 which could be excluded from the neighbour list. The shape
@@ -79,6 +81,19 @@ class NeighbourList(Cell):
                                 For use with some devices that only support sorting of float16 data.
                                 Default: ``False``.
 
+        adaptive (bool, optional):        Whether to rebuild the neighbour list only when it is needed. The atoms
+                                within the scaled cutoff distance are kept in the neighbour list, so the list is
+                                still valid until any atom moves more than half of the skin
+                                `(cutoff_scale - 1) * cutoff` since the last build. If this is set to ``True``,
+                                the displacement is checked at every `pace` steps and the list is only rebuilt
+                                when the displacement exceeds the half skin. The `pace` should be small enough
+                                that no atom moves further than the half skin within `pace` steps. An error is
+                                raised if the list can not hold all the atoms within the scaled cutoff distance.
+                                The list is always rebuilt when the PBC box changes, e.g. under a barostat.
+                                The check is done on the host by `update`, so `update` must be called outside of
+                                the graph, as `Sponge` does, and not inside the `construct` of a cell.
+                                Default: ``False``.
+
     Note:
         - B:  Batchsize, i.e. number of walkers of the simulation.
 
@@ -145,6 +160,7 @@ class NeighbourList(Cell):
                  grid_num_scale: float = 2,
                  use_grids: bool = False,
                  cast_fp16: bool = False,
+                 adaptive: bool = False,
                  ):
 
         super().__init__()
@@ -220,6 +236,7 @@ class NeighbourList(Cell):
                     cutoff_scale=cutoff_scale,
                     large_dis=self.large_dis,
                     cast_fp16=cast_fp16,
+                    check_scaled_cutoff=adaptive,
                 )
 
                 if num_neighbours is None:
@@ -227,6 +244,17 @@ class NeighbourList(Cell):
 
         self.num_neighbours = self.neighbour_list.num_neighbours
 
+        self.adaptive = adaptive and self.cutoff is not None
+        self.half_skin = None
+        if self.adaptive:
+            if cutoff_scale <= 1:
+                raise ValueError(f'cutoff_scale must be larger than 1 for the adaptive neighbour list, '
+                                 f'but got {cutoff_scale}!')
+            self.half_skin = self.cutoff * (cutoff_scale - 1) / 2
+        self.last_coordinate = None
+        self.last_pbc_box = None
+        self.num_rebuilds = 0
+
         index, mask = self.calculate(self.coordinate, self.pbc_box)
 
         self.neighbours = None
@@ -239,6 +267,13 @@ class NeighbourList(Cell):
         self.get_vector = GetVector(use_pbc)
         self.identity = ops.Identity()
 
+        if self.adaptive and self.neighbours is not None:
+            self.last_coordinate = Parameter(F.stop_gradient(self.coordinate).copy(), name='last_coordinate',
+                                             requires_grad=False)
+            if self.pbc_box is not None:
+                self.last_pbc_box = Parameter(F.stop_gradient(self.pbc_box).copy(), name='last_pbc_box',
+                                              requires_grad=False)
+
         self.norm_last_dim = None
         # MindSpore < 2.0.0-rc1
         if 'ord' not in signature(ops.norm).parameters.keys():
@@ -254,6 +289,20 @@ class NeighbourList(Cell):
         """
         return self._pace
 
+    @property
+    def max_neighbours(self) -> int:
+        r"""Maximum number of neighbouring atoms found at the last build of the neighbour list.
+        It should not exceed `num_neighbours`.
+
+        Returns:
+            int, maximum number of neighbouring atoms, or ``None`` if it is not tracked.
+
+        """
+        max_neighbours = getattr(self.neighbour_list, 'max_neighbours', None)
+        if max_neighbours is None:
+            return None
+        return get_integer(max_neighbours)
+
     def set_exclude_index(self, exclude_index: Tensor):
         r"""set exclude index
 
@@ -264,7 +313,7 @@ class NeighbourList(Cell):
         if exclude_index is None:
             return self
         self.exclude_index = self.neighbour_list.set_exclude_index(exclude_index)
-        index, mask = self.update(self.coordinate, self.pbc_box)
+        index, mask = self.update(self.coordinate, self.pbc_box, force=True)
         F.assign(self.neighbours, index)
         if self.neighbour_mask is None:
             self.neighbour_mask = Parameter(mask, name='neighbour_mask', requires_grad=False)
@@ -277,7 +326,32 @@ class NeighbourList(Cell):
         self.neighbour_list.print_info()
         return self
 
-    def update(self, coordinate: Tensor, pbc_box: Tensor = None) -> Tuple[Tensor, Tensor]:
+    def max_displacement(self, coordinate: Tensor, pbc_box: Tensor = None) -> Tensor:
+        r"""maximum displacement of atoms since the last build of the neighbour list
+
+        Args:
+            coordinate (Tensor):    Tensor of shape :math:`(B, A, D)`. Data type is float.
+                                    Position coordinate.
+            pbc_box (Tensor, optional):       Tensor of shape :math:`(B, D)`. Data type is float.
+                                    Size of PBC box.
+
+        Returns:
+            Tensor, the maximum displacement. Data type is float.
+
+        """
+        if self.last_coordinate is None:
+            return None
+        displacement = self.get_vector(self.last_coordinate, F.stop_gradient(coordinate), pbc_box)
+        return F.sqrt(ops.reduce_max(F.reduce_sum(F.square(displacement), -1)))
+
+    def _need_rebuild(self, coordinate: Tensor, pbc_box: Tensor = None) -> bool:
+        """Whether the adaptive neighbour list should be rebuilt. It is evaluated on the host."""
+        if self.last_pbc_box is not None and pbc_box is not None:
+            if not np.array_equal(self.last_pbc_box.asnumpy(), pbc_box.asnumpy()):
+                return True
+        return bool(self.max_displacement(coordinate, pbc_box).asnumpy() > self.half_skin.asnumpy())
+
+    def update(self, coordinate: Tensor, pbc_box: Tensor = None, force: bool = False) -> Tuple[Tensor, Tensor]:
         r"""update neighbour list
 
         Args:
@@ -285,6 +359,9 @@ class NeighbourList(Cell):
                                     Position coordinate.
             pbc_box (Tensor, optional):       Tensor of shape :math:`(B, D)`. Data type is float.
                                     Size of PBC box.
+            force (bool, optional): Whether to rebuild the neighbour list even if the atoms have not moved beyond
+                                    the half skin and the PBC box has not changed in adaptive mode.
+                                    Default: ``False``.
 
         Returns:
             neigh_idx (Tensor):     Tensor of shape :math:`(B, A, N)`. Data type is int.
@@ -298,6 +375,10 @@ class NeighbourList(Cell):
             - N:  Number of the maximum neighbouring atoms.
             - D:  Dimension of position coordinates.
 
+            - In adaptive mode, whether to rebuild the list is decided on the host and `num_rebuilds` is a Python
+              counter, so this function must be called outside of the graph (in PyNative mode or from the
+              Python side as `Sponge` does), and not inside the `construct` of a cell.
+
         """
 
         if self.neighbours is None:
@@ -307,8 +388,16 @@ class NeighbourList(Cell):
         if pbc_box is not None:
             pbc_box = F.stop_gradient(pbc_box)
 
+        if self.adaptive and not force and not self._need_rebuild(coordinate, pbc_box):
+            return self.get_neighbour_list()
+
         neighbours, neighbour_mask = self.calculate(coordinate, pbc_box)
         neighbours = F.depend(neighbours, self.neighbour_list.check_neighbour_list())
+        self.num_rebuilds += 1
+        if self.last_coordinate is not None:
+            neighbours = F.depend(neighbours, F.assign(self.last_coordinate, coordinate))
+        if self.last_pbc_box is not None and pbc_box is not None:
+            neighbours = F.depend(neighbours, F.assign(self.last_pbc_box, pbc_box))
 
         neighbours = F.depend(neighbours, F.assign(self.neighbours, neighbours))
         if self.neighbour_mask is not None:
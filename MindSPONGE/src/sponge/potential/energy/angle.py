@@ -23,7 +23,6 @@
 """Angle energy"""
 
 from typing import Union, List
-from operator import itemgetter
 import numpy as np
 from numpy import ndarray
 
@@ -35,7 +34,7 @@ from mindspore.ops import functional as F
 from .energy import EnergyCell, _energy_register
 from ...colvar import Angle
 from ...system import Molecule
-from ...data import get_bonded_types
+from ...data import get_bonded_types, match_parameter_types
 from ...function import functions as func
 from ...function import get_ms_array, get_arguments
 
@@ -185,28 +184,14 @@ class AngleEnergy(EnergyCell):
         t_index = parameters['parameter_names']["pattern"].index('bond_angle')
 
         angle_params: dict = parameters['parameters']
-        params = {}
-        for k, v in angle_params.items():
-            [a, b, c] = k.split('-')
-            if a != c:
-                params[c + '-' + b + '-' + a] = v
-        angle_params.update(params)
-
-        angle_type = get_bonded_types(angle_atoms)
-        type_list: list = angle_type.reshape(-1).tolist()
-
-        if len(type_list) == 1:
-            bond_angle = [angle_params[type_list[0]][t_index]]
-            force_constant = [angle_params[type_list[0]][k_index]]
-        else:
-            bond_angle = []
-            force_constant = []
-            for params in itemgetter(*type_list)(angle_params):
-                bond_angle.append(params[t_index])
-                force_constant.append(params[k_index])
-
-        force_constant = np.array(force_constant, np.float32).reshape(angle_type.shape)
-        bond_angle = np.array(bond_angle, np.float32).reshape(angle_type.shape) / 180 * np.pi
+        keys = list(angle_params.keys())
+        key_index, _ = match_parameter_types(angle_atoms, keys, orders=[(0, 1, 2), (2, 1, 0)])
+        if (key_index < 0).any():
+            raise KeyError(get_bonded_types(angle_atoms[key_index < 0])[0])
+
+        values = np.array([angle_params[key] for key in keys], np.float32)
+        force_constant = values[key_index, k_index]
+        bond_angle = values[key_index, t_index] / 180 * np.pi
 
         return index, force_constant, bond_angle
 
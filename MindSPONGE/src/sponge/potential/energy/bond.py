@@ -23,7 +23,6 @@
 """Bond energy"""
 
 from typing import Union, List
-from operator import itemgetter
 import numpy as np
 from numpy import ndarray
 
@@ -35,7 +34,7 @@ from mindspore.ops import functional as F
 from .energy import EnergyCell, _energy_register
 from ...colvar import Distance
 from ...system import Molecule
-from ...data import get_bonded_types
+from ...data import get_bonded_types, match_parameter_types
 from ...function import functions as func
 from ...function import get_ms_array, get_arguments
 
@@ -187,28 +186,14 @@ class BondEnergy(EnergyCell):
         r_index = parameters['parameter_names']["pattern"].index('bond_length')
 
         bond_params: dict = parameters['parameters']
-        params = {}
-        for k, v in bond_params.items():
-            [a, b] = k.split('-')
-            if a != b:
-                params[b + '-' + a] = v
-        bond_params.update(params)
-
-        bond_type = get_bonded_types(bond_atoms)
-        type_list: list = bond_type.reshape(-1).tolist()
-
-        if len(type_list) == 1:
-            bond_length = [bond_params[type_list[0]][r_index]]
-            force_constant = [bond_params[type_list[0]][k_index]]
-        else:
-            bond_length = []
-            force_constant = []
-            for params in itemgetter(*type_list)(bond_params):
-                bond_length.append(params[r_index])
-                force_constant.append(params[k_index])
-
-        force_constant = np.array(force_constant, np.float32).reshape(bond_type.shape)
-        bond_length = np.array(bond_length, np.float32).reshape(bond_type.shape)
+        keys = list(bond_params.keys())
+        key_index, _ = match_parameter_types(bond_atoms, keys, orders=[(0, 1), (1, 0)])
+        if (key_index < 0).any():
+            raise KeyError(get_bonded_types(bond_atoms[key_index < 0])[0])
+
+        values = np.array([bond_params[key] for key in keys], np.float32)
+        force_constant = values[key_index, k_index]
+        bond_length = values[key_index, r_index]
 
         return index, force_constant, bond_length
 
@@ -23,8 +23,6 @@
 """Torsion energy"""
 
 from typing import Union, List
-import re
-from operator import itemgetter
 import numpy as np
 from numpy import ndarray
 
@@ -36,7 +34,7 @@ from mindspore import Parameter
 from .energy import EnergyCell, _energy_register
 from ...colvar import Torsion
 from ...system import Molecule
-from ...data import get_dihedral_types
+from ...data import get_dihedral_types, match_parameter_types
 from ...function import functions as func
 from ...function import get_ms_array, get_arguments
 
@@ -201,41 +199,36 @@ class DihedralEnergy(EnergyCell):
 
         dihedral_params: dict = parameters['parameters']
 
-        key_types_ndarray = np.array([specific_name.split('-') for specific_name in dihedral_params.keys()], np.str_)
+        # the keys with less wildcards take precedence
+        keys = list(dihedral_params.keys())
+        key_types_ndarray = np.array([specific_name.split('-') for specific_name in keys], np.str_)
         types_sorted_args = np.argsort((key_types_ndarray == '?').sum(axis=-1))
-        sorted_key_types = key_types_ndarray[types_sorted_args]
-        transformed_key_types = ['-'.join(specific_name).replace('?', '.+').replace('*', '\\*') for
-                                 specific_name in sorted_key_types]
-
-        dihedral_types, inverse_dihedral_types = get_dihedral_types(dihedral_atoms)
-        type_list: list = dihedral_types.reshape(-1).tolist()
-        inverse_type_list: list = inverse_dihedral_types.reshape(-1).tolist()
-
-        for i, _ in enumerate(type_list):
-            for key_type in transformed_key_types:
-                if re.match('^'+key_type+'$', type_list[i]) or re.match('^'+key_type+'$', inverse_type_list[i]):
-                    type_list[i] = key_type.replace('.+', '?').replace('\\', '')
-                    break
-
-        force_constant = []
-        phase = []
-        periodicity = []
-        dihedral_index = []
-        for i, params in enumerate(itemgetter(*type_list)(dihedral_params)):
-            for _, lastd_params in enumerate(params):
-                dihedral_index.append(index[i])
-                force_constant.append(lastd_params[k_index])
-                phase.append(lastd_params[phi_index])
-                periodicity.append(lastd_params[t_index])
-
-        params = {}
-        force_constant = np.array(force_constant, np.float32)
+        sorted_keys = [keys[i] for i in types_sorted_args]
+
+        key_index, _ = match_parameter_types(dihedral_atoms, sorted_keys, orders=[(0, 1, 2, 3), (3, 2, 1, 0)])
+        key_index = key_index.reshape(-1)
+        if (key_index < 0).any():
+            dihedral_types, _ = get_dihedral_types(dihedral_atoms.reshape(-1, 4)[key_index < 0])
+            raise KeyError(dihedral_types[0])
+
+        # the parameters of all the keys in a flat table, with multiple terms for one key
+        num_terms = np.array([len(dihedral_params[key]) for key in sorted_keys], np.int64)
+        key_offset = np.cumsum(num_terms) - num_terms
+        values = np.array([params for key in sorted_keys for params in dihedral_params[key]], np.float32)
+
+        num_terms = num_terms[key_index]
+        term_offset = np.cumsum(num_terms) - num_terms
+        term_index = np.repeat(key_offset[key_index] - term_offset, num_terms) + np.arange(num_terms.sum())
+        dihedral_index = np.repeat(index.reshape(-1, 4), num_terms, axis=0)
+        values = values[term_index]
+
+        force_constant = values[:, k_index]
         ks0_filter = np.where(force_constant != 0)[0]
 
-        index = np.array(dihedral_index, np.int32)[ks0_filter]
+        index = dihedral_index.astype(np.int32)[ks0_filter]
         force_constant = force_constant[ks0_filter]
-        periodicity = np.array(periodicity, np.float32)[ks0_filter]
-        phase = np.array(phase, np.float32)[ks0_filter] / 180 * np.pi
+        periodicity = values[ks0_filter, t_index]
+        phase = values[ks0_filter, phi_index] / 180 * np.pi
 
         return index, force_constant, periodicity, phase
 
@@ -23,8 +23,7 @@
 """Torsion energy"""
 
 from typing import Union, List
-import re
-from operator import itemgetter
+from itertools import permutations
 import numpy as np
 from numpy import ndarray
 
@@ -32,7 +31,7 @@ from mindspore import Tensor
 
 from .energy import _energy_register
 from .dihedral import DihedralEnergy
-from ...data import get_improper_types
+from ...data import match_parameter_types
 from ...system import Molecule
 from ...function import get_arguments
 
@@ -149,48 +148,34 @@ class ImproperEnergy(DihedralEnergy):
 
         improper_params: dict = parameters['parameters']
 
-        key_types_ndarray = np.array([specific_name.split('-') for specific_name in improper_params.keys()], np.str_)
+        # the keys with less wildcards take precedence
+        keys = list(improper_params.keys())
+        key_types_ndarray = np.array([specific_name.split('-') for specific_name in keys], np.str_)
         types_sorted_args = np.argsort((key_types_ndarray == '?').sum(axis=-1))
-        sorted_key_types = key_types_ndarray[types_sorted_args]
-        transformed_key_types = ['-'.join(specific_name).replace('?', '.+').replace('*', '\\*') for specific_name in
-                                 sorted_key_types]
-
-        improper_types, orders = get_improper_types(improper_atoms)
-        type_list = improper_types[0].reshape(-1)
-
-        not_defined_mask = np.zeros(type_list.shape).astype(np.int32)
-        for i, _ in enumerate(type_list):
-            for key_type in transformed_key_types:
-                for j, itypes in enumerate(improper_types):
-                    if re.match('^'+key_type+'$', itypes[i]):
-                        this_improper = index[i][np.array(list(orders[j]))]
-                        if this_improper[2] != third_id[i]:
-                            continue
-                        index[i] = this_improper
-                        not_defined_mask[i] = 1
-                        type_list[i] = key_type.replace('.+', '?').replace('\\', '')
-                        break
-                else:
-                    continue
-                break
-
-        type_list = type_list[np.where(not_defined_mask > 0)[0]]
-
-        force_constant = []
-        phase = []
-        periodicity = []
-        improper_index = []
-        improper = index[np.where(not_defined_mask > 0)[0]]
-        for i, params in enumerate(itemgetter(*type_list)(improper_params)):
-            for _, lastd_params in enumerate(params):
-                improper_index.append(improper[i])
-                force_constant.append(lastd_params[k_index])
-                phase.append(lastd_params[phi_index])
-                periodicity.append(lastd_params[t_index])
-
-        index = np.array(improper_index, np.int32)
-        force_constant = np.array(force_constant, np.float32)
-        periodicity = np.array(periodicity, np.float32)
-        phase = np.array(phase, np.float32) / 180 * np.pi
+        sorted_keys = [keys[i] for i in types_sorted_args]
+
+        # the third atom of a matched improper dihedral must be the axis atom
+        orders = np.array(list(permutations(range(4))), np.int32)
+        valid = index[:, orders[:, 2]] == third_id[:, None]
+        key_index, order_index = match_parameter_types(improper_atoms, sorted_keys, orders, valid)
+
+        defined = np.where(key_index >= 0)[0]
+        key_index = key_index[defined]
+        improper = np.take_along_axis(index[defined], orders[order_index[defined]], axis=-1)
+
+        # the parameters of all the keys in a flat table, with multiple terms for one key
+        num_terms = np.array([len(improper_params[key]) for key in sorted_keys], np.int64)
+        key_offset = np.cumsum(num_terms) - num_terms
+        values = np.array([params for key in sorted_keys for params in improper_params[key]], np.float32)
+
+        num_terms = num_terms[key_index]
+        term_offset = np.cumsum(num_terms) - num_terms
+        term_index = np.repeat(key_offset[key_index] - term_offset, num_terms) + np.arange(num_terms.sum())
+        values = values[term_index]
+
+        index = np.repeat(improper, num_terms, axis=0).astype(np.int32)
+        force_constant = values[:, k_index]
+        periodicity = values[:, t_index]
+        phase = values[:, phi_index] / 180 * np.pi
 
         return index, force_constant, periodicity, phase
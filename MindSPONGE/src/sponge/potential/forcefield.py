@@ -23,7 +23,6 @@
 """Force filed"""
 import os
 from typing import Union, List
-import numpy as np
 from numpy import ndarray
 import mindspore as ms
 from mindspore import Tensor
@@ -34,6 +33,7 @@ from .energy import EnergyCell, get_energy_cell
 from .potential import PotentialCell
 from ..data.forcefield import get_forcefield
 from ..system import Molecule
+from ..system.molecule.bond_graph import get_exclude_index
 from ..function import get_arguments
 from ..function import Units, Length
 
@@ -378,41 +378,5 @@ class ForceField(ForceFieldBase):
         dihedrals = None if system.dihedrals is None else system.dihedrals.asnumpy()
         improper = None if system.improper_dihedrals is None else system.improper_dihedrals.asnumpy()
 
-        excludes_ = []
-        for i in range(num_atoms):
-            bond_excludes = bonds[np.where(
-                np.isin(bonds, i).sum(axis=1))[0]].flatten()
-            this_excludes = bond_excludes
-
-            if angles is not None:
-                angle_excludes = angles[
-                    np.where(np.isin(angles, i).sum(axis=1))[0]
-                ].flatten()
-                this_excludes = np.append(this_excludes, angle_excludes)
-
-            if dihedrals is not None:
-                dihedral_excludes = dihedrals[
-                    np.where(np.isin(dihedrals, i).sum(axis=1))[0]
-                ].flatten()
-                this_excludes = np.append(this_excludes, dihedral_excludes)
-            if improper is not None:
-                idihedral_excludes = improper[
-                    np.where(np.isin(improper, i).sum(axis=1))[0]
-                ].flatten()
-                this_excludes = np.append(this_excludes, idihedral_excludes)
-
-            this_excludes = np.unique(this_excludes)
-            excludes_.append(this_excludes[np.where(
-                this_excludes != i)[0]].tolist())
-        padding_length = 0
-        for i in range(num_atoms):
-            padding_length = max(padding_length, len(excludes_[i]))
-        excludes = np.empty((num_atoms, padding_length))
-        for i in range(num_atoms):
-            excludes[i] = np.pad(
-                np.array(excludes_[i]),
-                (0, padding_length - len(excludes_[i])),
-                mode="constant",
-                constant_values=num_atoms,
-            )
+        excludes = get_exclude_index(num_atoms, bonds, angles, dihedrals, improper)
         return Tensor(excludes[None, :], ms.int32)
@@ -25,6 +25,8 @@
 Fill in water molecules in a box.
 """
 import os
+import itertools
+from multiprocessing import Pool
 import numpy as np
 from numpy import ndarray
 from .hadder import read_pdb
@@ -38,9 +40,125 @@ DENSITY = _DENSITY * 6.022E23 / 1e03 ** 9
 _AVGDIS = DENSITY ** (-1 / 3)
 AVGDIS = _AVGDIS * 1.
 
+# cell list used by the worker processes of `get_clash_mask`
+_WORKER_CELL_LIST = None
+
+
+class _CellList:
+    """Cell list of the atoms to find the points close to them.
+
+    Args:
+        crds(ndarray): The coordinates of atoms with shape (A, 3).
+        cutoff(float): The distance within which a point clashes with an atom.
+        box(ndarray): The periodic box. If it is None, the periodic images are not considered.
+        origin(ndarray): The origin of the periodic box.
+    """
+
+    def __init__(self, crds: ndarray, cutoff: float, box: ndarray = None, origin: ndarray = None):
+        self.cutoff = float(cutoff)
+        crds = np.asarray(crds, np.float64).reshape(-1, 3)
+        if box is None:
+            self.box = None
+            self.origin = crds.min(axis=0) if crds.size > 0 else np.zeros(3)
+            self.num_cells = np.floor((crds.max(axis=0) - self.origin) / self.cutoff).astype(np.int64) + 1 \
+                if crds.size > 0 else np.ones(3, np.int64)
+            self.cell_size = np.full(3, self.cutoff)
+        else:
+            self.box = np.asarray(box, np.float64).reshape(3)
+            self.origin = np.zeros(3) if origin is None else np.asarray(origin, np.float64).reshape(3)
+            self.num_cells = np.maximum(np.floor(self.box / self.cutoff).astype(np.int64), 1)
+            self.cell_size = self.box / self.num_cells
+
+        cell_index = self._get_cell_index(crds)
+        cell_id = np.ravel_multi_index(cell_index.T, self.num_cells)
+        order = np.argsort(cell_id, kind='stable')
+        self.crds = crds[order]
+        self.counts = np.bincount(cell_id, minlength=int(np.prod(self.num_cells)))
+        self.starts = np.cumsum(self.counts) - self.counts
+
+    def clash(self, points: ndarray) -> ndarray:
+        """Return the mask of the points within the cutoff distance of any atom."""
+        points = np.asarray(points, np.float64).reshape(-1, 3)
+        mask = np.zeros(points.shape[0], bool)
+        if self.crds.shape[0] == 0:
+            return mask
+        if self.box is None:
+            cell_index = np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+        else:
+            cell_index = self._get_cell_index(points)
+
+        for offset in itertools.product((-1, 0, 1), repeat=3):
+            neighbour = cell_index + np.array(offset)
+            if self.box is None:
+                valid = np.all((neighbour >= 0) & (neighbour < self.num_cells), axis=-1)
+            else:
+                neighbour %= self.num_cells
+                valid = np.ones(points.shape[0], bool)
+            valid &= ~mask
+            point_index = np.nonzero(valid)[0]
+            cell_id = np.ravel_multi_index(neighbour[point_index].T, self.num_cells)
+            counts = self.counts[cell_id]
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            point_index = np.repeat(point_index, counts)
+            atom_index = np.repeat(self.starts[cell_id] - np.cumsum(counts) + counts, counts) + np.arange(total)
+            diff = points[point_index] - self.crds[atom_index]
+            if self.box is not None:
+                diff -= self.box * np.round(diff / self.box)
+            close = np.einsum('ij,ij->i', diff, diff) <= self.cutoff ** 2
+            mask[point_index[close]] = True
+        return mask
+
+    def _get_cell_index(self, crds: ndarray) -> ndarray:
+        """Get the index of cells of the coordinates."""
+        crds = crds - self.origin
+        if self.box is not None:
+            crds %= self.box
+        cell_index = np.floor(crds / self.cell_size).astype(np.int64)
+        return np.clip(cell_index, 0, self.num_cells - 1)
+
+
+def _init_worker(cell_list: _CellList):
+    global _WORKER_CELL_LIST
+    _WORKER_CELL_LIST = cell_list
+
+
+def _worker_clash(points: ndarray) -> ndarray:
+    return _WORKER_CELL_LIST.clash(points)
+
+
+def get_clash_mask(points: ndarray, crds: ndarray, cutoff: float, box: ndarray = None, origin: ndarray = None,
+                   chunk_size: int = 65536, num_workers: int = 1) -> ndarray:
+    """ Find the points within the cutoff distance of any atom by a cell list.
+    Args:
+        points(ndarray): The coordinates of the points to be tested, with shape (N, 3).
+        crds(ndarray): The coordinates of atoms, with shape (A, 3).
+        cutoff(float): The distance within which a point clashes with an atom.
+        box(ndarray): The periodic box. If it is given, the periodic images of atoms are also considered.
+        origin(ndarray): The origin of the periodic box.
+        chunk_size(int): The number of points tested at once, which bounds the memory usage.
+        num_workers(int): The number of processes to test the chunks of points.
+
+    Returns:
+        ndarray, the mask of the clashed points with shape (N,).
+    """
+    cell_list = _CellList(crds, cutoff, box, origin)
+    points = np.asarray(points).reshape(-1, 3)
+    chunks = [points[i: i + chunk_size] for i in range(0, points.shape[0], chunk_size)]
+    if not chunks:
+        return np.zeros(0, bool)
+    if num_workers > 1 and len(chunks) > 1:
+        with Pool(min(num_workers, len(chunks)), initializer=_init_worker, initargs=(cell_list,)) as pool:
+            masks = pool.map(_worker_clash, chunks)
+    else:
+        masks = [cell_list.clash(chunk) for chunk in chunks]
+    return np.concatenate(masks)
+
 
 def fill_water(pdb_in: str, pdb_out: str, gap: float = 4.0, box: ndarray = None, rebuild_hydrogen: bool = False,
-               return_pdb_obj: bool = False, adaptive_length: float = 5.0):
+               return_pdb_obj: bool = False, adaptive_length: float = 5.0, periodic: bool = False,
+               num_workers: int = 1):
     """ The function to fill in water.
     Args:
         pdb_in(str): The input molecule file.
@@ -50,6 +168,8 @@ def fill_water(pdb_in: str, pdb_out: str, gap: float = 4.0, box: ndarray = None,
         rebuild_hydrogen(bool): Decide to rebuild the hydrogen atoms in the molecule or not.
         return_pdb_obj(bool): If this option is on, the returned results would be a pdb object.
         adaptive_length(float): The water molecule width to add.
+        periodic(bool): Decide to remove the water molecules clashed with the periodic images of the system or not.
+        num_workers(int): The number of processes to find the clashed water molecules.
     """
     if box is None and adaptive_length is None:
         raise ValueError("Please input a box or adaptive_length for filling water molecules.")
@@ -105,10 +225,11 @@ def fill_water(pdb_in: str, pdb_out: str, gap: float = 4.0, box: ndarray = None,
 
     o_crd = np.concatenate((o_x[:, None], o_y[:, None], o_z[:, None]), axis=-1)
 
-    dis = np.linalg.norm(crds - o_crd[:, None, :], axis=-1)
-    filt = np.where((dis <= gap).sum(axis=-1) > 0)
+    pbc_box = final_box if periodic else None
+    origin = np.array([origin_x, origin_y, origin_z])
+    clash = get_clash_mask(o_crd, crds, gap, pbc_box, origin, num_workers=num_workers)
 
-    o_crd = np.delete(o_crd, filt, axis=0)
+    o_crd = o_crd[~clash]
     print('[MindSPONGE] Totally {} waters is added to the system!'.format(int(o_crd.shape[0])))
     h1_crd = o_crd + np.array([0.079079641, 0.061207927, 0.0], np.float32) * 10
     h2_crd = o_crd + np.array([-0.079079641, 0.061207927, 0.0], np.float32) * 10
@@ -0,0 +1,218 @@
+# Copyright 2021-2023 @ Shenzhen Bay Laboratory &
+#                       Peking University &
+#                       Huawei Technologies Co., Ltd
+#
+# This code is a part of MindSPONGE:
+# MindSpore Simulation Package tOwards Next Generation molecular modelling.
+#
+# MindSPONGE is open-source software based on the AI-framework:
+# MindSpore (https://www.mindspore.cn/)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Bond graph of molecular topology
+"""
+
+import itertools
+import numpy as np
+from numpy import ndarray
+
+# Order of the neighbour pairs of the angles around a vertex with 2, 3 and 4 neighbours.
+_ANGLE_PAIRS = {
+    2: [[0, 1]],
+    3: [[0, 1], [1, 2], [0, 2]],
+    4: [[0, 1], [1, 2], [2, 3], [0, 2], [0, 3], [1, 3]],
+}
+
+
+def _expand_ranges(starts: ndarray, counts: ndarray) -> ndarray:
+    """Concatenate the ranges [start, start + count) into one index array."""
+    total = int(counts.sum())
+    if total == 0:
+        return np.zeros(0, np.int64)
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + np.arange(total) - offsets
+
+
+class BondGraph:
+    r"""
+    Compressed sparse row (CSR) adjacency of the bond graph, used to enumerate the angles, dihedrals, improper
+    dihedrals and the excluded atom pairs of a molecular system without the loops over atoms.
+
+    The neighbours of atom `i` are `indices[indptr[i]:indptr[i+1]]`, in the order of the bonds they come from.
+
+    Args:
+        bonds (ndarray):    Array of bonds with shape `(b, 2)`.
+        num_atoms (int):    Number of atoms. If it is `None`, the largest atom index in `bonds` plus one is used.
+                            Default: None
+
+    Note:
+        b:  Number of bonds.
+    """
+
+    def __init__(self, bonds: ndarray, num_atoms: int = None):
+        self.bonds = np.asarray(bonds, np.int64).reshape(-1, 2)
+        if num_atoms is None:
+            num_atoms = int(self.bonds.max()) + 1 if self.bonds.size > 0 else 0
+        self.num_atoms = num_atoms
+
+        atoms = self.bonds.reshape(-1)
+        # stable sort keeps the neighbours of each atom in the order of bonds
+        order = np.argsort(atoms, kind='stable')
+        self.indices = self.bonds[:, ::-1].reshape(-1)[order]
+        self.degree = np.bincount(atoms, minlength=num_atoms)
+        self.indptr = np.concatenate(([0], np.cumsum(self.degree)))
+
+    def neighbours(self, atoms: ndarray, num: int) -> ndarray:
+        """Neighbours of `atoms` which all have `num` neighbours, with shape `(len(atoms), num)`."""
+        return self.indices[self.indptr[atoms][:, None] + np.arange(num)]
+
+    def angles(self) -> ndarray:
+        """
+        Build the angles with the vertex in the middle, ordered by the vertex.
+
+        Returns:
+            ndarray, angles with shape `(a, 3)`, or None if there is no angle.
+        """
+        vertices = np.where(self.degree > 1)[0]
+        angles = []
+        keys = []
+        for num in np.unique(self.degree[vertices]):
+            this_vertices = vertices[self.degree[vertices] == num]
+            pairs = np.array(_ANGLE_PAIRS.get(num, list(itertools.combinations(range(num), 2))))
+            neighbours = self.neighbours(this_vertices, num)
+            num_pairs = pairs.shape[0]
+            angles.append(np.stack((neighbours[:, pairs[:, 0]].reshape(-1),
+                                    np.repeat(this_vertices, num_pairs),
+                                    neighbours[:, pairs[:, 1]].reshape(-1)), axis=-1))
+            keys.append(np.repeat(this_vertices, num_pairs))
+        if not angles:
+            return None
+        keys = np.concatenate(keys)
+        return np.concatenate(angles)[np.argsort(keys, kind='stable')]
+
+    def dihedrals(self, angles: ndarray) -> ndarray:
+        r"""
+        Build the dihedrals :math:`(i, j, k, l)` around the bonds :math:`(j, k)` from the angles.
+        The dihedrals are ordered by the middle bond, then by atom :math:`i` and then by the order of the angles
+        that give atom :math:`l`.
+
+        Args:
+            angles (ndarray):   Array of angles with shape `(a, 3)`.
+
+        Returns:
+            ndarray, dihedrals with shape `(d, 4)`, or None if there is no dihedral.
+        """
+        if angles is None or angles.size == 0:
+            return None
+        angles = np.asarray(angles, np.int64)
+        num_atoms = max(self.num_atoms, int(angles.max()) + 1)
+
+        middles = self.bonds[(self.degree[self.bonds] > 1).all(axis=-1)]
+        if middles.size == 0:
+            return None
+
+        # half angles: (end, center, other), ordered by the end atom at the head then tail of the angles
+        ends = np.concatenate((angles[:, 0], angles[:, 2]))
+        others = np.concatenate((angles[:, 2], angles[:, 0]))
+        half_keys = ends * num_atoms + np.concatenate((angles[:, 1], angles[:, 1]))
+        order = np.argsort(half_keys, kind='stable')
+        half_keys = half_keys[order]
+        others_by_key = others[order]
+
+        # atoms `l` on the side of `k` (angles `j-k-l`), in the order of angles
+        left_keys = middles[:, 0] * num_atoms + middles[:, 1]
+        left_starts = np.searchsorted(half_keys, left_keys, side='left')
+        left_counts = np.searchsorted(half_keys, left_keys, side='right') - left_starts
+
+        # atoms `i` on the side of `j` (angles `k-j-i`), sorted and unique
+        unique_mask = np.ones(half_keys.shape[0], bool)
+        sorted_order = np.lexsort((others_by_key, half_keys))
+        sorted_keys = half_keys[sorted_order]
+        sorted_others = others_by_key[sorted_order]
+        unique_mask[1:] = (sorted_keys[1:] != sorted_keys[:-1]) | (sorted_others[1:] != sorted_others[:-1])
+        right_keys = sorted_keys[unique_mask]
+        right_others = sorted_others[unique_mask]
+        middle_keys = middles[:, 1] * num_atoms + middles[:, 0]
+        right_starts = np.searchsorted(right_keys, middle_keys, side='left')
+        right_counts = np.searchsorted(right_keys, middle_keys, side='right') - right_starts
+
+        counts = left_counts * right_counts
+        if counts.sum() == 0:
+            return None
+        middle_index = np.repeat(np.arange(middles.shape[0]), counts)
+        position = _expand_ranges(np.zeros_like(counts), counts)
+        right = right_others[right_starts[middle_index] + position // left_counts[middle_index]]
+        left = others_by_key[left_starts[middle_index] + position % left_counts[middle_index]]
+
+        dihedrals = np.concatenate((right[:, None], middles[middle_index], left[:, None]), axis=-1)
+        dihedrals = dihedrals[right != left]
+        if dihedrals.size == 0:
+            return None
+        return dihedrals
+
+    def improper(self):
+        """
+        Build the improper dihedrals of the SP2 atoms, i.e. the atoms with three neighbours.
+
+        Returns:
+            - improper (ndarray), the sorted atoms of the improper dihedrals with shape `(i, 4)`, or None.
+            - core (ndarray), the center atom of each improper dihedral with shape `(i,)`, or None.
+        """
+        core = np.where(self.degree == 3)[0]
+        if core.size == 0:
+            return None, None
+        improper = np.sort(np.concatenate((core[:, None], self.neighbours(core, 3)), axis=-1), axis=-1)
+        return improper, core
+
+
+def get_exclude_index(num_atoms: int, *terms: ndarray) -> ndarray:
+    """
+    Get the index of the excluded atoms of each atom, i.e. all the other atoms in the same bond, angle, dihedral or
+    improper dihedral. The index are sorted and padded with `num_atoms`.
+
+    Args:
+        num_atoms (int):    Number of atoms.
+        terms (ndarray):    Arrays of the atom index of bonds, angles, dihedrals and so on. `None` is skipped.
+
+    Returns:
+        ndarray, the index of excluded atoms with shape `(A, E)`.
+
+    Note:
+        A:  Number of atoms.
+        E:  Maximum number of excluded atoms of one atom.
+    """
+    pair_keys = []
+    for term in terms:
+        if term is None:
+            continue
+        term = np.asarray(term, np.int64)
+        width = term.shape[-1]
+        for i, j in itertools.permutations(range(width), 2):
+            pair_keys.append(term[:, i] * num_atoms + term[:, j])
+    if pair_keys:
+        pair_keys = np.unique(np.concatenate(pair_keys))
+    else:
+        pair_keys = np.zeros(0, np.int64)
+    atoms = pair_keys // num_atoms
+    excludes = pair_keys % num_atoms
+    valid = atoms != excludes
+    atoms = atoms[valid]
+    excludes = excludes[valid]
+
+    counts = np.bincount(atoms, minlength=num_atoms)
+    padding_length = int(counts.max()) if counts.size > 0 else 0
+    exclude_index = np.full((num_atoms, padding_length), num_atoms, np.int64)
+    exclude_index[atoms, np.arange(atoms.size) - np.repeat(np.cumsum(counts) - counts, counts)] = excludes
+    return exclude_index
@@ -40,8 +40,10 @@ from mindspore import numpy as msnp
 from ..modelling.pdb_generator import gen_pdb
 from ..modelling.mol2_parser import mol2parser
 from ..modelling.hadder import read_pdb
+from ..modelling.fill_water import get_clash_mask
 from ..residue.residue import Residue
 from ..residue.amino import AminoAcid
+from .bond_graph import BondGraph
 from ...data.template import get_molecule, get_template
 from ...colvar import Colvar
 from ...colvar.atoms import AtomsBase
@@ -707,54 +709,9 @@ class Molecule(Cell):
         if self.bonds is None:
             return self
 
-        def _construct_angles(bonds, angle_bonds):
-            for idx in self.angle_vertices:
-                this_bonds = bonds[np.where(angle_bonds == idx)[0]]
-                flatten_bonds = this_bonds.flatten()
-                this_idx = np.delete(flatten_bonds, np.where(flatten_bonds == idx))
-                yield this_idx
-
-        def _combinations(bonds, angle_bonds):
-            """
-            Get all the combinations of 3 atoms.
-
-            Args:
-                bonds (ndarray):            Array of bonds.
-                angle_bonds (ndarray):  Array of bonds for angles.
-
-            Returns:
-                np.ndarray, angles.
-            """
-            this_idx = _construct_angles(bonds, angle_bonds)
-            id_selections = [
-                [[0, 1]],
-                [[0, 1], [1, 2], [0, 2]],
-                [[0, 1], [1, 2], [2, 3], [0, 2], [0, 3], [1, 3]],
-            ]
-            angles = None
-            counter = 0
-            for idx in this_idx:
-                selections = id_selections[idx.size - 2]
-                for selection in selections:
-                    if angles is None:
-                        angles = np.insert(idx[selection], 1, self.angle_vertices[counter])[
-                            None, :]
-                    else:
-                        angles = np.append(
-                            angles,
-                            np.insert(idx[selection], 1, self.angle_vertices[counter])[
-                                None, :],
-                            axis=0,
-                        )
-                counter += 1
-            return angles
-
-        bonds = self.bonds[0].asnumpy()
-        self.angle_vertices = np.where(np.bincount(bonds.flatten()) > 1)[0]
-        angle_index = np.where(np.sum(np.isin(bonds, self.angle_vertices), axis=1) > 0)[0]
-        angle_bonds = bonds[angle_index]
-
-        angles = _combinations(bonds, angle_bonds)
+        graph = BondGraph(self.bonds[0].asnumpy())
+        self.angle_vertices = np.where(graph.degree > 1)[0]
+        angles = graph.angles()
 
         if angles is None:
             self.angles = None
@@ -765,83 +722,11 @@ class Molecule(Cell):
 
     def build_dihedrals(self):
         r"""build dihedral angles for the system"""
-        if self.bonds is None:
+        if self.bonds is None or self.angles is None:
             return self
 
-        def _trans_dangles(dangles, middle_id):
-            """
-            Construct the dihedrals.
-
-            Args:
-                dangles (ndarray):      Array of dangles.
-                middle_id (ndarray):    Array of middle IDs.
-
-            Returns:
-                np.ndarray, dihedrals.
-            """
-            left_id = np.isin(dangles[:, 0], middle_id[0])
-            left_ele = dangles[:, 2][left_id]
-            left_id = np.isin(dangles[:, 2], middle_id[0])
-            left_ele = np.append(left_ele, dangles[:, 0][left_id])
-            right_id = np.isin(dangles[:, 1], middle_id[0])
-            right_ele = np.unique(dangles[right_id])
-            right_ele = right_ele[np.where(
-                np.isin(right_ele, middle_id, invert=True))[0]]
-            sides = itertools.product(right_ele, left_ele)
-            sides_array = np.array(list(sides))
-
-            if sides_array.size == 0:
-                return sides_array
-
-            sides = sides_array[np.where(
-                sides_array[:, 0] != sides_array[:, 1])[0]]
-            left = np.append(
-                sides[:, 0].reshape(sides.shape[0], 1),
-                np.broadcast_to(middle_id, (sides.shape[0],) + middle_id.shape),
-                axis=1,
-            )
-            dihedrals = np.append(
-                left, sides[:, 1].reshape(sides.shape[0], 1), axis=1)
-            return dihedrals
-
-        def _get_dihedrals(angles, dihedral_middle_id):
-            """
-            Get the dihedrals indexes.
-
-            Args:
-                angles (ndarray):               Array of angles.
-                dihedral_middle_id (ndarray):   Array of dihedrals middle indexes.
-
-            Returns:
-                np.ndarray, dihedrals.
-            """
-            dihedrals = None
-            for i in range(dihedral_middle_id.shape[0]):
-                dangles = angles[
-                    np.where(
-                        (
-                            np.isin(angles, dihedral_middle_id[i]).sum(axis=1)
-                            * np.isin(angles[:, 1], dihedral_middle_id[i])
-                        )
-                        > 1
-                    )[0]
-                ]
-                this_sides = _trans_dangles(dangles, dihedral_middle_id[i])
-                if this_sides.size == 0:
-                    continue
-                if dihedrals is None:
-                    dihedrals = this_sides
-                else:
-                    dihedrals = np.append(dihedrals, this_sides, axis=0)
-
-            return dihedrals
-
-        bonds = self.bonds[0].asnumpy()
-        angles = self.angles.asnumpy()
-
-        dihedral_middle_id = bonds[np.where(np.isin(bonds, self.angle_vertices).sum(axis=1) == 2)[0]]
-
-        dihedrals = _get_dihedrals(angles, dihedral_middle_id)
+        graph = BondGraph(self.bonds[0].asnumpy())
+        dihedrals = graph.dihedrals(self.angles.asnumpy())
 
         if dihedrals is None:
             self.dihedrals = None
@@ -855,74 +740,8 @@ class Molecule(Cell):
         if self.bonds is None:
             return self
 
-        def _check_improper(bonds, core_id):
-            """
-            Check if there are same improper dihedrals.
-
-            Args:
-                bonds (ndarray):    Array of bonds.
-                core_id (ndarray):  Array of core indexes.
-
-            Returns:
-                int, core id of same improper dihedrals.
-            """
-            # pylint: disable=pointless-statement
-            checked_core_id = core_id.copy()
-            bonds_hash = [hash(tuple(x)) for x in bonds]
-            for i in range(core_id.shape[0]):
-                ids_for_idihedral = np.where(
-                    np.sum(np.isin(bonds, core_id[i]), axis=1) > 0
-                )[0]
-                bonds_for_idihedral = bonds[ids_for_idihedral]
-                uniques = np.unique(bonds_for_idihedral.flatten())
-                uniques = np.delete(uniques, np.where(uniques == core_id[i])[0])
-                uniques_product = np.array(list(itertools.product(uniques, uniques)))
-                uniques_hash = np.array([hash(tuple(x)) for x in itertools.product(uniques, uniques)])
-                excludes = np.isin(uniques_hash, bonds_hash)
-                exclude_size = np.unique(uniques_product[excludes]).size
-                # Exclude condition
-                if uniques.shape[0] - excludes.sum() <= 2 or exclude_size > 3:
-                    checked_core_id[i] == -1
-            return checked_core_id[np.where(checked_core_id > -1)[0]]
-
-        def _get_improper(bonds, core_id):
-            """
-            Get the improper dihedrals indexes.
-
-            Args:
-                bonds (ndarray):    Array of bonds.
-                core_id (ndarray):  Array of core indexes.
-
-            Returns:
-                - improper (np.ndarray).
-                - new_id (np.ndarray).
-            """
-            improper = None
-            new_id = None
-            for i in range(core_id.shape[0]):
-                ids_for_idihedral = np.where(
-                    np.sum(np.isin(bonds, core_id[i]), axis=1) > 0
-                )[0]
-                bonds_for_idihedral = bonds[ids_for_idihedral]
-                if bonds_for_idihedral.shape[0] == 3:
-                    idihedral = np.unique(bonds_for_idihedral.flatten())[None, :]
-                    if improper is None:
-                        improper = idihedral
-                        new_id = core_id[i]
-                    else:
-                        improper = np.append(improper, idihedral, axis=0)
-                        new_id = np.append(new_id, core_id[i])
-                else:
-                    # Only SP2 is considered.
-                    continue
-            return improper, new_id
-
-        bonds = self.bonds[0].asnumpy()
-
-        core_id = np.where(np.bincount(bonds.flatten()) > 2)[0]
-
-        checked_core_id = _check_improper(bonds, core_id)
-        improper, third_id = _get_improper(bonds, checked_core_id)
+        graph = BondGraph(self.bonds[0].asnumpy())
+        improper, third_id = graph.improper()
 
         if improper is None:
             self.improper_dihedrals = None
@@ -1346,7 +1165,7 @@ class Molecule(Cell):
         return self.identity(self.pbc_box)
 
     def fill_water(self, edge: float = None, gap: float = None, box: ndarray = None, pdb_out: str = None,
-                   template: str = None):
+                   template: str = None, periodic: bool = False, num_workers: int = 1):
         """ The inner function in Molecule class to add water in a given box.
 
         Args:
@@ -1355,6 +1174,8 @@ class Molecule(Cell):
             box(Tensor): The pbc box we want, default to be None.
             pdb_out(str): The string format pdb file name to store the information of system after filling water.
             template(str): The supplemental template of the water molecules filled.
+            periodic(bool): Decide to remove the water molecules clashed with the periodic images of the system.
+            num_workers(int): The number of processes to find the clashed water molecules.
 
         Returns:
             new_pbc_box(Tensor), this function will return a pbc_box after filling water.
@@ -1427,10 +1248,11 @@ class Molecule(Cell):
 
         o_crd = np.concatenate((o_x[:, None], o_y[:, None], o_z[:, None]), axis=-1)
 
-        dis = np.linalg.norm(crds - o_crd[:, None, :], axis=-1)
-        filt = np.where((dis <= gap).sum(axis=-1) > 0)
+        pbc_box = final_box if periodic else None
+        origin = np.array([origin_x, origin_y, origin_z])
+        clash = get_clash_mask(o_crd, crds, gap, pbc_box, origin, num_workers=num_workers)
 
-        o_crd = np.delete(o_crd, filt, axis=0)
+        o_crd = o_crd[~clash]
         print('[MindSPONGE] Totally {} waters is added to the system!'.format(o_crd.shape[0]))
         h1_crd = o_crd + np.array([0.079079641, 0.061207927, 0.0], np.float32) * 10
         h2_crd = o_crd + np.array([-0.079079641, 0.061207927, 0.0], np.float32) * 10
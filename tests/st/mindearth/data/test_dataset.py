@@ -80,6 +80,103 @@ def test_era5data():
         assert label.shape == (1, 32768, 69), f"The label shape should be (1, 32768, 69), but got {label.shape}."
 
 
+@pytest.mark.level0
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_era5data_frame_cache():
+    """
+    Feature: Test the frame cache of Era5Data in platform gpu and ascend.
+    Description: The cached Era5Data output should be the same as the uncached output, repeated frames hit the cache.
+    Expectation: Success or throw AssertionError.
+    """
+    file_path = os.path.abspath(__file__)
+    yaml_path = os.path.abspath(os.path.join(os.path.dirname(file_path), "..", "test_config.yaml"))
+    data_path = os.path.abspath(os.path.join(os.path.dirname(file_path), "..", "test_data_cache"))
+    train_dir = os.path.join(data_path, 'train', '2015')
+    train_surface_dir = os.path.join(data_path, 'train_surface', '2015')
+    train_static_dir = os.path.join(data_path, 'train_static', '2015')
+    train_surface_static_dir = os.path.join(data_path, 'train_surface_static', '2015')
+    for data_dir in [train_dir, train_static_dir, train_surface_dir, train_surface_static_dir]:
+        if not os.path.exists(data_dir):
+            make_dir(data_dir)
+    for file_name in ['2015_01_01_1.npy', '2015_01_01_7.npy', '2015_01_01_13.npy']:
+        np.save(os.path.join(train_surface_dir, file_name), np.random.rand(1, 128, 256, 4))
+        np.save(os.path.join(train_dir, file_name), np.random.rand(1, 13, 128, 256, 5).astype(np.float32))
+    np.save(os.path.join(train_static_dir, '2015.npy'), np.random.rand(5, 2).astype(np.float32))
+    np.save(os.path.join(train_surface_static_dir, '2015.npy'), np.random.rand(4, 2).astype(np.float32))
+    config = load_yaml_config(yaml_path)
+    config['data']['root_dir'] = data_path
+    data_params = config['data']
+    uncached_gen = MyEra5Data(data_params=data_params, run_mode='train')
+    data_params['frame_cache_size'] = 2 ** 30
+    cached_gen = MyEra5Data(data_params=data_params, run_mode='train')
+    cached_gen.mean_pressure_level, cached_gen.std_pressure_level = \
+        uncached_gen.mean_pressure_level, uncached_gen.std_pressure_level
+    cached_gen.mean_surface, cached_gen.std_surface = uncached_gen.mean_surface, uncached_gen.std_surface
+
+    expected_inputs, expected_labels = uncached_gen[np.int64(0)]
+    for _ in range(2):
+        inputs, labels = cached_gen[np.int64(0)]
+        assert np.array_equal(inputs, expected_inputs), "The cached inputs should be the same as the uncached inputs."
+        assert np.array_equal(labels, expected_labels), "The cached labels should be the same as the uncached labels."
+    cache_info = cached_gen.cache_info()
+    assert cache_info['misses'] == 2, f"The frame cache should miss 2 times, but got {cache_info['misses']}."
+    assert cache_info['hits'] == 2, f"The frame cache should hit 2 times, but got {cache_info['hits']}."
+    assert cache_info['static_files'] == 1, \
+        f"The static files of 1 year should be resident, but got {cache_info['static_files']}."
+    assert uncached_gen.cache_info()['frames'] == 0, "The frame cache should be disabled by default."
+
+
+@pytest.mark.level0
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize('patch', [False, True])
+def test_era5data_memmap(patch):
+    """
+    Feature: Test the memory-mapped store of Era5Data in platform gpu and ascend.
+    Description: The Era5Data output read from the memory-mapped store should be the same as the original output,
+                 and the normalization statistics should be loaded from the store.
+    Expectation: Success or throw AssertionError.
+    """
+    file_path = os.path.abspath(__file__)
+    yaml_path = os.path.abspath(os.path.join(os.path.dirname(file_path), "..", "test_config.yaml"))
+    data_path = os.path.abspath(os.path.join(os.path.dirname(file_path), "..", "test_data_memmap"))
+    train_dir = os.path.join(data_path, 'train', '2015')
+    train_surface_dir = os.path.join(data_path, 'train_surface', '2015')
+    train_static_dir = os.path.join(data_path, 'train_static', '2015')
+    train_surface_static_dir = os.path.join(data_path, 'train_surface_static', '2015')
+    for data_dir in [train_dir, train_static_dir, train_surface_dir, train_surface_static_dir]:
+        if not os.path.exists(data_dir):
+            make_dir(data_dir)
+    for file_name in ['2015_01_01_1.npy', '2015_01_01_7.npy', '2015_01_01_13.npy', '2015_01_01_19.npy']:
+        np.save(os.path.join(train_surface_dir, file_name), np.random.rand(1, 128, 256, 4))
+        np.save(os.path.join(train_dir, file_name), np.random.rand(1, 13, 128, 256, 5).astype(np.float32))
+    np.save(os.path.join(train_static_dir, '2015.npy'), np.random.rand(5, 2).astype(np.float32))
+    np.save(os.path.join(train_surface_static_dir, '2015.npy'), np.random.rand(4, 2).astype(np.float32))
+    config = load_yaml_config(yaml_path)
+    config['data']['root_dir'] = data_path
+    data_params = config['data']
+    data_params['patch'] = patch
+    data_params['patch_size'] = 8
+    data_gen = MyEra5Data(data_params=data_params, run_mode='train')
+    data_gen.convert_to_memmap(os.path.join(data_path, 'memmap'))
+    data_params['memmap_dir'] = os.path.join(data_path, 'memmap')
+    memmap_gen = MyEra5Data(data_params=data_params, run_mode='train')
+    assert len(memmap_gen) == len(data_gen), f"The length should be {len(data_gen)}, but got {len(memmap_gen)}."
+    for name in ('mean_pressure_level', 'std_pressure_level', 'mean_surface', 'std_surface'):
+        assert np.array_equal(getattr(memmap_gen, name), getattr(data_gen, name)), \
+            f"The {name} of the memory-mapped store should be the statistic used to normalize it."
+    for idx in range(len(data_gen)):
+        expected_inputs, expected_labels = data_gen[np.int64(idx)]
+        inputs, labels = memmap_gen[np.int64(idx)]
+        assert np.array_equal(inputs, expected_inputs), "The memory-mapped inputs should be the same as the original."
+        assert np.array_equal(labels, expected_labels), "The memory-mapped labels should be the same as the original."
+
+
 @pytest.mark.level0
 @pytest.mark.platform_arm_ascend_training
 @pytest.mark.platform_x86_ascend_training
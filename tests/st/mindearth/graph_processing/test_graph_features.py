@@ -0,0 +1,164 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test the vectorized node and edge features of the GraphCast graph processing"""
+import math
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+GRAPHCAST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../MindEarth/applications/'
+                                                                           'medium-range/graphcast')
+sys.path.insert(0, GRAPHCAST_PATH)
+
+# pylint: disable=C0413
+from graph_processing import generate_grid_node, generate_mesh_node, generate_mesh_edges
+from graph_processing.utils import load_table
+
+R = 6371
+
+
+def get_coor_idx(x, y):
+    return '%.3f' % x + "_" + '%.3f' % y
+
+
+def move_neg_zero(x):
+    if str(x) == "-0.0":
+        return -x
+    return x
+
+
+def get_cartesian(lon, lat):
+    lat, lon = math.radians(lat), math.radians(lon)
+    return R * math.cos(lat) * math.cos(lon), R * math.cos(lat) * math.sin(lon), R * math.sin(lat)
+
+
+def loop_mesh_edges(edge_array):
+    """The row by row mesh edge features before vectorization."""
+    df = pd.DataFrame(data=edge_array, columns=["mesh_lon1", "mesh_lat1", "mesh_lon2", "mesh_lat2"])
+    df = df.round(3).apply(lambda column: column.map(move_neg_zero))
+    df = df.drop_duplicates(subset=["mesh_lon1", "mesh_lat1", "mesh_lon2", "mesh_lat2"], keep='first')
+    df = df.reset_index(drop=True)
+
+    def diff(row):
+        x1, y1, z1 = get_cartesian(row['mesh_lon1'], row['mesh_lat1'])
+        x2, y2, z2 = get_cartesian(row['mesh_lon2'], row['mesh_lat2'])
+        return x2 - x1, y2 - y1, z2 - z1
+
+    df['idx'] = df.index
+    df['sender'] = df.apply(lambda row: get_coor_idx(row['mesh_lon1'], row['mesh_lat1']), axis=1)
+    df['receiver'] = df.apply(lambda row: get_coor_idx(row['mesh_lon2'], row['mesh_lat2']), axis=1)
+    df['length'] = df.apply(lambda row: math.sqrt(sum(d ** 2 for d in diff(row))), axis=1)
+    df['diff_x'] = df.apply(lambda row: diff(row)[0], axis=1)
+    df['diff_y'] = df.apply(lambda row: diff(row)[1], axis=1)
+    df['diff_z'] = df.apply(lambda row: diff(row)[2], axis=1)
+    return df
+
+
+def loop_node_features(node_array, lon, lat, move_zero):
+    """The row by row node features before vectorization."""
+    df = pd.DataFrame(data=node_array, columns=[lon, lat]).round(3)
+    if move_zero:
+        df = df.apply(lambda column: column.map(move_neg_zero))
+        df = df.drop_duplicates(subset=[lon, lat], keep='first').reset_index(drop=True)
+    df['cos_lat'] = df[lat].map(lambda x: math.cos(x * math.pi / 180.0))
+    df['sin_lon'] = df[lon].map(lambda x: math.sin(x * math.pi / 180.0))
+    df['cos_lon'] = df[lon].map(lambda x: math.cos(x * math.pi / 180.0))
+    df['coor'] = df.apply(lambda row: get_coor_idx(row[lon], row[lat]), axis=1)
+    return df
+
+
+def random_coordinates(num, seed):
+    """Random longitudes and latitudes with duplicates, -0.0 and values rounding to -0.0."""
+    rng = np.random.RandomState(seed)
+    coordinates = np.stack([rng.uniform(-180, 180, num), rng.uniform(-90, 90, num)], axis=-1)
+    coordinates[:5] = [[-0.0, 10.0], [-0.0004, -0.0], [0.0004, 45.0], [12.3455, -0.0001], [-0.0, 10.0]]
+    coordinates[-3:] = coordinates[5:8]
+    return coordinates
+
+
+def assert_same_table(result, expected):
+    """Compare the string columns exactly and the float columns numerically."""
+    assert list(result.columns) == list(expected.columns)
+    for name in expected.columns:
+        if not pd.api.types.is_numeric_dtype(expected[name]):
+            assert (result[name].to_numpy().astype(str) == expected[name].to_numpy().astype(str)).all()
+        else:
+            assert np.allclose(result[name].to_numpy(), expected[name].to_numpy(), rtol=1e-12, atol=1e-9)
+
+
+@pytest.fixture(name='config')
+def fixture_config(tmp_path):
+    input_path = tmp_path / 'input'
+    input_path.mkdir()
+    (tmp_path / 'tmp').mkdir()
+    return {"input_data": str(input_path),
+            "level": 0,
+            "resolution": 1.4,
+            "resolution_file": "grid_long_lat_coordinates_r{resolution}.npy",
+            "mesh_node": "mesh_node_level{level}_origin.npy",
+            "mesh_edge": "mesh_edge_level{level}_origin.npy",
+            "long_lat_features": "grid_node_features_r{resolution}.csv",
+            "long_lat_features_npy": "grid_node_features_r{resolution}.npy",
+            "mesh_node_features": "mesh_node_features_level{level}_r{resolution}.csv",
+            "mesh_node_features_npy": "mesh_node_features_level{level}_r{resolution}.npy",
+            "mesh_edge_features": "mesh_edge_features_level{level}_r{resolution}.csv"}
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_node_features(config):
+    """
+    Feature: Test the vectorized grid and mesh node features.
+    Description: Build the features of random nodes and of the nodes with -0.0 and duplicated coordinates.
+    Expectation: The tables are the same as the ones built row by row.
+    """
+    input_path, tmp_path = config["input_data"], os.path.join(os.path.dirname(config["input_data"]), 'tmp')
+    grid = random_coordinates(200, 0)
+    mesh = random_coordinates(100, 1)
+    np.save(os.path.join(input_path, "grid_long_lat_coordinates_r1.4.npy"), grid)
+    np.save(os.path.join(input_path, "mesh_node_level0_origin.npy"), mesh)
+
+    generate_grid_node(config)
+    generate_mesh_node(config)
+
+    expected = loop_node_features(grid, 'longitude', 'latitude', move_zero=False).reset_index()
+    assert_same_table(load_table(os.path.join(tmp_path, "grid_node_features_r1.4.csv")),
+                      expected.rename(columns={'index': 'idx'}))
+    expected = loop_node_features(mesh, 'mesh_lon', 'mesh_lat', move_zero=True)
+    expected.insert(2, 'idx', expected.index)
+    assert_same_table(load_table(os.path.join(tmp_path, "mesh_node_features_level0_r1.4.csv")), expected)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_mesh_edge_features(config):
+    """
+    Feature: Test the vectorized mesh edge features.
+    Description: Build the features of random edges and of the edges with -0.0 and duplicated coordinates.
+    Expectation: The table is the same as the one built row by row.
+    """
+    tmp_path = os.path.join(os.path.dirname(config["input_data"]), 'tmp')
+    edges = np.concatenate([random_coordinates(150, 2), random_coordinates(150, 3)], axis=-1)
+    np.save(os.path.join(config["input_data"], "mesh_edge_level0_origin.npy"), edges)
+
+    generate_mesh_edges(config)
+
+    assert_same_table(load_table(os.path.join(tmp_path, "mesh_edge_features_level0_r1.4.csv")),
+                      loop_mesh_edges(edges))
@@ -17,7 +17,7 @@ import os
 import numpy as np
 import pytest
 
-from mindspore import nn, context, ops
+from mindspore import nn, context, ops, Tensor
 
 from mindearth.utils import load_yaml_config, create_logger
 from mindearth.data import Dataset
@@ -139,3 +139,54 @@ def test_forecast():
     dataset = Dataset(MyIterable())
     test_dataset = dataset.create_dataset(1)
     infer_module.eval(test_dataset)
+
+
+class GridInference(WeatherForecast):
+    """Self-defined WeatherForecast on (B, C, H, W) grid data"""
+    def forecast(self, inputs, labels=None):
+        pred_lst = []
+        for _ in range(self.t_out_test):
+            inputs = inputs * 0.9
+            pred_lst.append(inputs)
+        return pred_lst
+
+    @staticmethod
+    def _get_total_sample_description(config, info_mode="std"):
+        return np.random.rand(69,).astype(np.float32)
+
+    @staticmethod
+    def _get_history_climate_mean(config, w_size, adjust_size=False):
+        return np.random.rand(32768, 69).astype(np.float32)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_forecast_metrics():
+    """
+    Feature: Test the batched metrics of WeatherForecast in platform gpu and ascend.
+    Description: The batched metrics should be the same as the metrics computed feature by feature.
+    Expectation: Success or throw AssertionError.
+    """
+    context.set_context(mode=context.PYNATIVE_MODE)
+    file_path = os.path.abspath(__file__)
+    yaml_path = os.path.abspath(os.path.join(os.path.dirname(file_path), "..", "test_config.yaml"))
+    config = load_yaml_config(yaml_path)
+    config['data']['t_out_test'] = 2
+    infer_module = GridInference(Net(69, 69), config, create_logger("./log.log"))
+    inputs = np.random.rand(2, 69, 128, 256).astype(np.float32)
+    labels = np.random.rand(2, 69, 2, 128, 256).astype(np.float32)
+    lat_weight_rmse, lat_weight_acc = infer_module._get_metrics(Tensor(inputs), Tensor(labels))
+    assert lat_weight_rmse.shape == (69, 2), f"The rmse shape should be (69, 2), but got {lat_weight_rmse.shape}."
+    assert lat_weight_acc.shape == (69, 2), f"The acc shape should be (69, 2), but got {lat_weight_acc.shape}."
+    pred = infer_module.forecast(inputs)
+    for t in range(2):
+        for f in range(69):
+            rmse = infer_module._calculate_lat_weighted_rmse(labels[:, f, t], pred[t][:, f])
+            acc = infer_module._calculate_lat_weighted_acc(labels[:, f, t], pred[t][:, f])
+            assert np.allclose(lat_weight_rmse[f, t], rmse, rtol=1e-3), \
+                f"The rmse should be {rmse}, but got {lat_weight_rmse[f, t]}."
+            assert np.allclose(lat_weight_acc[f, t], acc, rtol=1e-3), \
+                f"The acc should be {acc}, but got {lat_weight_acc[f, t]}."
@@ -0,0 +1,102 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""test domain decomposed cfd simulation"""
+import copy
+
+import numpy as np
+import pytest
+
+from mindspore import numpy as mnp
+from mindflow import cfd
+from mindflow.cfd.domain_decomposition import Communicator
+
+CONFIG = {
+    'mesh': {'dim': 2, 'nx': 16, 'ny': 12, 'x_range': [0, 1], 'y_range': [0, 1], 'pad_size': 3},
+    'material': {'type': 'IdealGas', 'heat_ratio': 1.4, 'gas_constant': 1.0, 'dynamic_viscosity': 0.01,
+                 'bulk_viscosity': 0.0, 'thermal_conductivity': 0.0},
+    'runtime': {'CFL': 0.5, 'current_time': 0.0, 'end_time': 0.1},
+    'integrator': {'type': 'RungeKutta3'},
+    'space_solver': {'is_convective_flux': True,
+                     'convective_flux': {'reconstructor': 'WENO5', 'riemann_computer': 'Rusanov'},
+                     'is_viscous_flux': True,
+                     'viscous_flux': {'interpolator': 'CentralFourthOrderInterpolator',
+                                      'face_derivative_computer': 'FourthOrderFaceDerivativeComputer',
+                                      'central_derivative_computer': 'FourthOrderCentralDerivativeComputer'}},
+    'boundary_conditions': {'x_min': {'type': 'Periodic'}, 'x_max': {'type': 'Periodic'},
+                            'y_min': {'type': 'Wall'}, 'y_max': {'type': 'Wall', 'velocity_x': 0.1}},
+}
+
+
+def initial_condition(mesh_x, mesh_y):
+    rho = 1.0 + 0.2 * mnp.sin(2 * np.pi * mesh_x) * mnp.sin(np.pi * mesh_y)
+    u = 0.1 * mnp.cos(2 * np.pi * mesh_y)
+    v = 0.1 * mnp.sin(2 * np.pi * mesh_x)
+    w = mnp.zeros_like(mesh_x)
+    p = mnp.ones_like(mesh_x)
+    return mnp.stack([rho, u, v, w, p], axis=0)
+
+
+def simulate(config, communicator=None):
+    """run the simulation and return the primitive variables of the local block."""
+    simulator = cfd.Simulator(config, communicator=communicator)
+    runtime = cfd.RunTime(config['runtime'], simulator.mesh_info, simulator.material, simulator.decomposition)
+
+    mesh_x, mesh_y, _ = simulator.mesh_info.mesh_xyz()
+    pri_var = initial_condition(mesh_x, mesh_y)
+    con_var = cfd.cal_con_var(pri_var, simulator.material)
+    while runtime.time_loop(pri_var):
+        runtime.compute_timestep(pri_var)
+        con_var = simulator.integration_step(con_var, runtime.timestep)
+        pri_var = cfd.cal_pri_var(con_var, simulator.material)
+        runtime.advance()
+    return pri_var.asnumpy(), simulator.decomposition.offsets if simulator.decomposition else None
+
+
+def simulate_block(communicator, config):
+    return simulate(config, communicator)
+
+
+@pytest.mark.level1
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_domain_decomposition():
+    """
+    Feature: domain decomposed cfd simulation
+    Description: run a 2D case on 2x2 blocks with the local multi-process communicator
+    Expectation: the assembled blocks are the same as the simulation on the whole mesh
+    """
+    expected, _ = simulate(CONFIG)
+
+    config = copy.deepcopy(CONFIG)
+    config['mesh']['partition'] = [2, 2]
+    blocks = cfd.launch_local(simulate_block, 4, args=(config,))
+
+    assembled = np.zeros_like(expected)
+    for block, offsets in blocks:
+        assembled[:, offsets[0]: offsets[0] + block.shape[1], offsets[1]: offsets[1] + block.shape[2], :] = block
+    assert np.allclose(assembled, expected, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_abstract_communicator():
+    """
+    Feature: communicator of domain decomposition
+    Description: instantiate the abstract base class of communicators
+    Expectation: raise TypeError
+    """
+    with pytest.raises(TypeError):
+        Communicator(0, 1)
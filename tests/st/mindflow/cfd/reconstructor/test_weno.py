@@ -0,0 +1,89 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""test the WENO reconstructors against a cell by cell reference"""
+import itertools
+
+import numpy as np
+import pytest
+
+from mindspore import Tensor, context
+from mindspore import dtype as mstype
+from mindflow.cfd.mesh_info import MeshInfo
+from mindflow.cfd.space_solver.reconstructor import WENO3, WENO5, WENO7
+
+
+def reference_reconstruct(reconstructor, var, axis, j):
+    """Reconstruct every face from its own stencil of cells, one face at a time."""
+    mesh_info = reconstructor.mesh_info
+    pad = mesh_info.pad
+    num_stencils = len(reconstructor._coe1[0])  # pylint: disable=protected-access
+    coe1 = reconstructor._coe1[j]  # pylint: disable=protected-access
+    coe2 = reconstructor._coe2[j]  # pylint: disable=protected-access
+
+    out_shape = [var.shape[0]]
+    for i in range(3):
+        if i == axis:
+            out_shape.append(mesh_info.number_of_cells[i] + 1)
+        else:
+            out_shape.append(mesh_info.number_of_cells[i])
+    out = np.zeros(out_shape)
+    for index in itertools.product(*[range(n) for n in out_shape]):
+        cell = list(index)
+        for i in range(3):
+            if i != axis and var.shape[i + 1] != mesh_info.number_of_cells[i]:
+                cell[i + 1] += pad
+        stencil = []
+        for k in range(2 * num_stencils - 1):
+            cell_k = list(cell)
+            cell_k[axis + 1] = pad - num_stencils + j + index[axis + 1] + k
+            stencil.append(var[tuple(cell_k)])
+        one_beta_sq = reconstructor._one_beta_sq(stencil)  # pylint: disable=protected-access
+        alpha = [coe1[k] * one_beta_sq[k] for k in range(num_stencils)]
+        poly = [sum(coe * stencil[k + i] for i, coe in enumerate(coe2[k])) for k in range(num_stencils)]
+        out[index] = sum(a * p for a, p in zip(alpha, poly)) / sum(alpha)
+    return out
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("reconstructor_cls", [WENO3, WENO5, WENO7])
+@pytest.mark.parametrize("dim", [2, 3])
+def test_weno_reconstruct(reconstructor_cls, dim):
+    """
+    Feature: WENO reconstructors
+    Description: reconstruct random variables along every axis of a 2D and a 3D padded mesh, the non-reconstructed
+                 axes of the 2D mesh along z are not padded
+    Expectation: the face values of both sides match the cell by cell reference
+    """
+    context.set_context(mode=context.GRAPH_MODE)
+    config = {'dim': dim, 'nx': 5, 'ny': 4, 'nz': 6 if dim == 3 else 1, 'pad_size': 4,
+              'x_range': [0, 1], 'y_range': [0, 1], 'z_range': [0, 1]}
+    mesh_info = MeshInfo(config)
+    reconstructor = reconstructor_cls(mesh_info)
+    shape = [2, 5 + 8, 4 + 8, 6 + 8 if dim == 3 else 1]
+    var = np.random.RandomState(0).uniform(0.5, 1.5, shape)
+    var_tensor = Tensor(var, mstype.float32)
+
+    for axis in range(dim):
+        left, right = reconstructor.reconstruct(var_tensor, axis)
+        expected_left = reference_reconstruct(reconstructor, var, axis, 0)
+        expected_right = reference_reconstruct(reconstructor, var, axis, 1)
+        assert np.allclose(left.asnumpy(), expected_left, rtol=1e-4, atol=1e-5)
+        assert np.allclose(right.asnumpy(), expected_right, rtol=1e-4, atol=1e-5)
+        assert np.allclose(reconstructor.reconstruct_from_left(var_tensor, axis).asnumpy(), expected_left,
+                           rtol=1e-4, atol=1e-5)
+        assert np.allclose(reconstructor.reconstruct_from_right(var_tensor, axis).asnumpy(), expected_right,
+                           rtol=1e-4, atol=1e-5)
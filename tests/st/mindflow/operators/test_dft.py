@@ -20,7 +20,8 @@ import pytest
 
 import mindspore as ms
 from mindspore import ops
-from mindflow.cell.neural_operators.dft import dft1, dft2, idft1, idft2
+from mindflow.cell import FNO1D, FNO2D, KNO1D, KNO2D
+from mindflow.cell.neural_operators.dft import dft1, dft2, idft1, idft2, _dft_matrices
 
 
 def dft_1d_torch(x, dim=-1):
@@ -87,6 +88,14 @@ def idft_2d_ms(x_re, x_im, shape, mode, dim=(-1)):
     return x_ms.asnumpy()
 
 
+def dft_2d_backend_ms(x, shape, mode, backend):
+    x_re = ms.Tensor(x)
+    x_im = ops.zeros_like(x_re)
+    dft2_cell = dft2(shape=shape, modes=mode, backend=backend)
+    x_ft_re, x_ft_im = dft2_cell((x_re, x_im))
+    return x_ft_re.asnumpy(), x_ft_im.asnumpy()
+
+
 @pytest.mark.level0
 @pytest.mark.platform_x86_gpu_training
 @pytest.mark.env_onecard
@@ -123,3 +132,104 @@ def test_dft2d():
     x_ms2d = idft_2d_ms(x_re_ms2d, x_im_ms2d, shape=(6, 8), mode=(3, 5), dim=(-3, -2))
 
     assert np.sum(x_torch2d - x_ms2d) < 0.001
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("backend", ["fft", "gauss"])
+def test_dft2d_backend(backend):
+    """
+    Feature: Test the fft and gauss backends of dft2d and idft2d.
+    Description: Compare the truncated transform with numpy rfft2 and check the round trip of all modes.
+    Expectation: Success or throw AssertionError.
+    """
+    x = np.random.randn(2, 3, 8, 8).astype(np.float32)
+    x_re, x_im = dft_2d_backend_ms(x, shape=(8, 8), mode=(2, 3), backend=backend)
+    expected = np.fft.rfft2(x, norm="ortho")
+    expected[..., 2:-2, :] = 0
+    assert np.allclose(x_re, expected.real[..., :3], atol=1e-5)
+    assert np.allclose(x_im, expected.imag[..., :3], atol=1e-5)
+
+    x_re, x_im = dft_2d_backend_ms(x, shape=(8, 8), mode=(4, 5), backend=backend)
+    idft2_cell = idft2(shape=(8, 8), modes=(4, 5), backend=backend)
+    x_ms, _ = idft2_cell((ms.Tensor(x_re), ms.Tensor(x_im)))
+    assert np.allclose(x_ms.asnumpy(), x, atol=1e-5)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_dft_matrices_shared():
+    """
+    Feature: Test the cache of the truncated DFT matrices.
+    Description: Two transforms with the same arguments are built.
+    Expectation: The DFT matrices are shared by both transforms.
+    """
+    cell1 = dft2(shape=(8, 8), modes=(2, 3), backend="gauss")
+    cell2 = dft2(shape=(8, 8), modes=(2, 3), backend="gauss")
+    assert cell1.dft1_seq[0].a_re_upper is cell2.dft1_seq[0].a_re_upper
+    assert cell1.dft1_seq[1].a_sum_upper is cell2.dft1_seq[1].a_sum_upper
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_dft_matrices_bounded():
+    """
+    Feature: Test the cache of the truncated DFT matrices.
+    Description: Build more transforms with different arguments than the cache can hold.
+    Expectation: The cache size is bounded and the least recently used matrices are released.
+    """
+    maxsize = _dft_matrices.cache_info().maxsize
+    first = dft1(shape=(4 * maxsize,), modes=1, backend="gauss")
+    for modes in range(2, maxsize + 2):
+        dft1(shape=(4 * maxsize,), modes=modes, backend="gauss")
+    assert _dft_matrices.cache_info().currsize <= maxsize
+    again = dft1(shape=(4 * maxsize,), modes=1, backend="gauss")
+    assert again.dft1_seq[0].a_re_upper is not first.dft1_seq[0].a_re_upper
+
+
+
+def _dft_backends(net):
+    """The backends of all the DFT cells of a network."""
+    return {dft_cell.backend for _, cell in net.cells_and_names() if hasattr(cell, "dft1_seq")
+            for dft_cell in cell.dft1_seq}
+
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_kno_backend():
+    """
+    Feature: Test the DFT backend argument of KNO1D.
+    Description: Build the same network with the fft and the gauss backends.
+    Expectation: The backend reaches the DFT cells and both networks give the same outputs.
+    """
+    ms.set_context(mode=ms.GRAPH_MODE)
+    x = ms.Tensor(np.random.randn(2, 16, 1).astype(np.float32))
+    outputs = []
+    for backend in ("fft", "gauss"):
+        np.random.seed(0)
+        ms.set_seed(0)
+        net = KNO1D(in_channels=1, channels=4, modes=3, depths=2, resolution=16, backend=backend)
+        assert _dft_backends(net) == {backend}
+        outputs.append(net(x)[0].asnumpy())
+    assert np.allclose(outputs[0], outputs[1], atol=1e-4)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+def test_neural_operator_backend():
+    """
+    Feature: Test the DFT backend argument of FNO and KNO.
+    Description: Build the networks with the fft backend.
+    Expectation: The backend reaches all the DFT cells.
+    """
+    fno1d = FNO1D(in_channels=2, out_channels=1, n_modes=[3], resolutions=[16], n_layers=2, dft_backend="fft")
+    fno2d = FNO2D(in_channels=2, out_channels=1, n_modes=[3, 3], resolutions=[8, 8], n_layers=2, dft_backend="fft")
+    kno2d = KNO2D(in_channels=2, channels=4, modes=3, depths=2, resolution=8, backend="fft")
+    for net in (fno1d, fno2d, kno2d):
+        assert _dft_backends(net) == {"fft"}
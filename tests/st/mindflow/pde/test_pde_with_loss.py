@@ -0,0 +1,191 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+test pde with loss
+"""
+import numpy as np
+import pytest
+from sympy import symbols, Function, diff
+
+from mindspore import context, nn, ops, Tensor
+from mindspore import dtype as mstype
+
+from mindflow.pde import PDEWithLoss, sympy_to_mindspore
+from mindflow.operators import batched_jacobian, batched_hessian
+
+np.random.seed(123456)
+
+
+# pylint: disable=C0111
+class Net(nn.Cell):
+    def __init__(self, cin=3, cout=2, hidden=10):
+        """Test Net for PDEWithLoss"""
+        super().__init__()
+        self.fc1 = nn.Dense(cin, hidden)
+        self.fc2 = nn.Dense(hidden, hidden)
+        self.fcout = nn.Dense(hidden, cout)
+        self.act = ops.Tanh()
+
+    def construct(self, x):
+        x = self.act(self.fc1(x))
+        x = self.act(self.fc2(x))
+        x = self.fcout(x)
+        return x
+
+
+class Problem(PDEWithLoss):
+    """Test problem with first-order, second-order and mixed derivatives"""
+    def __init__(self, model):
+        self.x, self.y, self.t = symbols('x y t')
+        self.u = Function('u')(self.x, self.y, self.t)
+        self.v = Function('v')(self.x, self.y, self.t)
+        self.in_vars = [self.x, self.y, self.t]
+        self.out_vars = [self.u, self.v]
+        super(Problem, self).__init__(model, self.in_vars, self.out_vars)
+        self.bc_nodes = sympy_to_mindspore(self.bc(), self.in_vars, self.out_vars)
+
+    def pde(self):
+        momentum = diff(self.u, (self.x, 2)) + self.u * diff(self.u, (self.t, 1)) - diff(self.v, self.x, self.y)
+        return {"momentum": momentum, "source": self.x * self.v}
+
+    def bc(self):
+        return {"bc": self.v + diff(self.v, (self.x, 1))}
+
+
+@pytest.mark.level0
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("mode", [context.GRAPH_MODE, context.PYNATIVE_MODE])
+def test_parse_node(mode):
+    """
+    Feature: Test parse_node of PDEWithLoss.
+    Description: Only the derivative terms used by the formula nodes are evaluated.
+    Expectation: The residuals match the ones computed from the full jacobian and hessian.
+    """
+    context.set_context(mode=mode)
+    model = Net()
+    problem = Problem(model)
+    assert problem.pde_nodes[0].jacobian_terms == (0,)
+    assert sorted(problem.pde_nodes[0].hessian_terms) == [(0, 0), (1, 0)]
+    assert problem.bc_nodes[0].jacobian_terms == (1,)
+
+    inputs = Tensor(np.random.random(size=(5, 3)), mstype.float32)
+    momentum, source = problem.parse_node(problem.pde_nodes, inputs=inputs)
+    bc_res = problem.parse_node(problem.bc_nodes, inputs=inputs)[0]
+
+    outputs = model(inputs).asnumpy()
+    jacobian = batched_jacobian(model)(inputs).asnumpy()
+    hessian = batched_hessian(model)(inputs).asnumpy()
+    expected = hessian[0, 0, :, 0:1] + outputs[:, 0:1] * jacobian[0, :, 2:3] - hessian[1, 0, :, 1:2]
+    assert np.allclose(momentum.asnumpy(), expected, atol=1e-6)
+    assert np.allclose(source.asnumpy(), inputs.asnumpy()[:, 0:1] * outputs[:, 1:2], atol=1e-6)
+    assert np.allclose(bc_res.asnumpy(), outputs[:, 1:2] + jacobian[1, :, 0:1], atol=1e-6)
+
+
+class PoissonProblem(PDEWithLoss):
+    """Test problem with several hessian rows of the same output"""
+    def __init__(self, model):
+        self.x, self.y, self.t = symbols('x y t')
+        self.u = Function('u')(self.x, self.y, self.t)
+        super(PoissonProblem, self).__init__(model, [self.x, self.y, self.t], [self.u])
+
+    def pde(self):
+        return {"poisson": diff(self.u, (self.x, 2)) + diff(self.u, (self.y, 2)) + diff(self.u, self.x, self.t)}
+
+
+@pytest.mark.level0
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("mode", [context.GRAPH_MODE, context.PYNATIVE_MODE])
+def test_parse_node_hessian_rows(mode):
+    """
+    Feature: Test parse_node of PDEWithLoss with several hessian rows of one output.
+    Description: The hessian rows of an output share one jacobian row.
+    Expectation: The residual and the deprecated jacobian/hessian attributes match the full jacobian and hessian.
+    """
+    context.set_context(mode=mode)
+    model = Net(cout=1)
+    problem = PoissonProblem(model)
+    assert sorted(problem.pde_nodes[0].hessian_terms) == [(0, 0), (0, 1), (0, 2)]
+
+    inputs = Tensor(np.random.random(size=(5, 3)), mstype.float32)
+    poisson = problem.parse_node(problem.pde_nodes, inputs=inputs)[0]
+
+    jacobian = batched_jacobian(model)(inputs).asnumpy()
+    hessian = batched_hessian(model)(inputs).asnumpy()
+    expected = hessian[0, 0, :, 0:1] + hessian[0, 1, :, 1:2] + hessian[0, 2, :, 0:1]
+    assert np.allclose(poisson.asnumpy(), expected, atol=1e-6)
+    assert np.allclose(problem.jacobian(inputs).asnumpy(), jacobian)
+    assert np.allclose(problem.hessian(inputs).asnumpy(), hessian)
+
+
+class HigherOrderProblem(PDEWithLoss):
+    """Test problem with third-order and fourth-order derivatives"""
+    def __init__(self, model):
+        self.x, self.t = symbols('x t')
+        self.u = Function('u')(self.x, self.t)
+        super(HigherOrderProblem, self).__init__(model, [self.x, self.t], [self.u])
+
+    def pde(self):
+        kdv = diff(self.u, (self.t, 1)) + 6.0 * self.u * diff(self.u, (self.x, 1)) + diff(self.u, (self.x, 3))
+        mixed = diff(self.u, (self.x, 2), (self.t, 2)) + diff(self.u, self.t, self.x, self.x, self.t)
+        return {"kdv": kdv, "mixed": mixed}
+
+
+def _numpy_model(model):
+    """float64 copy of the test net used for finite differences"""
+    weights = [(cell.weight.asnumpy().astype(np.float64), cell.bias.asnumpy().astype(np.float64))
+               for cell in (model.fc1, model.fc2, model.fcout)]
+
+    def forward(x):
+        x = np.tanh(x @ weights[0][0].T + weights[0][1])
+        x = np.tanh(x @ weights[1][0].T + weights[1][1])
+        return x @ weights[2][0].T + weights[2][1]
+    return forward
+
+
+@pytest.mark.level0
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.env_onecard
+@pytest.mark.parametrize("mode", [context.GRAPH_MODE, context.PYNATIVE_MODE])
+def test_parse_node_higher_order(mode):
+    """
+    Feature: Test parse_node of PDEWithLoss with derivatives above second order.
+    Description: The third-order and fourth-order derivatives are evaluated by nested directional gradients.
+    Expectation: The residuals match the finite differences of the network.
+    """
+    context.set_context(mode=mode)
+    model = Net(cin=2, cout=1)
+    problem = HigherOrderProblem(model)
+    assert problem.pde_nodes[0].higher_order_terms == ((0, (0, 0)),)
+    assert problem.pde_nodes[1].higher_order_terms == ((0, (0, 0, 1)),)
+
+    inputs = Tensor(np.random.random(size=(5, 2)), mstype.float32)
+    kdv, mixed = problem.parse_node(problem.pde_nodes, inputs=inputs)
+
+    fn = _numpy_model(model)
+    x = inputs.asnumpy().astype(np.float64)
+    h = 1e-2
+    ex, et = np.array([h, 0.0]), np.array([0.0, h])
+    u_t = (fn(x + et) - fn(x - et)) / (2 * h)
+    u_x = (fn(x + ex) - fn(x - ex)) / (2 * h)
+    u_xxx = (fn(x + 2 * ex) - 2 * fn(x + ex) + 2 * fn(x - ex) - fn(x - 2 * ex)) / (2 * h ** 3)
+    u_xx = lambda y: (fn(y + ex) - 2 * fn(y) + fn(y - ex)) / h ** 2
+    u_xxtt = (u_xx(x + et) - 2 * u_xx(x) + u_xx(x - et)) / h ** 2
+    assert np.allclose(kdv.asnumpy(), u_t + 6.0 * fn(x) * u_x + u_xxx, atol=1e-3)
+    assert np.allclose(mixed.asnumpy(), 2 * u_xxtt, atol=1e-3)
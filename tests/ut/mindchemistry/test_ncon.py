@@ -0,0 +1,95 @@
+# Copyright 2024 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the order of contractions of Ncon."""
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from mindspore import Tensor
+
+from mindchemistry.e3.utils.ncon import Ncon, _create_order, _get_dims, _optimize_order, _path_cost
+
+BATCH = 6
+MULS = (3, 4, 5)
+LS = (1, 2, 1)
+
+# the contractions of the connection modes of TensorProduct: wigner, input1, input2 and weight
+CON_LISTS = {
+    'uvw': ([[1, 2, -3], [-1, 3, 1], [-1, 4, 2], [3, 4, -2]], MULS),
+    'uvw_custom': ([[1, 2, -3], [-1, 3, 1], [-1, 4, 2], [-1, 3, 4, -2]], (BATCH,) + MULS),
+    'uvu': ([[1, 2, -3], [-1, -2, 1], [-1, 3, 2], [-2, 3]], MULS[:2]),
+    'uvv': ([[1, 2, -3], [-1, 3, 1], [-1, -2, 2], [3, -2]], MULS[:2]),
+    'uuu': ([[1, 2, -3], [-1, -2, 1], [-1, -2, 2], [-2]], MULS[:1]),
+    'uvuv': ([[1, 2, -4], [-1, -2, 1], [-1, -3, 2], [-2, -3]], MULS[:2]),
+}
+
+
+def get_shapes(con_list, weight_shape):
+    """Shapes of the wigner matrix, the inputs and the weights, where the inputs share the multiplicity in 'uuu'."""
+    l_dims = tuple(2 * l + 1 for l in LS)
+    mul2 = MULS[0] if con_list[1][1] == con_list[2][1] else MULS[1]
+    return [l_dims, (BATCH, MULS[0], l_dims[0]), (BATCH, mul2, l_dims[1]), weight_shape]
+
+
+def einsum(con_list, arrays):
+    """Contract the arrays by numpy with the output indices in the order of -1, -2, ..."""
+    letters = {}
+    for con in con_list:
+        for leg in con:
+            letters.setdefault(leg, chr(ord('a') + len(letters)))
+    inputs = ','.join(''.join(letters[leg] for leg in con) for con in con_list)
+    output = ''.join(letters[leg] for leg in sorted((leg for leg in letters if leg < 0), reverse=True))
+    return np.einsum(f'{inputs}->{output}', *arrays)
+
+
+@pytest.mark.parametrize('mode', list(CON_LISTS))
+def test_ncon_optimized_order(mode):
+    """
+    Feature: order of contractions of Ncon
+    Description: contract the tensors of the connection modes of TensorProduct with and without the shapes
+    Expectation: the optimized order gives the same result as the default order and numpy, and costs no more flops
+    """
+    con_list, weight_shape = CON_LISTS[mode]
+    shapes = get_shapes(con_list, weight_shape)
+    dims = _get_dims(con_list, shapes)
+    rng = np.random.RandomState(0)
+    arrays = [rng.normal(size=shape).astype(np.float32) for shape in shapes]
+
+    default = Ncon(deepcopy(con_list))([Tensor(array) for array in arrays]).asnumpy()
+    optimized = Ncon(deepcopy(con_list), shapes)([Tensor(array) for array in arrays]).asnumpy()
+    expected = einsum(con_list, arrays)
+    assert optimized.shape == default.shape == expected.shape
+    assert np.allclose(default, expected, atol=1e-4)
+    assert np.allclose(optimized, default, atol=1e-4)
+
+    order = _create_order(con_list)
+    optimized_order = _optimize_order(con_list, dims, order)
+    assert sorted(optimized_order) == sorted(order)
+    assert _path_cost(con_list, dims, optimized_order[::-1]) <= _path_cost(con_list, dims, order[::-1])
+
+
+def test_ncon_shapes_mismatch():
+    """
+    Feature: order of contractions of Ncon
+    Description: give the shapes which do not match the indices
+    Expectation: raise ValueError
+    """
+    con_list = [[1, -1], [1, -2]]
+    with pytest.raises(ValueError):
+        Ncon(con_list, [(2, 3)])
+    with pytest.raises(ValueError):
+        Ncon(con_list, [(2, 3), (2, 3, 4)])
+    with pytest.raises(ValueError):
+        Ncon(con_list, [(2, 3), (4, 3)])
@@ -0,0 +1,92 @@
+# Copyright 2024 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the Wigner D matrices of so2_conv."""
+import numpy as np
+import pytest
+import mindspore as ms
+from mindspore import Tensor
+
+from mindchemistry.so2_conv.wigner import _JD, get_jzj, wigner_D, wigner_D_list
+
+LMAX = 6
+
+
+def z_rot_mat(angle, lv):
+    """Dense z-rotation matrices of degree `lv` in float64, as in e3nn 0.4.0."""
+    frequencies = np.arange(lv, -lv - 1, -1)
+    mat = np.zeros(angle.shape + (2 * lv + 1, 2 * lv + 1))
+    index = np.arange(2 * lv + 1)
+    mat[..., index, index[::-1]] = np.sin(frequencies * angle[..., None])
+    mat[..., index, index] = np.cos(frequencies * angle[..., None])
+    return mat
+
+
+def reference_wigner_D(lv, alpha, beta, gamma):
+    """Wigner D matrices from the dense matmuls of z-rotation and J matrices in float64."""
+    j = _JD[lv]
+    return z_rot_mat(alpha, lv) @ j @ z_rot_mat(beta, lv) @ j @ z_rot_mat(gamma, lv)
+
+
+@pytest.fixture(name='angles')
+def fixture_angles():
+    rng = np.random.RandomState(0)
+    return tuple(rng.uniform(-np.pi, np.pi, (4, 5)) for _ in range(3))
+
+
+@pytest.mark.parametrize('dtype, atol', [(ms.float64, 1e-10), (ms.float32, 1e-5), (ms.float16, 5e-3)])
+def test_wigner_D_list(angles, dtype, atol):
+    """
+    Feature: Wigner D matrices of all the degrees up to lmax
+    Description: build the matrices with the cached J Z J tensors of float64, float32 and float16
+    Expectation: the matrices are close to the float64 reference from dense matmuls
+    """
+    alpha, beta, gamma = angles
+    blocks = wigner_D_list(LMAX, Tensor(alpha, ms.float64), Tensor(beta, ms.float64), Tensor(gamma, ms.float64),
+                           get_jzj(LMAX, dtype))
+    assert len(blocks) == LMAX + 1
+    for lv, block in enumerate(blocks):
+        assert block.dtype == dtype
+        assert block.shape == alpha.shape + (2 * lv + 1, 2 * lv + 1)
+        expected = reference_wigner_D(lv, alpha, beta, gamma)
+        assert np.allclose(block.asnumpy().astype(np.float64), expected, atol=atol)
+
+
+def test_wigner_D(angles):
+    """
+    Feature: Wigner D matrix of one degree
+    Description: build the matrices of each degree with the default float16 tensors
+    Expectation: the matrices are the same as the blocks of wigner_D_list and close to the float64 reference
+    """
+    alpha, beta, gamma = (Tensor(angle, ms.float32) for angle in angles)
+    blocks = wigner_D_list(LMAX, alpha, beta, gamma)
+    for lv in range(LMAX + 1):
+        block = wigner_D(lv, alpha, beta, gamma)
+        assert block.shape == blocks[lv].shape
+        assert np.allclose(block.asnumpy(), blocks[lv].asnumpy(), atol=1e-3)
+        assert np.allclose(block.asnumpy().astype(np.float64), reference_wigner_D(lv, *angles), atol=5e-3)
+
+
+def test_get_jzj_cache():
+    """
+    Feature: cached J Z J tensors
+    Description: get the tensors of different lmax and dtypes, and of a degree that is not implemented
+    Expectation: the tensors of each dtype are built once and shared, NotImplementedError is raised
+    """
+    jzj = get_jzj(LMAX, ms.float32)
+    assert len(jzj) == LMAX + 1
+    assert get_jzj(2, ms.float32)[2] is jzj[2]
+    assert get_jzj(2, ms.float64)[2] is not jzj[2]
+    with pytest.raises(NotImplementedError):
+        get_jzj(len(_JD))
@@ -0,0 +1,103 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the topology built from the bond graph against the atom by atom construction."""
+import itertools
+import os
+
+import numpy as np
+import pytest
+
+from sponge import Protein
+from sponge.system.molecule.bond_graph import get_exclude_index
+
+TUTORIAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../MindSPONGE/tutorials')
+PEPTIDES = [os.path.join(TUTORIAL_DIR, 'basic/alad.pdb'),
+            os.path.join(TUTORIAL_DIR, 'summerschool/sponge/case1_addH.pdb')]
+
+
+def loop_angles(bonds):
+    """The angles built vertex by vertex."""
+    angle_vertices = np.where(np.bincount(bonds.flatten()) > 1)[0]
+    angle_bonds = bonds[np.where(np.sum(np.isin(bonds, angle_vertices), axis=1) > 0)[0]]
+    id_selections = [
+        [[0, 1]],
+        [[0, 1], [1, 2], [0, 2]],
+        [[0, 1], [1, 2], [2, 3], [0, 2], [0, 3], [1, 3]],
+    ]
+    angles = []
+    for vertex in angle_vertices:
+        flatten_bonds = bonds[np.where(angle_bonds == vertex)[0]].flatten()
+        neighbours = np.delete(flatten_bonds, np.where(flatten_bonds == vertex))
+        for selection in id_selections[neighbours.size - 2]:
+            angles.append(np.insert(neighbours[selection], 1, vertex))
+    return np.array(angles), angle_vertices
+
+
+def loop_dihedrals(bonds, angles, angle_vertices):
+    """The dihedrals built middle bond by middle bond."""
+    dihedrals = []
+    for middle_id in bonds[np.where(np.isin(bonds, angle_vertices).sum(axis=1) == 2)[0]]:
+        dangles = angles[np.where(np.isin(angles, middle_id).sum(axis=1) * np.isin(angles[:, 1], middle_id) > 1)[0]]
+        left_ele = dangles[:, 2][np.isin(dangles[:, 0], middle_id[0])]
+        left_ele = np.append(left_ele, dangles[:, 0][np.isin(dangles[:, 2], middle_id[0])])
+        right_ele = np.unique(dangles[np.isin(dangles[:, 1], middle_id[0])])
+        right_ele = right_ele[np.where(np.isin(right_ele, middle_id, invert=True))[0]]
+        for right, left in itertools.product(right_ele, left_ele):
+            if right != left:
+                dihedrals.append([right, middle_id[0], middle_id[1], left])
+    return np.array(dihedrals)
+
+
+def loop_improper(bonds):
+    """The improper dihedrals built core atom by core atom."""
+    improper = []
+    for core in np.where(np.bincount(bonds.flatten()) > 2)[0]:
+        core_bonds = bonds[np.where(np.sum(np.isin(bonds, core), axis=1) > 0)[0]]
+        if core_bonds.shape[0] == 3:
+            improper.append(np.unique(core_bonds.flatten()))
+    return np.array(improper)
+
+
+def loop_excludes(num_atoms, *terms):
+    """The excluded atoms built atom by atom."""
+    excludes_ = []
+    for i in range(num_atoms):
+        this_excludes = np.concatenate([term[np.where(np.isin(term, i).sum(axis=1))[0]].flatten() for term in terms])
+        this_excludes = np.unique(this_excludes)
+        excludes_.append(this_excludes[this_excludes != i].tolist())
+    padding_length = max(len(excludes) for excludes in excludes_)
+    return np.array([excludes + [num_atoms] * (padding_length - len(excludes)) for excludes in excludes_])
+
+
+@pytest.mark.parametrize('pdb', PEPTIDES)
+def test_bond_graph_topology(pdb):
+    """
+    Feature: topology built from the bond graph
+    Description: build the angles, dihedrals, improper dihedrals and excluded atoms of small peptides
+    Expectation: the arrays and their order are the same as the ones built atom by atom
+    """
+    system = Protein(pdb=pdb)
+    num_atoms = system.num_atoms
+    bonds = system.bonds.asnumpy().reshape(-1, 2)
+    angles = system.angles.asnumpy().reshape(-1, 3)
+    dihedrals = system.dihedrals.asnumpy().reshape(-1, 4)
+    improper = system.improper_dihedrals.asnumpy().reshape(-1, 4)
+
+    expected_angles, angle_vertices = loop_angles(bonds)
+    assert np.array_equal(angles, expected_angles)
+    assert np.array_equal(dihedrals, loop_dihedrals(bonds, expected_angles, angle_vertices))
+    assert np.array_equal(improper, loop_improper(bonds))
+    assert np.array_equal(get_exclude_index(num_atoms, bonds, angles, dihedrals, improper),
+                          loop_excludes(num_atoms, bonds, angles, dihedrals, improper))
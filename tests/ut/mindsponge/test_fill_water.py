@@ -0,0 +1,78 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the clash mask of the water molecules filled in a box."""
+import numpy as np
+import pytest
+
+from sponge.system.modelling.fill_water import get_clash_mask
+
+CUTOFF = 2.5
+
+
+def brute_force_clash(points, crds, cutoff, box=None):
+    """The mask of the points within the cutoff distance of any atom, from all the pairwise distances."""
+    diff = points[:, None] - crds[None]
+    if box is not None:
+        diff -= box * np.round(diff / box)
+    return (np.linalg.norm(diff, axis=-1) <= cutoff).any(axis=-1)
+
+
+@pytest.mark.parametrize('num_workers', [1, 2])
+def test_clash_mask_non_periodic(num_workers):
+    """
+    Feature: clash mask by cell list
+    Description: test random points inside and around the atoms without a periodic box, in chunks
+    Expectation: the mask is the same as the one from all the pairwise distances
+    """
+    rng = np.random.RandomState(0)
+    crds = rng.uniform(0, 20, (300, 3))
+    points = rng.uniform(-5, 25, (2000, 3))
+    # points on the boundary of the cutoff distance
+    points[:10] = crds[:10] + np.array([CUTOFF, 0, 0])
+    mask = get_clash_mask(points, crds, CUTOFF, chunk_size=300, num_workers=num_workers)
+    expected = brute_force_clash(points, crds, CUTOFF)
+    assert 0 < expected.sum() < expected.size
+    assert np.array_equal(mask, expected)
+
+
+@pytest.mark.parametrize('box', [[20.0, 17.3, 23.9], [6.0, 4.0, 30.0]])
+def test_clash_mask_periodic(box):
+    """
+    Feature: clash mask by cell list
+    Description: test random points inside and outside of a periodic box with an origin, where the box is not a
+                 multiple of the cutoff or only holds one or two cells along some axes
+    Expectation: the mask is the same as the one from all the pairwise distances of the periodic images
+    """
+    rng = np.random.RandomState(1)
+    box = np.array(box)
+    origin = np.array([-3.0, 1.0, 2.0])
+    crds = origin + rng.uniform(0, 1, (int(np.prod(box) / 40), 3)) * box
+    points = origin + rng.uniform(-0.5, 1.5, (2000, 3)) * box
+    mask = get_clash_mask(points, crds, CUTOFF, box=box, origin=origin, chunk_size=700)
+    expected = brute_force_clash(points, crds, CUTOFF, box)
+    assert 0 < expected.sum() < expected.size
+    assert np.array_equal(mask, expected)
+
+
+def test_clash_mask_empty():
+    """
+    Feature: clash mask by cell list
+    Description: test without points or without atoms
+    Expectation: empty mask, or no clashed points
+    """
+    crds = np.random.RandomState(2).uniform(0, 10, (20, 3))
+    assert get_clash_mask(np.zeros((0, 3)), crds, CUTOFF).shape == (0,)
+    assert not get_clash_mask(crds, np.zeros((0, 3)), CUTOFF).any()
+    assert not get_clash_mask(crds, np.zeros((0, 3)), CUTOFF, box=np.full(3, 10.0)).any()
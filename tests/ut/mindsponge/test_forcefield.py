@@ -0,0 +1,66 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the bonded parameters of the bundled force fields of sponge."""
+import os
+
+import numpy as np
+import pytest
+
+from sponge import Protein, Molecule, ForceField
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+ALAD_PDB = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        '../../../MindSPONGE/tutorials/basic/alad.pdb')
+
+# acetanilide with GAFF atom types
+LIGAND_ATOMS = ['C', 'C', 'O', 'N'] + ['C'] * 6 + ['H'] * 9
+LIGAND_TYPES = ['C3', 'C', 'O', 'N'] + ['CA'] * 6 + ['HN', 'HC', 'HC', 'HC'] + ['HA'] * 5
+LIGAND_BONDS = [[0, 1], [1, 2], [1, 3], [3, 4], [4, 5], [5, 6], [6, 7], [7, 8], [8, 9], [9, 4],
+                [3, 10], [0, 11], [0, 12], [0, 13], [5, 14], [6, 15], [7, 16], [8, 17], [9, 18]]
+
+BONDED_TERMS = {
+    'bond_energy': ['index', 'force_constant', 'bond_length'],
+    'angle_energy': ['index', 'force_constant', 'bond_angle'],
+    'dihedral_energy': ['index', 'force_constant', 'periodicity', 'dihedral_phase'],
+    'improper_energy': ['index', 'force_constant', 'periodicity', 'dihedral_phase'],
+}
+
+
+def build_forcefield(name):
+    """build the force field of the test system"""
+    if name == 'ff14sb':
+        system = Protein(pdb=ALAD_PDB)
+        return ForceField(system, 'AMBER.FF14SB')
+    coordinate = np.random.RandomState(0).normal(0, 0.1, (len(LIGAND_ATOMS), 3)).astype(np.float32)
+    system = Molecule(atoms=LIGAND_ATOMS, atom_type=LIGAND_TYPES, bonds=LIGAND_BONDS, coordinate=coordinate,
+                      atom_charge=np.zeros(len(LIGAND_ATOMS)))
+    return ForceField(system, 'AMBER.GAFF', rebuild_system=False)
+
+
+@pytest.mark.parametrize('name', ['ff14sb', 'gaff'])
+def test_bonded_parameters(name):
+    """
+    Feature: bonded parameters of force field
+    Description: build the force field of alanine dipeptide with ff14SB and of acetanilide with GAFF
+    Expectation: the index and the parameters of the bonded terms are the same as the reference values
+    """
+    reference = np.load(os.path.join(DATA_DIR, 'forcefield_bonded.npz'))
+    energies = {energy.name: energy for energy in build_forcefield(name).energies}
+    for term, keys in BONDED_TERMS.items():
+        for key in keys:
+            expected = reference[f'{name}/{term}/{key}']
+            value = getattr(energies.get(term), key).asnumpy()
+            assert value.dtype == expected.dtype, f'{term}/{key}'
+            assert np.array_equal(value, expected), f'{term}/{key}'
@@ -0,0 +1,93 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the fused steps of Sponge.run."""
+import numpy as np
+import pytest
+from mindspore import context
+from mindspore.train.callback import Callback
+
+from sponge import Sponge, Molecule, ForceField, UpdaterMD
+from sponge.callback import RunInfo
+
+
+class RecordCoordinate(Callback):
+    """Record the coordinate at the steps which are multiples of `save_freq`."""
+
+    def __init__(self, system, save_freq):
+        self.system = system
+        self.save_freq = save_freq
+        self.count = 0
+        self.records = []
+
+    def step_end(self, run_context):
+        if self.count % self.save_freq == 0:
+            self.records.append(self.system.get_coordinate().asnumpy())
+        self.count += run_context.original_args().step_interval
+
+
+def simulate(steps, fused_steps, save_freq=10, num_runs=1):
+    """run the MD of a water box and return the recorded and final coordinates."""
+    system = Molecule(template='water.spce.yaml')
+    system.reduplicate([0.3, 0, 0])
+    system.reduplicate([0, 0.3, 0])
+    potential = ForceField(system, parameters='SPCE')
+    velocity = np.random.RandomState(0).normal(0, 0.5, system.coordinate.shape).astype(np.float32)
+    updater = UpdaterMD(system, time_step=1e-3, velocity=velocity, integrator='leap_frog')
+    md = Sponge(system, potential, updater)
+    record = RecordCoordinate(system, save_freq)
+    for _ in range(num_runs):
+        md.run(steps, callbacks=[record], show_time=False, fused_steps=fused_steps)
+    return np.stack(record.records), system.get_coordinate().asnumpy()
+
+
+def test_fused_steps():
+    """
+    Feature: fused steps of Sponge.run
+    Description: run the same simulation step by step and with 5 and 10 fused steps
+    Expectation: the recorded and the final coordinates are the same
+    """
+    context.set_context(mode=context.GRAPH_MODE)
+    expected_records, expected = simulate(40, 1)
+    for fused_steps in (5, 10):
+        records, coordinate = simulate(40, fused_steps)
+        assert np.allclose(records, expected_records, atol=1e-5)
+        assert np.allclose(coordinate, expected, atol=1e-5)
+
+
+def test_fused_steps_repeated_runs():
+    """
+    Feature: fused steps of Sponge.run
+    Description: call Sponge.run twice with the same fused network
+    Expectation: the recorded and the final coordinates are the same as running all the steps at once
+    """
+    context.set_context(mode=context.GRAPH_MODE)
+    expected_records, expected = simulate(40, 1)
+    records, coordinate = simulate(20, 5, num_runs=2)
+    assert np.allclose(records, expected_records, atol=1e-5)
+    assert np.allclose(coordinate, expected, atol=1e-5)
+
+
+def test_fused_steps_callback_freq():
+    """
+    Feature: fused steps of Sponge.run
+    Description: the record frequency of a callback is not a multiple of fused_steps
+    Expectation: raise ValueError
+    """
+    context.set_context(mode=context.GRAPH_MODE)
+    system = Molecule(template='water.spce.yaml')
+    potential = ForceField(system, parameters='SPCE')
+    md = Sponge(system, potential, UpdaterMD(system, time_step=1e-3, integrator='leap_frog'))
+    with pytest.raises(ValueError):
+        md.run(30, callbacks=[RunInfo(15)], show_time=False, fused_steps=10)
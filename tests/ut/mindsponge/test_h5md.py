@@ -0,0 +1,95 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the buffered and background writing of the H5MD files of sponge."""
+import h5py
+import numpy as np
+import pytest
+
+from sponge import Molecule
+from sponge.data.export import H5MD
+
+NUM_FRAMES = 11
+
+
+def write_frames(system, filename, buffer_size, background):
+    """Write random frames of position, box and observables, flush the tail and return the writer."""
+    h5md = H5MD(system, str(filename), buffer_size=buffer_size, background=background)
+    h5md.set_box(False)
+    h5md.set_velocity()
+    h5md.add_observables('potential_energy', (), 'float32', 'kj/mol')
+    rng = np.random.RandomState(0)
+    for i in range(NUM_FRAMES):
+        h5md.write_step(i * 10)
+        h5md.write_time(i * 0.01)
+        h5md.write_position(rng.normal(size=(system.num_atoms, 3)).astype(np.float32))
+        h5md.write_box(rng.uniform(1, 2, 3).astype(np.float32))
+        h5md.write_velocity(rng.normal(size=(system.num_atoms, 3)).astype(np.float32))
+        h5md.write_observables('potential_energy', np.float32(rng.normal()))
+    h5md.flush()
+    return h5md
+
+
+def read_datasets(filename):
+    """Read all the datasets of a H5MD file."""
+    datasets = {}
+    with h5py.File(filename, 'r') as file:
+        file.visititems(lambda name, obj: datasets.update({name: obj[()]})
+                        if isinstance(obj, h5py.Dataset) else None)
+    return datasets
+
+
+@pytest.mark.parametrize('buffer_size, background', [(4, False), (4, True), (1, True)])
+def test_h5md_buffered_writing(tmp_path, buffer_size, background):
+    """
+    Feature: buffered and background writing of H5MD files
+    Description: write frames which do not fill the last block, and flush before closing the file
+    Expectation: all the frames are written after flush, the file is the same as the one written frame by frame
+    """
+    system = Molecule(template='water.spce.yaml')
+    system.reduplicate([0.3, 0, 0])
+    system.set_pbc_box([0.6, 0.3, 0.3])
+    direct = write_frames(system, tmp_path / 'direct.h5md', 1, False)
+    direct.close()
+
+    h5md = write_frames(system, tmp_path / 'buffered.h5md', buffer_size, background)
+    assert h5md.position['value'].shape[0] == NUM_FRAMES
+    assert h5md.obs_group['potential_energy']['value'].shape[0] == NUM_FRAMES
+    h5md.close()
+    assert h5md.write_metrics['records'] == NUM_FRAMES
+
+    expected = read_datasets(tmp_path / 'direct.h5md')
+    datasets = read_datasets(tmp_path / 'buffered.h5md')
+    assert datasets.keys() == expected.keys()
+    for name, value in expected.items():
+        assert np.array_equal(datasets[name], value), name
+
+
+def test_h5md_close_writes_tail(tmp_path):
+    """
+    Feature: buffered and background writing of H5MD files
+    Description: close the file with frames left in the buffer without calling flush
+    Expectation: all the frames are written to the file
+    """
+    system = Molecule(template='water.spce.yaml')
+    h5md = H5MD(system, str(tmp_path / 'tail.h5md'), buffer_size=4, background=True)
+    positions = np.random.RandomState(0).normal(size=(NUM_FRAMES, system.num_atoms, 3)).astype(np.float32)
+    for i in range(NUM_FRAMES):
+        h5md.write_step(i)
+        h5md.write_position(positions[i].copy())
+    h5md.close()
+
+    datasets = read_datasets(tmp_path / 'tail.h5md')
+    assert np.array_equal(datasets['particles/trajectory/position/value'], positions)
+    assert np.array_equal(datasets['particles/trajectory/position/step'], np.arange(NUM_FRAMES))
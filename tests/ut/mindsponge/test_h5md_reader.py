@@ -0,0 +1,180 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the lazy reader of the H5MD files of sponge."""
+import numpy as np
+import pytest
+
+from mindspore import Tensor
+
+from sponge import Molecule
+from sponge.colvar import Distance
+from sponge.data.export import H5MD, H5MDReader
+from sponge.metrics import Metric
+from sponge.metrics.metrics import Average
+
+NUM_FRAMES = 23
+
+
+@pytest.fixture(name='trajectory')
+def fixture_trajectory(tmp_path):
+    """Write a trajectory of a water dimer with a time dependent PBC box in nm."""
+    system = Molecule(template='water.spce.yaml')
+    system.reduplicate([0.3, 0, 0])
+    system.set_pbc_box([0.6, 0.3, 0.3])
+    rng = np.random.RandomState(0)
+    positions = rng.normal(size=(NUM_FRAMES, system.num_atoms, 3)).astype(np.float32)
+    boxes = rng.uniform(1, 2, (NUM_FRAMES, 3)).astype(np.float32)
+
+    filename = str(tmp_path / 'trajectory.h5md')
+    h5md = H5MD(system, filename, buffer_size=4)
+    h5md.set_box(False)
+    for i in range(NUM_FRAMES):
+        h5md.write_position(positions[i].copy(), step=i * 10, time=i * 0.01)
+        h5md.write_box(boxes[i].copy())
+    h5md.close()
+    return filename, positions, boxes
+
+
+class CenterOfFrames(Metric):
+    """Mean coordinate of the atoms over the frames, updated frame by frame by the default `update_frames`."""
+
+    def __init__(self):
+        super().__init__()
+        self._sum = 0
+        self._count = 0
+
+    def clear(self):
+        self._sum = 0
+        self._count = 0
+
+    def update(self, coordinate, pbc_box=None, energy=None, force=None, potentials=None, total_bias=None,
+               biases=None):
+        # pylint: disable=unused-argument
+        assert coordinate.shape[0] == 1 and (pbc_box is None or pbc_box.shape[0] == 1)
+        self._sum += self._convert_data(coordinate)[0]
+        self._count += 1
+
+    def eval(self):
+        return self._sum / self._count
+
+
+def distance(positions, boxes, atoms):
+    """Distance between two atoms under PBC."""
+    vector = positions[:, atoms[1]] - positions[:, atoms[0]]
+    vector -= boxes * np.floor(vector / boxes + 0.5)
+    return np.linalg.norm(vector, axis=-1)
+
+
+def test_h5md_reader_index(trajectory):
+    """
+    Feature: lazy reader of H5MD files
+    Description: read the frames by index, slice, list of index and range, with an atom selection and in Angstrom
+    Expectation: the coordinates and PBC boxes are the same as the written ones
+    """
+    filename, positions, boxes = trajectory
+    with H5MDReader(filename) as reader:
+        assert len(reader) == NUM_FRAMES
+        assert reader.chunk_size == 4 and reader.batch_size == 4
+        assert np.array_equal(reader.steps, np.arange(NUM_FRAMES) * 10)
+        assert np.array_equal(reader[3], positions[3])
+        assert np.array_equal(reader[-1], positions[-1])
+        assert np.array_equal(reader[2:17:3], positions[2:17:3])
+        assert np.array_equal(reader[[7, 1, 7, -2]], positions[[7, 1, 7, -2]])
+        with pytest.raises(IndexError):
+            _ = reader[NUM_FRAMES]
+
+        coordinate, pbc_box = reader.read(5, 20, 4)
+        assert np.array_equal(coordinate, positions[5:20:4])
+        assert np.array_equal(pbc_box, boxes[5:20:4])
+
+    atoms = [5, 0, 2]
+    with H5MDReader(filename, atoms=atoms, length_unit='A') as reader:
+        assert reader.num_atoms == 3
+        assert np.allclose(reader[1:4], positions[1:4][:, atoms] * 10)
+        assert np.allclose(reader.read(0, 2)[1], boxes[:2] * 10)
+
+
+@pytest.mark.parametrize('prefetch', [0, 2])
+def test_h5md_reader_iter_batches(trajectory, prefetch):
+    """
+    Feature: lazy reader of H5MD files
+    Description: iterate the frames in batches with and without prefetching, with ranges and intervals
+    Expectation: the batches are aligned to the chunks and cover the same frames as the whole trajectory
+    """
+    filename, positions, boxes = trajectory
+    with H5MDReader(filename, batch_size=5, prefetch=prefetch) as reader:
+        assert reader.batch_size == 8
+        batches = list(reader)
+        assert [coordinate.shape[0] for coordinate, _ in batches] == [8, 8, 7]
+        assert np.array_equal(np.concatenate([coordinate for coordinate, _ in batches]), positions)
+        assert np.array_equal(np.concatenate([pbc_box for _, pbc_box in batches]), boxes)
+
+        batches = list(reader.iter_batches(batch_size=4, start=3, stop=21, step=3))
+        assert np.array_equal(np.concatenate([coordinate for coordinate, _ in batches]), positions[3:21:3])
+        assert np.array_equal(np.concatenate([pbc_box for _, pbc_box in batches]), boxes[3:21:3])
+
+        # stop iterating before the prefetching thread finishes
+        for _ in reader.iter_batches(batch_size=4):
+            break
+
+
+def test_h5md_reader_analyse_metric(trajectory):
+    """
+    Feature: lazy reader of H5MD files
+    Description: analyse the trajectory twice with a metric which is updated with single frames
+    Expectation: the metric is cleared before each analysis and covers all the selected frames
+    """
+    filename, positions, _ = trajectory
+    with H5MDReader(filename, batch_size=8) as reader:
+        for _ in range(2):
+            results = reader.analyse({'center': CenterOfFrames()}, start=1, step=3)
+            assert np.allclose(results['center'], positions[1::3].mean(0), atol=1e-5)
+
+
+def test_h5md_reader_analyse(trajectory):
+    """
+    Feature: lazy reader of H5MD files
+    Description: analyse the trajectory twice with a colvar and the average of a colvar
+    Expectation: the colvar of every frame and the average are the same as the ones calculated by numpy
+    """
+    filename, positions, boxes = trajectory
+    expected = distance(positions, boxes, [0, 4])
+    metrics = {'distance': Distance([0, 4]), 'average': Average(Distance([0, 4]))}
+    with H5MDReader(filename, batch_size=8) as reader:
+        for _ in range(2):
+            results = reader.analyse(metrics, step=2)
+            assert np.allclose(results['distance'].reshape(-1), expected[::2], atol=1e-5)
+            assert np.allclose(results['average'], expected[::2].mean(), atol=1e-5)
+
+
+def test_average_clear():
+    """
+    Feature: average of a colvar
+    Description: update the average, clear it and update it again with single frames and with a batch of frames
+    Expectation: the average only covers the frames after clear
+    """
+    coordinate = np.random.RandomState(1).normal(size=(6, 2, 3)).astype(np.float32)
+    expected = np.linalg.norm(coordinate[:, 1] - coordinate[:, 0], axis=-1)
+    average = Average(Distance([0, 1]))
+    average.clear()
+    average.update(Tensor(coordinate[:1]))
+    average.clear()
+    for i in range(3, 6):
+        average.update(Tensor(coordinate[i:i+1]))
+    assert np.allclose(average.eval(), expected[3:].mean(), atol=1e-5)
+
+    average.clear()
+    average.update_frames(Tensor(coordinate))
+    assert np.allclose(average.eval(), expected.mean(), atol=1e-5)
@@ -0,0 +1,115 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the neighbor search of the graphs of aichemist against brute force."""
+import numpy as np
+import pytest
+
+from aichemist.data import Graph, knn_edges
+
+BOX = np.array([10.0, 8.0, 12.0])
+
+
+def brute_force_edges(coord, max_neighbors=None, cutoff=None, box=None):
+    """The edges ordered by the start node and the distance, from all the pairwise distances."""
+    diff = coord[None, :] - coord[:, None]
+    if box is not None:
+        diff -= box * np.round(diff / box)
+    dist = np.linalg.norm(diff, axis=-1)
+    np.fill_diagonal(dist, np.inf)
+    edges = []
+    dists = []
+    for i, row in enumerate(dist):
+        neighbors = np.argsort(row)
+        if cutoff is not None:
+            neighbors = neighbors[row[neighbors] < cutoff]
+        else:
+            neighbors = neighbors[np.isfinite(row[neighbors])]
+        if max_neighbors is not None:
+            neighbors = neighbors[:max_neighbors]
+        edges.extend((i, j) for j in neighbors)
+        dists.extend(row[neighbors])
+    return np.array(edges, np.int64).reshape(-1, 2).T, np.array(dists)
+
+
+@pytest.mark.parametrize('max_neighbors, cutoff', [(6, None), (None, 2.5), (6, 2.5), (200, None)])
+@pytest.mark.parametrize('box', [None, BOX])
+def test_knn_edges(max_neighbors, cutoff, box):
+    """
+    Feature: neighbor search by KD-tree
+    Description: search the k-nearest neighbors, the neighbors within a cutoff and both, with and without PBC
+    Expectation: the edges and distances are the same as the ones from all the pairwise distances
+    """
+    coord = np.random.RandomState(0).uniform(0, 1, (150, 3)) * BOX
+    edges, dist = knn_edges(coord, max_neighbors=max_neighbors, cutoff=cutoff, box=box)
+    expected_edges, expected_dist = brute_force_edges(coord, max_neighbors, cutoff, box)
+    assert edges.dtype == np.int64
+    assert np.array_equal(edges, expected_edges)
+    assert np.allclose(dist, expected_dist)
+
+
+def test_knn_edges_wrap():
+    """
+    Feature: neighbor search by KD-tree
+    Description: search with PBC the coordinates outside of the box, and the tiny negative coordinates which are
+                 rounded to the box length by np.mod
+    Expectation: the coordinates are wrapped into the box and the edges are the same as brute force
+    """
+    rng = np.random.RandomState(1)
+    coord = rng.uniform(-1, 2, (60, 3)) * BOX
+    coord[:3] = [[-1e-17, 0, 0], [0, -1e-17, 5], [1, 2, -1e-17]]
+    assert (np.mod(coord[:3], BOX) == BOX).any()
+    edges, dist = knn_edges(coord, max_neighbors=4, cutoff=3.0, box=BOX)
+    expected_edges, expected_dist = brute_force_edges(coord, 4, 3.0, BOX)
+    assert np.array_equal(edges, expected_edges)
+    assert np.allclose(dist, expected_dist)
+
+
+@pytest.mark.parametrize('max_neighbors, cutoff', [(5, None), (None, 2.0)])
+def test_knn_edges_batch(max_neighbors, cutoff):
+    """
+    Feature: neighbor search by KD-tree
+    Description: search a batch of graphs, including a graph of one node, and build the graph batch
+    Expectation: nodes are only connected within their graphs, the edges are the ones of each graph with the
+                 indices offset by the start of the graph
+    """
+    rng = np.random.RandomState(2)
+    n_nodes = np.array([30, 1, 45, 4])
+    coord = rng.uniform(0, 5, (n_nodes.sum(), 3))
+    edges, dist = knn_edges(coord, max_neighbors=max_neighbors, cutoff=cutoff, n_nodes=n_nodes)
+
+    start = 0
+    expected_edges, expected_dist = [], []
+    for n_node in n_nodes:
+        graph_edges, graph_dist = brute_force_edges(coord[start:start + n_node], max_neighbors, cutoff)
+        expected_edges.append(graph_edges + start)
+        expected_dist.append(graph_dist)
+        start += n_node
+    assert np.array_equal(edges, np.concatenate(expected_edges, axis=1))
+    assert np.allclose(dist, np.concatenate(expected_dist))
+
+    graph = Graph.knn_graph(coord, max_neighbors=max_neighbors, cutoff=cutoff, n_nodes=n_nodes)
+    assert np.array_equal(graph.edges, edges)
+    assert np.array_equal(graph.n_edges, [e.shape[1] for e in expected_edges])
+    assert graph.edge_feat.shape[0] == edges.shape[1]
+
+
+def test_knn_edges_no_limit():
+    """
+    Feature: neighbor search by KD-tree
+    Description: search without max_neighbors and cutoff
+    Expectation: raise ValueError
+    """
+    with pytest.raises(ValueError):
+        knn_edges(np.zeros((4, 3)))
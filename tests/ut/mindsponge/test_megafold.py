@@ -0,0 +1,139 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the length buckets and the early exit of recycling of MEGA-Fold inference."""
+import os
+import pickle
+
+import numpy as np
+import pytest
+from mindspore import Tensor
+
+from mindsponge.common.config_load import load_config
+from mindsponge.pipeline.models.megafold.megafold import MEGAFold
+from mindsponge.pipeline.models.megafold.megafold_dataset import MEGAFoldDataSet
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../..')
+CONFIG_PATH = os.path.join(ROOT_DIR, 'MindSPONGE/applications/model_configs/MEGAFold/predict_256.yaml')
+# raw features of a sequence of 75 residues
+PKL_PATH = os.path.join(ROOT_DIR, 'tests/st/mindsponge/test_megafold/examples/pkl/T1082-D1.pkl')
+NUM_RES = 75
+
+
+def small_config(length_buckets=None, **tolerances):
+    """Inference config of a small network and MSA."""
+    config = load_config(CONFIG_PATH)
+    config.seq_length = 32
+    config.use_jit = False
+    config.model.msa_stack_num = 1
+    config.model.extra_msa_stack_num = 1
+    config.model.template.template_pair_stack.num_block = 1
+    config.data.max_msa_clusters = 8
+    config.data.max_extra_msa = 8
+    config.data.num_recycle = 4
+    config.data.length_buckets = length_buckets
+    for key, value in tolerances.items():
+        setattr(config.data, key, value)
+    return config
+
+
+def process_features(config):
+    """Features of the raw features processed by the data set."""
+    with open(PKL_PATH, 'rb') as f:
+        raw_feature = pickle.load(f)
+    return MEGAFoldDataSet(config).process(raw_feature)
+
+
+class FakeForward:
+    """Forward of the padded length, whose atom positions converge to the residue types over the recycles."""
+
+    def __init__(self):
+        self.num_calls = 0
+
+    def __call__(self, data):
+        self.num_calls += 1
+        aatype = data['aatype'].asnumpy().astype(np.float32)
+        prev_pos = data['prev_pos'].asnumpy().astype(np.float32)
+        pos = 0.5 * (prev_pos + np.tile(aatype[:, None, None], (1, 37, 3)))
+        logits = np.tile(np.mean(pos, axis=(1, 2))[:, None], (1, 50)) * np.linspace(-1, 1, 50)
+        return Tensor(pos), data['prev_msa_first_row'], data['prev_pair'], Tensor(logits.astype(np.float32))
+
+
+def predict(config, data):
+    """Predict with the fake forward, and return the outputs and the number of forward calls."""
+    model = MEGAFold(config)
+    model.forward = FakeForward()
+    res = model.predict(data)
+    assert model.last_num_recycle == model.forward.num_calls
+    return res, model.forward.num_calls
+
+
+def test_megafold_bucket_networks():
+    """
+    Feature: length buckets of MEGA-Fold inference
+    Description: get the networks of the padded lengths of two buckets
+    Expectation: each network is built once and shares all the parameters of the network of seq_length
+    """
+    # pylint: disable=protected-access
+    model = MEGAFold(small_config([64, 128]))
+    assert model._get_network(32) is model.network
+    params = model.network.parameters_dict()
+    for seq_length in [64, 128]:
+        network = model._get_network(seq_length)
+        assert model._get_network(seq_length) is network
+        bucket_params = network.parameters_dict()
+        assert bucket_params.keys() == params.keys()
+        assert all(bucket_params[name] is param for name, param in params.items())
+
+
+@pytest.mark.parametrize('length_buckets, padded_length', [([64, 128], 128), ([32, 64], 64)])
+def test_megafold_bucket_predict(length_buckets, padded_length):
+    """
+    Feature: length buckets of MEGA-Fold inference
+    Description: pad the sequence to the shortest bucket which holds it, or crop it to the largest bucket
+    Expectation: the features have the padded length, and the outputs have the true length
+    """
+    config = small_config(length_buckets)
+    data = process_features(config)
+    assert data['aatype'].shape[-1] == padded_length
+    assert data['num_residues'] == NUM_RES
+
+    (positions, mask, aatype, confidence, pdb_file), _ = predict(config, data)
+    length = min(NUM_RES, padded_length)
+    assert positions.shape == (length, 37, 3)
+    assert mask.shape == (length, 37)
+    assert aatype.shape == (length,)
+    assert np.isfinite(confidence)
+    assert len({line[22:26] for line in pdb_file.splitlines() if line.startswith('ATOM')}) == length
+
+
+def test_megafold_recycle_early_exit():
+    """
+    Feature: early exit of recycling of MEGA-Fold inference
+    Description: predict with zero tolerances, large tolerances and without tolerances
+    Expectation: zero tolerances run all the recycles and give the same outputs as without tolerances,
+                 large tolerances stop after the second recycle
+    """
+    data = process_features(small_config([64, 128]))
+    expected, num_calls = predict(small_config([64, 128]), data)
+    assert num_calls == 4
+
+    res, num_calls = predict(small_config([64, 128], recycle_pos_tolerance=0., recycle_plddt_tolerance=0.), data)
+    assert num_calls == 4
+    for value, expected_value in zip(res, expected):
+        assert np.array_equal(value, expected_value)
+
+    res, num_calls = predict(small_config([64, 128], recycle_pos_tolerance=1e9, recycle_plddt_tolerance=1e9), data)
+    assert num_calls == 2
+    assert res[0].shape == expected[0].shape
@@ -0,0 +1,102 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the MSA cluster features of the MEGA-Fold data pipeline against the one-hot implementation."""
+import numpy as np
+import pytest
+
+from mindsponge.data_transform import one_hot
+from mindsponge.pipeline.models.megafold.megafold_data import msa_nearest_neighbor_clusters, msa_summarize_clusters
+
+NUM_SEQ = 7
+NUM_RES = 11
+
+
+def reference_nearest_neighbor_clusters(feature, gap_agreement_weight=0.):
+    """Assign each extra MSA sequence to its nearest neighbor by the dense one-hot matrices."""
+    weights = np.concatenate([np.ones(21), gap_agreement_weight * np.ones(1), np.zeros(1)], 0)
+    sample_one_hot = feature['msa_mask'][:, :, None] * one_hot(23, feature['msa'])
+    num_seq, num_res, _ = sample_one_hot.shape
+    if feature['extra_msa_mask'].any():
+        extra_one_hot = feature['extra_msa_mask'][:, :, None] * one_hot(23, feature['extra_msa'])
+        agreement = np.matmul(np.reshape(extra_one_hot, [extra_one_hot.shape[0], num_res * 23]),
+                              np.reshape(sample_one_hot * weights, [num_seq, num_res * 23]).T)
+        return np.argmax(agreement, axis=1)
+    return np.array([])
+
+
+def reference_summarize_clusters(feature):
+    """The profile and deletion mean of each cluster by summing the extra sequences cluster by cluster."""
+    num_seq = feature['msa'].shape[0]
+
+    def csum(x):
+        return np.array([np.sum(x[np.where(feature['extra_cluster_assignment'] == i)], axis=0)
+                         for i in range(num_seq)])
+
+    mask = feature['extra_msa_mask']
+    mask_counts = 1e-6 + feature['msa_mask'] + csum(mask)
+    msa_sum = csum(mask[:, :, None] * one_hot(23, feature['extra_msa'])) + one_hot(23, feature['msa'])
+    del_sum = csum(mask * feature['extra_deletion_matrix']) + feature['deletion_matrix']
+    return msa_sum / mask_counts[:, :, None], del_sum / mask_counts
+
+
+def make_feature(num_extra, seed, extra_mask_rate=0.8):
+    """Random MSA features with masked entries, gaps and BERT masks."""
+    rng = np.random.RandomState(seed)
+    return {
+        'msa': rng.randint(0, 23, (NUM_SEQ, NUM_RES)).astype(np.int32),
+        'msa_mask': (rng.uniform(size=(NUM_SEQ, NUM_RES)) < 0.9).astype(np.float32),
+        'deletion_matrix': rng.randint(0, 4, (NUM_SEQ, NUM_RES)).astype(np.float32),
+        'extra_msa': rng.randint(0, 23, (num_extra, NUM_RES)).astype(np.int32),
+        'extra_msa_mask': (rng.uniform(size=(num_extra, NUM_RES)) < extra_mask_rate).astype(np.float32),
+        'extra_deletion_matrix': rng.randint(0, 4, (num_extra, NUM_RES)).astype(np.float32),
+    }
+
+
+@pytest.mark.parametrize('gap_agreement_weight', [0., 0.5])
+@pytest.mark.parametrize('chunk_size', [4, 256])
+def test_msa_clusters(gap_agreement_weight, chunk_size):
+    """
+    Feature: MSA cluster features of the MEGA-Fold data pipeline
+    Description: assign the extra sequences in chunks and summarize the clusters with segment sums
+    Expectation: the assignment, profile and deletion mean are the same as the dense one-hot implementation
+    """
+    feature = make_feature(num_extra=30, seed=0)
+    expected_assignment = reference_nearest_neighbor_clusters(feature, gap_agreement_weight)
+    feature = msa_nearest_neighbor_clusters(gap_agreement_weight=gap_agreement_weight,
+                                            chunk_size=chunk_size)(feature)
+    assert np.array_equal(feature['extra_cluster_assignment'], expected_assignment)
+
+    expected_profile, expected_deletion_mean = reference_summarize_clusters(feature)
+    feature = msa_summarize_clusters(feature)
+    assert feature['cluster_profile'].shape == (NUM_SEQ, NUM_RES, 23)
+    assert np.allclose(feature['cluster_profile'], expected_profile, rtol=1e-6)
+    assert np.allclose(feature['cluster_deletion_mean'], expected_deletion_mean, rtol=1e-6)
+
+
+@pytest.mark.parametrize('num_extra', [0, 5])
+def test_msa_clusters_empty_extra_msa(num_extra):
+    """
+    Feature: MSA cluster features of the MEGA-Fold data pipeline
+    Description: summarize the clusters without extra sequences or with all the extra sequences masked
+    Expectation: the assignment is empty, the features are the same as the dense one-hot implementation
+    """
+    feature = make_feature(num_extra=num_extra, seed=1, extra_mask_rate=0.)
+    feature = msa_nearest_neighbor_clusters()(feature)
+    assert feature['extra_cluster_assignment'].shape == (0,)
+
+    expected_profile, expected_deletion_mean = reference_summarize_clusters(feature)
+    feature = msa_summarize_clusters(feature)
+    assert np.allclose(feature['cluster_profile'], expected_profile, rtol=1e-6)
+    assert np.allclose(feature['cluster_deletion_mean'], expected_deletion_mean, rtol=1e-6)
@@ -0,0 +1,139 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the memory-mapped feature store of the MEGA-Fold training data."""
+import pickle
+
+import numpy as np
+import pytest
+
+from mindsponge.pipeline.dataset import data_process_run
+from mindsponge.pipeline.models.megafold.megafold_data import msa_block_deletion, msa_sample, msa_bert_mask, \
+    msa_nearest_neighbor_clusters, msa_summarize_clusters, extra_msa_crop, msa_feature_concatenate
+from mindsponge.pipeline.models.megafold.megafold_feature import _msa_feature_names
+from mindsponge.pipeline.models.megafold.megafold_store import FeatureStore, FeatureStoreWriter
+
+
+def make_sample(num_res, seed):
+    """Features of all the kinds kept in the store, where the arrays are ragged across the samples."""
+    rng = np.random.RandomState(seed)
+    return {
+        'positions': rng.normal(size=(num_res, 37, 3)).astype(np.float32),
+        'profile': rng.uniform(size=(num_res, 22)),
+        'half': rng.normal(size=(2, num_res)).astype(np.float16),
+        'aatype': rng.randint(0, 21, num_res).astype(np.int32),
+        'index': np.arange(num_res, dtype=np.int64),
+        'mask': rng.uniform(size=num_res) < 0.5,
+        'codes': rng.randint(0, 255, (3, num_res)).astype(np.uint8),
+        'transposed': rng.normal(size=(num_res, 3)).astype(np.float32).T,
+        'resolution': np.array(2.5, np.float32),
+        'seq_length': np.int64(num_res),
+        'empty': np.zeros((0, num_res), np.float32),
+        'domain_names': np.array([b'1abc_A', b'2xyz_B'], dtype=object),
+        'sequence': np.array(['ACDEF'[:num_res % 5 + 1]], dtype=object),
+        'name': f'sample_{seed}',
+        'num_alignments': num_res * 3,
+        'release_date': None,
+    }
+
+
+def assert_features_equal(features, expected):
+    """The features read from the store are the same as the written ones, including the dtypes and shapes."""
+    assert features.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, (np.ndarray, np.generic)):
+            assert type(features[key]) is type(value), key
+            assert features[key].dtype == value.dtype, key
+            assert features[key].shape == value.shape, key
+            assert np.array_equal(features[key], value), key
+        else:
+            assert features[key] == value, key
+
+
+@pytest.mark.parametrize('shard_size', [1 << 30, 4096])
+def test_feature_store_round_trip(tmp_path, shard_size):
+    """
+    Feature: feature store of MEGA-Fold training data
+    Description: write samples of ragged arrays of several dtypes, 0-d arrays, numpy scalars, arrays of bytes and
+                 str objects and plain values, into one shard or many small shards
+    Expectation: the features read back are the same, and the arrays are read-only
+    """
+    samples = [make_sample(num_res, seed) for seed, num_res in enumerate([7, 30, 1, 64])]
+    with FeatureStoreWriter(str(tmp_path), shard_size) as writer:
+        for i, sample in enumerate(samples):
+            writer.add(f'sample_{i}', sample)
+    assert FeatureStore.exists(str(tmp_path))
+
+    store = FeatureStore(str(tmp_path))
+    assert len(store) == len(samples)
+    assert store.names == [f'sample_{i}' for i in range(len(samples))]
+    assert (len(store.shards) == 1) == (shard_size == 1 << 30)
+    for i in [3, 0, 2, 1]:
+        features = store[i]
+        assert_features_equal(features, samples[i])
+        assert not features['positions'].flags.writeable
+        assert features['resolution'].shape == ()
+
+    # the store is pickled to the workers without the memory maps
+    assert_features_equal(pickle.loads(pickle.dumps(store))[1], samples[1])
+
+
+def test_feature_store_unsupported(tmp_path):
+    """
+    Feature: feature store of MEGA-Fold training data
+    Description: add features which can not be saved without pickle
+    Expectation: raise TypeError, and the store is not written
+    """
+    with pytest.raises(TypeError):
+        with FeatureStoreWriter(str(tmp_path)) as writer:
+            writer.add('sample', {'objects': np.array([1, 'a'], dtype=object)})
+    with pytest.raises(TypeError):
+        with FeatureStoreWriter(str(tmp_path)) as writer:
+            writer.add('sample', {'set': {1, 2}})
+    assert not FeatureStore.exists(str(tmp_path))
+
+
+def test_feature_store_ensemble(tmp_path):
+    """
+    Feature: feature store of MEGA-Fold training data
+    Description: run the ensemble functions of the MSA features on the read-only arrays of the store twice
+    Expectation: the ensemble functions do not write into the arrays, and the store is unchanged
+    """
+    rng = np.random.RandomState(0)
+    num_seq, num_res = 12, 9
+    sample = {
+        'msa': rng.randint(0, 22, (num_seq, num_res)).astype(np.int32),
+        'deletion_matrix': rng.randint(0, 3, (num_seq, num_res)).astype(np.float32),
+        'msa_mask': np.ones((num_seq, num_res), np.float32),
+        'hhblits_profile': rng.dirichlet(np.ones(22), num_res).astype(np.float32),
+        'aatype': rng.randint(0, 21, num_res).astype(np.int32),
+        'between_segment_residues': np.zeros(num_res, np.int32),
+        'seq_length': np.int32(num_res),
+    }
+    with FeatureStoreWriter(str(tmp_path)) as writer:
+        writer.add('sample', sample)
+    store = FeatureStore(str(tmp_path))
+
+    ensemble = [msa_block_deletion(msa_feature_list=_msa_feature_names, msa_fraction_per_block=0.3,
+                                   randomize_num_blocks=False, num_blocks=2, seed=1),
+                msa_sample(msa_feature_list=_msa_feature_names, keep_extra=True, max_msa_clusters=5, seed=1),
+                msa_bert_mask(uniform_prob=0.1, profile_prob=0.1, same_prob=0.1, replace_fraction=0.15, seed=1),
+                msa_nearest_neighbor_clusters(),
+                msa_summarize_clusters,
+                extra_msa_crop(feature_list=['extra_' + x for x in _msa_feature_names], max_extra_msa=4),
+                msa_feature_concatenate]
+    for _ in range(2):
+        features = data_process_run(store[0].copy(), ensemble)
+        assert features['msa_feat'].shape == (5, num_res, 49)
+        assert_features_equal(store[0], sample)
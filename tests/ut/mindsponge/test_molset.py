@@ -0,0 +1,194 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the packed molecules, the parallel featurization and the cache of the molecular datasets of aichemist."""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from rdkit import Chem
+
+from aichemist.data import Molecule, PackedGraph
+from aichemist.datasets import MolSet
+
+SMILES = ['CCO', 'c1ccccc1', 'CC(=O)O', 'N', 'C1CC1N', 'OCC(O)CO', 'C#N', 'O=C=O', 'CC(C)Cc1ccc(cc1)C(C)C(=O)O',
+          '[Na+].[Cl-]', 'C', 'FC(F)(F)c1ccccc1Br']
+
+
+def transform(mol, **kwargs):
+    """Transform of the molecules, which is picklable."""
+    return Molecule.from_molecule(mol, **kwargs)
+
+
+def other_transform(mol, **kwargs):
+    """Another transform with the same signature, which adds the hydrogens."""
+    return Molecule.from_molecule(mol, add_hs=True, **kwargs)
+
+
+def failing_transform(mol, **kwargs):
+    """Transform which fails on the molecules with nitrogen atoms."""
+    if mol.HasSubstructMatch(Chem.MolFromSmarts('[#7]')):
+        raise ValueError(f'Failed to transform {Chem.MolToSmiles(mol)}')
+    return Molecule.from_molecule(mol, **kwargs)
+
+
+@pytest.fixture(name='csv_file')
+def fixture_csv_file(tmp_path):
+    """A csv file of SMILES and two labels."""
+    fname = str(tmp_path / 'molecules.csv')
+    labels = np.random.RandomState(0).normal(size=(len(SMILES), 2))
+    pd.DataFrame({'smiles': SMILES, 'y1': labels[:, 0], 'y2': labels[:, 1]}).to_csv(fname, index=False)
+    return fname
+
+
+def load(fname, **kwargs):
+    """Load the molecules of the csv file with the default atom and bond features."""
+    dataset = MolSet(task_list=['y1', 'y2'], **kwargs)
+    return dataset.load_file(fname, atom_feat='default', bond_feat='default')
+
+
+def assert_items_equal(items, expected):
+    """The batches of the datasets are the same."""
+    assert len(items) == len(expected)
+    for item, expected_item in zip(items, expected):
+        if isinstance(expected_item, np.ndarray):
+            assert item.shape == expected_item.shape
+            assert np.array_equal(item, expected_item)
+        else:
+            assert item == expected_item
+
+
+def assert_datasets_equal(dataset, expected):
+    """The datasets give the same molecules and labels for single indexes and batches."""
+    assert len(dataset) == len(expected)
+    assert np.array_equal(dataset.label, expected.label)
+    for index in [[0], [len(expected) - 1], [3, 0, 7], list(range(len(expected)))]:
+        assert_items_equal(dataset[index], expected[index])
+
+
+def test_packed_graph(tmp_path):
+    """
+    Feature: packed storage of molecules
+    Description: pack molecules with nodes and edges of different numbers, select, batch, save and load them
+    Expectation: the molecules and batches are the same as the ones of the list of molecules
+    """
+    mols = [Molecule.from_smiles(smiles) for smiles in SMILES]
+    packed = PackedGraph.from_graphs(mols)
+    assert len(packed) == len(mols)
+
+    for i in [0, 3, 10, -1]:
+        mol = packed[i]
+        assert isinstance(mol, Molecule)
+        assert mol.n_node == mols[i].n_node
+        for key, value in mols[i].to_dict().items():
+            assert np.array_equal(mol.to_dict()[key], value), key
+
+    packed.save(str(tmp_path))
+    index = [9, 0, 4, 4]
+    expected = Molecule.pack([mols[i] for i in index]).to_dict()
+    for loaded in [packed, PackedGraph.load(str(tmp_path))]:
+        batch = loaded.pack(index).to_dict()
+        assert batch.keys() == expected.keys()
+        for key, value in expected.items():
+            assert np.array_equal(batch[key], value), key
+        assert len(loaded.subset(slice(2, 8))) == 6
+
+    with pytest.raises(ValueError):
+        PackedGraph.from_graphs([mols[0], Molecule.from_smiles('CC', atom_feat=None, bond_feat=None)])
+
+
+@pytest.mark.parametrize('num_workers', [2, 3])
+def test_molset_num_workers(csv_file, num_workers):
+    """
+    Feature: parallel featurization of molecular datasets
+    Description: transform the molecules in worker processes
+    Expectation: the molecules and labels are the same and in the same order as the ones transformed in serial
+    """
+    expected = load(csv_file, transform=transform)
+    dataset = load(csv_file, transform=transform, num_workers=num_workers)
+    assert_datasets_equal(dataset, expected)
+
+
+def test_molset_cache(csv_file, tmp_path):
+    """
+    Feature: cache of molecular datasets
+    Description: load the file again with the same options, another transform, other loading options,
+                 another content, and without a cache directory
+    Expectation: the same options hit the cache and give the same molecules, the others miss it
+    """
+    cache_dir = str(tmp_path / 'cache')
+    expected = load(csv_file, transform=transform)
+    assert not os.path.exists(cache_dir)
+
+    dataset = load(csv_file, transform=transform, cache_dir=cache_dir)
+    assert isinstance(dataset.data, list)
+    assert len(os.listdir(cache_dir)) == 1
+    assert_datasets_equal(dataset, expected)
+
+    dataset = load(csv_file, transform=transform, cache_dir=cache_dir, num_workers=2)
+    assert isinstance(dataset.data, PackedGraph)
+    assert len(os.listdir(cache_dir)) == 1
+    assert_datasets_equal(dataset, expected)
+
+    dataset = load(csv_file, transform=other_transform, cache_dir=cache_dir)
+    assert isinstance(dataset.data, list)
+    assert len(os.listdir(cache_dir)) == 2
+
+    dataset = MolSet(task_list=['y1', 'y2'], transform=transform, cache_dir=cache_dir).load_file(csv_file)
+    assert isinstance(dataset.data, list)
+    assert len(os.listdir(cache_dir)) == 3
+
+    pd.read_csv(csv_file)[:-1].to_csv(csv_file, index=False)
+    dataset = load(csv_file, transform=transform, cache_dir=cache_dir)
+    assert isinstance(dataset.data, list)
+    assert len(dataset) == len(SMILES) - 1
+    assert len(os.listdir(cache_dir)) == 4
+
+
+def test_molset_cache_key(csv_file, tmp_path):
+    """
+    Feature: cache of molecular datasets
+    Description: edit the code of a transform of the same name, and use a transform which can not be pickled
+    Expectation: the edited transform has another key, and the molecules of a lambda are not cached
+    """
+    def local_transform(mol, **kwargs):
+        return Molecule.from_molecule(mol, **kwargs)
+
+    cache_dir = str(tmp_path / 'cache')
+    dataset = MolSet(task_list=['y1', 'y2'], transform=transform, cache_dir=cache_dir)
+    key = dataset._cache_path(csv_file)    # pylint: disable=protected-access
+    code = transform.__code__
+    try:
+        transform.__code__ = other_transform.__code__
+        assert dataset._cache_path(csv_file) != key    # pylint: disable=protected-access
+    finally:
+        transform.__code__ = code
+    assert dataset._cache_path(csv_file) == key    # pylint: disable=protected-access
+
+    for func in [lambda mol, **kwargs: Molecule.from_molecule(mol, **kwargs), local_transform]:
+        with pytest.warns(UserWarning):
+            dataset = load(csv_file, transform=func, cache_dir=cache_dir)
+        assert len(dataset) == len(SMILES)
+    assert not os.path.exists(cache_dir)
+
+
+def test_molset_transform_error(csv_file):
+    """
+    Feature: parallel featurization of molecular datasets
+    Description: transform the molecules in worker processes with a transform which fails on some molecules
+    Expectation: the error of the worker is raised by load_file
+    """
+    with pytest.raises(ValueError, match='Failed to transform'):
+        load(csv_file, transform=failing_transform, num_workers=2)
@@ -0,0 +1,102 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the adaptive neighbour list of sponge."""
+import numpy as np
+import pytest
+from mindspore import Tensor
+
+from sponge import Molecule
+from sponge.partition import NeighbourList
+
+CUTOFF = 0.4
+CUTOFF_SCALE = 1.5
+NUM_ATOMS = 48
+
+
+def random_system(seed=0):
+    """Atoms placed randomly in a cube of 1.2 nm."""
+    coordinate = np.random.RandomState(seed).uniform(0, 1.2, (1, NUM_ATOMS, 3)).astype(np.float32)
+    return Molecule(atoms=['Ar'] * NUM_ATOMS, coordinate=coordinate, length_unit='nm'), coordinate
+
+
+def pairs_within_cutoff(index, mask, coordinate):
+    """The set of atom pairs in the neighbour list that are within the cutoff distance."""
+    index = index.asnumpy()[0]
+    mask = np.ones_like(index, bool) if mask is None else mask.asnumpy()[0]
+    distance = np.linalg.norm(coordinate[0][:, None] - coordinate[0][index], axis=-1)
+    atoms, columns = np.nonzero(mask & (distance < CUTOFF))
+    return set(zip(atoms.tolist(), index[atoms, columns].tolist()))
+
+
+def test_adaptive_neighbour_list():
+    """
+    Feature: adaptive neighbour list
+    Description: move the atoms randomly and update the adaptive and the per-step neighbour lists
+    Expectation: both lists hold the same atom pairs within the cutoff, the adaptive list skips some rebuilds
+    """
+    system, coordinate = random_system()
+    adaptive = NeighbourList(system, cutoff=CUTOFF, cutoff_scale=CUTOFF_SCALE, pace=1, adaptive=True)
+    per_step = NeighbourList(system, cutoff=CUTOFF, cutoff_scale=CUTOFF_SCALE, pace=1,
+                             num_neighbours=NUM_ATOMS - 1)
+
+    rng = np.random.RandomState(1)
+    num_steps = 30
+    for _ in range(num_steps):
+        coordinate = coordinate + rng.normal(0, 0.01, coordinate.shape).astype(np.float32)
+        index, mask = adaptive.update(Tensor(coordinate))
+        expected_index, expected_mask = per_step.update(Tensor(coordinate))
+        assert pairs_within_cutoff(index, mask, coordinate) == \
+            pairs_within_cutoff(expected_index, expected_mask, coordinate)
+    assert 0 < adaptive.num_rebuilds < num_steps
+
+
+def test_adaptive_neighbour_overflow():
+    """
+    Feature: adaptive neighbour list
+    Description: the neighbour list can hold the atoms within the cutoff but not within the scaled cutoff
+    Expectation: only the adaptive neighbour list raises RuntimeError
+    """
+    system, coordinate = random_system()
+    distance = np.linalg.norm(coordinate[0][:, None] - coordinate[0][None], axis=-1)
+    num_neighbours = int(((distance < CUTOFF).sum(-1) - 1).max())
+    assert num_neighbours < int(((distance < CUTOFF * CUTOFF_SCALE).sum(-1) - 1).max())
+
+    per_step = NeighbourList(system, cutoff=CUTOFF, cutoff_scale=CUTOFF_SCALE, num_neighbours=num_neighbours)
+    per_step.update(Tensor(coordinate))
+
+    adaptive = NeighbourList(system, cutoff=CUTOFF, cutoff_scale=CUTOFF_SCALE, num_neighbours=num_neighbours,
+                             adaptive=True)
+    with pytest.raises(RuntimeError):
+        adaptive.update(Tensor(coordinate), force=True)
+
+
+def test_adaptive_neighbour_pbc_box():
+    """
+    Feature: adaptive neighbour list
+    Description: update the adaptive neighbour list with unchanged coordinates, then with a scaled PBC box
+    Expectation: the list is only rebuilt when the PBC box changes
+    """
+    coordinate = np.random.RandomState(0).uniform(0, 1.2, (1, NUM_ATOMS, 3)).astype(np.float32)
+    pbc_box = np.array([[1.2, 1.2, 1.2]], np.float32)
+    system = Molecule(atoms=['Ar'] * NUM_ATOMS, coordinate=coordinate, pbc_box=pbc_box, length_unit='nm')
+    adaptive = NeighbourList(system, cutoff=CUTOFF, cutoff_scale=CUTOFF_SCALE, adaptive=True,
+                             num_neighbours=NUM_ATOMS - 1)
+
+    adaptive.update(Tensor(coordinate), Tensor(pbc_box))
+    assert adaptive.num_rebuilds == 0
+    adaptive.update(Tensor(coordinate), Tensor(pbc_box * 1.01))
+    assert adaptive.num_rebuilds == 1
+    adaptive.update(Tensor(coordinate), Tensor(pbc_box * 1.01))
+    assert adaptive.num_rebuilds == 1
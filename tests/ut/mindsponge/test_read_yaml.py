@@ -0,0 +1,56 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the cache of the parsed YAML files of sponge."""
+import os
+
+import yaml
+
+from sponge.data import data as sponge_data
+
+CONTENT = """
+parameters:
+  lj_energy:
+    parameters:
+      NO: [0.325, 0.711]
+      N: [0.325, 0.711]
+      1: [0.1, 0.2]
+  comment: null
+"""
+
+
+def test_read_yaml_cache(tmp_path, monkeypatch):
+    """
+    Feature: cache of the parsed YAML files
+    Description: read a YAML file with keys other than str, then read it again from the JSON cache,
+                 and from a broken cache file
+    Expectation: the data is the same as the data parsed by yaml.safe_load
+    """
+    monkeypatch.setenv('MINDSPONGE_CACHE_DIR', str(tmp_path / 'cache'))
+    filename = tmp_path / 'test.yaml'
+    filename.write_text(CONTENT, encoding='utf-8')
+    expected = yaml.safe_load(CONTENT)
+
+    assert sponge_data.read_yaml(str(filename)) == expected
+    cache_dir = sponge_data.get_cache_directory()
+    cache_files = os.listdir(cache_dir)
+    assert len(cache_files) == 1 and cache_files[0].endswith('.json')
+
+    sponge_data._yaml_memo.clear() # pylint: disable=protected-access
+    assert sponge_data.read_yaml(str(filename)) == expected
+
+    with open(os.path.join(cache_dir, cache_files[0]), 'w', encoding='utf-8') as file:
+        file.write('{broken')
+    sponge_data._yaml_memo.clear() # pylint: disable=protected-access
+    assert sponge_data.read_yaml(str(filename)) == expected